@@ -0,0 +1,122 @@
+"""
+Space Conquer - Scenario Benchmarks
+
+Run with ``python -m benchmarks`` from the project root. Results are written as
+JSON and compared against the stored baseline; the exit status is 1 when a
+metric regressed past its threshold or startup took longer than its budget.
+"""
+import argparse
+import os
+import sys
+import pygame
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.harness import (DEFAULT_THRESHOLDS, STARTUP_BUDGET_MS, run_benchmarks, save_results,
+                                load_results, compare_results)
+from src.utils.log_manager import setup_logging
+
+BENCHMARK_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIRECTORY, 'baseline.json')
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIRECTORY, 'results', 'latest.json')
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Space Conquer scenario benchmarks")
+    parser.add_argument('scenarios', nargs='*', metavar='SCENARIO',
+                        help="Scenarios to run (default: all)")
+    parser.add_argument('--list', action='store_true',
+                        help="List the available scenarios and exit")
+    parser.add_argument('--frames', type=int, default=600,
+                        help="Measured frames per scenario")
+    parser.add_argument('--warmup', type=int, default=60,
+                        help="Frames run before measuring")
+    parser.add_argument('--no-render', action='store_true',
+                        help="Only simulate; skip drawing to the offscreen surface")
+    parser.add_argument('--seed', type=int, default=1,
+                        help="Seed for the game's random streams")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                        help="Where to write the JSON results")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help="Baseline JSON to compare against")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Also write the results as the new baseline")
+    parser.add_argument('--threshold', action='append', default=[], metavar='METRIC=PERCENT',
+                        help="Allowed growth for a metric before it counts as a regression "
+                             f"(defaults: {', '.join(f'{k}={v:g}' for k, v in DEFAULT_THRESHOLDS.items())})")
+    parser.add_argument('--startup-budget', type=float, default=STARTUP_BUDGET_MS, metavar='MS',
+                        help="Longest allowed time from creating the game to its first menu frame")
+    return parser.parse_args()
+
+def parse_thresholds(overrides):
+    """Apply METRIC=PERCENT overrides to the default thresholds."""
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    for override in overrides:
+        metric, _, value = override.partition('=')
+        try:
+            thresholds[metric.strip()] = float(value)
+        except ValueError:
+            sys.exit(f"Invalid threshold '{override}', expected METRIC=PERCENT")
+    return thresholds
+
+def print_result(name, result):
+    """Print one scenario's timings and entity counts."""
+    entities = "  ".join(f"{key}={value['max']}" for key, value in result['entities'].items() if value['max'])
+    print(f"{name:<24}{result['p50_ms']:>8.3f}{result['p95_ms']:>8.3f}{result['p99_ms']:>8.3f}"
+          f"{result['max_ms']:>8.3f}{result['blocks_per_frame']:>9.1f}{result['gc_collections']:>5}  {entities}")
+
+def print_comparison(comparisons):
+    """Print the baseline comparison and return True if anything regressed."""
+    print()
+    print(f"{'Scenario':<24}{'Metric':<18}{'Base':>9}{'Now':>9}{'Change':>9}")
+    regressed = False
+    for name, metric, old, new, change, is_regression in comparisons:
+        flag = "  REGRESSION" if is_regression else ""
+        print(f"{name:<24}{metric:<18}{old:>9.3f}{new:>9.3f}{change:>+8.1f}%{flag}")
+        regressed = regressed or is_regression
+    return regressed
+
+def main():
+    """Run the selected scenarios and compare them with the baseline."""
+    args = parse_args()
+    if args.list:
+        for name, scenario in SCENARIOS.items():
+            print(f"{name:<24}{scenario.description}")
+        return 0
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        sys.exit(f"Unknown scenario(s): {', '.join(unknown)} (see --list)")
+    scenarios = [SCENARIOS[name] for name in (args.scenarios or SCENARIOS)]
+    thresholds = parse_thresholds(args.threshold)
+
+    # Keep the console for the results; game messages still go to logs/
+    setup_logging(console=False)
+    print(f"{'Scenario':<24}{'p50 ms':>8}{'p95 ms':>8}{'p99 ms':>8}{'max ms':>8}"
+          f"{'blocks':>9}{'gc':>5}  peak entities")
+    results = run_benchmarks(scenarios, args.frames, args.warmup, not args.no_render, args.seed,
+                             report=print_result)
+    pygame.quit()
+
+    startup = results['startup']
+    over_budget = startup['first_frame_ms'] > args.startup_budget
+    print(f"\nStartup: first frame after {startup['first_frame_ms']:.1f} ms "
+          f"(budget {args.startup_budget:g} ms), deferred work done after {startup['startup_complete_ms']:.1f} ms"
+          f"{'  OVER BUDGET' if over_budget else ''}")
+    
+    save_results(results, args.output)
+    print(f"\nResults written to {args.output}")
+    failed = 1 if over_budget else 0
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return failed
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline} (create one with --save-baseline)")
+        return failed
+    if baseline.get('settings') != results['settings']:
+        print(f"Warning: baseline was recorded with different settings: {baseline.get('settings')}")
+    return 1 if print_comparison(compare_results(results, baseline, thresholds)) else failed
+
+if __name__ == "__main__":
+    sys.exit(main())
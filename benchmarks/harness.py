@@ -0,0 +1,232 @@
+"""
+Benchmark harness for the Space Impact game.
+Runs scenarios headlessly for a fixed number of frames, records frame-time
+percentiles, per-stage profiler timings, memory-block churn and entity counts,
+and compares the results against a stored baseline. Also times startup to the
+first menu frame against a budget.
+"""
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import numpy as np
+import pygame
+from src.game_manager import GameManager
+from src.utils.profiler import Profiler
+from src.utils.startup_trace import reset_startup_trace
+
+RESULT_VERSION = 1
+
+# Time from creating the game to its first menu frame, in milliseconds
+STARTUP_BUDGET_MS = 250.0
+
+# Allowed growth in percent before a metric counts as a regression
+DEFAULT_THRESHOLDS = {
+    'p50_ms': 10.0,
+    'p95_ms': 15.0,
+    'p99_ms': 25.0,
+    'blocks_per_frame': 25.0,
+}
+# Changes smaller than this are noise, whatever the percentage
+MIN_REGRESSION = {
+    'p50_ms': 0.05,
+    'p95_ms': 0.05,
+    'p99_ms': 0.1,
+    'blocks_per_frame': 5.0,
+}
+
+def _entity_counts(game):
+    """Return the number of live entities of each kind."""
+    counts = {
+        'enemies': len(game.enemies),
+        'projectiles': game.projectile_manager.count,
+        'particles': game.particle_system.count,
+        'hazards': len(game.asteroids) + len(game.debris),
+        'player_bullets': len(game.player.bullets) if game.player else 0,
+        'boss_bullets': 0,
+    }
+    for boss in (game.boss_manager.mini_boss, game.boss_manager.main_boss):
+        if boss is not None:
+            counts['boss_bullets'] += len(boss.bullets)
+    return counts
+
+def _gc_collections():
+    """Return the number of garbage collections run so far."""
+    return sum(generation['collections'] for generation in gc.get_stats())
+
+def run_scenario(scenario, frames=600, warmup=60, render=True, seed=1):
+    """
+    Run one scenario and measure it.
+
+    Args:
+        scenario: Scenario from benchmarks.scenarios
+        frames: Number of measured frames
+        warmup: Frames run before measuring (caches fill, pools grow)
+        render: Draw every frame to the offscreen surface
+        seed: Seed for the game's random streams
+
+    Returns:
+        dict: Frame-time percentiles, stage timings, block churn and entity counts
+    """
+    game = GameManager(headless=True, render=render, seed=seed)
+    pygame.app = type('', (), {})()
+    pygame.app.game_manager = game
+
+    inputs = scenario.setup(game)
+
+    def step_inputs(frame):
+        # step() numbers frames from 0 on every call, so pin the scenario frame
+        return (lambda _: inputs(frame)) if inputs else None
+
+    for frame in range(warmup):
+        scenario.prepare(game, frame)
+        scenario.act(game, frame)
+        game.step(1, step_inputs(frame))
+
+    # Fresh profiler sized to keep every measured frame
+    game.profiler = Profiler(capacity=frames, enabled=True)
+    frame_ns = np.zeros(frames, dtype=np.int64)
+    block_deltas = np.zeros(frames, dtype=np.int64)
+    count_samples = []
+    collections = _gc_collections()
+    perf_counter_ns = time.perf_counter_ns
+    getallocatedblocks = sys.getallocatedblocks
+
+    for i in range(frames):
+        frame = warmup + i
+        scenario.prepare(game, frame)
+        count_samples.append(_entity_counts(game))
+        blocks = getallocatedblocks()
+        start = perf_counter_ns()
+        scenario.act(game, frame)
+        game.step(1, step_inputs(frame))
+        frame_ns[i] = perf_counter_ns() - start
+        block_deltas[i] = getallocatedblocks() - blocks
+
+    collections = _gc_collections() - collections
+    frame_ms = frame_ns / 1e6
+    p50, p95, p99 = np.percentile(frame_ms, (50, 95, 99))
+    entities = {}
+    for name in count_samples[0]:
+        values = [counts[name] for counts in count_samples]
+        entities[name] = {'mean': sum(values) / len(values), 'max': max(values)}
+    stages = {name: {'p50_ms': stage['p50_ms'], 'p99_ms': stage['p99_ms']}
+              for name, stage in game.profiler.get_stats().items()}
+
+    return {
+        'description': scenario.description,
+        'frames': frames,
+        'p50_ms': float(p50),
+        'p95_ms': float(p95),
+        'p99_ms': float(p99),
+        'max_ms': float(frame_ms.max()),
+        'mean_ms': float(frame_ms.mean()),
+        # Net memory blocks allocated per frame (positive frames only, so freed
+        # garbage doesn't hide allocations) and garbage collections during the run
+        'blocks_per_frame': float(np.clip(block_deltas, 0, None).mean()),
+        'gc_collections': collections,
+        'entities': entities,
+        'stages': stages,
+    }
+
+def measure_startup(render=True):
+    """
+    Create a fresh game and time it to the first menu frame and to the end of
+    its deferred startup work. Imports are not included (they happen once per process).
+    
+    Args:
+        render: Draw the menu frames to the offscreen surface
+    
+    Returns:
+        dict: first_frame_ms, startup_complete_ms and the duration of every stage
+    """
+    trace = reset_startup_trace()
+    game = GameManager(headless=True, render=render)
+    pygame.app = type('', (), {})()
+    pygame.app.game_manager = game
+    while not game.is_startup_complete():
+        game.step(1)
+    
+    return {
+        'first_frame_ms': trace.get_mark_ms('first_frame'),
+        'startup_complete_ms': trace.get_mark_ms('startup_complete'),
+        'stages': {name: duration for name, start, duration, thread in trace.get_timeline()
+                   if duration is not None},
+    }
+
+def run_benchmarks(scenarios, frames=600, warmup=60, render=True, seed=1, report=None):
+    """
+    Run several scenarios and collect their results.
+
+    Args:
+        scenarios: Scenarios to run, in order
+        frames, warmup, render, seed: See run_scenario
+        report: Optional function called with (name, result) after each scenario
+
+    Returns:
+        dict: Result document with run settings and per-scenario results
+    """
+    results = {
+        'version': RESULT_VERSION,
+        'created': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'machine': {
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+        },
+        'settings': {'frames': frames, 'warmup': warmup, 'render': render, 'seed': seed},
+        'scenarios': {},
+    }
+    # Startup first, before other games have warmed up fonts and caches
+    results['startup'] = measure_startup(render)
+    for scenario in scenarios:
+        result = run_scenario(scenario, frames, warmup, render, seed)
+        results['scenarios'][scenario.name] = result
+        if report:
+            report(scenario.name, result)
+    return results
+
+def save_results(results, path):
+    """Write a result document as JSON."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+def load_results(path):
+    """Read a result document, or return None if the file doesn't exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+def compare_results(results, baseline, thresholds=None):
+    """
+    Compare results against a baseline.
+
+    Args:
+        results: Result document of the current run
+        baseline: Result document to compare against
+        thresholds: Metric -> allowed growth in percent (defaults to DEFAULT_THRESHOLDS)
+
+    Returns:
+        list: (scenario, metric, baseline value, current value, change in percent,
+              regressed) for every metric present in both documents
+    """
+    thresholds = thresholds or DEFAULT_THRESHOLDS
+    comparisons = []
+    for name, result in results['scenarios'].items():
+        reference = baseline.get('scenarios', {}).get(name)
+        if reference is None:
+            continue
+        for metric, allowed in thresholds.items():
+            if metric not in result or metric not in reference:
+                continue
+            old, new = reference[metric], result[metric]
+            change = (new - old) / old * 100 if old else 0.0
+            regressed = change > allowed and new - old > MIN_REGRESSION.get(metric, 0.0)
+            comparisons.append((name, metric, old, new, change, regressed))
+    return comparisons
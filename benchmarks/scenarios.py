@@ -0,0 +1,192 @@
+"""
+Benchmark scenarios for the Space Impact game.
+Each scenario puts a headless game into one situation we care about (menu,
+frenzy mode, boss attacks, bullet hell, mass clear) and keeps it there for
+the whole measured run, so every run times the same workload.
+"""
+import math
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.sprites.enemy_enhanced import EnhancedEnemy
+from src.sprites.super_enemy_enhanced import SuperEnemyEnhanced
+from src.sprites.asteroid import Asteroid
+from src.sprites.debris import Debris
+from src.utils.game_clock import get_clock
+from src.utils.object_pool import get_pool
+from src.utils.projectile_manager import KIND_AIMED
+from main import make_autopilot
+
+# Phase indices in PhaseManager._init_phases
+PHASE_SUPER_MONSTERS = 4
+PHASE_MINI_BOSS = 5
+PHASE_FINAL_BOSS = 7
+
+SUPER_ENEMY_CAP = 2              # Same limit as the spawner in GameManager.update
+BULLET_HELL_PROJECTILES = 3000   # Enemy projectiles kept alive in the bullet hell scenario
+MASS_CLEAR_INTERVAL = 60         # Frames between mass clears
+MASS_CLEAR_ENEMIES = 30          # Enemies on screen before each mass clear
+MASS_CLEAR_HAZARDS = 8           # Asteroids and debris (each) on screen before each mass clear
+BOSS_ENTRY_TIMEOUT = 1200        # Frames to wait for a boss to finish its entry animation
+
+class Scenario:
+    """A named benchmark situation built from setup, prepare and act hooks."""
+
+    def __init__(self, name, description, setup=None, prepare=None, act=None):
+        """
+        Initialize the scenario.
+
+        Args:
+            name: Identifier used on the command line and in result files
+            description: One-line summary shown by --list
+            setup: Function taking the game, run once before warmup. Returns the
+                   input function for the run (frame -> held keys) or None
+            prepare: Function taking (game, frame), run before each frame outside
+                     the timed region (keeps the scenario in its state)
+            act: Function taking (game, frame), run before each frame inside the
+                 timed region (work that is part of what we measure)
+        """
+        self.name = name
+        self.description = description
+        self.setup = setup or (lambda game: None)
+        self.prepare = prepare or (lambda game, frame: None)
+        self.act = act or (lambda game, frame: None)
+
+def _start_game(game):
+    """Start a normal game with an invulnerable player and play through the map intro."""
+    game.start_new_game()
+    game.player.invulnerable = True
+    game.player.invulnerable_duration = float('inf')
+    autopilot = make_autopilot(game)
+    game.step(game.map_name_duration + 1, autopilot)
+    return autopilot
+
+def _spawn_enemy(game, enemy_type):
+    """Spawn an enemy the same way the game's spawner does."""
+    if enemy_type == 'super':
+        enemy = get_pool(SuperEnemyEnhanced).acquire(game.asset_loader.images, game.enemy_behavior_manager)
+    else:
+        enemy = get_pool(EnhancedEnemy).acquire(enemy_type, game.asset_loader.images, game.enemy_behavior_manager)
+    enemy.points = game.enemy_points[enemy_type]
+    enemy.speed_multiplier = game.enemy_speed_multiplier
+    enemy.game_manager = game
+    game.enemies.add(enemy)
+    game.all_sprites.add(enemy)
+    return enemy
+
+def _wait_for_boss(game, boss, autopilot):
+    """Step until a boss has finished its entry animation."""
+    for _ in range(BOSS_ENTRY_TIMEOUT):
+        if boss is None or boss.entry_complete:
+            break
+        game.step(1, autopilot)
+
+def _keep_boss_alive(boss):
+    """Undo the damage done by the autopilot so the boss stays in the fight."""
+    boss.health = boss.max_health
+    boss.dying = False
+
+# Start phase
+
+def _setup_start_phase(game):
+    return _start_game(game)
+
+# Frenzy mode with the super-enemy cap reached
+
+def _setup_frenzy(game):
+    autopilot = _start_game(game)
+    phase_manager = game.phase_manager
+    phase_manager.skip_to_phase(PHASE_SUPER_MONSTERS)
+    # Keep the frenzy running for the whole benchmark
+    phase_manager.frenzy_mode = True
+    phase_manager.frenzy_start_time = phase_manager.game_time
+    phase_manager.frenzy_duration = float('inf')
+    return autopilot
+
+def _prepare_frenzy(game, frame):
+    while game.get_super_enemy_count() < SUPER_ENEMY_CAP:
+        _spawn_enemy(game, 'super')
+
+# Mini-boss sniper pattern
+
+def _setup_mini_boss(game):
+    autopilot = _start_game(game)
+    game.phase_manager.skip_to_phase(PHASE_MINI_BOSS)
+    _wait_for_boss(game, game.boss_manager.mini_boss, autopilot)
+    return autopilot
+
+def _prepare_mini_boss(game, frame):
+    boss = game.boss_manager.mini_boss
+    if boss:
+        _keep_boss_alive(boss)
+        boss.attack_pattern = "sniper"
+        boss.sniper_in_warning = True
+        boss.sniper_target_y = game.player.rect.centery
+
+# Main boss laser plus shield
+
+def _setup_main_boss(game):
+    autopilot = _start_game(game)
+    game.phase_manager.skip_to_phase(PHASE_FINAL_BOSS)
+    _wait_for_boss(game, game.boss_manager.main_boss, autopilot)
+    return autopilot
+
+def _prepare_main_boss(game, frame):
+    boss = game.boss_manager.main_boss
+    if not boss:
+        return
+    _keep_boss_alive(boss)
+    boss.shield_active = True
+    boss.shield_health = boss.max_shield_health
+    # shoot() sets up its laser state on the first shot; only hold the laser once it exists
+    if hasattr(boss, 'last_shot_time'):
+        boss.laser_active = True
+        boss.laser_phase = 'firing'
+        boss.laser_fire_time = get_clock().get_ticks()
+        boss.laser_target_y = boss.player_y_position
+        boss.laser_width = 25
+
+# Synthetic bullet hell
+
+def _prepare_bullet_hell(game, frame):
+    projectiles = game.projectile_manager
+    while projectiles.count < BULLET_HELL_PROJECTILES:
+        # Fan of aimed bolts from the right edge, spread by serial number so every run matches
+        serial = projectiles.next_serial
+        angle = math.radians((serial * 37) % 120 - 60)
+        speed = 3 + (serial % 4)
+        y = 20 + (serial * 53) % (SCREEN_HEIGHT - 40)
+        projectiles.spawn(SCREEN_WIDTH - 10, y, -speed * math.cos(angle), speed * math.sin(angle),
+                          8, 4, (255, 80, 80), kind=KIND_AIMED)
+
+# Mass clear via _clear_all_enemies_with_explosion
+
+def _prepare_mass_clear(game, frame):
+    if frame % MASS_CLEAR_INTERVAL:
+        return
+    for i in range(MASS_CLEAR_ENEMIES - len(game.enemies)):
+        enemy_type = 'super' if i < SUPER_ENEMY_CAP else ('elite' if i % 2 else 'low')
+        _spawn_enemy(game, enemy_type)
+    for _ in range(MASS_CLEAR_HAZARDS - len(game.asteroids)):
+        game.asteroids.add(get_pool(Asteroid).acquire(game.asset_loader.images, game.sound_manager))
+    for _ in range(MASS_CLEAR_HAZARDS - len(game.debris)):
+        game.debris.add(get_pool(Debris).acquire(game.asset_loader.images))
+
+def _act_mass_clear(game, frame):
+    if frame % MASS_CLEAR_INTERVAL == 0:
+        game.phase_manager._clear_all_enemies_with_explosion()
+
+SCENARIOS = {scenario.name: scenario for scenario in (
+    Scenario('menu_idle', "Start screen with no input"),
+    Scenario('start_phase', "First phase of a normal game with the autopilot firing",
+             setup=_setup_start_phase),
+    Scenario('frenzy_super_cap', "Frenzy mode in the Super Monsters phase with the super-enemy cap reached",
+             setup=_setup_frenzy, prepare=_prepare_frenzy),
+    Scenario('mini_boss_sniper', "Mini-boss fight held in the sniper pattern",
+             setup=_setup_mini_boss, prepare=_prepare_mini_boss),
+    Scenario('main_boss_laser_shield', "Main boss firing its laser with the shield up",
+             setup=_setup_main_boss, prepare=_prepare_main_boss),
+    Scenario('bullet_hell', f"{BULLET_HELL_PROJECTILES} enemy projectiles on screen",
+             setup=_setup_start_phase, prepare=_prepare_bullet_hell),
+    Scenario('mass_clear', f"{MASS_CLEAR_ENEMIES} enemies and {MASS_CLEAR_HAZARDS * 2} hazards "
+             f"exploded every {MASS_CLEAR_INTERVAL} frames",
+             setup=_setup_start_phase, prepare=_prepare_mass_clear, act=_act_mass_clear),
+)}
@@ -4,15 +4,240 @@ Space Conquer - Main Entry Point
 
 A Python recreation of the classic Space Impact game that was popular on Nokia phones.
 """
+import argparse
+import random
+import time
+# Imported first so the startup trace covers importing pygame and the game
+from src.utils.startup_trace import get_startup_trace
 import pygame
+from src.config import FPS
 from src.game_manager import GameManager
+from src.utils.object_pool import get_pool_stats
+from src.utils.log_manager import setup_logging
+from src.utils.input_recorder import InputReplay
+
+get_startup_trace().lap('imports', get_startup_trace().origin)
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Space Conquer")
+    parser.add_argument('--headless', action='store_true',
+                        help="Simulate a session without a window or audio device")
+    parser.add_argument('--frames', type=int, default=600 * FPS,
+                        help="Maximum frames to simulate in headless mode (stops early once the final boss is defeated)")
+    parser.add_argument('--render', action='store_true',
+                        help="Draw every frame to the offscreen surface in headless mode")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Seed for the game's random streams (same seed and input replay identically)")
+    parser.add_argument('--mortal', action='store_true',
+                        help="Let the player die in headless mode instead of surviving the whole session")
+    parser.add_argument('--profile', action='store_true',
+                        help="Record per-stage frame timings in headless mode and print their percentiles")
+    parser.add_argument('--asset-report', action='store_true',
+                        help="Print how each image was converted for blitting, benchmark blit cost "
+                             "and report memory per asset bundle, then exit")
+    parser.add_argument('--record', metavar='FILE',
+                        help="Record the session's input and seed to a replay file")
+    parser.add_argument('--replay', metavar='FILE',
+                        help="Play back a replay file (at full speed with --headless, in real time otherwise)")
+    parser.add_argument('--debug-logs', action='store_true',
+                        help="Start with debug log messages enabled (also toggled from the testing panel)")
+    parser.add_argument('--startup-trace', action='store_true',
+                        help="Start the game, print how long each startup stage took until the first "
+                             "menu frame and the deferred work after it, then exit")
+    return parser.parse_args()
+
+def make_autopilot(game):
+    """Scripted input for headless runs: keep firing, line up with bosses, otherwise sweep."""
+    def autopilot(frame):
+        keys = {pygame.K_SPACE}
+        boss = game.boss_manager.main_boss or game.boss_manager.mini_boss
+        if boss and game.player:
+            if game.player.rect.centery < boss.rect.centery - 10:
+                keys.add(pygame.K_DOWN)
+            elif game.player.rect.centery > boss.rect.centery + 10:
+                keys.add(pygame.K_UP)
+        else:
+            keys.add(pygame.K_UP if (frame // 90) % 2 == 0 else pygame.K_DOWN)
+        return keys
+    return autopilot
+
+def run_headless(args):
+    """Run a fixed-step headless session and print a summary."""
+    game = GameManager(headless=True, render=args.render, seed=args.seed)
+    pygame.app = type('', (), {})()
+    pygame.app.game_manager = game
+    
+    # Normal game so phases advance on the timer
+    game.start_new_game()
+    if not args.mortal:
+        # Keep the player invulnerable so the autopilot reaches the end of the map
+        game.player.invulnerable = True
+        game.player.invulnerable_duration = float('inf')
+    if args.profile:
+        game.profiler.enable()
+    if args.record:
+        game.start_recording(args.record, start_in_game=True, invulnerable=not args.mortal)
+    
+    autopilot = make_autopilot(game)
+    start = time.perf_counter()
+    frames = 0
+    while frames < args.frames:
+        # Step in one-second chunks so the run can end once the final boss is down
+        chunk = min(FPS, args.frames - frames)
+        if not game.step(chunk, lambda frame: autopilot(frames + frame)):
+            break
+        frames += chunk
+        if game.boss_manager.main_boss_spawned and not game.boss_manager.has_any_boss():
+            break
+    elapsed = time.perf_counter() - start
+    
+    phase = game.phase_manager.get_current_phase()
+    print(f"Simulated {frames} frames ({frames / FPS:.0f}s of game time) in {elapsed:.2f}s")
+    print(f"Score: {game.score}  Phase: {phase.name if phase else 'None'}  "
+          f"Game over: {game.game_state == game.GAME_STATE_GAME_OVER}")
+    if args.profile:
+        print_profile(game.profiler)
+        print_pool_stats()
+        print_voice_stats(game.sound_manager.voices)
+    game.stop_recording()
+    pygame.quit()
+
+def run_replay(args):
+    """Play back a replay file, headless at full speed or in a window in real time."""
+    replay = InputReplay(args.replay)
+    game = GameManager(headless=args.headless, render=args.render, seed=replay.seed)
+    pygame.app = type('', (), {})()
+    pygame.app.game_manager = game
+    
+    # Recreate the state the recording started from
+    if replay.start_in_game:
+        game.start_new_game()
+    if replay.invulnerable:
+        game.player.invulnerable = True
+        game.player.invulnerable_duration = float('inf')
+    if args.profile:
+        game.profiler.enable()
+    game.replay = replay
+    if not args.headless:
+        game.run()
+        return
+    
+    start = time.perf_counter()
+    while True:
+        frame_input = replay.next_frame()
+        if frame_input is None or not game.run_frame(frame_input):
+            break
+    elapsed = time.perf_counter() - start
+    
+    phase = game.phase_manager.get_current_phase()
+    print(f"Replayed {replay.frames} frames in {elapsed:.2f}s")
+    print(f"Score: {game.score}  Phase: {phase.name if phase else 'None'}  "
+          f"Game over: {game.game_state == game.GAME_STATE_GAME_OVER}")
+    if replay.divergences:
+        print(f"DIVERGED at frame {replay.first_divergence} "
+              f"({replay.divergences} of {replay.checkpoints} checkpoints failed)")
+    else:
+        print(f"All {replay.checkpoints} checkpoints matched")
+    if args.profile:
+        print_profile(game.profiler)
+    pygame.quit()
+
+def print_profile(profiler):
+    """Print the per-stage timing percentiles recorded by the profiler."""
+    print(f"{'Stage':<24}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for name, stage in profiler.get_stats().items():
+        print(f"{name:<24}{stage['p50_ms']:>9.3f}{stage['p95_ms']:>9.3f}"
+              f"{stage['p99_ms']:>9.3f}{stage['max_ms']:>9.3f}")
+
+def print_pool_stats():
+    """Print how often each sprite pool recycled an instance."""
+    print(f"{'Pool':<24}{'reused':>9}{'built':>9}{'live':>9}{'free':>9}{'peak':>9}")
+    for name, stats in get_pool_stats().items():
+        print(f"{name:<24}{stats['hits']:>9}{stats['misses']:>9}{stats['live']:>9}"
+              f"{stats['free']:>9}{stats['high_water']:>9}")
+
+def print_voice_stats(voices):
+    """Print how sound effect requests were voiced over the run."""
+    stats = voices.get_total_stats()
+    print(f"{'Sound effects':<24}{'played':>9}{'merged':>9}{'stolen':>9}{'dropped':>9}")
+    print(f"{'':<24}{stats['played']:>9}{stats['merged']:>9}{stats['stolen']:>9}{stats['dropped']:>9}")
+
+def run_asset_report():
+    """Print the blit mode and blit cost of each image, then the memory held by each asset bundle."""
+    game = GameManager(headless=True)
+    game.finish_startup()
+    asset_manager = game.asset_loader.asset_manager
+    timings = asset_manager.benchmark_blits(game.screen)
+    
+    print(f"{'Image':<28}{'Mode':<10}{'Size':>10}{'Raw us':>10}{'Opt us':>10}")
+    total_raw = total_optimized = 0.0
+    for image_id, mode, (width, height) in asset_manager.get_blit_report():
+        raw_us, optimized_us = timings.get(image_id, (0.0, 0.0))
+        total_raw += raw_us
+        total_optimized += optimized_us
+        print(f"{image_id:<28}{mode:<10}{f'{width}x{height}':>10}{raw_us:>10.1f}{optimized_us:>10.1f}")
+    print(f"{'Total':<48}{total_raw:>10.1f}{total_optimized:>10.1f}")
+    
+    print()
+    print(f"Loading progress: {asset_manager.get_loading_progress() * 100:.0f}%")
+    print(f"{'Bundle':<28}{'State':<14}{'Assets':>8}{'KiB':>10}")
+    total_bytes = 0
+    for bundle_name, state, resident, size in asset_manager.get_bundle_memory_report():
+        total_bytes += size
+        print(f"{bundle_name:<28}{state:<14}{resident:>8}{size / 1024:>10.1f}")
+    print(f"{'Total':<50}{total_bytes / 1024:>10.1f}")
+    pygame.quit()
+
+def run_startup_trace(args):
+    """Show the menu until the deferred startup work is done, then print the startup timeline."""
+    game = GameManager(headless=args.headless, render=True, seed=args.seed)
+    pygame.app = type('', (), {})()
+    pygame.app.game_manager = game
+    while not game.is_startup_complete():
+        if not game.step(1):
+            break
+    
+    trace = get_startup_trace()
+    for line in trace.format_timeline():
+        print(line)
+    # Either mark is missing if the window was closed before it was reached
+    first_frame_ms = trace.get_mark_ms('first_frame')
+    complete_ms = trace.get_mark_ms('startup_complete')
+    if first_frame_ms is None:
+        print("\nNo frame shown, startup not complete")
+    elif complete_ms is None:
+        print(f"\nFirst frame after {first_frame_ms:.1f} ms, startup not complete")
+    else:
+        print(f"\nFirst frame after {first_frame_ms:.1f} ms, startup complete after {complete_ms:.1f} ms")
+    pygame.quit()
 
 def main():
     """Main entry point for the game."""
-    game = GameManager()
+    args = parse_args()
+    setup_logging(debug=args.debug_logs)
+    if args.startup_trace:
+        run_startup_trace(args)
+        return
+    if args.asset_report:
+        run_asset_report()
+        return
+    if args.replay:
+        run_replay(args)
+        return
+    if args.record and args.seed is None:
+        # Recordings need a seed; pick one so the session can be replayed
+        args.seed = random.SystemRandom().randrange(2 ** 31)
+    if args.headless:
+        run_headless(args)
+        return
+    
+    game = GameManager(seed=args.seed)
     # Store a reference to the game manager for global access
     pygame.app = type('', (), {})()
     pygame.app.game_manager = game
+    if args.record:
+        game.start_recording(args.record)
     game.run()
 
 if __name__ == "__main__":
@@ -5,8 +5,7 @@ import pygame
 import os
 from pathlib import Path
 
-# Initialize pygame
-pygame.init()
+# pygame itself is initialized by GameManager, not on import
 
 # Game constants
 SCREEN_WIDTH = 800
@@ -22,6 +21,15 @@ BLUE = (0, 0, 255)
 GRAY = (150, 150, 150)
 DARK_GRAY = (80, 80, 80)
 
+# Rendering settings
+ROTATION_STEPS = 72  # Angle buckets for cached sprite rotations (72 = 5 degrees)
+
+# Background starfield, one entry per parallax layer (drawn back to front)
+STAR_LAYERS = [
+    {'count': 150, 'speed': (0.15, 0.4), 'size': (1, 1), 'brightness': 0.5},  # Distant dust
+    {'count': 50, 'speed': (0.5, 3.0), 'size': (1, 3), 'brightness': 1.0},    # Main star layer
+]
+
 # Debug settings
 DEBUG_HITBOXES = False  # Set to False by default, can be toggled in test mode
 
@@ -2,11 +2,10 @@
 Game Manager for the Space Impact game.
 Handles the main game loop and game state.
 """
+import os
 import pygame
 import sys
-import random
 import math
-import time
 from .config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, ENEMY_SPAWN_DELAY, POWERUP_SPAWN_DELAY, DEBUG_HITBOXES, PLAYER_INITIAL_HEALTH
 from .utils.sound_manager import SoundManager
 from .utils.asset_loader import AssetLoader
@@ -15,33 +14,113 @@ from .utils.background_manager import BackgroundManager
 from .utils.phase_manager import PhaseManager
 from .utils.boss_manager import BossManager
 from .utils.enemy_behavior_manager import EnemyBehaviorManager
+from .utils.projectile_manager import ProjectileManager
+from .utils.particle_system import ParticleSystem
+from .utils.collision_manager import (CollisionManager, LAYER_PLAYER, LAYER_PLAYER_BULLET, LAYER_ENEMY,
+                                      LAYER_ASTEROID, LAYER_DEBRIS, LAYER_POWERUP,
+                                      LAYER_BOSS, LAYER_BOSS_BULLET)
 from .sprites.player import Player
 from .sprites.enemy import Enemy
 from .sprites.enemy_enhanced import EnhancedEnemy
 from .sprites.super_enemy import SuperEnemy
 from .sprites.super_enemy_enhanced import SuperEnemyEnhanced
 from .sprites.powerup import PowerUp
-from .sprites.star import Star
+from .sprites.star import StarField
 from .sprites.asteroid import Asteroid
 from .sprites.debris import Debris
+from .utils.game_clock import GameClock, MODE_FIXED, MODE_VARIABLE, get_clock, set_clock, get_rng, seed_streams
+from .utils.font_manager import get_font, get_font_manager, render_text
+from .utils.glow_cache import get_glow_cache
+from .utils.tint_cache import get_tint_cache
+from .utils.object_pool import get_pool, collect_pools, forget_live_sprites, get_pool_stats
+from .utils.input_state import KeyState
+from .utils.input_recorder import FrameInput, InputRecorder
+from .utils.profiler import Profiler
+from .utils.startup_trace import get_startup_trace
+from .utils.log_manager import get_logger, throttle
+
+# Random streams (seeded through the game clock module)
+rng = get_rng('spawning')
+logger = get_logger('game')
 
 class GameManager:
-    def __init__(self):
+    def __init__(self, headless=False, render=False, clock=None, seed=None):
+        """
+        Initialize the game.
+        
+        Args:
+            headless (bool): Run without a window or audio device using SDL's dummy
+                             drivers and a fixed-step clock (for benchmarks and CI)
+            render (bool): In headless mode, still draw each frame to the offscreen screen surface
+            clock (GameClock): Simulation clock to use. Defaults to a fixed-step clock when
+                               headless and a variable real-time clock otherwise
+            seed: Seed for the per-subsystem random streams. None keeps runs non-deterministic
+        """
+        self.headless = headless
+        self.render = render or not headless
+        
+        # Time each startup stage (printed by --startup-trace, always logged)
+        trace = get_startup_trace()
+        t = trace.start()
+        
+        if headless:
+            # Switch SDL to the dummy drivers (pygame may already be initialized by an earlier game)
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+            if pygame.display.get_init() and pygame.display.get_driver() != 'dummy':
+                pygame.display.quit()
+            if pygame.mixer.get_init():
+                pygame.mixer.quit()
+        
         # Initialize pygame
         pygame.init()
+        t = trace.lap('pygame_init', t)
+        
+        # Simulation clock: fixed steps when headless so runs are not tied to real time
+        if clock is None:
+            clock = GameClock(mode=MODE_FIXED if headless else MODE_VARIABLE, fixed_step=1.0 / FPS)
+        self.game_clock = clock
+        set_clock(self.game_clock)
         
-        # Create the game window
+        # Seed every random stream so a seed plus an input sequence replays identically
+        self.seed = seed
+        seed_streams(seed)
+        
+        # Create the game window (an offscreen surface with the dummy driver)
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Space Conquer")
         self.clock = pygame.time.Clock()
+        t = trace.lap('display', t)
         
-        # Initialize managers
-        self.asset_loader = AssetLoader()
+        # Initialize managers (the first map's assets load after the first menu frame)
+        self.asset_loader = AssetLoader(load_map=False)
+        t = trace.lap('assets', t)
         self.sound_manager = SoundManager()
+        t = trace.lap('sound', t)
         self.ui_manager = UIManager(self.asset_loader, self.sound_manager)
         self.ui_manager.game_manager = self  # Add reference to game manager
-        self.background_manager = BackgroundManager(self.asset_loader)
-        self.enemy_behavior_manager = EnemyBehaviorManager()  # Initialize enemy behavior manager
+        t = trace.lap('ui', t)
+        self.background_manager = None  # Gameplay only, created by _init_background
+        self.projectile_manager = ProjectileManager()  # Shared pool for all enemy projectiles
+        self.particle_system = ParticleSystem()  # Shared pool for explosion particles
+        self.enemy_behavior_manager = EnemyBehaviorManager(self.projectile_manager)  # Initialize enemy behavior manager
+        self.collision_manager = CollisionManager()  # Broadphase for all gameplay collisions
+        self.profiler = Profiler()  # Per-stage frame timings (F3 in testing mode)
+        t = trace.lap('gameplay_systems', t)
+        
+        # Startup work not needed for the menu: runs one task per frame once the
+        # menu is showing, or all at once when a game starts
+        self.deferred_init = [
+            ('map_assets', self._init_map_assets),
+            ('background', self._init_background),
+            ('music_preload', self.sound_manager.preload_music),
+        ]
+        self.first_frame_shown = False
+        
+        # Input recording and replay
+        self.recorder = None  # InputRecorder writing every frame's input
+        self.replay = None    # InputReplay feeding recorded input instead of the keyboard
+        self.key_mods = 0     # Modifier keys held this frame
         
         # Game state constants
         self.GAME_STATE_MENU = 0
@@ -53,8 +132,8 @@ class GameManager:
         self.game_state = self.GAME_STATE_MENU
         self.score = 0
         
-        # Create stars
-        self.stars = [Star() for _ in range(50)]
+        # Create the parallax starfield
+        self.stars = StarField()
         
         # Initialize sprite groups
         self.all_sprites = pygame.sprite.Group()
@@ -100,9 +179,47 @@ class GameManager:
         
         # Initialize phase manager
         self.phase_manager = PhaseManager(self)
+        t = trace.lap('game_state', t)
         
         # Start menu music
         self.sound_manager.play_music('menu')
+        trace.lap('menu_music', t)
+    
+    def _init_map_assets(self):
+        """Load the current map's asset bundle (and start prefetching the next one)."""
+        if self.asset_loader.set_map(self.current_map) and self.background_manager:
+            self.background_manager.set_asset_loader(self.asset_loader)
+    
+    def _init_background(self):
+        """Create the themed map background."""
+        self.background_manager = BackgroundManager(self.asset_loader)
+    
+    def _run_deferred_init(self, all_tasks=False):
+        """
+        Run deferred startup work.
+        
+        Args:
+            all_tasks (bool): Run everything left instead of a single task
+        """
+        trace = get_startup_trace()
+        while self.deferred_init:
+            name, task = self.deferred_init.pop(0)
+            t = trace.start()
+            task()
+            trace.lap(f"deferred.{name}", t)
+            if not self.deferred_init:
+                trace.mark('startup_complete')
+                trace.log_timeline()
+            if not all_tasks:
+                break
+    
+    def finish_startup(self):
+        """Run all deferred startup work now (before a game starts, or for reports)."""
+        self._run_deferred_init(all_tasks=True)
+    
+    def is_startup_complete(self):
+        """Return True once the deferred startup work has all run."""
+        return not self.deferred_init
     
     def start_new_game(self, testing_mode=False):
         """Initialize a new game."""
@@ -111,26 +228,31 @@ class GameManager:
         self.score = 0
         self.testing_mode = testing_mode
         
+        # Gameplay assets and systems deferred at startup must be ready first
+        self.finish_startup()
+        
+        # Restart the random streams so every game with the same seed plays out the same
+        if self.seed is not None:
+            seed_streams(self.seed)
+        
         # Stop menu music before switching to gameplay music
         self.sound_manager.stop_music()
-        print(f"[DEBUG] After stop_music, current_music: {self.sound_manager.current_music}")
+        logger.debug("After stop_music, current_music: %s", self.sound_manager.current_music)
         
         # DEBUG: Print which music track is about to be played
-        print(f"[DEBUG] Map: {self.maps[self.current_map] if hasattr(self, 'maps') and self.maps else 'Unknown'}, Music: starlight_end")
+        logger.debug("Map: %s, Music: starlight_end",
+                     self.maps[self.current_map] if hasattr(self, 'maps') and self.maps else 'Unknown')
         
         # Switch to map-specific music (starlight_end) and play start sound
         if not testing_mode:
             self.sound_manager.play_music('starlight_end')
             
             if self.sound_manager.sound_enabled:
-                # Temporarily lower music volume during start sound
+                # Lower music volume while the start sound plays (restored after 0.6 seconds)
                 if self.sound_manager.music_enabled:
-                    self.sound_manager.temporarily_lower_music()
+                    self.sound_manager.temporarily_lower_music(duration=600)
                 
                 self.sound_manager.play_sound('game_start')
-                
-                # Schedule music volume restoration after start sound finishes
-                pygame.time.set_timer(pygame.USEREVENT, 600)  # 0.6 second timer
         else:
             # In testing mode, just switch music without sound effects
             self.sound_manager.play_music('starlight_end')
@@ -141,6 +263,9 @@ class GameManager:
         self.powerups = pygame.sprite.Group()
         self.asteroids = pygame.sprite.Group()
         self.debris = pygame.sprite.Group()
+        self.projectile_manager.clear()
+        forget_live_sprites()  # Sprites of the previous game are dropped with its groups
+        self.particle_system.clear()
         
         # Create player
         self.player = Player(self.asset_loader.get_image('player'), self.sound_manager)
@@ -160,6 +285,7 @@ class GameManager:
         
         # Reset map variables
         self.current_map = 0
+        self._init_map_assets()
         self.enemy_types_available = ['low']  # Start with low-type enemies
         self.showing_map_name = True
         self.map_transition_timer = self.map_name_duration
@@ -170,19 +296,19 @@ class GameManager:
         
         # Enemy spawn timer
         self.enemy_spawn_delay = self.enemy_spawn_rates[0]
-        self.last_enemy_spawn = pygame.time.get_ticks()
+        self.last_enemy_spawn = get_clock().get_ticks()
         
         # Power-up spawn timer
         self.powerup_spawn_delay = POWERUP_SPAWN_DELAY
-        self.last_powerup_spawn = pygame.time.get_ticks()
+        self.last_powerup_spawn = get_clock().get_ticks()
         
         # Asteroid spawn timer
         self.asteroid_spawn_delay = 3333  # ~3.3 seconds between asteroid spawns (5000/1.5)
-        self.last_asteroid_spawn = pygame.time.get_ticks()
+        self.last_asteroid_spawn = get_clock().get_ticks()
         
         # Debris spawn timer
         self.debris_spawn_delay = 5333  # ~5.3 seconds between debris spawns (8000/1.5)
-        self.last_debris_spawn = pygame.time.get_ticks()
+        self.last_debris_spawn = get_clock().get_ticks()
         
         # Enemy speed and powerup drop chance modifiers
         self.enemy_speed_multiplier = 1.0
@@ -207,27 +333,20 @@ class GameManager:
             # Always give extra speed for better testing experience
             self.player.speed = 8    # Extra speed for testing
     
-    def handle_events(self):
-        """Handle game events."""
-        for event in pygame.event.get():
+    def handle_events(self, events=None):
+        """
+        Handle game events.
+        
+        Args:
+            events: Events to handle (defaults to the pygame event queue)
+        """
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 return False
             
-            elif event.type == pygame.USEREVENT:
-                # Restore music volume after start sound finishes
-                if self.sound_manager.music_enabled:
-                    self.sound_manager.restore_music_volume()
-                pygame.time.set_timer(pygame.USEREVENT, 0)  # Disable the timer
-            
-            elif event.type == pygame.USEREVENT + 1:
-                # Restore music volume after game over sound finishes
-                if self.sound_manager.music_enabled:
-                    self.sound_manager.restore_music_volume()
-                pygame.time.set_timer(pygame.USEREVENT + 1, 0)  # Disable the timer
-            
             elif event.type == pygame.KEYDOWN:
                 # Check for Ctrl+D to toggle the robot button
-                if event.key == pygame.K_d and pygame.key.get_mods() & pygame.KMOD_CTRL:
+                if event.key == pygame.K_d and event.mod & pygame.KMOD_CTRL:
                     self.ui_manager.toggle_robot_button()
                     # Play a sound effect for feedback
                     if 'select' in self.sound_manager.sounds:
@@ -290,12 +409,19 @@ class GameManager:
                     elif event.key == pygame.K_0:
                         # Toggle debug info
                         self.show_debug_info = not self.show_debug_info
+                    elif event.key == pygame.K_F3:
+                        # Toggle the profiler and its overlay
+                        enabled = self.profiler.toggle()
+                        logger.info(f"Profiler: {'ON' if enabled else 'OFF'}")
+                    elif event.key == pygame.K_F4:
+                        # Dump the profiler buffers to CSV
+                        self.profiler.dump_csv()
                     elif event.key == pygame.K_d:
                         # Toggle debug hitboxes
                         from src.config import DEBUG_HITBOXES
                         import src.config as config
                         config.DEBUG_HITBOXES = not config.DEBUG_HITBOXES
-                        print(f"Debug hitboxes: {'ON' if config.DEBUG_HITBOXES else 'OFF'}")
+                        logger.info(f"Debug hitboxes: {'ON' if config.DEBUG_HITBOXES else 'OFF'}")
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left mouse button
@@ -371,7 +497,7 @@ class GameManager:
                             self.boss_manager.reset()
                             
                             # Reset testing mode when returning to main menu
-                            if not pygame.key.get_mods() & pygame.KMOD_CTRL:  # Only reset if Ctrl is not held
+                            if not self.key_mods & pygame.KMOD_CTRL:  # Only reset if Ctrl is not held
                                 self.testing_mode = False
                                 self.ui_manager.testing_panel_open = False
                                 self.ui_manager.show_robot_button = False
@@ -388,7 +514,7 @@ class GameManager:
                         for i, phase in enumerate(self.phase_manager.phases):
                             if hasattr(phase, 'rect') and phase.rect.collidepoint(event.pos):
                                 self.phase_manager.skip_to_phase(i)
-                                print(f"Skipped to phase: {phase.name} (Time: {phase.time_threshold})")
+                                logger.info(f"Skipped to phase: {phase.name} (Time: {phase.time_threshold})")
                                 break
             
             elif event.type == pygame.MOUSEBUTTONUP:
@@ -402,9 +528,17 @@ class GameManager:
     
     def update(self):
         """Update game state."""
+        profiler = self.profiler
+        t = profiler.start()
+        
+        # Sprites killed last frame are no longer referenced and can be reused
+        collect_pools()
+        
+        # Advance music crossfades and ducking, close the sound effect counters
+        self.sound_manager.update()
+        
         # Update stars and background
-        for star in self.stars:
-            star.update()
+        self.stars.update()
         
         if self.game_state == self.GAME_STATE_PLAYING:
             self.background_manager.update()
@@ -435,10 +569,12 @@ class GameManager:
                         self.show_chapter_header = True  # Now show the chapter header at the top
                         # Reset the game timer to 0:00 when chapter showcase ends
                         self.phase_manager.game_time = 0
-                        self.phase_manager.last_update_time_ms = time.time() * 1000
+                        self.phase_manager.last_update_time_ms = get_clock().time() * 1000
+                t = profiler.lap('update.background', t)
                 
                 # Update player and sprites
                 self.player.update()
+                t = profiler.lap('update.player', t)
                 
                 # Apply speed multiplier to enemies
                 for enemy in self.enemies:
@@ -446,9 +582,15 @@ class GameManager:
                 
                 # Update all sprites
                 self.enemies.update()
+                t = profiler.lap('update.enemies', t)
                 self.powerups.update()
                 self.asteroids.update()
                 self.debris.update()
+                t = profiler.lap('update.hazards', t)
+                self.projectile_manager.update(self.player.rect.center)
+                t = profiler.lap('update.projectiles', t)
+                self.particle_system.update(get_clock().dt)
+                t = profiler.lap('update.particles', t)
                 
                 # Update bosses
                 boss_spawned = self.boss_manager.update()
@@ -457,13 +599,15 @@ class GameManager:
                 if self.boss_manager.has_active_boss():
                     # Switch to boss music if we're not already playing it
                     if self.sound_manager.get_current_track() != 'boss_battle':
-                        print("[DEBUG] Switching to boss battle music")
+                        logger.info("Switching to boss battle music")
                         self.sound_manager.switch_music('boss_battle')
                 else:
                     # Only switch back to gameplay music if we were playing boss music and there's no active boss
                     if self.sound_manager.get_current_track() == 'boss_battle':
-                        print("[DEBUG] Boss defeated, switching back to gameplay music")
+                        if throttle('game.music_switch'):
+                            logger.info("Boss defeated, switching back to gameplay music")
                         self.sound_manager.switch_music('starlight_end')
+                t = profiler.lap('update.bosses', t)
                 
                 # Update phase manager based on time
                 self.phase_manager.update()
@@ -471,7 +615,7 @@ class GameManager:
                 # Check if we should spawn an asteroid during boss fights
                 if self.boss_manager.has_active_boss() and self.phase_manager.should_spawn_boss_asteroid():
                     # Spawn an asteroid during boss fight
-                    asteroid = Asteroid(self.asset_loader.images, self.sound_manager)
+                    asteroid = get_pool(Asteroid).acquire(self.asset_loader.images, self.sound_manager)
                     self.asteroids.add(asteroid)
                     self.all_sprites.add(asteroid)
                 
@@ -480,6 +624,7 @@ class GameManager:
                     self.boss_warning_timer -= 1
                     if self.boss_warning_timer <= 0:
                         self.showing_boss_warning = False
+                t = profiler.lap('update.phases', t)
                 
                 # Only spawn entities if timer has started, no boss is active, and enemy spawn cooldown is over
                 if (not self.showing_map_name and 
@@ -492,7 +637,7 @@ class GameManager:
                     
                     # Spawn enemies if available in current phase
                     if self.enemy_types_available:
-                        now = pygame.time.get_ticks()
+                        now = get_clock().get_ticks()
                         if now - self.last_enemy_spawn > self.enemy_spawn_delay * spawn_rate_multiplier:
                             self.last_enemy_spawn = now
                             
@@ -509,7 +654,8 @@ class GameManager:
                                 for _ in range(super_boost):
                                     weighted_types.append('super')
                                     
-                                print("Super enemy spawn chance boosted by 25%")
+                                if throttle('game.super_boost', 5000):
+                                    logger.debug("Super enemy spawn chance boosted by 25%")
                             
                             # Also boost elite enemies if available
                             if 'elite' in self.enemy_types_available:
@@ -522,7 +668,7 @@ class GameManager:
                                     weighted_types.append('elite')
                             
                             # Select from weighted list
-                            enemy_type = random.choice(weighted_types)
+                            enemy_type = rng.choice(weighted_types)
                             
                             # Check if we're trying to spawn a super-type enemy
                             if enemy_type == 'super':
@@ -540,10 +686,10 @@ class GameManager:
                             # Create enemy with behavior manager
                             if enemy_type == 'super':
                                 # Use the specialized SuperEnemyEnhanced class for super-type enemies
-                                enemy = SuperEnemyEnhanced(self.asset_loader.images, self.enemy_behavior_manager)
+                                enemy = get_pool(SuperEnemyEnhanced).acquire(self.asset_loader.images, self.enemy_behavior_manager)
                             else:
                                 # Use the regular Enemy class for other enemy types
-                                enemy = EnhancedEnemy(enemy_type, self.asset_loader.images, self.enemy_behavior_manager)
+                                enemy = get_pool(EnhancedEnemy).acquire(enemy_type, self.asset_loader.images, self.enemy_behavior_manager)
                                 
                             enemy.points = self.enemy_points[enemy_type]  # Set points based on enemy type
                             enemy.speed_multiplier = self.enemy_speed_multiplier  # Apply speed multiplier
@@ -555,10 +701,10 @@ class GameManager:
                     # Spawn asteroids after 30 seconds
                     current_phase = self.phase_manager.get_current_phase()
                     if current_phase and current_phase.time_threshold >= 30:
-                        now = pygame.time.get_ticks()
+                        now = get_clock().get_ticks()
                         if now - self.last_asteroid_spawn > self.asteroid_spawn_delay * spawn_rate_multiplier:
                             self.last_asteroid_spawn = now
-                            asteroid = Asteroid(self.asset_loader.images, self.sound_manager)
+                            asteroid = get_pool(Asteroid).acquire(self.asset_loader.images, self.sound_manager)
                             
                             # Apply powerup drop chance modifier
                             base_drop_chance = asteroid.powerup_drop_chance
@@ -570,10 +716,10 @@ class GameManager:
                     
                     # Spawn debris after 45 seconds
                     if current_phase and current_phase.time_threshold >= 45:
-                        now = pygame.time.get_ticks()
+                        now = get_clock().get_ticks()
                         if now - self.last_debris_spawn > self.debris_spawn_delay * spawn_rate_multiplier:
                             self.last_debris_spawn = now
-                            debris = Debris(self.asset_loader.images)
+                            debris = get_pool(Debris).acquire(self.asset_loader.images)
                             
                             # Apply speed multiplier if in super monsters phase or later
                             if current_phase and current_phase.time_threshold >= 60:
@@ -584,106 +730,92 @@ class GameManager:
                 else:
                     # Decrease enemy spawn cooldown if it's active
                     if self.enemy_spawn_cooldown > 0:
-                        self.enemy_spawn_cooldown -= 1/60  # Decrease by 1 second per 60 frames
+                        self.enemy_spawn_cooldown -= get_clock().dt  # Count down in simulation seconds
+                t = profiler.lap('update.spawning', t)
+                
+                # Rebuild the collision broadphase from this frame's positions
+                self._rebuild_collision_grid()
+                collisions = self.collision_manager
+                t = profiler.lap('collide.broadphase', t)
                 
                 # Check for bullet collisions with enemies
                 for enemy in list(self.enemies):  # Use a copy of the list to avoid modification during iteration
-                    for bullet in list(self.player.bullets):  # Use a copy of the list to avoid modification during iteration
-                        if enemy.hitbox.colliderect(bullet.hitbox):
-                            # Apply damage to enemy
-                            bullet.kill()
+                    for bullet in collisions.query(enemy.hitbox, LAYER_ENEMY, LAYER_PLAYER_BULLET, enemy):
+                        # Apply damage to enemy
+                        bullet.kill()
+                        
+                        # Check if enemy is destroyed
+                        if enemy.take_damage(1):
+                            # Apply score multiplier if active
+                            points = enemy.points * self.player.score_multiplier
+                            self.score += points
                             
-                            # Check if enemy is destroyed
-                            if enemy.take_damage(1):
-                                # Apply score multiplier if active
-                                points = enemy.points * self.player.score_multiplier
-                                self.score += points
-                                
-                                # The enemy's take_damage method will handle starting the death animation
-                                # The enemy will be removed automatically when the animation completes
+                            # The enemy's take_damage method will handle starting the death animation
+                            # The enemy will be removed automatically when the animation completes
+                t = profiler.lap('collide.enemies', t)
                 
                 # Check for bullet collisions with asteroids
                 for asteroid in self.asteroids:
-                    for bullet in self.player.bullets:
-                        if asteroid.hitbox.colliderect(bullet.hitbox):
-                            bullet.kill()
-                            if asteroid.take_damage(1):
-                                # Asteroid destroyed, check if it should drop a powerup
-                                if asteroid.should_drop_powerup():
-                                    powerup = PowerUp(self.asset_loader.images, powerup_type=asteroid.powerup_type)
-                                    powerup.rect.center = asteroid.rect.center
-                                    self.powerups.add(powerup)
-                                    self.all_sprites.add(powerup)
-                                
-                                # Apply score multiplier if active
-                                points = asteroid.points * self.player.score_multiplier
-                                self.score += points
+                    for bullet in collisions.query(asteroid.hitbox, LAYER_ASTEROID, LAYER_PLAYER_BULLET, asteroid):
+                        bullet.kill()
+                        if asteroid.take_damage(1):
+                            # Asteroid destroyed, check if it should drop a powerup
+                            if asteroid.should_drop_powerup():
+                                powerup = get_pool(PowerUp).acquire(self.asset_loader.images, powerup_type=asteroid.powerup_type)
+                                powerup.rect.center = asteroid.rect.center
+                                self.powerups.add(powerup)
+                                self.all_sprites.add(powerup)
+                            
+                            # Apply score multiplier if active
+                            points = asteroid.points * self.player.score_multiplier
+                            self.score += points
+                t = profiler.lap('collide.asteroids', t)
                 
                 # Check for bullet collisions with debris
                 for debris_obj in self.debris:
-                    for bullet in self.player.bullets:
-                        if debris_obj.hitbox.colliderect(bullet.hitbox):
-                            bullet.kill()
-                            if debris_obj.take_damage(1):
-                                # Apply score multiplier if active
-                                points = debris_obj.points * self.player.score_multiplier
-                                self.score += points
-                                debris_obj.kill()
+                    for bullet in collisions.query(debris_obj.hitbox, LAYER_DEBRIS, LAYER_PLAYER_BULLET, debris_obj):
+                        bullet.kill()
+                        if debris_obj.take_damage(1):
+                            # Apply score multiplier if active
+                            points = debris_obj.points * self.player.score_multiplier
+                            self.score += points
+                            debris_obj.kill()
+                t = profiler.lap('collide.debris', t)
                 
                 # Handle all boss-related collisions
                 self.boss_manager.handle_collisions(self.player)
+                t = profiler.lap('collide.bosses', t)
+                
+                # Check for player collision with enemy bullets (one vectorized test for the whole pool)
+                projectiles = self.projectile_manager
+                hit_indices = projectiles.collide_rect(self.player.hitbox)
+                # Confirm the rect hits against the ship's pixel mask
+                hit_indices = [i for i in hit_indices
+                               if collisions.narrowphase(self.player, projectiles.get_rect(i))]
+                for i in hit_indices:
+                    # Apply damage to player
+                    source_id = f"enemy_bullet_{projectiles.owner[i]}_{projectiles.serial[i]}"
+                    damage_applied = self.player.take_damage(
+                        self.testing_mode and self.ui_manager.god_mode,
+                        source_id=source_id,
+                        damage=int(projectiles.damage[i])
+                    )
+                    
+                    if damage_applied and self.player.health <= 0:
+                        self.game_state = self.GAME_STATE_GAME_OVER
+                        self.game_active = False
+                        # Play game over sound
+                        self.sound_manager.play_sound('game_over')
+                
+                # Remove the bullets that hit
+                projectiles.remove(hit_indices)
+                t = profiler.lap('collide.projectiles', t)
                 
                 # Check for player collision with enemies
+                body_hits = collisions.query(self.player.hitbox, LAYER_PLAYER, LAYER_ENEMY, self.player)
                 for enemy in self.enemies:
-                    # Check for collision with enemy bullets
-                    if hasattr(enemy, 'bullets'):
-                        for bullet in list(enemy.bullets):
-                            # Create a bullet rect for collision detection based on direction
-                            if 'direction' in bullet and bullet['direction'] == 'left':
-                                # Horizontal bullet (moving left)
-                                bullet_rect = pygame.Rect(
-                                    bullet['x'] - bullet['width'] // 2,
-                                    bullet['y'] - bullet['height'] // 2,
-                                    bullet['width'],
-                                    bullet['height']
-                                )
-                            elif 'vx' in bullet and 'vy' in bullet:
-                                # Bullet with velocity components (for super enemies)
-                                bullet_rect = pygame.Rect(
-                                    bullet['x'] - bullet['width'] // 2,
-                                    bullet['y'] - bullet['height'] // 2,
-                                    bullet['width'],
-                                    bullet['height']
-                                )
-                            else:
-                                # Vertical bullet (moving down)
-                                bullet_rect = pygame.Rect(
-                                    bullet['x'] - bullet['width'] // 2,
-                                    bullet['y'],
-                                    bullet['width'],
-                                    bullet['height']
-                                )
-                            
-                            if self.player.hitbox.colliderect(bullet_rect):
-                                # Remove the bullet
-                                enemy.bullets.remove(bullet)
-                                
-                                # Apply damage to player
-                                source_id = f"enemy_bullet_{enemy.rect.x}_{enemy.rect.y}"
-                                damage_applied = self.player.take_damage(
-                                    self.testing_mode and self.ui_manager.god_mode,
-                                    source_id=source_id,
-                                    damage=bullet['damage']
-                                )
-                                
-                                if damage_applied and self.player.health <= 0:
-                                    self.game_state = self.GAME_STATE_GAME_OVER
-                                    self.game_active = False
-                                    # Play game over sound
-                                    self.sound_manager.play_sound('game_over')
-                    
                     # Check for collision with enemy body
-                    if self.player.hitbox.colliderect(enemy.hitbox):
+                    if enemy in body_hits:
                         # Use the new take_damage method with source ID for cooldown
                         source_id = f"enemy_{enemy.rect.x}_{enemy.rect.y}"
                         damage_applied = self.player.take_damage(
@@ -734,15 +866,14 @@ class GameManager:
                             # Play shield break sound
                             self.sound_manager.play_sound('explosion')  # Use explosion sound for now
                             enemy.shield_break_sound_played = True
-                            # Lower music volume for game over sound
+                            # Lower music volume for game over sound (restored after 1.5 seconds)
                             if self.sound_manager.music_enabled:
                                 self.sound_manager.temporarily_lower_music(duration=1500)
-                            # Schedule music volume restoration
-                            pygame.time.set_timer(pygame.USEREVENT + 1, 1500)  # 1.5 seconds
+                t = profiler.lap('collide.player_enemies', t)
                 
                 # Check for player collision with debris
-                for debris_obj in self.debris:
-                    if self.player.hitbox.colliderect(debris_obj.hitbox):
+                for debris_obj in collisions.query(self.player.hitbox, LAYER_PLAYER, LAYER_DEBRIS, self.player):
+                    if debris_obj.alive():
                         # Use the take_damage method with source ID for cooldown
                         source_id = f"debris_{debris_obj.rect.x}_{debris_obj.rect.y}"
                         damage_applied = self.player.take_damage(
@@ -759,20 +890,49 @@ class GameManager:
                             self.game_active = False
                             # Play game over sound
                             self.sound_manager.play_sound('game_over')
-                            # Lower music volume for game over sound
+                            # Lower music volume for game over sound (restored after 1.5 seconds)
                             if self.sound_manager.music_enabled:
                                 self.sound_manager.temporarily_lower_music(duration=1500)
-                            # Schedule music volume restoration
-                            pygame.time.set_timer(pygame.USEREVENT + 1, 1500)  # 1.5 seconds
+                t = profiler.lap('collide.player_debris', t)
                 
                 # Check for player collision with power-ups
-                for powerup in self.powerups:
-                    if self.player.hitbox.colliderect(powerup.hitbox):
+                for powerup in collisions.query(self.player.hitbox, LAYER_PLAYER, LAYER_POWERUP):
+                    if powerup.alive():
                         self.player.apply_powerup(powerup.type)
                         # Play powerup sound
                         self.sound_manager.play_sound('powerup')
                         powerup.kill()
+                t = profiler.lap('collide.pickups', t)
+                
+                # Entity counts shown next to the timings
+                if profiler.enabled:
+                    profiler.set_count('enemies', len(self.enemies))
+                    profiler.set_count('bullets', len(self.player.bullets))
+                    profiler.set_count('projectiles', self.projectile_manager.count)
+                    profiler.set_count('particles', self.particle_system.count)
+                    profiler.set_count('hazards', len(self.asteroids) + len(self.debris))
+                    profiler.set_count('pair tests', self.collision_manager.get_frame_stats()['pair_tests'])
+                    profiler.set_count('mask rejections', self.collision_manager.get_frame_stats()['mask_rejections'])
     
+    def _rebuild_collision_grid(self):
+        """Insert every collidable entity into the broadphase for this frame."""
+        collisions = self.collision_manager
+        collisions.begin_frame()
+
+        collisions.insert(self.player, self.player.hitbox, LAYER_PLAYER)
+        collisions.insert_group(self.player.bullets, LAYER_PLAYER_BULLET)
+        collisions.insert_group(self.enemies, LAYER_ENEMY)
+        collisions.insert_group(self.asteroids, LAYER_ASTEROID)
+        collisions.insert_group(self.debris, LAYER_DEBRIS)
+        collisions.insert_group(self.powerups, LAYER_POWERUP)
+
+        # Bosses and their bullets
+        for boss in (self.boss_manager.mini_boss, self.boss_manager.main_boss):
+            if boss and hasattr(boss, 'hitbox'):
+                collisions.insert(boss, boss.hitbox, LAYER_BOSS)
+                if hasattr(boss, 'bullets'):
+                    collisions.insert_group(boss.bullets, LAYER_BOSS_BULLET)
+
     def update_enemy_types(self):
         """Update available enemy types based on score."""
         # Use the phase manager to update phases based on score
@@ -819,6 +979,9 @@ class GameManager:
     
     def draw(self):
         """Draw the game screen."""
+        profiler = self.profiler
+        t = profiler.start()
+        
         # Fill with deep space color for Starlight's End
         deep_space = (5, 5, 15)  # Very dark blue-black
         self.screen.fill(deep_space)
@@ -826,10 +989,11 @@ class GameManager:
         # Draw themed background elements
         if self.game_state == self.GAME_STATE_PLAYING or self.game_state == self.GAME_STATE_RESPAWNING:
             self.background_manager.draw(self.screen)
+        t = profiler.lap('draw.background', t)
         
         # Draw stars
-        for star in self.stars:
-            star.draw(self.screen)
+        self.stars.draw(self.screen)
+        t = profiler.lap('draw.stars', t)
         
         if not self.ui_manager.settings_open:
             if (self.game_state == self.GAME_STATE_PLAYING or self.game_state == self.GAME_STATE_RESPAWNING) and self.player:
@@ -840,10 +1004,16 @@ class GameManager:
                 # Draw player bullets with enhanced effects
                 for bullet in self.player.bullets:
                     bullet.draw(self.screen)
+                t = profiler.lap('draw.sprites', t)
                 
                 # Draw enemies with enhanced effects
                 for enemy in self.enemies:
                     enemy.draw(self.screen)
+                t = profiler.lap('draw.enemies', t)
+                
+                # Draw enemy projectiles
+                self.projectile_manager.draw(self.screen)
+                t = profiler.lap('draw.projectiles', t)
                     
                 # Draw game timer below chapter title (or boss timer if boss is active)
                 self.phase_manager.draw_game_timer(self.screen)
@@ -859,6 +1029,7 @@ class GameManager:
                 # Draw boss warning effect if active
                 if self.showing_boss_warning:
                     self.phase_manager.draw_boss_warning(self.screen, self.boss_warning_type)
+                t = profiler.lap('draw.phases', t)
                 
                 # Draw asteroids with enhanced effects
                 for asteroid in self.asteroids:
@@ -871,14 +1042,20 @@ class GameManager:
                 # Draw powerups with enhanced effects
                 for powerup in self.powerups:
                     powerup.draw(self.screen)
+                t = profiler.lap('draw.hazards', t)
                 
                 # Draw bosses
                 self.boss_manager.draw(self.screen)
+                t = profiler.lap('draw.bosses', t)
+                
+                # Draw explosion particles on top of everything they came from
+                self.particle_system.draw(self.screen)
+                t = profiler.lap('draw.particles', t)
                 
                 # Show current map name at the top only after intro
                 if self.show_chapter_header:
-                    map_font = pygame.font.SysFont('Arial', 22)
-                    map_text = map_font.render(f"Chapter {self.current_map + 1}: {self.maps[self.current_map]}", True, (255, 255, 255))
+                    map_font = get_font('Arial', 22)
+                    map_text = render_text(map_font, f"Chapter {self.current_map + 1}: {self.maps[self.current_map]}", True, (255, 255, 255))
                     self.screen.blit(map_text, (SCREEN_WIDTH // 2 - map_text.get_width() // 2, 10))
                 
                 # Show map name during transition
@@ -889,11 +1066,11 @@ class GameManager:
                     self.screen.blit(overlay, (0, SCREEN_HEIGHT // 2 - 60))
                     
                     # Draw chapter and map name
-                    chapter_font = pygame.font.SysFont('Arial', 28)
-                    map_font = pygame.font.SysFont('Arial', 36)
+                    chapter_font = get_font('Arial', 28)
+                    map_font = get_font('Arial', 36)
                     
-                    chapter_text = chapter_font.render(f"Chapter {self.current_map + 1}:", True, (200, 200, 255))
-                    map_name = map_font.render(self.maps[self.current_map], True, (255, 255, 255))
+                    chapter_text = render_text(chapter_font, f"Chapter {self.current_map + 1}:", True, (200, 200, 255))
+                    map_name = render_text(map_font, self.maps[self.current_map], True, (255, 255, 255))
                     
                     self.screen.blit(chapter_text, (SCREEN_WIDTH // 2 - chapter_text.get_width() // 2, SCREEN_HEIGHT // 2 - 40))
                     self.screen.blit(map_name, (SCREEN_WIDTH // 2 - map_name.get_width() // 2, SCREEN_HEIGHT // 2))
@@ -908,18 +1085,18 @@ class GameManager:
                 
                 # Show score multiplier if active
                 if self.player.score_multiplier > 1:
-                    multiplier_font = pygame.font.SysFont('Arial', 22)
-                    multiplier_text = multiplier_font.render(f"Score x{self.player.score_multiplier}", True, (255, 215, 0))  # Gold color
+                    multiplier_font = get_font('Arial', 22)
+                    multiplier_text = render_text(multiplier_font, f"Score x{self.player.score_multiplier}", True, (255, 215, 0))  # Gold color
                     self.screen.blit(multiplier_text, (SCREEN_WIDTH - multiplier_text.get_width() - 10, 40))
                     
                     # Show remaining time
                     time_left = self.player.score_multiplier_timer // 60  # Convert frames to seconds
-                    time_text = multiplier_font.render(f"Time: {time_left}s", True, (255, 215, 0))
+                    time_text = render_text(multiplier_font, f"Time: {time_left}s", True, (255, 215, 0))
                     self.screen.blit(time_text, (SCREEN_WIDTH - time_text.get_width() - 10, 70))
                 
                 # Show debug info if enabled
                 if self.show_debug_info and self.testing_mode:
-                    debug_font = pygame.font.SysFont('Arial', 16)
+                    debug_font = get_font('Arial', 16)
                     debug_info = [
                         f"Testing Mode: Active",
                         f"FPS: {int(self.clock.get_fps())}",
@@ -931,11 +1108,23 @@ class GameManager:
                         f"Mini-Boss: {'Active' if self.boss_manager.mini_boss else 'Inactive'}",
                         f"Main Boss: {'Active' if self.boss_manager.main_boss else 'Inactive'}",
                         f"Enemy Types: {', '.join(self.enemy_types_available)}",
+                        f"Collision Tests: {self.collision_manager.get_frame_stats()['pair_tests']} "
+                        f"(naive {self.collision_manager.get_frame_stats()['naive_pair_tests']})",
+                        f"Mask Tests: {self.collision_manager.get_frame_stats()['mask_tests']} "
+                        f"({self.collision_manager.get_frame_stats()['mask_rejections']} rejected)",
+                        f"Text Cache: {get_font_manager().get_stats()['hits']} hits / {get_font_manager().get_stats()['misses']} misses",
+                        f"Glow Cache: {get_glow_cache().get_stats()['hits']} hits / {get_glow_cache().get_stats()['misses']} misses",
+                        f"Tint Cache: {get_tint_cache().get_stats()['hits']} hits / {get_tint_cache().get_stats()['misses']} misses",
+                        f"Pools: {sum(p['hits'] for p in get_pool_stats().values())} reused / "
+                        f"{sum(p['misses'] for p in get_pool_stats().values())} built",
+                        f"UI Renders: {sum(self.ui_manager.get_render_counts().values())}",
+                        f"SFX: {self.sound_manager.voices.get_total_stats()['merged']} merged / "
+                        f"{self.sound_manager.voices.get_total_stats()['dropped']} dropped",
                         f"Debug Hitboxes: {'ON' if DEBUG_HITBOXES else 'OFF'} (Press D to toggle)"
                     ]
                     
                     for i, info in enumerate(debug_info):
-                        text = debug_font.render(info, True, (200, 200, 200))
+                        text = render_text(debug_font, info, True, (200, 200, 200))
                         self.screen.blit(text, (10, 80 + i * 20))
                 
                 # Draw phase markers in testing mode
@@ -956,6 +1145,7 @@ class GameManager:
             elif self.game_state == self.GAME_STATE_MENU:
                 # Show start screen
                 self.ui_manager.show_start_screen(self.screen, self.testing_mode)
+                t = profiler.lap('draw.menu', t)
         else:
             # Draw settings panel - pass the current game state
             self.ui_manager.draw_settings_panel(self.screen, self.game_state)
@@ -967,27 +1157,138 @@ class GameManager:
         # Always draw the settings button
         self.ui_manager.draw_settings_button(self.screen)
         
+        # Draw the profiler overlay on top of everything in testing mode
+        if self.testing_mode and profiler.visible:
+            profiler.draw_overlay(self.screen)
+        t = profiler.lap('draw.ui', t)
+        
         # Update the display
-        pygame.display.flip()
+        if not self.headless:
+            pygame.display.flip()
+            profiler.lap('draw.flip', t)
     
     def run(self):
         """Run the main game loop."""
         running = True
         while running:
-            # Handle events
-            running = self.handle_events()
+            # Recorded input while a replay lasts, then the keyboard
+            frame_input = self.replay.next_frame() if self.replay else None
+            if frame_input is None:
+                if self.replay:
+                    logger.info("Replay finished, switching to live input")
+                    self.replay = None
+                frame_input = FrameInput.poll()
+            else:
+                # Keep the window responsive; only a quit request is taken from the real queue
+                if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                    break
             
-            # Update game state
-            self.update()
-            
-            # Draw the screen
-            self.draw()
+            running = self.run_frame(frame_input)
             
             # Cap the frame rate
             self.clock.tick(FPS)
         
+        self.stop_recording()
         pygame.quit()
         sys.exit()
+    
+    def run_frame(self, frame_input):
+        """
+        Run one frame: handle input, update, draw and advance the clock.
+        
+        Args:
+            frame_input (FrameInput): Held keys, modifiers and events for the frame,
+                                      plus the step to advance by when replaying
+        
+        Returns:
+            bool: False if a quit event was received, True otherwise
+        """
+        profiler = self.profiler
+        frame_start = t = profiler.start()
+        
+        # Handle events
+        self.key_mods = frame_input.mods
+        running = self.handle_events(frame_input.events)
+        # Held keys go to the player after events, so a player created this frame gets them too
+        if self.player:
+            self.player.key_state = KeyState(frame_input.keys)
+        t = profiler.lap('frame.events', t)
+        
+        # Update game state
+        self.update()
+        t = profiler.lap('frame.update', t)
+        
+        # Draw the screen
+        if self.render:
+            self.draw()
+            profiler.lap('frame.draw', t)
+        profiler.lap('frame.total', frame_start)
+        profiler.end_frame()
+        
+        # Startup work deferred past the first frame, one task per frame
+        if not self.first_frame_shown:
+            self.first_frame_shown = True
+            get_startup_trace().mark('first_frame')
+        elif self.deferred_init:
+            self._run_deferred_init()
+        
+        # Advance simulation time
+        step = self.game_clock.tick(frame_input.step)
+        if self.recorder:
+            self.recorder.record(frame_input, step, self)
+        if self.replay:
+            self.replay.verify(self)
+        return running
+    
+    def step(self, n_frames=1, inputs=None):
+        """
+        Advance the simulation by a number of frames without waiting on real time.
+        
+        Args:
+            n_frames (int): Number of frames to simulate
+            inputs: Keys held by the player. Either None, a collection of pygame key
+                    codes held for every frame, a sequence with one collection per
+                    frame, or a callable taking the frame index and returning one
+        
+        Returns:
+            bool: False if a quit event was received, True otherwise
+        """
+        per_frame = isinstance(inputs, (list, tuple)) and inputs and not isinstance(inputs[0], int)
+        held = tuple(inputs) if inputs is not None and not per_frame and not callable(inputs) else ()
+        
+        for frame in range(n_frames):
+            # Scripted input for the player
+            if callable(inputs):
+                keys = inputs(frame)
+            elif per_frame:
+                keys = inputs[frame] if frame < len(inputs) else ()
+            else:
+                keys = held
+            
+            if not self.run_frame(FrameInput(keys, 0, pygame.event.get())):
+                return False
+        
+        return True
+    
+    def start_recording(self, path, start_in_game=False, invulnerable=False):
+        """
+        Record every following frame's input to a replay file.
+        
+        Args:
+            path (str): Replay file to write
+            start_in_game (bool): The session starts in a running game rather than the menu
+            invulnerable (bool): The player was made invulnerable for the session
+        """
+        self.stop_recording()
+        self.recorder = InputRecorder(path, self.seed, self.game_clock.fixed_step,
+                                      start_in_game=start_in_game, invulnerable=invulnerable)
+        logger.info(f"Recording input to {path} (seed {self.seed})")
+    
+    def stop_recording(self):
+        """Finish and close the replay file being recorded, if any."""
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
 
     def initialize_boss(self, boss_type):
         """Initialize a boss of the specified type and add it to the game."""
@@ -1037,13 +1338,14 @@ class GameManager:
         
         # Make player temporarily invulnerable
         self.player.invulnerable = True
-        self.player.invulnerable_timer = pygame.time.get_ticks()
+        self.player.invulnerable_timer = get_clock().get_ticks()
         self.player.invulnerable_duration = 3000  # 3 seconds of invulnerability after respawn
         
-        # Clear nearby enemies for safety
+        # Clear nearby enemies and projectiles for safety
         for enemy in self.enemies:
             if enemy.rect.x < SCREEN_WIDTH // 2:
                 enemy.kill()
+        self.projectile_manager.clear()
                 
         # Play respawn sound if available
         if 'powerup' in self.sound_manager.sounds:
@@ -1056,13 +1358,13 @@ class GameManager:
         # Reset UI respawn state
         self.ui_manager.respawning = False
             
-        print("Player respawned in test mode")
+        logger.info("Player respawned in test mode")
     def handle_player_death(self):
         """Handle player death based on game mode."""
         if self.testing_mode and not self.ui_manager.god_mode:
             # In test mode without god mode, start respawn countdown instead of game over
             self.ui_manager.start_respawn_countdown()
-            print("Player died in test mode - starting respawn countdown")
+            logger.info("Player died in test mode - starting respawn countdown")
             return True
         else:
             # Normal game over
@@ -1070,11 +1372,9 @@ class GameManager:
             self.game_active = False
             # Play game over sound
             self.sound_manager.play_sound('game_over')
-            # Lower music volume for game over sound
+            # Lower music volume for game over sound (restored after 1.5 seconds)
             if self.sound_manager.music_enabled:
                 self.sound_manager.temporarily_lower_music(duration=1500)
-            # Schedule music volume restoration
-            pygame.time.set_timer(pygame.USEREVENT + 1, 1500)  # 1.5 seconds
             return False
     def should_use_respawn(self):
         """Check if we should use respawn instead of game over."""
@@ -3,13 +3,20 @@ Asteroid sprite for the Space Impact game.
 Asteroids are stationary objects that drop powerups when destroyed.
 """
 import pygame
-import random
 import math
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, DEBUG_HITBOXES
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, DEBUG_HITBOXES, ROTATION_STEPS
+from src.utils.game_clock import get_rng
+from src.utils.rotation_cache import get_rotation_cache
+from src.utils.tint_cache import get_tint_cache
+from src.utils.object_pool import PooledSprite
+from src.utils.log_manager import get_logger
 
-class Asteroid(pygame.sprite.Sprite):
-    def __init__(self, images, sound_manager):
-        super().__init__()
+# Random streams (seeded through the game clock module)
+rng = get_rng('asteroids')
+logger = get_logger('asteroids')
+
+class Asteroid(PooledSprite):
+    def reset(self, images, sound_manager):
         self.image = images.get('asteroid')
         self.sound_manager = sound_manager
         
@@ -20,11 +27,13 @@ class Asteroid(pygame.sprite.Sprite):
             self.image.fill((150, 150, 150))  # Gray for asteroid
         
         self.rect = self.image.get_rect()
-        self.original_image = self.image.copy()
+        # Shared (not copied) so every asteroid uses the same cached rotations
+        self.original_image = self.image
+        self.rotation_cache = get_rotation_cache(ROTATION_STEPS)
         
         # Position the asteroid at a random position on the right side of the screen
-        self.rect.x = SCREEN_WIDTH + random.randint(50, 200)
-        self.rect.y = random.randint(50, SCREEN_HEIGHT - 50)
+        self.rect.x = SCREEN_WIDTH + rng.randint(50, 200)
+        self.rect.y = rng.randint(50, SCREEN_HEIGHT - 50)
         
         # Create a hitbox that matches the sprite size (same as enemies)
         self.hitbox = pygame.Rect(0, 0, self.rect.width, self.rect.height)
@@ -36,8 +45,9 @@ class Asteroid(pygame.sprite.Sprite):
         self.points = 45  # Points awarded for destroying (increased from 15 to 45, 3x)
         
         # Rotation properties
-        self.angle = random.randint(0, 360)
-        self.rotation_speed = random.uniform(-1.0, 1.0)  # Degrees per frame
+        self.angle = rng.randint(0, 360)
+        self.rotation_speed = rng.uniform(-1.0, 1.0)  # Degrees per frame
+        self.mask = None
         
         # Animation properties for destruction
         self.is_exploding = False
@@ -47,14 +57,14 @@ class Asteroid(pygame.sprite.Sprite):
         self.explosion_counter = 0
         
         # Powerup to drop when destroyed
-        self.powerup_type = random.choice(['health', 'speed', 'rapid_fire', 'score_multiplier'])
+        self.powerup_type = rng.choice(['health', 'speed', 'rapid_fire', 'score_multiplier'])
         
         # Chance to drop a powerup (can be modified by game phases)
         self.powerup_drop_chance = 0.3  # 30% chance (3 out of 10 asteroids)
         
         # Damage to player on collision - increased to make asteroids more dangerous
         self.collision_damage = 3  # Increased from 1 to 3 (asteroids are massive and should be very dangerous)
-        print(f"Asteroid created with collision_damage: {self.collision_damage}")
+        logger.debug("Asteroid created with collision_damage: %s", self.collision_damage)
         
         # Visual effect properties
         self.glow_alpha = 0
@@ -78,16 +88,18 @@ class Asteroid(pygame.sprite.Sprite):
             
             # Rotate the asteroid
             self.angle += self.rotation_speed
-            self.image = pygame.transform.rotate(self.original_image, self.angle)
+            frame = self.rotation_cache.get_frame(self.original_image, self.angle)
+            self.image = frame.image
+            self.mask = frame.mask
             
             # Keep the center position the same after rotation
             old_center = self.rect.center
-            self.rect = self.image.get_rect()
+            self.rect.size = frame.size
             self.rect.center = old_center
             
-            # Update hitbox position to match the rotated image
-            self.hitbox = pygame.Rect(0, 0, self.rect.width, self.rect.height)
-            self.hitbox.center = self.rect.center
+            # Update hitbox to match the rotated image
+            self.hitbox.size = frame.size
+            self.hitbox.center = old_center
             
             # Update hit flash effect
             if self.hit_flash:
@@ -132,10 +144,8 @@ class Asteroid(pygame.sprite.Sprite):
         else:
             # Draw the asteroid
             if self.hit_flash:
-                # Create a white flash effect when hit (simplified)
-                flash_surface = self.image.copy()
-                flash_surface.fill((255, 255, 255, 128), None, pygame.BLEND_RGBA_ADD)
-                surface.blit(flash_surface, self.rect)
+                # Draw the cached white flash of the current rotation frame
+                surface.blit(get_tint_cache().get_tinted(self.image, (255, 255, 255, 128)), self.rect)
             else:
                 # Draw the asteroid image
                 surface.blit(self.image, self.rect)
@@ -145,4 +155,4 @@ class Asteroid(pygame.sprite.Sprite):
                 pygame.draw.rect(surface, (150, 150, 0), self.hitbox, 1)
     def should_drop_powerup(self):
         """Determine if the asteroid should drop a powerup based on the current chance."""
-        return random.random() < self.powerup_drop_chance
+        return rng.random() < self.powerup_drop_chance
@@ -3,8 +3,19 @@ Boss class for Space Impact game.
 """
 import pygame
 import math
-import random
-from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, DEBUG_HITBOXES
+from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, DEBUG_HITBOXES, ROTATION_STEPS
+from ..utils.game_clock import get_clock, get_rng
+from ..utils.font_manager import get_font, render_text
+from ..utils.rotation_cache import get_rotation_cache
+from ..utils.tint_cache import get_tint_cache
+from ..utils.trail_system import Trail, get_trail_system
+from ..utils.object_pool import PooledSprite, get_pool, empty_group
+from ..utils.log_manager import get_logger, throttle
+
+# Random streams (seeded through the game clock module)
+rng = get_rng('bosses')
+fx_rng = get_rng('fx')
+logger = get_logger('boss')
 
 class Boss(pygame.sprite.Sprite):
     """Boss enemy class."""
@@ -176,7 +187,7 @@ class Boss(pygame.sprite.Sprite):
         self.dying = False
         self.death_start_time = 0
         self.death_duration = 2000  # 2 seconds
-        self.explosion_particles = []
+        self.particle_system = None  # Shared particle system, set by the boss manager
         
         # Load health bar images
         self.health_bar_bg = asset_loader.get_image('health_bar_bg')
@@ -231,14 +242,14 @@ class Boss(pygame.sprite.Sprite):
         if self.boss_type == 'main' and hasattr(self, 'has_shield') and self.has_shield and not self.shield_active:
             # Check if enough time has passed since last hit (30 seconds)
             shield_regen_delay = 30000  # 30 seconds
-            now = pygame.time.get_ticks()
+            now = get_clock().get_ticks()
             
             if now - self.last_shield_hit > shield_regen_delay:
                 # Fully restore shield
                 self.shield_health = self.max_shield_health
                 self.shield_active = True
                 self.flash_effect = 20  # Visual feedback (increased from 15)
-                print(f"Shield fully restored after 30 seconds! Shield health: {self.shield_health}/{self.max_shield_health}")
+                logger.info(f"Shield fully restored after 30 seconds! Shield health: {self.shield_health}/{self.max_shield_health}")
                 self.sound_manager.play_sound('powerup')  # Play shield reactivation sound
                 
                 # Reset last hit time to prevent immediate regeneration
@@ -263,7 +274,7 @@ class Boss(pygame.sprite.Sprite):
                 # Handle dash attack in phase 2+
                 if self.attack_phase >= 2 and not self.is_dashing:
                     # Check if it's time to dash
-                    now = pygame.time.get_ticks()
+                    now = get_clock().get_ticks()
                     if now > self.dash_cooldown:
                         # Start dash
                         self.is_dashing = True
@@ -277,7 +288,7 @@ class Boss(pygame.sprite.Sprite):
                             
                 if self.is_dashing:
                     # Execute dash
-                    now = pygame.time.get_ticks()
+                    now = get_clock().get_ticks()
                     if now < self.dash_duration:
                         # Move towards target y
                         dy = self.dash_target_y - self.rect.centery
@@ -325,34 +336,34 @@ class Boss(pygame.sprite.Sprite):
                         self.figure8_amplitude = 150
                         self.figure8_frequency = 0.02
                         self.movement_mode_duration = 360  # 6 seconds
-                        print(f"Boss switching to figure8 movement pattern")
+                        logger.debug("Boss switching to figure8 movement pattern")
                         
                     elif self.movement_mode == "circle":
                         self.circle_center_y = SCREEN_HEIGHT // 2
                         self.circle_radius = 120
                         self.circle_angle = 0
                         self.circle_speed = 0.05
-                        self.circle_direction = random.choice([-1, 1])  # Random direction
+                        self.circle_direction = rng.choice([-1, 1])  # Random direction
                         self.movement_mode_duration = 240  # 4 seconds
-                        print(f"Boss switching to circle movement pattern (direction: {self.circle_direction})")
+                        logger.debug("Boss switching to circle movement pattern (direction: %s)", self.circle_direction)
                         
                     elif self.movement_mode == "zigzag":
                         self.zigzag_points = []
                         # Create random zigzag points
                         num_points = 5
                         for i in range(num_points):
-                            x = self.entry_target_x + random.randint(-50, 50)
-                            y = random.randint(100, SCREEN_HEIGHT - 100)
+                            x = self.entry_target_x + rng.randint(-50, 50)
+                            y = rng.randint(100, SCREEN_HEIGHT - 100)
                             self.zigzag_points.append((x, y))
                         self.zigzag_current_point = 0
                         self.zigzag_speed = 5
                         self.movement_mode_duration = 300  # 5 seconds
-                        print(f"Boss switching to zigzag movement pattern with {num_points} points")
+                        logger.debug("Boss switching to zigzag movement pattern with %s points", num_points)
                         
                     elif self.movement_mode == "track_player":
                         self.tracking_speed = 3.0  # Faster tracking
                         self.movement_mode_duration = 180  # 3 seconds
-                        print(f"Boss switching to player tracking movement")
+                        logger.debug("Boss switching to player tracking movement")
                 
                 # Execute current movement mode
                 if self.movement_mode == "track_player":
@@ -427,7 +438,7 @@ class Boss(pygame.sprite.Sprite):
                             self.zigzag_current_point += 1
                             
                             # Add a small pause at each point
-                            if random.random() < 0.5:  # 50% chance to pause
+                            if rng.random() < 0.5:  # 50% chance to pause
                                 self.zigzag_pause = 10  # Pause for 10 frames
                     else:
                         # Reset to first point
@@ -452,20 +463,21 @@ class Boss(pygame.sprite.Sprite):
             self.rect.top = screen_margin
     def update_shooting(self):
         """Update boss shooting."""
-        now = pygame.time.get_ticks()
+        now = get_clock().get_ticks()
         
         # Check if it's time to shoot
         if now - self.last_shot > self.shoot_delay:
-            print(f"Time to shoot! Last shot: {self.last_shot}, now: {now}, delay: {self.shoot_delay}")
+            logger.debug("Time to shoot! Last shot: %s, now: %s, delay: %s", self.last_shot, now, self.shoot_delay)
             self.last_shot = now
             self.shoot()
         else:
-            if self.movement_timer % 60 == 0:  # Print every second (assuming 60 FPS)
-                print(f"Waiting to shoot... {(now - self.last_shot) / 1000:.1f}s / {self.shoot_delay / 1000:.1f}s")
+            if throttle('boss.waiting_to_shoot'):
+                logger.debug("Waiting to shoot... %.1fs / %.1fs", (now - self.last_shot) / 1000, self.shoot_delay / 1000)
             
     def update_entry_animation(self):
         """Update boss entry animation."""
-        print(f"Entry animation: x={self.rect.x}, target={self.entry_target_x}, speed={self.entry_speed}")
+        if throttle('boss.entry_animation'):
+            logger.debug("Entry animation: x=%s, target=%s, speed=%s", self.rect.x, self.entry_target_x, self.entry_speed)
         # Move boss from right edge to battle position
         if self.rect.right > self.entry_target_x:
             self.rect.x += self.entry_speed
@@ -473,7 +485,7 @@ class Boss(pygame.sprite.Sprite):
             # Entry complete
             self.entry_complete = True
             self.rect.right = self.entry_target_x
-            print(f"Entry animation complete! Boss ready to battle.")
+            logger.info(f"Entry animation complete! Boss ready to battle.")
             
             # Play boss arrival sound
             self.sound_manager.play_sound('explosion')
@@ -488,62 +500,22 @@ class Boss(pygame.sprite.Sprite):
         
     def update_death_animation(self):
         """Update boss death animation."""
-        now = pygame.time.get_ticks()
+        now = get_clock().get_ticks()
         progress = (now - self.death_start_time) / self.death_duration
         
         if progress >= 1.0:
             # Death animation complete
             return True
             
-        # Create explosion particles
-        if len(self.explosion_particles) < 50:
-            # Add new particles
-            for _ in range(5):
-                # Random position within boss
-                x = self.rect.centerx + random.randint(-self.rect.width//2, self.rect.width//2)
-                y = self.rect.centery + random.randint(-self.rect.height//2, self.rect.height//2)
-                
-                # Random velocity
-                vx = random.uniform(-3, 3)
-                vy = random.uniform(-3, 3)
-                
-                # Random size and lifetime
-                size = random.randint(3, 10)
-                lifetime = random.randint(20, 40)
-                
-                # Random color (red/orange/yellow)
-                r = random.randint(200, 255)
-                g = random.randint(100, 200)
-                b = random.randint(0, 100)
-                
-                # Add particle
-                self.explosion_particles.append({
-                    'x': x,
-                    'y': y,
-                    'vx': vx,
-                    'vy': vy,
-                    'size': size,
-                    'lifetime': lifetime,
-                    'color': (r, g, b)
-                })
-                
-        # Update existing particles
-        for particle in self.explosion_particles[:]:
-            # Move particle
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            
-            # Decrease lifetime
-            particle['lifetime'] -= 1
-            
-            # Remove dead particles
-            if particle['lifetime'] <= 0:
-                self.explosion_particles.remove(particle)
+        # Keep about 50 explosion particles alive over the hull
+        if self.particle_system and self.particle_system.count_owned(id(self)) < 50:
+            self.particle_system.emit(self.rect.centerx, self.rect.centery, 'boss',
+                                      area=self.rect.size, owner=id(self))
                 
         return False
     def shoot(self):
         """Shoot bullets with alternating patterns and reasonable fire rate."""
-        now = pygame.time.get_ticks()
+        now = get_clock().get_ticks()
         
         # Only shoot if boss is on screen
         if self.rect.right < 0 or self.rect.left > SCREEN_WIDTH or self.rect.bottom < 0 or self.rect.top > SCREEN_HEIGHT:
@@ -582,7 +554,7 @@ class Boss(pygame.sprite.Sprite):
                         self.laser_phase = 'firing'
                         self.laser_fire_time = now
                         self.sound_manager.play_sound('explosion')  # Laser fire sound
-                        print(f"Laser firing started!")
+                        logger.debug("Laser firing started!")
                     return
                     
                 elif self.laser_phase == 'firing':
@@ -593,7 +565,7 @@ class Boss(pygame.sprite.Sprite):
                         self.laser_phase = 'cooldown'
                         self.laser_cooldown = now
                         self.laser_active = False
-                        print(f"Laser firing ended, entering cooldown")
+                        logger.debug("Laser firing ended, entering cooldown")
                     return
                     
                 elif self.laser_phase == 'cooldown':
@@ -603,7 +575,7 @@ class Boss(pygame.sprite.Sprite):
                         # End cooldown
                         self.laser_active = False
                         self.shot_pattern = 'cone'  # Reset to cone pattern
-                        print(f"Laser cooldown ended")
+                        logger.debug("Laser cooldown ended")
                     return
             else:
                 # Initialize laser phases if not set
@@ -613,7 +585,7 @@ class Boss(pygame.sprite.Sprite):
                 self.laser_target_y = self.rect.centery
                 if hasattr(self, 'player_y_position'):
                     self.laser_target_y = self.player_y_position
-                print(f"Laser charging started at y={self.laser_target_y}!")
+                logger.debug("Laser charging started at y=%s!", self.laser_target_y)
                 return
         
         # Set a slower fire rate (2000ms = 2 seconds between shots)
@@ -635,9 +607,9 @@ class Boss(pygame.sprite.Sprite):
             # 70% chance to use laser attack when shield is down (increased from 40%), 40% otherwise
             laser_chance = 0.7 if shield_down else 0.4
             
-            if random.random() < laser_chance:
+            if rng.random() < laser_chance:
                 self.shot_pattern = 'laser'
-                print(f"Switching to laser pattern (Shield down: {shield_down})")
+                logger.debug("Switching to laser pattern (Shield down: %s)", shield_down)
                 self.laser_active = True
                 self.laser_phase = 'charging'
                 self.laser_charge_time = now
@@ -651,7 +623,7 @@ class Boss(pygame.sprite.Sprite):
             else:
                 # Alternate between cone and line patterns
                 self.shot_pattern = 'line' if self.shot_pattern == 'cone' else 'cone'
-                print(f"Switching to {self.shot_pattern} pattern")
+                logger.debug("Switching to %s pattern", self.shot_pattern)
         
         # Play sound
         self.sound_manager.play_sound('shoot')
@@ -686,7 +658,7 @@ class Boss(pygame.sprite.Sprite):
                 vy = math.sin(angle_rad) * speed
                 
                 # Create bullet
-                bullet = BossBullet(
+                bullet = get_pool(BossBullet).acquire(
                     self.rect.left, 
                     self.rect.centery, 
                     vx,
@@ -694,7 +666,7 @@ class Boss(pygame.sprite.Sprite):
                 )
                 bullet.vy = vy
                 self.bullets.add(bullet)
-                print(f"Created cone bullet at angle {angle:.1f}° targeting y={target_y}")
+                logger.debug("Created cone bullet at angle %.1f° targeting y=%s", angle, target_y)
         else:
             # Horizontal line pattern
             num_bullets = 3
@@ -709,26 +681,27 @@ class Boss(pygame.sprite.Sprite):
                 y_offset = (i - (num_bullets-1)/2) * vertical_spacing
                 
                 # Create bullet
-                bullet = BossBullet(
+                bullet = get_pool(BossBullet).acquire(
                     self.rect.left,
                     self.rect.centery + y_offset,  # Center on boss position with offset
                     -6,  # Straight left, slower
                     2    # Higher damage for line shots
                 )
                 self.bullets.add(bullet)
-                print(f"Created line bullet at y={self.rect.centery + y_offset}")
+                logger.debug("Created line bullet at y=%s", self.rect.centery + y_offset)
     def take_damage(self, damage=1, hit_position=None):
         """Handle boss taking damage."""
-        print(f"{self.boss_type} boss taking damage: {damage}")
+        logger.debug("%s boss taking damage: %s", self.boss_type, damage)
         # Prevent damage during entrance
         if not self.entry_complete:
             return False
             
         # Handle shield for main boss
         if self.boss_type == 'main' and hasattr(self, 'has_shield') and self.has_shield and self.shield_active:
-            self.last_shield_hit = pygame.time.get_ticks()
+            self.last_shield_hit = get_clock().get_ticks()
             self.shield_health -= damage
-            print(f"Boss shield damaged! Shield health: {self.shield_health}/{self.max_shield_health}")
+            if throttle('boss.shield_hit'):
+                logger.debug("Boss shield damaged! Shield health: %s/%s", self.shield_health, self.max_shield_health)
             
             # Visual feedback
             self.hit_flash = 5  # Shorter flash for shield hit
@@ -738,7 +711,7 @@ class Boss(pygame.sprite.Sprite):
                 self.shield_active = False
                 self.sound_manager.play_sound('explosion')  # Shield break sound
                 self.hit_flash = 15  # Longer flash for shield break
-                print(f"Boss shield BROKEN! Will regenerate in 30 seconds.")
+                logger.info(f"Boss shield BROKEN! Will regenerate in 30 seconds.")
                 return False  # Shield absorbed all damage
                 
             # Shield absorbed damage
@@ -771,7 +744,7 @@ class Boss(pygame.sprite.Sprite):
         previous_phase = self.attack_phase
             
         self.health -= damage
-        print(f"Boss health reduced to {self.health}/{self.max_health}")
+        logger.debug("Boss health reduced to %s/%s", self.health, self.max_health)
         self.sound_manager.play_sound('explosion')
         
         # Set hit flash effect
@@ -792,7 +765,7 @@ class Boss(pygame.sprite.Sprite):
                 self.dash_speed = 12  # Faster dashes
                 
                 # Clear bullets on phase change for cleaner transition
-                self.bullets.empty()
+                empty_group(self.bullets)
                 
                 # Play phase transition sound
                 self.sound_manager.play_sound('explosion')
@@ -806,7 +779,7 @@ class Boss(pygame.sprite.Sprite):
                 self.dash_speed = 10  # Enable dashing
                 
                 # Clear bullets on phase change for cleaner transition
-                self.bullets.empty()
+                empty_group(self.bullets)
                 
                 # Play phase transition sound
                 self.sound_manager.play_sound('explosion')
@@ -822,7 +795,7 @@ class Boss(pygame.sprite.Sprite):
             # If phase changed, apply phase-specific changes
             if new_phase != previous_phase:
                 self.attack_phase = new_phase
-                print(f"Boss entering phase {new_phase}!")
+                logger.info(f"Boss entering phase {new_phase}!")
                 
                 # Apply phase-specific changes
                 if new_phase == 3:
@@ -836,7 +809,7 @@ class Boss(pygame.sprite.Sprite):
                     self.sound_manager.play_sound('explosion')
                     
                     # Clear bullets on phase change for cleaner transition
-                    self.bullets.empty()
+                    empty_group(self.bullets)
                     
                     # If we skipped phase 2, ensure we get all phase 2 benefits as well
                     if previous_phase == 1:
@@ -853,11 +826,11 @@ class Boss(pygame.sprite.Sprite):
                     self.sound_manager.play_sound('explosion')
                     
                     # Clear bullets on phase change for cleaner transition
-                    self.bullets.empty()
+                    empty_group(self.bullets)
         
         # Check if boss is defeated
         if self.health <= 0 and not self.dying:
-            print(f"Boss defeated!")
+            logger.info(f"Boss defeated!")
             self.destroy()
             return True
         return False
@@ -865,8 +838,7 @@ class Boss(pygame.sprite.Sprite):
         """Start the boss death animation."""
         if not self.dying:
             self.dying = True
-            self.death_start_time = pygame.time.get_ticks()
-            self.explosion_particles = []
+            self.death_start_time = get_clock().get_ticks()
             self.sound_manager.play_sound('explosion')
             
     def get_player_position(self):
@@ -904,8 +876,8 @@ class Boss(pygame.sprite.Sprite):
             surface.blit(fill_surface, (bar_x + 1, bar_y + 1))
         
         # Draw the boss name and health
-        font = pygame.font.SysFont('Arial', 16)
-        text = font.render(f"{self.name}: {self.health}/{self.max_health}", True, (255, 255, 255))
+        font = get_font('Arial', 16)
+        text = render_text(font, f"{self.name}: {self.health}/{self.max_health}", True, (255, 255, 255))
         surface.blit(text, (bar_x + (self.health_bar_bg.get_width() - text.get_width()) // 2, bar_y + 16))
         
         # Draw shield bar for main boss
@@ -929,11 +901,11 @@ class Boss(pygame.sprite.Sprite):
                     pygame.draw.rect(surface, shield_color, shield_fill_rect)
                 
                 # Draw shield text
-                shield_text = font.render(f"Shield: {int(self.shield_health)}/{self.max_shield_health}", True, (200, 200, 255))
+                shield_text = render_text(font, f"Shield: {int(self.shield_health)}/{self.max_shield_health}", True, (200, 200, 255))
                 surface.blit(shield_text, (bar_x + (self.health_bar_bg.get_width() - shield_text.get_width()) // 2, shield_bar_y + 12))
             else:
                 # Shield is down, show regeneration countdown
-                now = pygame.time.get_ticks()
+                now = get_clock().get_ticks()
                 time_since_hit = now - self.last_shield_hit
                 regen_time = 30000  # 30 seconds
                 time_left = max(0, (regen_time - time_since_hit) / 1000)  # Convert to seconds
@@ -952,7 +924,7 @@ class Boss(pygame.sprite.Sprite):
                         pygame.draw.rect(surface, regen_color, regen_rect)
                 
                 # Draw countdown text
-                countdown_text = font.render(f"Shield Regenerating: {int(time_left)}s", True, (255, 200, 100))
+                countdown_text = render_text(font, f"Shield Regenerating: {int(time_left)}s", True, (255, 200, 100))
                 surface.blit(countdown_text, (bar_x + (self.health_bar_bg.get_width() - countdown_text.get_width()) // 2, shield_bar_y + 12))
     
     def draw(self, surface):
@@ -976,7 +948,7 @@ class Boss(pygame.sprite.Sprite):
                 alpha = 180 - i * 20
                 
                 # Pulse the trail color
-                pulse = (math.sin(pygame.time.get_ticks() * 0.01) + 1) / 2
+                pulse = (math.sin(get_clock().get_ticks() * 0.01) + 1) / 2
                 r = 255
                 g = int(100 + 50 * pulse)
                 b = int(50 * pulse)
@@ -993,8 +965,8 @@ class Boss(pygame.sprite.Sprite):
                 surface.blit(trail_surface, trail_rect)
                 
             # Draw charge warning
-            font = pygame.font.SysFont('Arial', 16)
-            warning_text = font.render("CHARGING!", True, (255, 50, 50))
+            font = get_font('Arial', 16)
+            warning_text = render_text(font, "CHARGING!", True, (255, 50, 50))
             surface.blit(warning_text, (self.rect.centerx - warning_text.get_width()//2, self.rect.top - 25))
         
         # Draw sniper warning and bullet for mini-boss
@@ -1002,48 +974,44 @@ class Boss(pygame.sprite.Sprite):
             if self.attack_pattern == "sniper" and self.sniper_in_warning:
                 # Draw a warning line where the sniper shot will go
                 warning_color = (100, 255, 255)
-                pulse = 0.5 + 0.5 * abs(math.sin(pygame.time.get_ticks() * 0.01))
+                pulse = 0.5 + 0.5 * abs(math.sin(get_clock().get_ticks() * 0.01))
                 warning_width = int(2 + 2 * pulse)
                 start_pos = (self.rect.left, self.sniper_target_y)
                 end_pos = (0, self.sniper_target_y)
                 pygame.draw.line(surface, warning_color, start_pos, end_pos, warning_width)
                 # Draw warning text
-                font = pygame.font.SysFont('Arial', 16)
-                warn_text = font.render("SNIPER!", True, warning_color)
+                font = get_font('Arial', 16)
+                warn_text = render_text(font, "SNIPER!", True, warning_color)
                 surface.blit(warn_text, (self.rect.left - warn_text.get_width() - 10, self.sniper_target_y - 20))
         
-        # Create a copy of the image for effects
-        display_image = self.image.copy()
+        # Start from the plain image; flashes swap in cached tinted copies
+        display_image = self.image
+        tint_cache = get_tint_cache()
         
         # Apply hit flash effect
         if self.hit_flash > 0:
-            # Create white flash overlay
-            flash_overlay = pygame.Surface(display_image.get_size(), pygame.SRCALPHA)
+            # White flash, brightest right after the hit
             flash_intensity = min(255, self.hit_flash * 25)
-            flash_overlay.fill((flash_intensity, flash_intensity, flash_intensity, 0))
-            display_image.blit(flash_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            display_image = tint_cache.get_tinted(display_image, (255, 255, 255, 0), flash_intensity / 255)
             
             # Decrease hit flash
             self.hit_flash -= 1
         
         # Apply pattern change flash effect
         if hasattr(self, 'flash_effect') and self.flash_effect > 0:
-            # Create colored flash overlay based on attack pattern
-            flash_overlay = pygame.Surface(display_image.get_size(), pygame.SRCALPHA)
-            
+            # Colored flash based on attack pattern
             if self.attack_pattern == "spread":
                 # Red for spread
-                flash_color = (255, 100, 100, 0)
+                flash_color = (255, 100, 100, 100)
             elif self.attack_pattern == "aimed":
                 # Blue for aimed
-                flash_color = (100, 100, 255, 0)
+                flash_color = (100, 100, 255, 100)
             else:  # barrage
                 # Yellow for barrage
-                flash_color = (255, 255, 100, 0)
+                flash_color = (255, 255, 100, 100)
                 
             flash_intensity = min(100, self.flash_effect * 10)
-            flash_overlay.fill((flash_color[0], flash_color[1], flash_color[2], flash_intensity))
-            display_image.blit(flash_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            display_image = tint_cache.get_tinted(display_image, flash_color, flash_intensity / 100)
             
             # Decrease flash effect
             self.flash_effect -= 1
@@ -1058,7 +1026,7 @@ class Boss(pygame.sprite.Sprite):
             shield_size = int(max(self.rect.width, self.rect.height) * (1.0 + 0.15 * shield_health_percent))
             
             # Pulsing effect
-            pulse = (math.sin(pygame.time.get_ticks() * 0.005) + 1) / 2
+            pulse = (math.sin(get_clock().get_ticks() * 0.005) + 1) / 2
             shield_alpha = int(100 + 50 * pulse)  # 100-150 alpha
             
             # Create shield surface
@@ -1086,8 +1054,8 @@ class Boss(pygame.sprite.Sprite):
             surface.blit(shield_surface, shield_rect)
             
             # Draw shield percentage near the boss
-            font = pygame.font.SysFont('Arial', 14)
-            shield_text = font.render(f"{int(shield_health_percent * 100)}%", True, shield_color[:3])
+            font = get_font('Arial', 14)
+            shield_text = render_text(font, f"{int(shield_health_percent * 100)}%", True, shield_color[:3])
             text_pos = (self.rect.centerx - shield_text.get_width() // 2, 
                         self.rect.top - shield_text.get_height() - 5)
             surface.blit(shield_text, text_pos)
@@ -1121,7 +1089,7 @@ class Boss(pygame.sprite.Sprite):
             weak_point_y = self.rect.centery + (self.weak_point_position[1] - self.rect.centery)
             
             # Pulsing effect
-            now = pygame.time.get_ticks()
+            now = get_clock().get_ticks()
             pulse = (math.sin(now * 0.01) + 1) / 2
             
             # Draw outer glow
@@ -1136,35 +1104,28 @@ class Boss(pygame.sprite.Sprite):
             pygame.draw.circle(surface, (255, 200, 200), (weak_point_x, weak_point_y), highlight_radius)
             
             # Draw "WEAK POINT" text
-            font = pygame.font.SysFont('Arial', 12)
-            weak_text = font.render("WEAK POINT", True, (255, 50, 50))
+            font = get_font('Arial', 12)
+            weak_text = render_text(font, "WEAK POINT", True, (255, 50, 50))
             surface.blit(weak_text, (weak_point_x - weak_text.get_width()//2, weak_point_y - 30))
             
     def draw_death_animation(self, surface):
         """Draw the death animation."""
-        # Draw explosion particles
-        for particle in self.explosion_particles:
-            pygame.draw.circle(
-                surface, 
-                particle['color'], 
-                (int(particle['x']), int(particle['y'])), 
-                particle['size']
-            )
+        # Explosion particles are drawn by the shared particle system
             
         # Draw explosion text
-        progress = (pygame.time.get_ticks() - self.death_start_time) / self.death_duration
+        progress = (get_clock().get_ticks() - self.death_start_time) / self.death_duration
         if progress < 0.5:
             # First half of animation - show "BOSS DEFEATED"
             font_size = int(20 + 20 * progress)  # Grow from 20 to 40
-            font = pygame.font.SysFont('Arial', font_size, bold=True)
-            text = font.render("BOSS DEFEATED!", True, (255, 255, 255))
+            font = get_font('Arial', font_size, bold=True)
+            text = render_text(font, "BOSS DEFEATED!", True, (255, 255, 255))
             text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
             surface.blit(text, text_rect)
         else:
             # Second half - show score
             font_size = 40
-            font = pygame.font.SysFont('Arial', font_size, bold=True)
-            text = font.render(f"+{self.score_value} POINTS", True, (255, 255, 100))
+            font = get_font('Arial', font_size, bold=True)
+            text = render_text(font, f"+{self.score_value} POINTS", True, (255, 255, 100))
             text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
             surface.blit(text, text_rect)
             
@@ -1174,7 +1135,7 @@ class Boss(pygame.sprite.Sprite):
             self.laser_target_y = self.player_y_position if hasattr(self, 'player_y_position') else self.rect.centery
             
         # Calculate warning line properties
-        now = pygame.time.get_ticks()
+        now = get_clock().get_ticks()
         charge_progress = (now - self.laser_charge_time) / 1500  # 1.5 seconds charging
         
         # Warning line color pulses from white to red
@@ -1200,15 +1161,15 @@ class Boss(pygame.sprite.Sprite):
         
         # Draw warning text that pulses
         font_size = int(22 + 8 * pulse_factor)  # Pulsing font size between 22 and 30
-        font = pygame.font.SysFont('Arial', font_size, bold=True)  # Added bold
-        warning_text = font.render("!!! LASER CHARGING !!!", True, (r, g, b))
+        font = get_font('Arial', font_size, bold=True)  # Added bold
+        warning_text = render_text(font, "!!! LASER CHARGING !!!", True, (r, g, b))
         text_x = SCREEN_WIDTH // 2 - warning_text.get_width() // 2
         text_y = self.laser_target_y - 50  # Moved up slightly
         surface.blit(warning_text, (text_x, text_y))
         
         # Draw second warning text below
-        font2 = pygame.font.SysFont('Arial', 18)
-        warning_text2 = font2.render("MOVE OUT OF THE WAY!", True, (r, g, b))
+        font2 = get_font('Arial', 18)
+        warning_text2 = render_text(font2, "MOVE OUT OF THE WAY!", True, (r, g, b))
         text_x2 = SCREEN_WIDTH // 2 - warning_text2.get_width() // 2
         text_y2 = self.laser_target_y + 30  # Below the laser line
         surface.blit(warning_text2, (text_x2, text_y2))
@@ -1233,7 +1194,7 @@ class Boss(pygame.sprite.Sprite):
         end_pos = (0, self.laser_target_y)
         
         # Draw main beam with pulsing effect
-        now = pygame.time.get_ticks()
+        now = get_clock().get_ticks()
         pulse_factor = (math.sin(now * 0.02) + 1) / 2  # 0 to 1, faster pulse
         
         # Pulse the width slightly
@@ -1281,25 +1242,25 @@ class Boss(pygame.sprite.Sprite):
         
         # Add small particles around the impact point
         for _ in range(15):  # Increased from 10 to 15 particles
-            particle_x = impact_x + random.randint(-impact_radius, impact_radius//2)
-            particle_y = impact_y + random.randint(-impact_radius, impact_radius)
-            particle_size = random.randint(2, 8)  # Increased from 2-6 to 2-8
+            particle_x = impact_x + fx_rng.randint(-impact_radius, impact_radius//2)
+            particle_y = impact_y + fx_rng.randint(-impact_radius, impact_radius)
+            particle_size = fx_rng.randint(2, 8)  # Increased from 2-6 to 2-8
             
             # Randomize particle color for more visual interest
-            r = random.randint(200, 255)
-            g = random.randint(100, 200)
-            b = random.randint(50, 150)
+            r = fx_rng.randint(200, 255)
+            g = fx_rng.randint(100, 200)
+            b = fx_rng.randint(50, 150)
             pygame.draw.circle(surface, (r, g, b), (particle_x, particle_y), particle_size)
             
         # Add streaking effect along the beam
         for _ in range(8):  # Increased from 5 to 8 streaks
-            streak_x = random.randint(0, self.rect.left)
-            streak_y = self.laser_target_y + random.randint(-5, 5)  # Wider variation
-            streak_length = random.randint(20, 60)  # Longer potential streaks
-            streak_width = random.randint(1, 4)  # Thicker potential streaks
+            streak_x = fx_rng.randint(0, self.rect.left)
+            streak_y = self.laser_target_y + fx_rng.randint(-5, 5)  # Wider variation
+            streak_length = fx_rng.randint(20, 60)  # Longer potential streaks
+            streak_width = fx_rng.randint(1, 4)  # Thicker potential streaks
             
             # Randomize streak brightness
-            brightness = random.randint(200, 255)
+            brightness = fx_rng.randint(200, 255)
             pygame.draw.line(surface, (brightness, brightness, brightness), 
                             (streak_x, streak_y), 
                             (streak_x + streak_length, streak_y), 
@@ -1307,11 +1268,11 @@ class Boss(pygame.sprite.Sprite):
             
         # Add secondary impact particles that fly outward from the impact point
         for _ in range(5):  # Add 5 flying particles
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.randint(impact_radius//2, impact_radius*2)
+            angle = fx_rng.uniform(0, 2 * math.pi)
+            distance = fx_rng.randint(impact_radius//2, impact_radius*2)
             particle_x = impact_x + int(math.cos(angle) * distance)
             particle_y = impact_y + int(math.sin(angle) * distance)
-            size = random.randint(2, 5)
+            size = fx_rng.randint(2, 5)
             pygame.draw.circle(surface, (255, 200, 100), (particle_x, particle_y), size)
             
         # Check for collision with player
@@ -1351,15 +1312,15 @@ class Boss(pygame.sprite.Sprite):
         # Debug visualization - draw the laser collision rect if debug mode is on
         if DEBUG_HITBOXES:
             pygame.draw.rect(pygame.display.get_surface(), (255, 0, 0), laser_rect, 1)
-class BossBullet(pygame.sprite.Sprite):
+class BossBullet(PooledSprite):
     """Bullets fired by bosses."""
-    def __init__(self, x, y, speed, damage):
-        super().__init__()
-        
+    # Unrotated bullet images shared by every bullet of the same size and color
+    base_images = {}
+    
+    def reset(self, x, y, speed, damage):
         # Create a more interesting bullet shape
         self.width = 12
         self.height = 6
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         
         # Color properties
         self.color_shift = None  # Can be set to tint the bullet
@@ -1385,6 +1346,10 @@ class BossBullet(pygame.sprite.Sprite):
         else:
             self.vx = speed  # Already calculated as a vector
             self.vy = 0
+        
+        # Velocity the image was last rotated for
+        self.heading = None
+        self.mask = None
             
         self.damage = damage
         
@@ -1393,16 +1358,28 @@ class BossBullet(pygame.sprite.Sprite):
         self.hitbox.center = self.rect.center
         
         # Add trail effect properties
-        self.trail = []
         self.max_trail_length = 5
+        self.trail = Trail(self.max_trail_length)
         
         # Time tracking for visual effects
-        self.creation_time = pygame.time.get_ticks()
+        self.creation_time = get_clock().get_ticks()
     
     def create_bullet_image(self):
         """Create the bullet image with optional color shift."""
-        # Clear the image
-        self.image.fill((0, 0, 0, 0))
+        key = (self.width, self.height, self.color_shift)
+        self.base_image = BossBullet.base_images.get(key)
+        if self.base_image is None:
+            self.base_image = self.draw_bullet_image()
+            BossBullet.base_images[key] = self.base_image
+        self.image = self.base_image
+        
+        # Rotate the bullet based on its velocity
+        if hasattr(self, 'vy') and self.vy != 0:
+            self.apply_heading()
+    
+    def draw_bullet_image(self):
+        """Draw the unrotated bullet image."""
+        image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         
         # Draw a gradient bullet with a bright core
         for i in range(self.width):
@@ -1419,7 +1396,7 @@ class BossBullet(pygame.sprite.Sprite):
                 color = (255, intensity, intensity)  # Red to bright red gradient
             
             # Draw a vertical line at position i
-            pygame.draw.line(self.image, color, (i, 0), (i, self.height-1), 1)
+            pygame.draw.line(image, color, (i, 0), (i, self.height-1), 1)
         
         # Add a bright core
         core_color = (255, 255, 200)
@@ -1431,16 +1408,26 @@ class BossBullet(pygame.sprite.Sprite):
                 min(255, 200 + self.color_shift[2] // 4)
             )
             
-        pygame.draw.rect(self.image, core_color, (0, self.height//4, self.width//2, self.height//2))
-        
-        # Rotate the bullet based on its velocity
-        if hasattr(self, 'vy') and self.vy != 0:
-            angle = math.degrees(math.atan2(self.vy, self.vx))
-            self.image = pygame.transform.rotate(self.image, -angle)
-            self.rect = self.image.get_rect(center=self.rect.center)
+        pygame.draw.rect(image, core_color, (0, self.height//4, self.width//2, self.height//2))
+        return image
+    
+    def apply_heading(self):
+        """Rotate the bullet to face its velocity using the shared rotation cache."""
+        self.heading = (self.vx, self.vy)
+        angle = math.degrees(math.atan2(self.vy, self.vx))
+        frame = get_rotation_cache(ROTATION_STEPS).get_frame(self.base_image, -angle)
+        self.image = frame.image
+        self.mask = frame.mask
+        center = self.rect.center
+        self.rect.size = frame.size
+        self.rect.center = center
             
     def update(self):
         """Update the bullet position."""
+        # Face the velocity once it's known (aimed shots set vy after creation)
+        if self.vy != 0 and self.heading != (self.vx, self.vy):
+            self.apply_heading()
+        
         # Move the bullet
         self.rect.x += self.vx
         self.rect.y += self.vy
@@ -1448,14 +1435,8 @@ class BossBullet(pygame.sprite.Sprite):
         # Update hitbox position
         self.hitbox.center = self.rect.center
         
-        # Add trail effect
-        if hasattr(self, 'trail'):
-            # Add current position to trail
-            self.trail.append((self.rect.centerx, self.rect.centery))
-            
-            # Limit trail length
-            if len(self.trail) > self.max_trail_length:
-                self.trail.pop(0)
+        # Add current position to the trail (the ring buffer drops the oldest)
+        self.trail.push(self.rect.centerx, self.rect.centery)
         
         # Check if bullet is off screen
         if self.rect.right < 0 or self.rect.left > SCREEN_WIDTH or self.rect.bottom < 0 or self.rect.top > SCREEN_HEIGHT:
@@ -1463,29 +1444,17 @@ class BossBullet(pygame.sprite.Sprite):
             
     def draw(self, surface):
         """Draw the bullet with trail effect."""
-        # Draw trail
-        if hasattr(self, 'trail') and len(self.trail) > 1:
-            # Calculate trail alpha based on position in trail
-            for i in range(len(self.trail) - 1):
-                alpha = int(255 * (i / len(self.trail)))
-                
-                # Get trail segment
-                start_pos = self.trail[i]
-                end_pos = self.trail[i + 1]
-                
-                # Draw trail segment
-                if self.color_shift:
-                    trail_color = (
-                        min(255, self.color_shift[0] // 2),
-                        min(255, self.color_shift[1] // 2),
-                        min(255, self.color_shift[2] // 2),
-                        alpha
-                    )
-                else:
-                    trail_color = (255, 100, 100, alpha)
-                    
-                # Draw trail segment as a line
-                pygame.draw.line(surface, trail_color, start_pos, end_pos, 2)
+        # Draw trail as a single line strip (segment alpha is lost on the opaque screen anyway)
+        if len(self.trail) > 1:
+            if self.color_shift:
+                trail_color = (
+                    min(255, self.color_shift[0] // 2),
+                    min(255, self.color_shift[1] // 2),
+                    min(255, self.color_shift[2] // 2)
+                )
+            else:
+                trail_color = (255, 100, 100)
+            get_trail_system().draw_line(surface, trail_color, self.trail, 2)
         
         # Draw bullet
         surface.blit(self.image, self.rect)
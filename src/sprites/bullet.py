@@ -3,10 +3,10 @@ Bullet sprite for the Space Impact game.
 """
 import pygame
 from src.config import SCREEN_WIDTH, DEBUG_HITBOXES
+from src.utils.object_pool import PooledSprite
 
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, image=None):
-        super().__init__()
+class Bullet(PooledSprite):
+    def reset(self, x, y, image=None):
         self.image = image if image else pygame.Surface((10, 5))
         if image is None:
             self.image.fill((255, 255, 255))  # Default white bullet if no image
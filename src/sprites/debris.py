@@ -3,13 +3,17 @@ Debris sprite for the Space Impact game.
 Debris moves in a straight line and damages the player on collision.
 """
 import pygame
-import random
 import math
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, DEBUG_HITBOXES
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, DEBUG_HITBOXES, ROTATION_STEPS
+from src.utils.game_clock import get_rng
+from src.utils.rotation_cache import get_rotation_cache
+from src.utils.object_pool import PooledSprite
 
-class Debris(pygame.sprite.Sprite):
-    def __init__(self, images):
-        super().__init__()
+# Random streams (seeded through the game clock module)
+rng = get_rng('debris')
+
+class Debris(PooledSprite):
+    def reset(self, images):
         self.image = images.get('debris')
         
         # Check if image is None and provide a fallback
@@ -21,8 +25,8 @@ class Debris(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         
         # Position the debris at a random position on the right side of the screen
-        self.rect.x = SCREEN_WIDTH + random.randint(50, 200)
-        self.rect.y = random.randint(50, SCREEN_HEIGHT - 50)
+        self.rect.x = SCREEN_WIDTH + rng.randint(50, 200)
+        self.rect.y = rng.randint(50, SCREEN_HEIGHT - 50)
         
         # Create a hitbox (85% of sprite size)
         hitbox_width = int(self.rect.width * 0.85)
@@ -31,7 +35,7 @@ class Debris(pygame.sprite.Sprite):
         self.hitbox.center = self.rect.center
         
         # Debris properties
-        self.base_speed = random.randint(4, 7)  # Faster than normal enemies
+        self.base_speed = rng.randint(4, 7)  # Faster than normal enemies
         self.speed_multiplier = 1.0  # Can be modified by game phases
         self.speed = self.base_speed
         self.damage = 1  # Damage dealt to player on collision
@@ -40,8 +44,11 @@ class Debris(pygame.sprite.Sprite):
         
         # Add slight rotation for visual effect
         self.angle = 0
-        self.rotation_speed = random.uniform(-2.0, 2.0)  # Degrees per frame
-        self.original_image = self.image.copy()
+        self.rotation_speed = rng.uniform(-2.0, 2.0)  # Degrees per frame
+        # Shared (not copied) so every debris piece uses the same cached rotations
+        self.original_image = self.image
+        self.rotation_cache = get_rotation_cache(ROTATION_STEPS)
+        self.mask = None
     
     def update(self):
         # Apply speed multiplier
@@ -52,11 +59,13 @@ class Debris(pygame.sprite.Sprite):
         
         # Rotate the debris
         self.angle += self.rotation_speed
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
+        frame = self.rotation_cache.get_frame(self.original_image, self.angle)
+        self.image = frame.image
+        self.mask = frame.mask
         
         # Keep the center position the same after rotation
         old_center = self.rect.center
-        self.rect = self.image.get_rect()
+        self.rect.size = frame.size
         self.rect.center = old_center
         
         # Update hitbox position to follow the rect
@@ -10,14 +10,20 @@ Enemy Types:
 - Boss: Final boss at 3:00 mark
 """
 import pygame
-import random
 import math
-import time
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, DEBUG_HITBOXES
+from src.utils.game_clock import get_clock, get_rng
+from src.utils.tint_cache import get_tint_cache
+from src.utils.trail_system import get_trail_system
+from src.utils.glow_cache import blit_glow
+from src.utils.object_pool import PooledSprite
 
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, enemy_type, images, behavior_manager=None):
-        super().__init__()
+# Random streams (seeded through the game clock module)
+rng = get_rng('enemies')
+fx_rng = get_rng('fx')
+
+class Enemy(PooledSprite):
+    def reset(self, enemy_type, images, behavior_manager=None):
         self.enemy_type = enemy_type
         
         # Set image based on enemy type
@@ -41,7 +47,6 @@ class Enemy(pygame.sprite.Sprite):
             
         elif enemy_type == 'super':
             self.image = images.get('super_enemy') or images.get('tank_enemy')
-            self.original_image = self.image.copy()
             self.health = 4  # Increased from 3 to 4
             self.base_speed = 1.5  # Slightly slower base speed
             self.points = 100  # Increased from 75 to 100 due to enhanced difficulty
@@ -58,7 +63,7 @@ class Enemy(pygame.sprite.Sprite):
             self.shield_pulse_radius = 0
             
             # Attack system
-            self.attack_cooldown = random.uniform(3.0, 5.0)  # Initial cooldown
+            self.attack_cooldown = rng.uniform(3.0, 5.0)  # Initial cooldown
             self.attack_phase = 1  # Current attack phase (1-3)
             self.is_charging = False
             self.charge_cooldown = 0
@@ -79,7 +84,8 @@ class Enemy(pygame.sprite.Sprite):
         self.speed = self.base_speed
         
         # Store the original image for the enemy's telegraph effect
-        self.original_image = self.image.copy()
+        # (shared, not copied: effects swap in cached tinted versions instead of drawing on it)
+        self.original_image = self.image
         
         # Create the rect
         self.rect = self.image.get_rect()
@@ -90,11 +96,8 @@ class Enemy(pygame.sprite.Sprite):
         self.hitbox = pygame.Rect(0, 0, hitbox_width, hitbox_height)
         self.hitbox.center = self.rect.center
         
-        # For bullet firing
-        self.bullets = []  # Store bullets here
-        
         # Initialize time tracking
-        self.last_time = time.time()
+        self.last_time = get_clock().time()
         
         # Initialize behavior using the behavior manager
         self.behavior_manager = behavior_manager
@@ -104,7 +107,7 @@ class Enemy(pygame.sprite.Sprite):
     def update(self):
         """Update the enemy based on its behavior pattern."""
         # Get current time for time-based behaviors
-        current_time = time.time()
+        current_time = get_clock().time()
         delta_time = current_time - self.last_time
         self.last_time = current_time
         
@@ -114,7 +117,6 @@ class Enemy(pygame.sprite.Sprite):
         # Use behavior manager if available
         if self.behavior_manager:
             self.behavior_manager.update_behavior(self, delta_time)
-            self.behavior_manager.update_bullets(self)
         else:
             # Fallback to basic movement if no behavior manager
             self.rect.x -= self.speed
@@ -160,18 +162,6 @@ class Enemy(pygame.sprite.Sprite):
         """Fire a projectile (for enemies that can shoot)."""
         if self.behavior_manager:
             self.behavior_manager._fire_shot(self)
-        else:
-            # Default bullet behavior
-            bullet = {
-                'x': self.rect.centerx,
-                'y': self.rect.bottom,
-                'speed': 3,
-                'width': 4,
-                'height': 8,
-                'color': (255, 100, 100),
-                'damage': 1
-            }
-            self.bullets.append(bullet)
     
     def draw(self, surface):
         """Draw the enemy with visual effects."""
@@ -187,6 +177,7 @@ class Enemy(pygame.sprite.Sprite):
             # Determine if we're in burst mode for special effects
             is_bursting = hasattr(self, 'is_bursting') and self.is_bursting
             
+            ghosts = []
             for i in range(trail_length):
                 # Calculate position and alpha for this trail segment
                 segment_spacing = 5 if not is_bursting else 8  # Wider spacing during burst
@@ -196,22 +187,15 @@ class Enemy(pygame.sprite.Sprite):
                 base_alpha = 180 if not is_bursting else 220
                 trail_alpha = base_alpha - (i + 1) * alpha_step
                 
-                # Create a semi-transparent copy of the image
-                trail_image = self.image.copy()
-                trail_image.set_alpha(trail_alpha)
-                
                 # During burst, add color tint to trail
+                tint = None
                 if is_bursting:
-                    # Create a colored overlay
-                    overlay = pygame.Surface(trail_image.get_size(), pygame.SRCALPHA)
-                    overlay_color = (255, 200, 0, min(150, int(80 * (trail_length - i) / trail_length)))
-                    overlay.fill(overlay_color)
-                    trail_image.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                    tint = (255, 200, 0, min(150, int(80 * (trail_length - i) / trail_length)))
                 
-                # Draw the trail segment
-                trail_rect = self.rect.copy()
-                trail_rect.x = trail_x
-                surface.blit(trail_image, trail_rect)
+                ghosts.append(((trail_x, self.rect.y), trail_alpha, tint))
+            
+            # Draw every segment from the cached semi-transparent ghost frames
+            get_trail_system().draw_ghosts(surface, self.image, ghosts)
         
         # Draw special effects for super-type enemy (shield, etc.)
         if self.enemy_type == 'super':
@@ -250,26 +234,26 @@ class Enemy(pygame.sprite.Sprite):
                 # For elite-type in burst mode, add an extra intense engine glow
                 if hasattr(self, 'has_trail') and self.has_trail:
                     # Create a larger engine glow with pulsing effect
-                    pulse_factor = 0.7 + 0.3 * abs(math.sin(time.time() * 15))  # Fast pulsing
+                    pulse_factor = 0.7 + 0.3 * abs(math.sin(get_clock().time() * 15))  # Fast pulsing
                     glow_size = int(12 * pulse_factor)  # Larger, pulsing glow
                     
                     # Outer glow (large)
-                    pygame.draw.circle(surface, glow_color, (engine_x, engine_y), glow_size)
+                    blit_glow(surface, (engine_x, engine_y), glow_size, glow_color, falloff=0)
                     
                     # Middle glow (medium)
-                    pygame.draw.circle(surface, (255, 240, 150), (engine_x, engine_y), glow_size * 0.7)
+                    blit_glow(surface, (engine_x, engine_y), int(glow_size * 0.7), (255, 240, 150), falloff=0)
                     
                     # Inner bright core (small)
-                    pygame.draw.circle(surface, (255, 255, 255), (engine_x, engine_y), glow_size * 0.4)
+                    blit_glow(surface, (engine_x, engine_y), int(glow_size * 0.4), (255, 255, 255), falloff=0)
                     
                     # Add energy particles during burst
                     for _ in range(3):
-                        particle_size = random.randint(2, 4)
-                        offset_x = random.randint(10, 25)
-                        offset_y = random.randint(-8, 8)
+                        particle_size = fx_rng.randint(2, 4)
+                        offset_x = fx_rng.randint(10, 25)
+                        offset_y = fx_rng.randint(-8, 8)
                         particle_x = engine_x + offset_x
                         particle_y = engine_y + offset_y
-                        particle_color = (255, 220 + random.randint(0, 35), 100 + random.randint(0, 155))
+                        particle_color = (255, 220 + fx_rng.randint(0, 35), 100 + fx_rng.randint(0, 155))
                         pygame.draw.circle(surface, particle_color, (particle_x, particle_y), particle_size)
                     
                     # Skip the regular engine glow
@@ -282,15 +266,15 @@ class Enemy(pygame.sprite.Sprite):
                 if hasattr(self, 'has_trail') and self.has_trail:
                     # Create a pulsing engine glow that grows as we approach burst
                     progress = 1.0 - (self.pre_burst_delay / 0.4)  # Assuming 0.4s telegraph time
-                    pulse_factor = 0.5 + 0.5 * abs(math.sin(time.time() * 10))  # Medium pulsing
+                    pulse_factor = 0.5 + 0.5 * abs(math.sin(get_clock().time() * 10))  # Medium pulsing
                     base_size = 8 + int(4 * progress)  # Grows as we approach burst
                     glow_size = int(base_size * pulse_factor)
                     
                     # Draw the charging glow
-                    pygame.draw.circle(surface, glow_color, (engine_x, engine_y), glow_size)
+                    blit_glow(surface, (engine_x, engine_y), glow_size, glow_color, falloff=0)
                     
                     # Inner bright core
-                    pygame.draw.circle(surface, (255, 255, 200), (engine_x, engine_y), glow_size // 2)
+                    blit_glow(surface, (engine_x, engine_y), glow_size // 2, (255, 255, 200), falloff=0)
                     
                     # Skip the regular engine glow
                     glow_color = None
@@ -302,10 +286,10 @@ class Enemy(pygame.sprite.Sprite):
                 if hasattr(self, 'has_trail') and self.has_trail:
                     # Create a larger engine glow
                     glow_size = 8
-                    pygame.draw.circle(surface, glow_color, (engine_x, engine_y), glow_size)
+                    blit_glow(surface, (engine_x, engine_y), glow_size, glow_color, falloff=0)
                     
                     # Add inner bright core
-                    pygame.draw.circle(surface, (255, 255, 200), (engine_x, engine_y), glow_size // 2)
+                    blit_glow(surface, (engine_x, engine_y), glow_size // 2, (255, 255, 200), falloff=0)
                     
                     # Skip the regular engine glow
                     glow_color = None
@@ -375,73 +359,6 @@ class Enemy(pygame.sprite.Sprite):
                 surface.blit(glow_surface, 
                            (light_pos[0] - light_size * 3, light_pos[1] - light_size * 3))
         
-        # Draw bullets
-        for bullet in self.bullets:
-            # Adjust bullet drawing based on direction (horizontal or vertical)
-            if 'speed' in bullet and bullet['speed'] < 0:  # Horizontal bullet (moving left)
-                bullet_rect = pygame.Rect(
-                    bullet['x'] - bullet['width'] // 2,
-                    bullet['y'] - bullet['height'] // 2,
-                    bullet['width'],
-                    bullet['height']
-                )
-                
-                # Draw a more pronounced bullet
-                pygame.draw.rect(surface, bullet['color'], bullet_rect)
-                
-                # Add a bright core to the bullet
-                core_rect = pygame.Rect(
-                    bullet['x'] - bullet['width'] // 4,
-                    bullet['y'] - bullet['height'] // 4,
-                    bullet['width'] // 2,
-                    bullet['height'] // 2
-                )
-                pygame.draw.rect(surface, (255, 200, 200), core_rect)
-                
-                # Add a larger glow effect for horizontal bullets
-                glow_width = bullet['width'] * 2
-                glow_height = bullet['height'] * 2
-                glow_surface = pygame.Surface((glow_width, glow_height), pygame.SRCALPHA)
-                
-                # Create an elongated glow in the direction of travel
-                glow_color = (*bullet['color'][:3], 100)
-                pygame.draw.ellipse(glow_surface, glow_color, (0, 0, glow_width, glow_height))
-                
-                # Add a trail effect
-                trail_length = bullet['width'] * 1.5
-                trail_surface = pygame.Surface((int(trail_length), bullet['height']), pygame.SRCALPHA)
-                for i in range(int(trail_length)):
-                    alpha = 150 * (1 - i / trail_length)
-                    trail_color = (*bullet['color'][:3], int(alpha))
-                    pygame.draw.line(trail_surface, trail_color, 
-                                   (i, bullet['height'] // 2), 
-                                   (i, bullet['height'] // 2), 
-                                   1)
-                
-                # Position the glow and trail
-                surface.blit(glow_surface, 
-                           (bullet['x'] - glow_width // 2, 
-                            bullet['y'] - glow_height // 2))
-                surface.blit(trail_surface,
-                           (bullet['x'] + bullet['width'] // 2,
-                            bullet['y'] - bullet['height'] // 2))
-            else:  # Vertical bullet (moving down)
-                bullet_rect = pygame.Rect(
-                    bullet['x'] - bullet['width'] // 2,
-                    bullet['y'],
-                    bullet['width'],
-                    bullet['height']
-                )
-                pygame.draw.rect(surface, bullet['color'], bullet_rect)
-                
-                # Add a small glow effect to the bullet
-                glow_surface = pygame.Surface((bullet['width'] + 4, bullet['height'] + 4), pygame.SRCALPHA)
-                pygame.draw.ellipse(glow_surface, (*bullet['color'][:3], 100), 
-                                  (0, 0, bullet['width'] + 4, bullet['height'] + 4))
-                surface.blit(glow_surface, 
-                       (bullet['x'] - (bullet['width'] + 4) // 2, 
-                        bullet['y'] - 2))
-        
         # Add health indicator for enemies with more than 1 health
         if self.health > 1:
             health_width = 20
@@ -468,9 +385,6 @@ class Enemy(pygame.sprite.Sprite):
             pygame.draw.rect(surface, health_color, 
                            (health_x, health_y, health_fill_width, health_height))
     
-    def get_bullets(self):
-        """Return the enemy's bullets for collision detection."""
-        return self.bullets
     def draw_super_effects(self, surface):
         """Draw special effects for super-type enemy."""
         if self.enemy_type != 'super':
@@ -535,12 +449,12 @@ class Enemy(pygame.sprite.Sprite):
             # Add particles during high flare
             if flare_intensity > 0.7:
                 for _ in range(2):
-                    particle_size = random.randint(2, 4)
-                    offset_x = random.randint(5, 15)
-                    offset_y = random.randint(-5, 5)
+                    particle_size = fx_rng.randint(2, 4)
+                    offset_x = fx_rng.randint(5, 15)
+                    offset_y = fx_rng.randint(-5, 5)
                     particle_x = engine_x + offset_x
                     particle_y = engine_y + offset_y
-                    particle_color = (255, 150 + random.randint(0, 105), 0)
+                    particle_color = (255, 150 + fx_rng.randint(0, 105), 0)
                     pygame.draw.circle(surface, particle_color, (particle_x, particle_y), particle_size)
         
         # Draw attack warning if active
@@ -555,7 +469,7 @@ class Enemy(pygame.sprite.Sprite):
                 warning_surface = pygame.Surface((warning_radius*2, warning_radius*2), pygame.SRCALPHA)
                 
                 # Pulsing effect
-                pulse = abs(math.sin(time.time() * 10)) * 5
+                pulse = abs(math.sin(get_clock().time() * 10)) * 5
                 pygame.draw.circle(warning_surface, warning_color, (warning_radius, warning_radius), warning_radius - pulse, 2)
                 
                 # Draw warning on surface
@@ -572,7 +486,7 @@ class Enemy(pygame.sprite.Sprite):
                 pygame.draw.line(surface, warning_color, start_pos, end_pos, 3)
                 
                 # Draw pulsing dot at end
-                pulse = abs(math.sin(time.time() * 10)) * 2
+                pulse = abs(math.sin(get_clock().time() * 10)) * 2
                 pygame.draw.circle(surface, warning_color, end_pos, 3 + pulse)
             
             elif attack_type == "missile_barrage":
@@ -593,56 +507,49 @@ class Enemy(pygame.sprite.Sprite):
                     pygame.draw.line(surface, warning_color, start_pos, end_pos, 2)
                     
                     # Draw pulsing dot at end
-                    pulse = abs(math.sin(time.time() * 10 + angle)) * 2
+                    pulse = abs(math.sin(get_clock().time() * 10 + angle)) * 2
                     pygame.draw.circle(surface, warning_color, end_pos, 2 + pulse)
         
         # Draw damage flash effect
         if hasattr(self, 'damage_flash') and self.damage_flash > 0:
-            # Create a copy of the image with damage flash
-            flash_image = self.image.copy()
-            flash_overlay = pygame.Surface(flash_image.get_size(), pygame.SRCALPHA)
-            
             # Calculate flash intensity
-            flash_intensity = int(min(255, self.damage_flash * 25))
+            flash_intensity = min(255, self.damage_flash * 25) / 255
             
             # Different colors based on phase
             if hasattr(self, 'attack_phase'):
                 if self.attack_phase == 3:
                     # Red flash for critical phase
-                    flash_color = (flash_intensity, 0, 0, 0)
+                    flash_color = (255, 0, 0, 0)
                 elif self.attack_phase == 2:
                     # Orange flash for damaged phase
-                    flash_color = (flash_intensity, flash_intensity // 2, 0, 0)
+                    flash_color = (255, 127, 0, 0)
                 else:
                     # White flash for normal phase
-                    flash_color = (flash_intensity, flash_intensity, flash_intensity, 0)
+                    flash_color = (255, 255, 255, 0)
             else:
                 # Default white flash
-                flash_color = (flash_intensity, flash_intensity, flash_intensity, 0)
-            
-            flash_overlay.fill(flash_color)
-            flash_image.blit(flash_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                flash_color = (255, 255, 255, 0)
             
-            # Draw the flashed image
-            surface.blit(flash_image, self.rect)
+            # Draw the cached flashed image
+            surface.blit(get_tint_cache().get_tinted(self.image, flash_color, flash_intensity), self.rect)
         
         # Draw damage state visual effects
         if hasattr(self, 'attack_phase'):
             if self.attack_phase == 3:
                 # Critical damage: add sparks
                 for _ in range(2):
-                    if random.random() < 0.3:  # 30% chance per frame
-                        spark_x = self.rect.x + random.randint(0, self.rect.width)
-                        spark_y = self.rect.y + random.randint(0, self.rect.height)
-                        spark_size = random.randint(1, 3)
+                    if fx_rng.random() < 0.3:  # 30% chance per frame
+                        spark_x = self.rect.x + fx_rng.randint(0, self.rect.width)
+                        spark_y = self.rect.y + fx_rng.randint(0, self.rect.height)
+                        spark_size = fx_rng.randint(1, 3)
                         spark_color = (255, 200, 50)
                         pygame.draw.circle(surface, spark_color, (spark_x, spark_y), spark_size)
             
             elif self.attack_phase == 2:
                 # Moderate damage: add occasional spark
-                if random.random() < 0.1:  # 10% chance per frame
-                    spark_x = self.rect.x + random.randint(0, self.rect.width)
-                    spark_y = self.rect.y + random.randint(0, self.rect.height)
-                    spark_size = random.randint(1, 2)
+                if fx_rng.random() < 0.1:  # 10% chance per frame
+                    spark_x = self.rect.x + fx_rng.randint(0, self.rect.width)
+                    spark_y = self.rect.y + fx_rng.randint(0, self.rect.height)
+                    spark_size = fx_rng.randint(1, 2)
                     spark_color = (255, 200, 50)
                     pygame.draw.circle(surface, spark_color, (spark_x, spark_y), spark_size)
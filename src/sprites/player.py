@@ -2,10 +2,15 @@
 Player sprite for the Space Impact game.
 """
 import pygame
-import time
 import math
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, PLAYER_INITIAL_HEALTH, PLAYER_INITIAL_SPEED, PLAYER_SHOOT_DELAY, DEBUG_HITBOXES
 from .bullet import Bullet
+from src.utils.game_clock import get_clock
+from src.utils.tint_cache import get_tint_cache
+from src.utils.object_pool import get_pool
+from src.utils.log_manager import get_logger
+
+logger = get_logger('player')
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, image, sound_manager):
@@ -26,7 +31,7 @@ class Player(pygame.sprite.Sprite):
         self.speed = PLAYER_INITIAL_SPEED
         self.bullets = pygame.sprite.Group()
         self.shoot_delay = PLAYER_SHOOT_DELAY
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = get_clock().get_ticks()
         self.health = PLAYER_INITIAL_HEALTH
         self.max_health = PLAYER_INITIAL_HEALTH
         self.rapid_fire = False
@@ -50,14 +55,17 @@ class Player(pygame.sprite.Sprite):
         # Damage cooldown system
         self.damage_cooldown = {}  # Dictionary to track cooldown for different damage sources
         self.damage_cooldown_duration = 1000  # 1 second cooldown between damage from same source
+        
+        # Scripted input (KeyState) used instead of the keyboard when set
+        self.key_state = None
     
     def update(self):
         # Store last position for movement prediction by enemies
         self.last_x = self.rect.x
         self.last_y = self.rect.y
         
-        # Get keyboard input
-        keys = pygame.key.get_pressed()
+        # Get keyboard input (or scripted input in headless runs)
+        keys = self.key_state if self.key_state is not None else pygame.key.get_pressed()
         if keys[pygame.K_UP]:
             self.rect.y -= self.speed
         if keys[pygame.K_DOWN]:
@@ -104,7 +112,7 @@ class Player(pygame.sprite.Sprite):
                 self.score_multiplier = 1
         
         # Check for invulnerability timer
-        current_time = pygame.time.get_ticks()
+        current_time = get_clock().get_ticks()
         if self.invulnerable:
             if current_time - self.invulnerable_timer > self.invulnerable_duration:
                 self.invulnerable = False
@@ -119,29 +127,27 @@ class Player(pygame.sprite.Sprite):
                     if self.visible:
                         self.image = self.original_image
                     else:
-                        # Create a colored version of the image for blinking
-                        colored_image = self.original_image.copy()
-                        colored_image.fill(self.blink_color, special_flags=pygame.BLEND_ADD)
-                        self.image = colored_image
+                        # Use the cached colored version of the image for blinking
+                        self.image = get_tint_cache().get_tinted(self.original_image, self.blink_color)
         
         # Update damage cooldowns
-        current_time = pygame.time.get_ticks()
+        current_time = get_clock().get_ticks()
         for source_id in list(self.damage_cooldown.keys()):
             if current_time - self.damage_cooldown[source_id] > self.damage_cooldown_duration:
                 del self.damage_cooldown[source_id]
     
     def shoot(self, bullet_image=None):
-        now = pygame.time.get_ticks()
+        now = get_clock().get_ticks()
         if now - self.last_shot > self.shoot_delay:
             self.last_shot = now
             
             # Create bullet with proper image
-            bullet = Bullet(self.rect.right, self.rect.centery, bullet_image)
+            bullet = get_pool(Bullet).acquire(self.rect.right, self.rect.centery, bullet_image)
             self.bullets.add(bullet)
             
             # Add a second bullet if rapid fire is active
             if self.rapid_fire:
-                bullet2 = Bullet(self.rect.right, self.rect.centery - 10, bullet_image)
+                bullet2 = get_pool(Bullet).acquire(self.rect.right, self.rect.centery - 10, bullet_image)
                 self.bullets.add(bullet2)
             
             # Play sound
@@ -184,16 +190,16 @@ class Player(pygame.sprite.Sprite):
             
         # If no source_id provided, generate a random one (not ideal but prevents errors)
         if source_id is None:
-            source_id = f"unknown_{pygame.time.get_ticks()}"
+            source_id = f"unknown_{get_clock().get_ticks()}"
             
         # Check if this source is on cooldown
-        current_time = pygame.time.get_ticks()
+        current_time = get_clock().get_ticks()
         if source_id in self.damage_cooldown:
             return False  # Still on cooldown, no damage applied
             
         # Check if player is invulnerable
         if self.invulnerable:
-            self.blink_timer = pygame.time.get_ticks()
+            self.blink_timer = get_clock().get_ticks()
             return False  # No actual damage applied
             
         # Apply damage and start cooldown
@@ -202,16 +208,16 @@ class Player(pygame.sprite.Sprite):
         
         # Start invulnerability period
         self.invulnerable = True
-        self.invulnerable_timer = pygame.time.get_ticks()
-        self.blink_timer = pygame.time.get_ticks()
+        self.invulnerable_timer = get_clock().get_ticks()
+        self.blink_timer = get_clock().get_ticks()
         
         # Set cooldown for this damage source
         self.damage_cooldown[source_id] = current_time
         
         # Start invulnerability period
         self.invulnerable = True
-        self.invulnerable_timer = pygame.time.get_ticks()
-        self.blink_timer = pygame.time.get_ticks()
+        self.invulnerable_timer = get_clock().get_ticks()
+        self.blink_timer = get_clock().get_ticks()
         
         # Set cooldown for this damage source
         self.damage_cooldown[source_id] = current_time
@@ -223,7 +229,7 @@ class Player(pygame.sprite.Sprite):
                 # In test mode without god mode, start respawn countdown
                 game_manager.game_state = game_manager.GAME_STATE_RESPAWNING
                 game_manager.ui_manager.start_respawn_countdown()
-                print("Player died in test mode - starting respawn countdown")
+                logger.info("Player died in test mode - starting respawn countdown")
                 # Return True to indicate damage was applied but don't proceed with game over
                 return True
             else:
@@ -2,16 +2,18 @@
 Power-up sprites for the Space Impact game.
 """
 import pygame
-import random
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, DEBUG_HITBOXES
+from src.utils.game_clock import get_rng
+from src.utils.object_pool import PooledSprite
 
-class PowerUp(pygame.sprite.Sprite):
-    def __init__(self, images, powerup_type=None):
-        super().__init__()
-        
+# Random streams (seeded through the game clock module)
+rng = get_rng('powerups')
+
+class PowerUp(PooledSprite):
+    def reset(self, images, powerup_type=None):
         # Randomly select power-up type if not specified
         if powerup_type is None:
-            self.type = random.choice(['health', 'speed', 'rapid_fire', 'score_multiplier'])
+            self.type = rng.choice(['health', 'speed', 'rapid_fire', 'score_multiplier'])
         else:
             self.type = powerup_type
         
@@ -26,9 +28,9 @@ class PowerUp(pygame.sprite.Sprite):
             self.image = images.get('score_multiplier')
         
         self.rect = self.image.get_rect()
-        self.rect.x = SCREEN_WIDTH + random.randint(50, 200)
-        self.rect.y = random.randint(50, SCREEN_HEIGHT - 50)
-        self.speed = random.randint(2, 4)
+        self.rect.x = SCREEN_WIDTH + rng.randint(50, 200)
+        self.rect.y = rng.randint(50, SCREEN_HEIGHT - 50)
+        self.speed = rng.randint(2, 4)
         
         # Create a hitbox that's slightly smaller than the sprite (90% of sprite size)
         # Power-ups should be easier to collect, so we use a larger hitbox ratio
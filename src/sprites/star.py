@@ -1,109 +1,198 @@
 """
 Star background elements for the Space Impact game.
+Every star of every parallax layer lives in one set of NumPy arrays, so the
+whole field drifts, twinkles and respawns in a single vectorized step. Tiny
+stars are written straight into the screen pixels and larger ones are blitted
+in one batch from the shared glow cache.
 """
+import numpy as np
 import pygame
-import random
-import math
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
-
-class Star:
-    def __init__(self):
-        self.x = random.randint(0, SCREEN_WIDTH)
-        self.y = random.randint(0, SCREEN_HEIGHT)
-        self.size = random.randint(1, 3)
-        self.speed = random.uniform(0.5, 3.0)  # Slower, more melancholic drift
-        
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, STAR_LAYERS
+from src.utils.game_clock import get_clock, get_rng
+from src.utils.glow_cache import get_glow_cache
+
+# Random streams (seeded through the game clock module)
+rng = get_rng('stars')
+
+COLOR_STEP = 8        # Star colors are quantized so cached glow and core sprites are reused
+DEATH_FRAMES = 600    # Frames over which a dying star fades out
+
+class StarField:
+    """Scrolling parallax starfield backed by NumPy columns."""
+
+    def __init__(self, layers=STAR_LAYERS):
+        """
+        Create every star of every layer.
+
+        Args:
+            layers: Layer settings, back to front. Each layer has a star count,
+                    a (min, max) speed in pixels per frame, a (min, max) size and
+                    a brightness multiplier
+        """
+        self.layers = layers
+        self.np_rng = np.random.default_rng(rng.getrandbits(64))
+        gen = self.np_rng
+
+        n = sum(layer['count'] for layer in layers)
+        self.count = n
+        # Layer index of every star (stars are stored back to front)
+        self.layer = np.repeat(np.arange(len(layers)), [layer['count'] for layer in layers])
+        self.speed_min = np.array([layers[i]['speed'][0] for i in self.layer], dtype=np.float32)
+        self.speed_max = np.array([layers[i]['speed'][1] for i in self.layer], dtype=np.float32)
+
+        self.x = gen.integers(0, SCREEN_WIDTH + 1, n).astype(np.float32)
+        self.y = gen.integers(0, SCREEN_HEIGHT + 1, n).astype(np.float32)
+        self.speed = gen.uniform(self.speed_min, self.speed_max).astype(np.float32)
+        size_min = np.array([layers[i]['size'][0] for i in self.layer])
+        size_max = np.array([layers[i]['size'][1] for i in self.layer])
+        self.base_size = gen.integers(size_min, size_max + 1).astype(np.float32)
+        self.size = self.base_size.copy()
+
         # Starlight's End theme colors - sparse, fading stars
-        color_choice = random.randint(0, 10)
-        if color_choice < 5:  # 50% dim white/gray stars (dying)
-            brightness = random.randint(120, 180)
-            self.color = (brightness, brightness, brightness)
-        elif color_choice < 7:  # 20% cool blue (distant)
-            self.color = (random.randint(80, 120), random.randint(120, 160), random.randint(180, 220))
-        elif color_choice < 9:  # 20% warm orange/red (dying)
-            self.color = (random.randint(180, 220), random.randint(100, 140), random.randint(60, 100))
-        else:  # 10% very dim purple (ethereal)
-            self.color = (random.randint(100, 140), random.randint(80, 120), random.randint(140, 180))
-        
-        # Add slow, melancholic twinkling effect
-        self.twinkle_speed = random.uniform(0.005, 0.02)  # Slower twinkling
-        self.twinkle_offset = random.uniform(0, 6.28)
-        self.base_size = self.size
-        self.fade_factor = random.uniform(0.6, 1.0)  # Some stars are naturally dimmer
-        
+        self.color = self._pick_colors(n)
+        brightness = np.array([layers[i]['brightness'] for i in self.layer], dtype=np.float32)
+        self.color = (self.color * brightness[:, None]).astype(np.int32)
+
+        # Slow, melancholic twinkling
+        self.twinkle_speed = gen.uniform(0.005, 0.02, n).astype(np.float32)
+        self.twinkle_offset = gen.uniform(0, 6.28, n).astype(np.float32)
+        self.fade_factor = gen.uniform(0.6, 1.0, n).astype(np.float32)  # Some stars are naturally dimmer
+
         # Rare dying star flickers instead of shooting stars
-        self.is_dying = random.random() < 0.01  # 1% chance
-        if self.is_dying:
-            self.death_timer = random.randint(300, 600)  # Frames until death
-            self.flicker_intensity = random.uniform(0.3, 0.7)
-            self.death_speed = random.uniform(0.01, 0.03)
-    
+        self.dying = np.zeros(n, dtype=bool)
+        self.death_timer = np.zeros(n, dtype=np.float32)
+        self.flicker_intensity = np.zeros(n, dtype=np.float32)
+        self.death_speed = np.zeros(n, dtype=np.float32)
+        self._roll_dying(np.arange(n))
+
+    def _pick_colors(self, n):
+        """Pick theme colors for n stars."""
+        gen = self.np_rng
+        choice = gen.integers(0, 11, n)
+        brightness = gen.integers(120, 181, n)
+        gray = np.stack([brightness] * 3, axis=1)                               # 50% dim white/gray (dying)
+        blue = np.stack([gen.integers(80, 121, n), gen.integers(120, 161, n),
+                         gen.integers(180, 221, n)], axis=1)                    # 20% cool blue (distant)
+        orange = np.stack([gen.integers(180, 221, n), gen.integers(100, 141, n),
+                           gen.integers(60, 101, n)], axis=1)                   # 20% warm orange/red (dying)
+        purple = np.stack([gen.integers(100, 141, n), gen.integers(80, 121, n),
+                           gen.integers(140, 181, n)], axis=1)                  # 10% very dim purple (ethereal)
+        return np.select([(choice < 5)[:, None], (choice < 7)[:, None], (choice < 9)[:, None]],
+                         [gray, blue, orange], purple)
+
+    def _roll_dying(self, idx):
+        """Give each selected star a 1% chance to be a dying star."""
+        gen = self.np_rng
+        k = len(idx)
+        dying = gen.random(k) < 0.01
+        self.dying[idx] = dying
+        self.death_timer[idx] = gen.integers(300, 601, k)  # Frames until death
+        self.flicker_intensity[idx] = gen.uniform(0.3, 0.7, k)
+        self.death_speed[idx] = gen.uniform(0.01, 0.03, k)
+
     def update(self):
+        """Drift, twinkle and respawn every star."""
         self.x -= self.speed
-        
-        # Update twinkling/dying effect
-        if self.is_dying:
-            self.death_timer -= 1
-            # Flickering death effect
-            death_flicker = self.flicker_intensity * math.sin(pygame.time.get_ticks() * self.death_speed)
-            fade_progress = 1.0 - (self.death_timer / 600)
-            self.size = self.base_size * (0.5 + 0.5 * death_flicker) * (1.0 - fade_progress)
-            
-            if self.death_timer <= 0:
-                # Star dies, respawn as new star
-                self._respawn()
-        else:
-            # Normal gentle twinkling
-            twinkle_factor = 0.4 * math.sin(pygame.time.get_ticks() * self.twinkle_speed + self.twinkle_offset) + 0.6
-            self.size = self.base_size * twinkle_factor * self.fade_factor
-        
-        # Reset when off-screen
-        if self.x < -10:
-            self._respawn()
-    
-    def _respawn(self):
-        """Respawn star with new properties."""
-        self.x = SCREEN_WIDTH + random.randint(0, 50)
-        self.y = random.randint(0, SCREEN_HEIGHT)
-        self.speed = random.uniform(0.5, 3.0)
-        self.fade_factor = random.uniform(0.6, 1.0)
-        
-        # Small chance to become a dying star
-        self.is_dying = random.random() < 0.01
-        if self.is_dying:
-            self.death_timer = random.randint(300, 600)
-            self.flicker_intensity = random.uniform(0.3, 0.7)
-            self.death_speed = random.uniform(0.01, 0.03)
-    
+        ticks = get_clock().get_ticks()
+
+        # Normal gentle twinkling
+        twinkle_factor = 0.4 * np.sin(ticks * self.twinkle_speed + self.twinkle_offset) + 0.6
+        size = self.base_size * twinkle_factor * self.fade_factor
+
+        # Flickering death effect
+        dying = self.dying
+        if dying.any():
+            self.death_timer[dying] -= 1
+            death_flicker = self.flicker_intensity[dying] * np.sin(ticks * self.death_speed[dying])
+            fade_progress = 1.0 - (self.death_timer[dying] / DEATH_FRAMES)
+            size[dying] = self.base_size[dying] * (0.5 + 0.5 * death_flicker) * (1.0 - fade_progress)
+        self.size = size.astype(np.float32)
+
+        # Respawn dead and off-screen stars at the right edge
+        respawn = np.nonzero((dying & (self.death_timer <= 0)) | (self.x < -10))[0]
+        if len(respawn):
+            gen = self.np_rng
+            k = len(respawn)
+            self.x[respawn] = SCREEN_WIDTH + gen.integers(0, 51, k)
+            self.y[respawn] = gen.integers(0, SCREEN_HEIGHT + 1, k)
+            self.speed[respawn] = gen.uniform(self.speed_min[respawn], self.speed_max[respawn])
+            self.fade_factor[respawn] = gen.uniform(0.6, 1.0, k)
+            self._roll_dying(respawn)
+
+    def _current_colors(self):
+        """Return every star's color, fading dying stars to red."""
+        color = self.color.astype(np.float32)
+        dying = self.dying
+        if dying.any():
+            progress = (1.0 - (self.death_timer[dying] / DEATH_FRAMES))[:, None]
+            base = color[dying]
+            faded = np.empty_like(base)
+            faded[:, 0] = np.minimum(255, base[:, 0] + (255 - base[:, 0]) * progress[:, 0])
+            faded[:, 1] = base[:, 1] * (1.0 - progress[:, 0] * 0.7)
+            faded[:, 2] = base[:, 2] * (1.0 - progress[:, 0] * 0.8)
+            color[dying] = faded
+        return color
+
     def draw(self, surface):
-        if self.size <= 0.5:  # Don't draw nearly dead stars
+        """Draw every visible star."""
+        visible = self.size > 0.5  # Don't draw nearly dead stars
+        if not visible.any():
+            return
+        color = self._current_colors()
+        glow_cache = get_glow_cache()
+        sprites = []
+
+        # Subtle glow for larger or dying stars (colors rounded so sprites are shared)
+        glowing = np.nonzero(visible & ((self.base_size >= 2) | self.dying))[0]
+        if len(glowing):
+            glow_size = np.maximum(self.size[glowing] * 1.5, 3)
+            alpha = 30 * self.fade_factor[glowing]
+            dying = self.dying[glowing]
+            alpha[dying] *= 1.5 - (self.death_timer[glowing][dying] / DEATH_FRAMES)  # Brighter as it dies
+            glow_radius = np.round(glow_size).astype(np.int32)
+            left = (self.x[glowing].astype(np.int32) - glow_radius).tolist()
+            top = (self.y[glowing].astype(np.int32) - glow_radius).tolist()
+            glow_color = (color[glowing] // COLOR_STEP * COLOR_STEP).astype(np.int32).tolist()
+            glow_radius = glow_radius.tolist()
+            alpha = alpha.tolist()
+            for i in range(len(glow_radius)):
+                glow = glow_cache.get_glow(glow_radius[i], glow_color[i], alpha[i])
+                if glow is not None:
+                    sprites.append((glow, (left[i], top[i])))
+
+        # Star cores, dimmed by their fade factor
+        core_color = color * self.fade_factor[:, None]
+        radius = np.maximum(1, self.size.astype(np.int32))
+
+        # Stars wider than a pixel are blitted as cached discs
+        large = np.nonzero(visible & (radius > 1))[0]
+        if len(large):
+            disc_radius = radius[large]
+            left = (self.x[large].astype(np.int32) - disc_radius).tolist()
+            top = (self.y[large].astype(np.int32) - disc_radius).tolist()
+            disc_color = (core_color[large] // COLOR_STEP * COLOR_STEP).astype(np.int32).tolist()
+            disc_radius = disc_radius.tolist()
+            for i in range(len(disc_radius)):
+                disc = glow_cache.get_glow(disc_radius[i], disc_color[i], falloff=0)
+                sprites.append((disc, (left[i], top[i])))
+        if sprites:
+            surface.blits(sprites, doreturn=False)
+
+        # Single-pixel stars are written straight into the surface
+        small = visible & (radius == 1)
+        xs = self.x.astype(np.int32)
+        ys = self.y.astype(np.int32)
+        small &= (xs >= 0) & (xs < surface.get_width()) & (ys >= 0) & (ys < surface.get_height())
+        if small.any():
+            self._write_pixels(surface, xs[small], ys[small], core_color[small].astype(np.uint8))
+
+    def _write_pixels(self, surface, xs, ys, colors):
+        """Set one pixel per star, falling back to set_at for surfaces surfarray can't map."""
+        try:
+            pixels = pygame.surfarray.pixels3d(surface)
+        except (ValueError, pygame.error):
+            for x, y, c in zip(xs.tolist(), ys.tolist(), colors.tolist()):
+                surface.set_at((x, y), c)
             return
-            
-        # Calculate current color with fading
-        current_color = self.color
-        if self.is_dying:
-            death_progress = 1.0 - (self.death_timer / 600)
-            # Fade to red as star dies
-            fade_red = min(255, int(self.color[0] + (255 - self.color[0]) * death_progress))
-            fade_green = int(self.color[1] * (1.0 - death_progress * 0.7))
-            fade_blue = int(self.color[2] * (1.0 - death_progress * 0.8))
-            current_color = (fade_red, fade_green, fade_blue)
-        
-        # Draw subtle glow for larger or dying stars
-        if self.base_size >= 2 or self.is_dying:
-            glow_size = max(self.size * 1.5, 3)
-            glow_surface = pygame.Surface((int(glow_size * 2), int(glow_size * 2)), pygame.SRCALPHA)
-            
-            # Softer, more ethereal glow
-            for r in range(int(glow_size), 0, -1):
-                alpha = int(30 * (r / glow_size) * self.fade_factor)
-                if self.is_dying:
-                    alpha = int(alpha * (1.5 - (self.death_timer / 600)))  # Brighter as it dies
-                glow_color = (*current_color, alpha)
-                pygame.draw.circle(glow_surface, glow_color, (int(glow_size), int(glow_size)), r)
-            
-            surface.blit(glow_surface, (int(self.x - glow_size), int(self.y - glow_size)))
-        
-        # Draw the star core
-        final_color = tuple(int(c * self.fade_factor) for c in current_color)
-        pygame.draw.circle(surface, final_color, (int(self.x), int(self.y)), max(1, int(self.size)))
+        pixels[xs, ys] = colors
+        del pixels  # Unlock the surface
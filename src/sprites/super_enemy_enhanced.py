@@ -4,20 +4,24 @@ This is a specialized enemy type with shield, multi-phase attacks, and death exp
 When shield is active, it fires bullets. When shield is broken, it fires lasers with a 3-second cooldown.
 """
 import pygame
-import random
 import math
-import time
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, DEBUG_HITBOXES
 from src.sprites.enemy import Enemy
+from src.utils.game_clock import get_clock, get_rng
+from src.utils.font_manager import get_font, render_text
+
+# Random streams (seeded through the game clock module)
+rng = get_rng('enemies')
+fx_rng = get_rng('fx')
 
 class SuperEnemyEnhanced(Enemy):
-    def __init__(self, images, behavior_manager=None):
+    def reset(self, images, behavior_manager=None):
         # Initialize with the base Enemy class but override key properties
-        super().__init__('super', images, behavior_manager)
+        super().reset('super', images, behavior_manager)
         
         # Override position to ensure it's always far to the right
         self.rect.x = SCREEN_WIDTH + 300
-        self.rect.y = random.randint(80, SCREEN_HEIGHT - 80)
+        self.rect.y = rng.randint(80, SCREEN_HEIGHT - 80)
         
         # Shield system
         self.max_shield = 3  # Increased from 2 to 3 for more durability
@@ -36,7 +40,7 @@ class SuperEnemyEnhanced(Enemy):
         self.health = self.max_health
         
         # Attack system
-        self.attack_cooldown = random.uniform(3.0, 5.0)
+        self.attack_cooldown = rng.uniform(3.0, 5.0)
         self.attack_phase = 1  # Current attack phase (1-3)
         self.is_charging = False
         self.charge_cooldown = 0
@@ -58,11 +62,11 @@ class SuperEnemyEnhanced(Enemy):
         self.direction = -1  # Start moving left
         self.min_x = 100  # Don't go further left than this
         self.max_x = SCREEN_WIDTH - self.rect.width - 20  # Don't go off right edge
-        self.preferred_distance = random.randint(180, 250)  # Distance from player
+        self.preferred_distance = rng.randint(180, 250)  # Distance from player
         self.min_distance = 120
         self.max_distance = 300
         self.position_update_timer = 0
-        self.position_update_interval = random.uniform(0.8, 1.5)
+        self.position_update_interval = rng.uniform(0.8, 1.5)
         self.current_target_x = None
         
         # Death explosion properties
@@ -79,7 +83,7 @@ class SuperEnemyEnhanced(Enemy):
     def update(self):
         """Override the update method to handle shield and explosion logic."""
         # Get current time for time-based behaviors
-        current_time = time.time()
+        current_time = get_clock().time()
         delta_time = current_time - self.last_time
         self.last_time = current_time
         
@@ -98,12 +102,10 @@ class SuperEnemyEnhanced(Enemy):
                 self.behavior_manager.update_behavior(self, delta_time)
             
             # Update attack behavior based on shield status
+            # Bullets fired while shielded are moved by the shared projectile pool
             if not self.has_shield:
                 # When shield is down, use laser attacks instead of bullets
                 self.try_laser_attack(delta_time)
-            else:
-                # When shield is up, use normal bullets
-                self.behavior_manager.update_bullets(self)
         else:
             # Fallback to basic movement if no behavior manager and not firing laser
             if not (self.laser_active and (self.laser_charging or self.laser_firing)):
@@ -136,7 +138,7 @@ class SuperEnemyEnhanced(Enemy):
             return
             
         # Try to fire a laser every 3 seconds when shield is down
-        if random.random() < 0.33 * delta_time:  # ~33% chance per second
+        if rng.random() < 0.33 * delta_time:  # ~33% chance per second
             self.start_laser_attack()
     
     def start_laser_attack(self):
@@ -144,7 +146,7 @@ class SuperEnemyEnhanced(Enemy):
         self.laser_active = True
         self.laser_charging = True
         self.laser_firing = False
-        self.laser_charge_time = time.time()
+        self.laser_charge_time = get_clock().time()
         
         # Store the current velocity to restore it after firing
         if hasattr(self, 'vx'):
@@ -165,7 +167,7 @@ class SuperEnemyEnhanced(Enemy):
         if not self.laser_active:
             return
             
-        current_time = time.time()
+        current_time = get_clock().time()
         
         if self.laser_charging:
             # Charging phase - 1.5 seconds
@@ -215,7 +217,7 @@ class SuperEnemyEnhanced(Enemy):
                 self.has_shield = False
                 self.shield = 0
                 self.shield_broken = True
-                self.shield_break_time = time.time()
+                self.shield_break_time = get_clock().time()
                 self.shield_break_sound_played = False
                 self.shield_regen_cooldown = 5.0  # 5 seconds to regenerate shield
             damage_taken = True
@@ -286,104 +288,6 @@ class SuperEnemyEnhanced(Enemy):
         if DEBUG_HITBOXES:
             pygame.draw.rect(surface, (255, 0, 0), self.hitbox, 1)
         
-        # Draw bullets
-        for bullet in self.bullets:
-            # Adjust bullet drawing based on type
-            if 'vx' in bullet and 'vy' in bullet:
-                # Bullet with velocity components (juggernaut bullets)
-                bullet_rect = pygame.Rect(
-                    bullet['x'] - bullet['width'] // 2,
-                    bullet['y'] - bullet['height'] // 2,
-                    bullet['width'],
-                    bullet['height']
-                )
-                
-                # Draw a more pronounced bullet with gradient effect
-                bullet_surface = pygame.Surface((bullet['width'], bullet['height']), pygame.SRCALPHA)
-                
-                # Get base color
-                base_color = bullet['color']
-                
-                # Draw gradient effect
-                for i in range(bullet['width']):
-                    # Calculate color intensity based on position
-                    intensity = 255 - int(200 * (i / bullet['width']))
-                    
-                    # Create color with gradient
-                    if isinstance(base_color, tuple) and len(base_color) >= 3:
-                        r = min(255, base_color[0])
-                        g = min(255, base_color[1])
-                        b = min(255, base_color[2])
-                        color = (r, g, b)
-                    else:
-                        color = (255, 100, 100)  # Default red
-                    
-                    # Draw a vertical line at position i
-                    pygame.draw.line(bullet_surface, color, (i, 0), (i, bullet['height']-1), 1)
-                
-                # Add a bright core
-                core_rect = pygame.Rect(
-                    bullet['width'] // 4,
-                    bullet['height'] // 4,
-                    bullet['width'] // 2,
-                    bullet['height'] // 2
-                )
-                pygame.draw.rect(bullet_surface, (255, 255, 200), core_rect)
-                
-                # Rotate the bullet based on its velocity
-                angle = math.degrees(math.atan2(bullet['vy'], bullet['vx']))
-                rotated_surface = pygame.transform.rotate(bullet_surface, -angle)
-                
-                # Get the new rect after rotation
-                rotated_rect = rotated_surface.get_rect(center=(bullet['x'], bullet['y']))
-                
-                # Draw the rotated bullet
-                surface.blit(rotated_surface, rotated_rect)
-                
-                # Draw trail if it's a homing missile
-                if 'homing' in bullet and bullet['homing'] and 'trail' in bullet and len(bullet['trail']) > 1:
-                    for i in range(len(bullet['trail']) - 1):
-                        # Calculate alpha based on position in trail
-                        alpha = int(255 * (i / len(bullet['trail'])))
-                        
-                        # Draw trail segment
-                        pygame.draw.line(
-                            surface,
-                            (255, 100, 0, alpha),  # Orange trail
-                            bullet['trail'][i],
-                            bullet['trail'][i + 1],
-                            2
-                        )
-            elif 'direction' in bullet and bullet['direction'] == 'left':
-                # Horizontal bullet (moving left)
-                bullet_rect = pygame.Rect(
-                    bullet['x'],
-                    bullet['y'] - bullet['height'] // 2,
-                    bullet['width'],
-                    bullet['height']
-                )
-                
-                # Draw a more pronounced bullet
-                pygame.draw.rect(surface, bullet['color'], bullet_rect)
-                
-                # Add a bright core to the bullet
-                core_rect = pygame.Rect(
-                    bullet['x'] + 1,
-                    bullet['y'] - bullet['height'] // 4,
-                    bullet['width'] // 2,
-                    bullet['height'] // 2
-                )
-                pygame.draw.rect(surface, (255, 200, 200), core_rect)
-            else:
-                # Vertical bullet (moving down)
-                bullet_rect = pygame.Rect(
-                    bullet['x'] - bullet['width'] // 2,
-                    bullet['y'],
-                    bullet['width'],
-                    bullet['height']
-                )
-                pygame.draw.rect(surface, bullet['color'], bullet_rect)
-        
         # Draw health bar
         self.draw_health_bar(surface)
     
@@ -416,7 +320,7 @@ class SuperEnemyEnhanced(Enemy):
             pygame.draw.circle(shield_surface, shield_color, (shield_radius, shield_radius), radius, thickness)
         
         # Add pulsing effect
-        current_time = time.time()
+        current_time = get_clock().time()
         pulse = (math.sin(current_time * 5) + 1) / 2  # 0 to 1 pulsing
         
         # Draw inner glow with pulsing
@@ -429,8 +333,8 @@ class SuperEnemyEnhanced(Enemy):
         surface.blit(shield_surface, shield_rect)
         
         # Draw shield health percentage
-        font = pygame.font.SysFont('Arial', 12)
-        shield_text = font.render(f"{int(shield_health_percent * 100)}%", True, (150, 200, 255))
+        font = get_font('Arial', 12)
+        shield_text = render_text(font, f"{int(shield_health_percent * 100)}%", True, (150, 200, 255))
         text_pos = (self.rect.centerx - shield_text.get_width() // 2, 
                     self.rect.top - shield_text.get_height() - 5)
         surface.blit(shield_text, text_pos)
@@ -438,7 +342,7 @@ class SuperEnemyEnhanced(Enemy):
     def draw_laser_warning(self, surface):
         """Draw a warning for the laser attack."""
         # Calculate warning line properties
-        current_time = time.time()
+        current_time = get_clock().time()
         charge_progress = (current_time - self.laser_charge_time) / 1.5  # 1.5 seconds charging
         
         # Warning line color pulses from white to red
@@ -464,8 +368,8 @@ class SuperEnemyEnhanced(Enemy):
         
         # Draw warning text that pulses
         font_size = int(16 + 6 * pulse_factor)  # Pulsing font size
-        font = pygame.font.SysFont('Arial', font_size, bold=True)
-        warning_text = font.render("LASER CHARGING", True, (r, g, b))
+        font = get_font('Arial', font_size, bold=True)
+        warning_text = render_text(font, "LASER CHARGING", True, (r, g, b))
         text_x = self.rect.left - warning_text.get_width() - 10
         text_y = self.laser_target_y - warning_text.get_height() // 2
         surface.blit(warning_text, (text_x, text_y))
@@ -498,7 +402,7 @@ class SuperEnemyEnhanced(Enemy):
         end_pos = (0, self.laser_target_y)
         
         # Draw main beam with pulsing effect
-        current_time = time.time()
+        current_time = get_clock().time()
         pulse_factor = (math.sin(current_time * 20) + 1) / 2  # 0 to 1, faster pulse
         
         # Pulse the width slightly
@@ -541,9 +445,9 @@ class SuperEnemyEnhanced(Enemy):
         
         # Add small particles around the impact point
         for _ in range(5):
-            particle_x = impact_x + random.randint(-impact_radius, impact_radius//2)
-            particle_y = impact_y + random.randint(-impact_radius, impact_radius)
-            particle_size = random.randint(2, 4)
+            particle_x = impact_x + fx_rng.randint(-impact_radius, impact_radius//2)
+            particle_y = impact_y + fx_rng.randint(-impact_radius, impact_radius)
+            particle_size = fx_rng.randint(2, 4)
             pygame.draw.circle(surface, (255, 200, 200), (particle_x, particle_y), particle_size)
         
         # Draw a "locked" indicator to show the enemy is stationary
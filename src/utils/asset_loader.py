@@ -6,17 +6,66 @@ This is a legacy class that now uses the new AssetManager internally.
 import pygame
 import os
 from src.config import get_asset_path
-from src.utils.asset_manager import AssetManager
+from src.utils.asset_manager import AssetManager, CORE_BUNDLE
+from src.utils.log_manager import get_logger
+
+logger = get_logger('assets')
 
 class AssetLoader:
-    def __init__(self):
+    def __init__(self, load_map=True):
+        """
+        Initialize the asset loader.
+        
+        Args:
+            load_map: Also load the first map's bundle now. GameManager passes False
+                      and calls set_map once the menu is showing
+        """
         self.images = {}
+        self.map_id = None
         self.asset_manager = AssetManager()
-        self.asset_manager.load_all_assets()
-        self._load_images()
+        # Only the core bundle and the first map's bundle load now; later maps
+        # load (and the one after them prefetches) when set_map reaches them
+        self.asset_manager.load_all_music()
+        self.asset_manager.load_all_maps()
+        self.asset_manager.load_bundle(CORE_BUNDLE)
+        # Convert images to the display format before handing them out
+        self.asset_manager.optimize_images()
+        if load_map:
+            self.set_map(0)
+        else:
+            self._load_images()
+    
+    def set_map(self, map_index):
+        """
+        Switch the map-specific images to another map.
+        
+        Loads the map's bundle, prefetches the next map's and unloads the rest.
+        
+        Args:
+            map_index: Position of the map in the map manifest (GameManager.current_map)
+            
+        Returns:
+            True if the map changed
+        """
+        maps = self.asset_manager.get_all_maps()
+        map_data = maps[min(map_index, len(maps) - 1)] if maps else {}
+        map_id = map_data.get("id")
+        if map_id is not None and map_id == self.map_id:
+            return False
+        
+        if map_id is not None:
+            self.asset_manager.enter_map(map_id)
+        self.map_id = map_id
+        self._load_images(map_data.get("images", {}))
+        return True
     
-    def _load_images(self):
-        """Load all game images using the asset manager."""
+    def _load_images(self, map_images=None):
+        """
+        Load all game images using the asset manager.
+        
+        Args:
+            map_images: The current map's legacy name -> image ID overrides from the map manifest
+        """
         image_ids = {
             'player': 'player-default',
             'normal_enemy': 'SE-monster-lower',  # Keep for backward compatibility
@@ -42,9 +91,15 @@ class AssetLoader:
             'asteroid': 'asteroid',
             'debris': 'debris'
         }
+        if map_images:
+            image_ids.update(map_images)
         
+        # Update in place: sprites and pools hold a reference to this dictionary.
+        # Images of a map that isn't loaded yet are filled in by set_map
+        loaded_bundles = self.asset_manager.loaded_bundles
         for old_name, new_id in image_ids.items():
-            self.images[old_name] = self.asset_manager.get_image(new_id)
+            if self.asset_manager.get_image_bundle(new_id) in loaded_bundles:
+                self.images[old_name] = self.asset_manager.get_image(new_id)
     
     def load_image(self, name, filename):
         """
@@ -101,7 +156,7 @@ class AssetLoader:
         if name in self.images:
             return self.images[name]
         else:
-            print(f"Warning: Image '{name}' not found")
+            logger.warning(f"Warning: Image '{name}' not found")
             # Try to load it from the asset manager using the name as the asset ID
             image = self.asset_manager.get_image(name)
             if image:
@@ -115,5 +170,5 @@ class AssetLoader:
             self.images[name] = pygame.transform.scale(self.images[name], (width, height))
             return self.images[name]
         else:
-            print(f"Warning: Cannot scale image '{name}' - not found")
+            logger.warning(f"Warning: Cannot scale image '{name}' - not found")
             return pygame.Surface((width, height))
@@ -1,17 +1,48 @@
 """
 Simplified Asset Manager for Space Conquer.
 Provides a basic system for loading and managing game assets.
+Assets are grouped into bundles (core plus one per map) that load, prefetch
+and unload as the game moves between maps.
 """
 import os
 import json
+import time
 import pygame
-import logging
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from src.utils.log_manager import get_logger
+from src.utils.audio_variants import get_variant_paths
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, 
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger('AssetManager')
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = get_logger('assets')
+
+# Blit modes chosen by the display-format optimization pass
+BLIT_OPAQUE = "opaque"      # convert(): no transparency at all
+BLIT_COLORKEY = "colorkey"  # convert() + colorkey with RLEACCEL: binary (on/off) transparency
+BLIT_ALPHA = "alpha"        # convert_alpha(): partial transparency
+
+# Candidate colorkeys, tried in order until one isn't used by an opaque pixel
+COLORKEY_CANDIDATES = [(255, 0, 255), (0, 255, 0), (1, 2, 3), (254, 1, 253)]
+
+# Manifest entries without a "bundle" key belong to the core bundle (UI, player, power-ups)
+CORE_BUNDLE = "core"
+PREFETCH_WORKERS = 2  # Threads decoding the images of prefetched bundles
+
+# Shared pool for bundle prefetching (created on first use)
+_prefetch_pool = None
+
+def get_prefetch_pool():
+    """Return the shared thread pool that decodes prefetched bundles."""
+    global _prefetch_pool
+    if _prefetch_pool is None:
+        _prefetch_pool = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS,
+                                            thread_name_prefix="asset-prefetch")
+    return _prefetch_pool
 
 class AssetManager:
     """
@@ -37,6 +68,15 @@ class AssetManager:
         self.music = {}
         self.maps = {}
         
+        # Display-format optimization state (filled in by optimize_images)
+        self.images_optimized = False
+        self.blit_modes = {}
+        
+        # Bundle state
+        self.loaded_bundles = set()
+        self.prefetches = {}  # Bundle name -> {image_id: Future of the decoded, scaled surface}
+        self.current_map_id = None
+        
         # Asset directories
         self.asset_dirs = {
             "images": self.base_dir / "assets" / "images",
@@ -89,26 +129,261 @@ class AssetManager:
             self.sound_manifest = {}
             self.music_manifest = {}
             self.map_manifest = {"maps": []}
+        
+        self.bundles = self._build_bundles()
+    
+    def _build_bundles(self):
+        """
+        Group the image and sound manifest entries by their "bundle" key.
+        
+        Returns:
+            Dictionary mapping bundle name to {"images": [ids], "sounds": [ids]}
+        """
+        bundles = {CORE_BUNDLE: {"images": [], "sounds": []}}
+        for kind, manifest in (("images", self.image_manifest), ("sounds", self.sound_manifest)):
+            for asset_id, asset_data in manifest.items():
+                bundle_name = asset_data.get("bundle", CORE_BUNDLE)
+                bundles.setdefault(bundle_name, {"images": [], "sounds": []})[kind].append(asset_id)
+        return bundles
+    
+    def get_image_bundle(self, image_id):
+        """Return the name of the bundle an image belongs to (core for images not in the manifest)."""
+        return self.image_manifest.get(image_id, {}).get("bundle", CORE_BUNDLE)
     
     def load_all_assets(self):
-        """Load all game assets."""
-        self.load_all_images()
-        self.load_all_sounds()
+        """Load all game assets (every bundle, not just the current map's)."""
+        for bundle_name in self.bundles:
+            self.load_bundle(bundle_name)
         self.load_all_music()
         self.load_all_maps()
         logger.info("All assets loaded successfully")
     
+    def load_bundle(self, bundle_name):
+        """
+        Load every image and sound of a bundle.
+        
+        Images already decoded by prefetch_bundle are taken from the worker pool
+        (waiting for any still in flight) and only converted here, on the main thread.
+        
+        Args:
+            bundle_name: Name of the bundle ("core" or a map's bundle)
+            
+        Returns:
+            True if the bundle is loaded, False if it isn't declared in the manifests
+        """
+        if bundle_name in self.loaded_bundles:
+            return True
+        if bundle_name not in self.bundles:
+            logger.warning(f"Bundle '{bundle_name}' not found in manifests")
+            return False
+        
+        start = time.perf_counter()
+        bundle = self.bundles[bundle_name]
+        prefetched = self.prefetches.pop(bundle_name, {})
+        for image_id in bundle["images"]:
+            future = prefetched.get(image_id)
+            raw_image = None
+            if future is not None and not future.cancelled() and future.exception() is None:
+                raw_image = future.result()
+            self.load_image(image_id, raw_image)
+        for sound_id in bundle["sounds"]:
+            self.load_sound(sound_id)
+        self.loaded_bundles.add(bundle_name)
+        
+        logger.info(f"Bundle '{bundle_name}' loaded in {(time.perf_counter() - start) * 1000:.1f} ms "
+                    f"({len(prefetched)} of {len(bundle['images'])} images prefetched)")
+        return True
+    
+    def prefetch_bundle(self, bundle_name):
+        """
+        Start decoding a bundle's images on the worker pool.
+        
+        Reading and scaling the files happens off the main thread; the display
+        conversion waits for load_bundle because it needs the display.
+        
+        Args:
+            bundle_name: Name of the bundle to prefetch
+        """
+        if bundle_name in self.loaded_bundles or bundle_name in self.prefetches:
+            return
+        if bundle_name not in self.bundles:
+            logger.warning(f"Bundle '{bundle_name}' not found in manifests")
+            return
+        
+        pool = get_prefetch_pool()
+        self.prefetches[bundle_name] = {image_id: pool.submit(self._load_raw_image, image_id)
+                                        for image_id in self.bundles[bundle_name]["images"]
+                                        if image_id not in self.images}
+        logger.info(f"Prefetching bundle '{bundle_name}' ({len(self.prefetches[bundle_name])} images)")
+    
+    def unload_bundle(self, bundle_name):
+        """
+        Drop a bundle's images and sounds, cancelling any prefetch still pending.
+        The core bundle is never unloaded.
+        
+        Args:
+            bundle_name: Name of the bundle to unload
+            
+        Returns:
+            True if anything was unloaded
+        """
+        if bundle_name == CORE_BUNDLE or bundle_name not in self.bundles:
+            return False
+        if bundle_name not in self.loaded_bundles and bundle_name not in self.prefetches:
+            return False
+        
+        for future in self.prefetches.pop(bundle_name, {}).values():
+            future.cancel()
+        bundle = self.bundles[bundle_name]
+        for image_id in bundle["images"]:
+            self.images.pop(image_id, None)
+            self.blit_modes.pop(image_id, None)
+        for sound_id in bundle["sounds"]:
+            self.sounds.pop(sound_id, None)
+        self.loaded_bundles.discard(bundle_name)
+        logger.info(f"Bundle '{bundle_name}' unloaded")
+        return True
+    
+    def get_next_map(self, map_id):
+        """
+        Get the map that follows another in the map manifest.
+        
+        Args:
+            map_id: The ID of the current map
+            
+        Returns:
+            The next map's data dictionary, or None for the last map
+        """
+        map_ids = list(self.maps)
+        if map_id not in map_ids:
+            return None
+        index = map_ids.index(map_id) + 1
+        return self.maps[map_ids[index]] if index < len(map_ids) else None
+    
+    def enter_map(self, map_id):
+        """
+        Make a map current: load the core bundle and the map's bundle, start
+        prefetching the next map's bundle and unload every other map bundle.
+        
+        Args:
+            map_id: The ID of the map
+            
+        Returns:
+            The map data dictionary, or None if there are no maps
+        """
+        map_data = self.get_map(map_id)
+        if map_data is None:
+            return None
+        
+        current_bundle = map_data.get("bundle")
+        next_map = self.get_next_map(map_data["id"])
+        next_bundle = next_map.get("bundle") if next_map else None
+        
+        # Free the bundles we no longer need before loading new ones
+        for bundle_name in self.loaded_bundles | set(self.prefetches):
+            if bundle_name not in (CORE_BUNDLE, current_bundle, next_bundle):
+                self.unload_bundle(bundle_name)
+        
+        self.load_bundle(CORE_BUNDLE)
+        if current_bundle:
+            self.load_bundle(current_bundle)
+        if next_bundle:
+            self.prefetch_bundle(next_bundle)
+        self.current_map_id = map_data["id"]
+        return map_data
+    
+    def get_loading_progress(self, bundle_name=None):
+        """
+        Report how far bundles have loaded.
+        
+        An image counts as done once it is decoded (by a prefetch worker or on load),
+        a sound once it is loaded.
+        
+        Args:
+            bundle_name: Bundle to report on, or None for every loaded or prefetching bundle
+            
+        Returns:
+            Fraction of the assets done, between 0.0 and 1.0
+        """
+        if bundle_name is None:
+            bundle_names = self.loaded_bundles | set(self.prefetches)
+        else:
+            bundle_names = [bundle_name]
+        
+        done = total = 0
+        for name in bundle_names:
+            bundle = self.bundles.get(name)
+            if bundle is None:
+                continue
+            pending = self.prefetches.get(name, {})
+            for image_id in bundle["images"]:
+                total += 1
+                future = pending.get(image_id)
+                if image_id in self.images or (future is not None and future.done()):
+                    done += 1
+            for sound_id in bundle["sounds"]:
+                total += 1
+                if sound_id in self.sounds:
+                    done += 1
+        return done / total if total else 1.0
+    
+    def get_bundle_memory_report(self):
+        """
+        Account the memory held by each bundle.
+        
+        Returns:
+            List of (bundle, state, resident assets, bytes) tuples in manifest order.
+            State is "loaded", "prefetching", "prefetched" or "unloaded"; bytes cover
+            the pixels of loaded and prefetched images and the samples of loaded sounds.
+        """
+        report = []
+        for bundle_name, bundle in self.bundles.items():
+            pending = self.prefetches.get(bundle_name, {})
+            resident = 0
+            size = 0
+            for image_id in bundle["images"]:
+                image = self.images.get(image_id)
+                future = pending.get(image_id)
+                if image is None and future is not None and future.done() and not future.cancelled():
+                    image = future.result() if future.exception() is None else None
+                if image is not None:
+                    resident += 1
+                    size += image.get_pitch() * image.get_height()
+            for sound_id in bundle["sounds"]:
+                sound = self.sounds.get(sound_id)
+                if sound is not None:
+                    resident += 1
+                    size += self._sound_bytes(sound)
+            
+            if bundle_name in self.loaded_bundles:
+                state = "loaded"
+            elif pending:
+                state = "prefetched" if all(future.done() for future in pending.values()) else "prefetching"
+            else:
+                state = "unloaded"
+            report.append((bundle_name, state, resident, size))
+        return report
+    
+    def _sound_bytes(self, sound):
+        """Return the size of a loaded sound's sample data in bytes."""
+        mixer_format = pygame.mixer.get_init()
+        if not mixer_format:
+            return 0
+        frequency, sample_format, channels = mixer_format
+        return int(sound.get_length() * frequency) * channels * (abs(sample_format) // 8)
+    
     def load_all_images(self):
         """Load all images defined in the manifest."""
         for image_id, image_data in self.image_manifest.items():
             self.load_image(image_id)
     
-    def load_image(self, image_id):
+    def load_image(self, image_id, raw_image=None):
         """
         Load an image by its ID from the manifest.
         
         Args:
             image_id: The ID of the image in the manifest
+            raw_image: Surface already decoded by a prefetch worker, used instead of reading the file
             
         Returns:
             The loaded pygame Surface, or a default surface if loading fails
@@ -124,21 +399,15 @@ class AssetManager:
         
         # Get image data from manifest
         image_data = self.image_manifest[image_id]
-        image_file = image_data["file"]
-        
-        # Try to load image from the assets directory
-        image_path = self.asset_dirs["images"] / image_file
+        image_path = self.asset_dirs["images"] / image_data["file"]
         
         try:
-            if image_path.exists():
-                self.images[image_id] = pygame.image.load(str(image_path))
-                
-                # Scale if specified
-                if "scale" in image_data:
-                    width, height = image_data["scale"]
-                    self.images[image_id] = pygame.transform.scale(
-                        self.images[image_id], (width, height)
-                    )
+            image = raw_image if raw_image is not None else self._load_raw_image(image_id)
+            if image is not None:
+                # Images loaded after the optimization pass are converted right away
+                if self.images_optimized:
+                    image = self._optimize_image(image_id, image)
+                self.images[image_id] = image
                 
                 logger.info(f"Image '{image_id}' loaded from {image_path}")
                 return self.images[image_id]
@@ -149,6 +418,203 @@ class AssetManager:
             logger.error(f"Error loading image '{image_id}' from {image_path}: {e}")
             return self._create_default_surface(image_id)
     
+    def _load_raw_image(self, image_id):
+        """
+        Load an image file and apply its manifest scale, without any display-format conversion.
+        
+        Args:
+            image_id: The ID of the image in the manifest
+            
+        Returns:
+            The loaded pygame Surface, or None if the file doesn't exist
+        """
+        image_data = self.image_manifest[image_id]
+        image_path = self.asset_dirs["images"] / image_data["file"]
+        if not image_path.exists():
+            return None
+        
+        image = pygame.image.load(str(image_path))
+        
+        # Scale if specified
+        if "scale" in image_data:
+            width, height = image_data["scale"]
+            image = pygame.transform.scale(image, (width, height))
+        
+        return image
+    
+    def classify_image(self, image_id, image):
+        """
+        Pick the fastest blit mode for an image.
+        
+        A manifest entry can force a mode with "blit" (e.g. images that get
+        RGBA tint blends at runtime need real per-pixel alpha).
+        
+        Args:
+            image_id: The ID of the image in the manifest
+            image: The unconverted pygame Surface
+            
+        Returns:
+            One of BLIT_OPAQUE, BLIT_COLORKEY or BLIT_ALPHA
+        """
+        forced = self.image_manifest.get(image_id, {}).get("blit")
+        if forced in (BLIT_OPAQUE, BLIT_COLORKEY, BLIT_ALPHA):
+            return forced
+        
+        # Surfaces without per-pixel alpha are opaque (or already colorkeyed)
+        if not image.get_flags() & pygame.SRCALPHA:
+            return BLIT_COLORKEY if image.get_colorkey() is not None else BLIT_OPAQUE
+        
+        if NUMPY_AVAILABLE:
+            alpha = pygame.surfarray.array_alpha(image)
+            if alpha.min() == 255:
+                return BLIT_OPAQUE
+            if np.all((alpha == 0) | (alpha == 255)):
+                return BLIT_COLORKEY
+            return BLIT_ALPHA
+        
+        # Slow fallback without NumPy
+        binary = True
+        opaque = True
+        width, height = image.get_size()
+        for x in range(width):
+            for y in range(height):
+                a = image.get_at((x, y)).a
+                if a != 255:
+                    opaque = False
+                    if a != 0:
+                        binary = False
+                        break
+            if not binary:
+                break
+        if opaque:
+            return BLIT_OPAQUE
+        return BLIT_COLORKEY if binary else BLIT_ALPHA
+    
+    def _find_colorkey(self, image):
+        """Return a color not used by any visible pixel of an image, or None."""
+        if NUMPY_AVAILABLE:
+            rgb = pygame.surfarray.array3d(image)
+            visible = pygame.surfarray.array_alpha(image) != 0
+            colors = rgb[visible]
+            for key in COLORKEY_CANDIDATES:
+                if not np.any(np.all(colors == key, axis=1)):
+                    return key
+            return None
+        
+        used = set()
+        width, height = image.get_size()
+        for x in range(width):
+            for y in range(height):
+                color = image.get_at((x, y))
+                if color.a != 0:
+                    used.add((color.r, color.g, color.b))
+        for key in COLORKEY_CANDIDATES:
+            if key not in used:
+                return key
+        return None
+    
+    def _optimize_image(self, image_id, image):
+        """
+        Convert an image to the display format using its fastest blit mode.
+        
+        Args:
+            image_id: The ID of the image in the manifest
+            image: The unconverted pygame Surface
+            
+        Returns:
+            The converted pygame Surface
+        """
+        mode = self.classify_image(image_id, image)
+        
+        if mode == BLIT_COLORKEY:
+            if image.get_flags() & pygame.SRCALPHA:
+                key = self._find_colorkey(image)
+                if key is None:
+                    # Every candidate key is in use, keep real alpha
+                    mode = BLIT_ALPHA
+                else:
+                    # Paint the transparent pixels with the key, then drop the alpha channel
+                    keyed = pygame.Surface(image.get_size())
+                    keyed.fill(key)
+                    keyed.blit(image, (0, 0))
+                    converted = keyed.convert()
+                    converted.set_colorkey(key, pygame.RLEACCEL)
+            else:
+                converted = image.convert()
+                converted.set_colorkey(image.get_colorkey(), pygame.RLEACCEL)
+        
+        if mode == BLIT_OPAQUE:
+            converted = image.convert()
+        elif mode == BLIT_ALPHA:
+            converted = image.convert_alpha()
+        
+        self.blit_modes[image_id] = mode
+        return converted
+    
+    def optimize_images(self):
+        """
+        Convert every loaded image to the display's pixel format.
+        
+        Must run after pygame.display.set_mode() (a dummy video driver works too).
+        Loaded images are replaced in place, and images loaded later are converted on load.
+        
+        Returns:
+            Dictionary mapping each image ID to its blit mode
+        """
+        if pygame.display.get_surface() is None:
+            logger.warning("Image optimization skipped: no display surface yet")
+            return self.blit_modes
+        
+        for image_id, image in list(self.images.items()):
+            if image_id in self.image_manifest and image_id not in self.blit_modes:
+                self.images[image_id] = self._optimize_image(image_id, image)
+        self.images_optimized = True
+        
+        counts = {}
+        for mode in self.blit_modes.values():
+            counts[mode] = counts.get(mode, 0) + 1
+        logger.info(f"Optimized {len(self.blit_modes)} images: " +
+                    ", ".join(f"{count} {mode}" for mode, count in sorted(counts.items())))
+        return self.blit_modes
+    
+    def get_blit_report(self):
+        """
+        Describe how each image was classified.
+        
+        Returns:
+            List of (image_id, blit_mode, (width, height)) tuples sorted by image ID
+        """
+        return [(image_id, mode, self.images[image_id].get_size())
+                for image_id, mode in sorted(self.blit_modes.items())]
+    
+    def benchmark_blits(self, target=None, repeats=200):
+        """
+        Measure blit cost of every optimized image against its unconverted original.
+        
+        Args:
+            target: Surface to blit onto (defaults to the display surface)
+            repeats: Number of blits timed per image
+            
+        Returns:
+            Dictionary mapping image ID to (raw_us, optimized_us) average microseconds per blit
+        """
+        if target is None:
+            target = pygame.display.get_surface()
+        results = {}
+        for image_id in sorted(self.blit_modes):
+            raw = self._load_raw_image(image_id)
+            if raw is None:
+                continue
+            optimized = self.images[image_id]
+            timings = []
+            for image in (raw, optimized):
+                start = time.perf_counter()
+                for _ in range(repeats):
+                    target.blit(image, (0, 0))
+                timings.append((time.perf_counter() - start) / repeats * 1000000)
+            results[image_id] = tuple(timings)
+        return results
+    
     def _create_default_surface(self, image_id):
         """Create a default surface for an image that couldn't be loaded."""
         # Determine size based on image ID
@@ -197,25 +663,26 @@ class AssetManager:
         sound_data = self.sound_manifest[sound_id]
         sound_file = sound_data["file"]
         
-        # Try to load sound from the assets directory
-        sound_path = self.asset_dirs["sounds"] / sound_file
-        
-        try:
-            if sound_path.exists():
-                self.sounds[sound_id] = pygame.mixer.Sound(str(sound_path))
-                
-                # Set volume if specified
-                if "volume" in sound_data:
-                    self.sounds[sound_id].set_volume(sound_data["volume"])
-                
-                logger.info(f"Sound '{sound_id}' loaded from {sound_path}")
-                return self.sounds[sound_id]
-            else:
-                logger.warning(f"Sound file not found: {sound_path}")
-                return None
-        except pygame.error as e:
-            logger.error(f"Error loading sound '{sound_id}' from {sound_path}: {e}")
+        # Try the compact variants first, then the WAV
+        sound_paths = get_variant_paths(self.asset_dirs["sounds"], sound_data)
+        if not sound_paths:
+            logger.warning(f"Sound file not found: {self.asset_dirs['sounds'] / sound_file}")
             return None
+        
+        for sound_path in sound_paths:
+            try:
+                self.sounds[sound_id] = pygame.mixer.Sound(sound_path)
+            except pygame.error as e:
+                logger.error(f"Error loading sound '{sound_id}' from {sound_path}: {e}")
+                continue
+            
+            # Set volume if specified
+            if "volume" in sound_data:
+                self.sounds[sound_id].set_volume(sound_data["volume"])
+            
+            logger.info(f"Sound '{sound_id}' loaded from {sound_path}")
+            return self.sounds[sound_id]
+        return None
     
     def load_all_music(self):
         """Load all music tracks defined in the manifest."""
@@ -226,6 +693,9 @@ class AssetManager:
         """
         Get the path to a music file by its ID from the manifest.
         
+        A compact variant (e.g. OGG) is preferred when the manifest lists one
+        and it exists; otherwise the WAV is used.
+        
         Args:
             music_id: The ID of the music track in the manifest
             
@@ -242,18 +712,20 @@ class AssetManager:
         music_file = music_data["file"]
         
         # Try to find music file in the assets directory
-        music_path = self.asset_dirs["music"] / music_file
+        music_paths = get_variant_paths(self.asset_dirs["music"], music_data)
         
-        if music_path.exists():
-            # Store the path
+        if music_paths:
+            # Store the path, and the rest in case the first can't be decoded
+            music_path = music_paths[0]
             self.music[music_id] = {
-                "path": str(music_path),
+                "path": music_path,
+                "fallbacks": music_paths[1:],
                 "volume": music_data.get("volume", 0.5)
             }
             logger.info(f"Music '{music_id}' found at {music_path}")
-            return str(music_path)
+            return music_path
         else:
-            logger.warning(f"Music file not found: {music_path}")
+            logger.warning(f"Music file not found: {self.asset_dirs['music'] / music_file}")
             return None
     
     def load_all_maps(self):
@@ -342,16 +814,30 @@ class AssetManager:
     
     def reload_assets(self):
         """Reload all assets from disk."""
+        # Remember which bundles were in use
+        bundle_names = set(self.loaded_bundles)
+        for pending in self.prefetches.values():
+            for future in pending.values():
+                future.cancel()
+        
         # Reload manifests
         self._load_asset_manifests()
         
         # Clear cached assets
         self.images = {}
+        self.blit_modes = {}
         self.sounds = {}
         self.music = {}
         self.maps = {}
+        self.loaded_bundles = set()
+        self.prefetches = {}
         
-        # Reload assets
-        self.load_all_assets()
+        # Reload the bundles that were loaded
+        self.load_all_music()
+        self.load_all_maps()
+        for bundle_name in bundle_names:
+            self.load_bundle(bundle_name)
+        if self.current_map_id is not None:
+            self.enter_map(self.current_map_id)
         
         logger.info("All assets reloaded")
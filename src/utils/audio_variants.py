@@ -0,0 +1,67 @@
+"""
+Audio variants for the Space Impact game.
+Sound and music manifest entries keep the WAV in "file" and can list compact
+transcodes under "variants" (written by ``python -m tools.transcode_audio``).
+The helpers here pick the variant to load at runtime, with the WAV as fallback.
+"""
+import os
+import json
+from src.config import BASE_DIR, get_asset_path
+
+# Compressed formats preferred at runtime, best first; the WAV in "file" is always the fallback
+PREFERRED_FORMATS = ('ogg',)
+
+def load_audio_manifest(subdir):
+    """
+    Read an audio manifest.
+
+    Args:
+        subdir: 'sounds' or 'music'
+
+    Returns:
+        The manifest dictionary, or an empty one if it can't be read
+    """
+    try:
+        with open(BASE_DIR / "assets" / subdir / "manifest.json", "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def get_variant_paths(directory, entry):
+    """
+    List the files an audio manifest entry can be loaded from, in preference order.
+
+    Args:
+        directory: Path of the asset directory the entry belongs to
+        entry: Manifest entry with "file" and optional "variants"
+
+    Returns:
+        List of existing file paths (as strings), compact variants first, WAV last
+    """
+    variants = entry.get("variants", {})
+    names = [variants[fmt] for fmt in PREFERRED_FORMATS if fmt in variants]
+    names.append(entry["file"])
+    return [str(directory / name) for name in names if (directory / name).exists()]
+
+def find_variant_paths(subdir, filename, manifest=None):
+    """
+    List the files a WAV can be loaded from, using the manifest entry that names it.
+
+    Args:
+        subdir: 'sounds' or 'music'
+        filename: WAV file name, as listed in the entry's "file"
+        manifest: Already loaded manifest for subdir (read from disk if None)
+
+    Returns:
+        List of existing file paths, compact variants first (empty if nothing exists)
+    """
+    if manifest is None:
+        manifest = load_audio_manifest(subdir)
+    for entry in manifest.values():
+        if entry.get("file") == filename:
+            paths = get_variant_paths(BASE_DIR / "assets" / subdir, entry)
+            if paths:
+                return paths
+    # Not in the manifest: the WAV alone, wherever get_asset_path finds it
+    path = get_asset_path(subdir, filename)
+    return [path] if os.path.exists(path) else []
@@ -3,9 +3,12 @@ Background manager for themed map visuals.
 Highly optimized version with reduced visual effects for better performance.
 """
 import pygame
-import random
 import math
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.utils.game_clock import get_rng
+
+# Random streams (seeded through the game clock module)
+rng = get_rng('background')
 
 class BackgroundManager:
     def __init__(self, asset_loader=None):
@@ -42,13 +45,8 @@ class BackgroundManager:
         # Frame counter for staggered updates
         self.frame_counter = 0
         
-        # Pre-render the blue stars at different alpha levels
+        # Blue stars at different alpha levels, rendered on first use
         self.blue_stars_surfaces = {}
-        if self.blue_stars_image:
-            for alpha in range(100, 256, 10):  # Create surfaces for alpha values 100, 110, 120, ..., 250
-                surface = self.blue_stars_image.copy()
-                surface.set_alpha(alpha)
-                self.blue_stars_surfaces[alpha] = surface
     
     def set_asset_loader(self, asset_loader):
         """Set the asset loader after initialization."""
@@ -60,23 +58,27 @@ class BackgroundManager:
         self.overlay_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         self.overlay_surface.fill((20, 0, 40, 30))  # Dark purple with transparency
         
-        # Pre-render the blue stars at different alpha levels
+        # Blue stars at different alpha levels, rendered on first use
         self.blue_stars_surfaces = {}
-        if self.blue_stars_image:
-            for alpha in range(100, 256, 10):  # Create surfaces for alpha values 100, 110, 120, ..., 250
-                surface = self.blue_stars_image.copy()
-                surface.set_alpha(alpha)
-                self.blue_stars_surfaces[alpha] = surface
+    
+    def _get_blue_stars_surface(self, alpha):
+        """Return the blue stars image at an alpha level, rendering it the first time it's needed."""
+        surface = self.blue_stars_surfaces.get(alpha)
+        if surface is None:
+            surface = self.blue_stars_image.copy()
+            surface.set_alpha(alpha)
+            self.blue_stars_surfaces[alpha] = surface
+        return surface
     
     def _create_debris(self):
         return {
-            'x': random.randint(0, SCREEN_WIDTH),
-            'y': random.randint(0, SCREEN_HEIGHT),
-            'size': random.randint(2, 4),  # Reduced size
-            'speed': random.uniform(0.5, 1.5),  # Reduced speed
+            'x': rng.randint(0, SCREEN_WIDTH),
+            'y': rng.randint(0, SCREEN_HEIGHT),
+            'size': rng.randint(2, 4),  # Reduced size
+            'speed': rng.uniform(0.5, 1.5),  # Reduced speed
             'color': (100, 100, 120),
-            'rotation': random.uniform(0, 6.28),
-            'rotation_speed': random.uniform(-0.01, 0.01)  # Reduced rotation speed
+            'rotation': rng.uniform(0, 6.28),
+            'rotation_speed': rng.uniform(-0.01, 0.01)  # Reduced rotation speed
         }
     
     def update(self):
@@ -110,7 +112,7 @@ class BackgroundManager:
                 
                 if debris['x'] < -10:
                     debris['x'] = SCREEN_WIDTH + 10
-                    debris['y'] = random.randint(0, SCREEN_HEIGHT)
+                    debris['y'] = rng.randint(0, SCREEN_HEIGHT)
     
     def draw(self, surface):
         # Draw background image with parallax scrolling
@@ -124,13 +126,13 @@ class BackgroundManager:
                 surface.blit(self.overlay_surface, (0, 0))
         
         # Draw blue stars with blinking effect (using pre-rendered surfaces)
-        if self.blue_stars_surfaces:
+        if self.blue_stars_image:
             # Find the closest pre-rendered alpha level
             alpha_key = round(self.blue_stars_alpha / 10) * 10
             alpha_key = max(100, min(250, alpha_key))  # Ensure it's within our pre-rendered range
             
             # Use the pre-rendered surface
-            surface.blit(self.blue_stars_surfaces[alpha_key], (0, 0))
+            surface.blit(self._get_blue_stars_surface(alpha_key), (0, 0))
         
         # Draw cosmic debris (simplified)
         for debris in self.cosmic_debris:
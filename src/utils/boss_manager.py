@@ -4,6 +4,10 @@ Handles boss creation, updates, and collisions.
 """
 import pygame
 from ..sprites.boss import Boss
+from .collision_manager import LAYER_PLAYER, LAYER_PLAYER_BULLET, LAYER_BOSS, LAYER_BOSS_BULLET
+from .log_manager import get_logger, throttle
+
+logger = get_logger('boss')
 
 class BossManager:
     """Manages boss entities and their interactions."""
@@ -34,13 +38,13 @@ class BossManager:
         self.mini_boss_dying = False
         self.main_boss_dying = False
         
-        print("Boss manager reset - all bosses cleared")
+        logger.info("Boss manager reset - all bosses cleared")
     
     def spawn_boss(self, boss_type):
         """Spawn a boss of the specified type."""
         # First, clear any existing bosses
         self.reset()
-        print(f"Spawning {boss_type} boss after reset")
+        logger.info(f"Spawning {boss_type} boss after reset")
         
         # Set spawn position at right edge of screen, centered vertically
         x = self.game_manager.screen.get_width()
@@ -52,10 +56,12 @@ class BossManager:
             # Set player reference for targeting
             if hasattr(self.game_manager, 'player'):
                 self.mini_boss.player_ref = self.game_manager.player
+            # Death explosions go into the shared particle system
+            self.mini_boss.particle_system = getattr(self.game_manager, 'particle_system', None)
             # Add to all sprites group
             self.game_manager.all_sprites.add(self.mini_boss)
             self.mini_boss_spawned = True
-            print(f"Mini boss spawned!")
+            logger.info(f"Mini boss spawned!")
             return self.mini_boss
         elif boss_type == 'main':
             # Create main boss
@@ -63,16 +69,18 @@ class BossManager:
             # Set player reference for targeting
             if hasattr(self.game_manager, 'player'):
                 self.main_boss.player_ref = self.game_manager.player
+            # Death explosions go into the shared particle system
+            self.main_boss.particle_system = getattr(self.game_manager, 'particle_system', None)
             # Add to all sprites group
             # Debug boss attributes
-            print(f"Boss attributes: entry_complete={self.main_boss.entry_complete}, " +
-                  f"entry_speed={self.main_boss.entry_speed}, " +
-                  f"entry_target_x={self.main_boss.entry_target_x}, " +
-                  f"last_shot={self.main_boss.last_shot}, " +
-                  f"shoot_delay={self.main_boss.shoot_delay}")
+            logger.debug("Boss attributes: entry_complete=%s, entry_speed=%s, entry_target_x=%s, "
+                         "last_shot=%s, shoot_delay=%s",
+                         self.main_boss.entry_complete, self.main_boss.entry_speed,
+                         self.main_boss.entry_target_x, self.main_boss.last_shot,
+                         self.main_boss.shoot_delay)
             self.game_manager.all_sprites.add(self.main_boss)
             self.main_boss_spawned = True
-            print(f"Main boss spawned! ID: {id(self.main_boss)}")
+            logger.info(f"Main boss spawned! ID: {id(self.main_boss)}")
             # Force initialization of critical attributes
             self.main_boss.entry_complete = False
             self.main_boss.movement_timer = 0
@@ -94,7 +102,7 @@ class BossManager:
                 self.mini_boss.kill()  # Remove from all sprite groups
                 self.mini_boss = None
                 self.mini_boss_dying = False
-                print("Mini boss destroyed and removed!")
+                logger.info("Mini boss destroyed and removed!")
                 
                 # Notify phase manager that mini boss is defeated
                 if hasattr(self.game_manager.phase_manager, 'handle_boss_defeated'):
@@ -103,7 +111,10 @@ class BossManager:
         # Update main boss
         if self.main_boss:
             # Debug main boss state
-            print(f"Main boss update: entry={self.main_boss.entry_complete}, pos=({self.main_boss.rect.x}, {self.main_boss.rect.y}), last_shot={self.main_boss.last_shot}, shoot_delay={self.main_boss.shoot_delay}")
+            if throttle('boss.main_update'):
+                logger.debug("Main boss update: entry=%s, pos=(%s, %s), last_shot=%s, shoot_delay=%s",
+                             self.main_boss.entry_complete, self.main_boss.rect.x, self.main_boss.rect.y,
+                             self.main_boss.last_shot, self.main_boss.shoot_delay)
             # Update boss and check if death animation is complete
             animation_complete = self.main_boss.update()
             if animation_complete:
@@ -111,7 +122,7 @@ class BossManager:
                 self.main_boss.kill()  # Remove from all sprite groups
                 self.main_boss = None
                 self.main_boss_dying = False
-                print("Main boss destroyed and removed!")
+                logger.info("Main boss destroyed and removed!")
                 
                 # Notify phase manager that main boss is defeated
                 if hasattr(self.game_manager.phase_manager, 'handle_boss_defeated'):
@@ -158,7 +169,8 @@ class BossManager:
         if not hasattr(boss, 'hitbox'):
             return
         
-        print(f"Checking collisions for {boss.boss_type} boss")
+        if throttle('boss.collisions'):
+            logger.debug("Checking collisions for %s boss", boss.boss_type)
         
         # Handle laser collision with player
         if boss.boss_type == 'main' and hasattr(boss, 'laser_active') and boss.laser_active:
@@ -184,34 +196,36 @@ class BossManager:
                         damage=3  # Increased from 2 to 3 damage per frame
                     )
             
+        collisions = self.game_manager.collision_manager
+        
         # Check player bullets against boss
-        for bullet in list(player.bullets):
-            if bullet.hitbox.colliderect(boss.hitbox):
-                print(f"Player bullet hit {boss.boss_type} boss!")
-                # Get bullet position for weak point detection
-                hit_position = (bullet.rect.centerx, bullet.rect.centery)
+        for bullet in collisions.query(boss.hitbox, LAYER_BOSS, LAYER_PLAYER_BULLET, boss):
+            logger.debug("Player bullet hit %s boss!", boss.boss_type)
+            # Get bullet position for weak point detection
+            hit_position = (bullet.rect.centerx, bullet.rect.centery)
+            
+            # Remove the bullet
+            bullet.kill()
+            
+            # Apply damage to boss with hit position
+            if boss.take_damage(1, hit_position):
+                # Boss defeated
+                points = boss.score_value * player.score_multiplier
+                self.game_manager.score += points
                 
-                # Remove the bullet
-                bullet.kill()
+                # Set dying flag
+                if boss == self.mini_boss:
+                    self.mini_boss_dying = True
+                elif boss == self.main_boss:
+                    self.main_boss_dying = True
                 
-                # Apply damage to boss with hit position
-                if boss.take_damage(1, hit_position):
-                    # Boss defeated
-                    points = boss.score_value * player.score_multiplier
-                    self.game_manager.score += points
-                    
-                    # Set dying flag
-                    if boss == self.mini_boss:
-                        self.mini_boss_dying = True
-                    elif boss == self.main_boss:
-                        self.main_boss_dying = True
-                    
-                    return  # Exit after boss is defeated
+                return  # Exit after boss is defeated
         
         # Check boss bullets against player
         if hasattr(boss, 'bullets'):
-            for bullet in list(boss.bullets):
-                if player.hitbox.colliderect(bullet.hitbox):
+            for bullet in collisions.query(player.hitbox, LAYER_PLAYER, LAYER_BOSS_BULLET, player):
+                # Only handle bullets fired by this boss
+                if bullet in boss.bullets:
                     bullet.kill()
                     god_mode = self.game_manager.testing_mode and self.game_manager.ui_manager.god_mode
                     source_id = f"boss_bullet_{bullet.rect.x}_{bullet.rect.y}"
@@ -225,8 +239,8 @@ class BossManager:
                                 self.game_manager.game_state = self.game_manager.GAME_STATE_GAME_OVER
                                 self.game_manager.sound_manager.play_sound('game_over')
         
-        # Check direct collision between player and boss
-        if player.hitbox.colliderect(boss.hitbox):
+        # Check direct collision between player and boss (pixel-perfect after the rect hit)
+        if player.hitbox.colliderect(boss.hitbox) and collisions.narrowphase(player, boss):
             god_mode = self.game_manager.testing_mode and self.game_manager.ui_manager.god_mode
             source_id = f"boss_body_{boss.boss_type}"
             if player.take_damage(god_mode, source_id=source_id):
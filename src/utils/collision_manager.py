@@ -0,0 +1,227 @@
+"""
+Collision Manager for the Space Impact game.
+Provides a uniform-grid broadphase so collision checks only test nearby pairs,
+with an optional pixel-mask narrowphase that confirms rect hits.
+"""
+import pygame
+from src.utils.mask_cache import sprites_overlap, sprite_overlaps_rect
+
+# Collision layers (bit flags so they can be combined into masks)
+LAYER_PLAYER = 1 << 0
+LAYER_PLAYER_BULLET = 1 << 1
+LAYER_ENEMY = 1 << 2
+LAYER_ENEMY_BULLET = 1 << 3
+LAYER_ASTEROID = 1 << 4
+LAYER_DEBRIS = 1 << 5
+LAYER_POWERUP = 1 << 6
+LAYER_BOSS = 1 << 7
+LAYER_BOSS_BULLET = 1 << 8
+
+LAYER_NAMES = {
+    LAYER_PLAYER: 'player',
+    LAYER_PLAYER_BULLET: 'player_bullet',
+    LAYER_ENEMY: 'enemy',
+    LAYER_ENEMY_BULLET: 'enemy_bullet',
+    LAYER_ASTEROID: 'asteroid',
+    LAYER_DEBRIS: 'debris',
+    LAYER_POWERUP: 'powerup',
+    LAYER_BOSS: 'boss',
+    LAYER_BOSS_BULLET: 'boss_bullet',
+}
+
+# Which layers each layer is allowed to collide with
+DEFAULT_COLLISION_MATRIX = {
+    LAYER_PLAYER: LAYER_ENEMY | LAYER_ENEMY_BULLET | LAYER_DEBRIS | LAYER_POWERUP | LAYER_BOSS | LAYER_BOSS_BULLET,
+    LAYER_PLAYER_BULLET: LAYER_ENEMY | LAYER_ASTEROID | LAYER_DEBRIS | LAYER_BOSS,
+    LAYER_ENEMY: LAYER_PLAYER | LAYER_PLAYER_BULLET,
+    LAYER_ENEMY_BULLET: LAYER_PLAYER,
+    LAYER_ASTEROID: LAYER_PLAYER_BULLET,
+    LAYER_DEBRIS: LAYER_PLAYER | LAYER_PLAYER_BULLET,
+    LAYER_POWERUP: LAYER_PLAYER,
+    LAYER_BOSS: LAYER_PLAYER | LAYER_PLAYER_BULLET,
+    LAYER_BOSS_BULLET: LAYER_PLAYER,
+}
+
+class CollisionManager:
+    """Spatial-hash broadphase with a layer/mask collision matrix."""
+
+    def __init__(self, cell_size=64, use_masks=True):
+        """
+        Initialize the collision manager.
+
+        Args:
+            cell_size: Width and height of a grid cell in pixels
+            use_masks: Confirm rect hits with cached pixel masks when a sprite is given
+        """
+        self.cell_size = cell_size
+        self.use_masks = use_masks
+        self.collision_matrix = dict(DEFAULT_COLLISION_MATRIX)
+
+        # Spatial hash: (cell_x, cell_y) -> list of entry indices
+        self.grid = {}
+        # Entries are (obj, rect, layer) in insertion order
+        self.entries = []
+        self.layer_counts = {}
+        self.removed = set()
+
+        # Per-frame statistics (current frame and the last completed frame)
+        self.stats = self._empty_stats()
+        self.last_frame_stats = self._empty_stats()
+
+    def _empty_stats(self):
+        """Create a fresh statistics dictionary."""
+        return {
+            'entities': 0,
+            'queries': 0,
+            'pair_tests': 0,
+            'naive_pair_tests': 0,
+            'hits': 0,
+            'mask_tests': 0,
+            'mask_rejections': 0,
+            'pairs': {}
+        }
+
+    def begin_frame(self):
+        """Clear the grid and start collecting statistics for a new frame."""
+        if self.stats['entities'] or self.stats['queries']:
+            self.last_frame_stats = self.stats
+        self.stats = self._empty_stats()
+        self.grid.clear()
+        self.entries = []
+        self.layer_counts = {}
+        self.removed.clear()
+
+    def set_collides(self, layer_a, layer_b, enabled=True):
+        """Enable or disable collisions between two layers (symmetric)."""
+        if enabled:
+            self.collision_matrix[layer_a] = self.collision_matrix.get(layer_a, 0) | layer_b
+            self.collision_matrix[layer_b] = self.collision_matrix.get(layer_b, 0) | layer_a
+        else:
+            self.collision_matrix[layer_a] = self.collision_matrix.get(layer_a, 0) & ~layer_b
+            self.collision_matrix[layer_b] = self.collision_matrix.get(layer_b, 0) & ~layer_a
+
+    def can_collide(self, layer_a, layer_b):
+        """Check the collision matrix for a pair of layers."""
+        return bool(self.collision_matrix.get(layer_a, 0) & layer_b)
+
+    def _cells_for_rect(self, rect):
+        """Return the range of grid cells covered by a rect."""
+        size = self.cell_size
+        return (rect.left // size, (rect.right - 1) // size,
+                rect.top // size, (rect.bottom - 1) // size)
+
+    def insert(self, obj, rect, layer):
+        """Add an object with its collision rect to the grid for this frame."""
+        index = len(self.entries)
+        self.entries.append((obj, rect, layer))
+        self.layer_counts[layer] = self.layer_counts.get(layer, 0) + 1
+        self.stats['entities'] += 1
+
+        min_x, max_x, min_y, max_y = self._cells_for_rect(rect)
+        grid = self.grid
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = grid.get((cell_x, cell_y))
+                if cell is None:
+                    grid[(cell_x, cell_y)] = [index]
+                else:
+                    cell.append(index)
+
+    def insert_group(self, group, layer):
+        """Add every sprite of a group using its hitbox."""
+        for sprite in group:
+            self.insert(sprite, sprite.hitbox, layer)
+
+    def remove(self, obj):
+        """Exclude an object from the remaining queries of this frame."""
+        self.removed.add(id(obj))
+
+    def query(self, rect, source_layer, target_layer, sprite=None):
+        """
+        Find objects on a layer that overlap a rect.
+
+        Args:
+            rect: The rect to test against the grid
+            source_layer: Layer of the object doing the query
+            target_layer: Layer of the objects to test against
+            sprite: Sprite doing the query; if given, rect hits must also
+                    overlap pixel-perfectly with its mask
+
+        Returns:
+            list: Colliding objects in insertion order
+        """
+        if not self.can_collide(source_layer, target_layer):
+            return []
+
+        stats = self.stats
+        stats['queries'] += 1
+        target_count = self.layer_counts.get(target_layer, 0)
+        stats['naive_pair_tests'] += target_count
+        if target_count == 0:
+            return []
+
+        # Gather candidate entries from every cell the rect touches
+        candidates = set()
+        min_x, max_x, min_y, max_y = self._cells_for_rect(rect)
+        grid = self.grid
+        entries = self.entries
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = grid.get((cell_x, cell_y))
+                if cell:
+                    for index in cell:
+                        if entries[index][2] == target_layer:
+                            candidates.add(index)
+
+        if not candidates:
+            return []
+
+        # Narrow test in insertion order so results match a brute-force loop
+        hits = []
+        tests = 0
+        removed = self.removed
+        for index in sorted(candidates):
+            obj, obj_rect, _ = entries[index]
+            if removed and id(obj) in removed:
+                continue
+            # Skip sprites that were killed earlier this frame
+            if isinstance(obj, pygame.sprite.Sprite) and not obj.alive():
+                continue
+            tests += 1
+            if rect.colliderect(obj_rect):
+                if sprite is not None and not self.narrowphase(sprite, obj):
+                    continue
+                hits.append(obj)
+
+        stats['pair_tests'] += tests
+        stats['hits'] += len(hits)
+        pair_name = f"{LAYER_NAMES.get(source_layer, source_layer)}/{LAYER_NAMES.get(target_layer, target_layer)}"
+        stats['pairs'][pair_name] = stats['pairs'].get(pair_name, 0) + tests
+        return hits
+
+    def narrowphase(self, sprite, other):
+        """
+        Confirm a rect hit with the cached pixel masks.
+
+        Args:
+            sprite: Sprite whose rect hit the other object
+            other: Sprite, or a plain pygame.Rect (projectiles, beams)
+
+        Returns:
+            bool: True if the opaque pixels overlap (or masks are disabled)
+        """
+        if not self.use_masks:
+            return True
+        stats = self.stats
+        stats['mask_tests'] += 1
+        if isinstance(other, pygame.Rect):
+            hit = sprite_overlaps_rect(sprite, other)
+        else:
+            hit = sprites_overlap(sprite, other)
+        if not hit:
+            stats['mask_rejections'] += 1
+        return hit
+
+    def get_frame_stats(self):
+        """Return the statistics of the last completed frame."""
+        return self.last_frame_stats
@@ -2,17 +2,24 @@
 Enemy Behavior Manager for Space Conquer.
 Handles different enemy movement and attack patterns.
 """
-import pygame
-import random
 import math
-import time
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.utils.projectile_manager import KIND_DOWN, KIND_LEFT, KIND_AIMED, KIND_MISSILE
+from src.utils.game_clock import get_clock, get_rng
+from src.utils.trail_system import Trail
+from src.utils.tint_cache import get_tint_cache
+
+# Random streams (seeded through the game clock module)
+rng = get_rng('enemies')
 
 class EnemyBehaviorManager:
     """Manages different enemy behaviors and movement patterns."""
     
-    def __init__(self):
+    def __init__(self, projectile_manager=None):
         """Initialize the behavior manager."""
+        # Shared pool that receives every projectile enemies fire
+        self.projectile_manager = projectile_manager
+        
         # Dictionary of available behaviors
         self.behaviors = {
             "drifter": self.drifter_behavior,
@@ -53,7 +60,7 @@ class EnemyBehaviorManager:
     def _init_drifter(self, enemy):
         """Initialize drifter behavior (low-type enemy)."""
         # Horizontal movement properties (primary movement) - reduced by 25%
-        base_speed = random.uniform(1.5, 2.0)
+        base_speed = rng.uniform(1.5, 2.0)
         enemy.horizontal_speed = base_speed * 0.75  # 25% reduction in speed
         
         # Dash properties (rare vertical movement)
@@ -63,7 +70,7 @@ class EnemyBehaviorManager:
         enemy.dash_duration = 0
         enemy.dash_speed = enemy.horizontal_speed * 0.8  # Dash speed slightly slower than horizontal
         enemy.dash_cooldown = 0  # Cooldown after a dash
-        enemy.dash_trail = []  # Store positions for trail effect
+        enemy.dash_trail = Trail(5)  # Store the last 5 positions for trail effect
         enemy.dash_warning = 0  # Warning time before dash
         
         # Shooting properties
@@ -76,18 +83,18 @@ class EnemyBehaviorManager:
         enemy.targeting_line_visible = False  # Whether to show targeting line
         
         # Stutter behavior
-        enemy.stutter_timer = random.uniform(3.0, 5.0)  # Time until next stutter
+        enemy.stutter_timer = rng.uniform(3.0, 5.0)  # Time until next stutter
         enemy.stutter_duration = 0.0  # Current stutter duration
         enemy.is_stuttering = False
-        enemy.last_time = time.time()
+        enemy.last_time = get_clock().time()
         enemy.stutter_warning = 0  # Warning time before stutter
         
         # Flickering light properties
-        enemy.light_flicker_speed = random.uniform(0.1, 0.2)
-        enemy.light_flicker_angle = random.random() * 6.28
+        enemy.light_flicker_speed = rng.uniform(0.1, 0.2)
+        enemy.light_flicker_angle = rng.random() * 6.28
         enemy.light_brightness = 50  # Base brightness
         enemy.light_size = 3
-        enemy.light_color_shift = random.choice([
+        enemy.light_color_shift = rng.choice([
             (255, 100, 100),  # Red
             (100, 100, 255),  # Blue
             (255, 255, 100),  # Yellow
@@ -98,30 +105,30 @@ class EnemyBehaviorManager:
         # Visual effect properties
         enemy.engine_glow = 0  # Engine glow intensity
         enemy.hit_flash = 0  # Flash when taking damage
-        enemy.variant = random.randint(0, 2)  # Visual variant (0-2)
+        enemy.variant = rng.randint(0, 2)  # Visual variant (0-2)
         
         # Position at the right edge of the screen with random y position
-        enemy.rect.x = SCREEN_WIDTH + random.randint(10, 30)  # Just off the right edge
-        enemy.rect.y = random.randint(50, SCREEN_HEIGHT - 100)  # Random vertical position
+        enemy.rect.x = SCREEN_WIDTH + rng.randint(10, 30)  # Just off the right edge
+        enemy.rect.y = rng.randint(50, SCREEN_HEIGHT - 100)  # Random vertical position
         
         # Set light position after rect is positioned
         enemy.light_position = (enemy.rect.centerx, enemy.rect.centery - 5)
     
     def _init_oscillate(self, enemy):
         """Initialize oscillating behavior."""
-        enemy.oscillation_amplitude = random.randint(10, 20)
-        enemy.oscillation_speed = random.uniform(0.05, 0.1)
-        enemy.oscillation_angle = random.random() * 6.28
+        enemy.oscillation_amplitude = rng.randint(10, 20)
+        enemy.oscillation_speed = rng.uniform(0.05, 0.1)
+        enemy.oscillation_angle = rng.random() * 6.28
         
         # Position from the right side
-        enemy.rect.x = SCREEN_WIDTH + random.randint(50, 200)
-        enemy.rect.y = random.randint(50, SCREEN_HEIGHT - 50)
+        enemy.rect.x = SCREEN_WIDTH + rng.randint(50, 200)
+        enemy.rect.y = rng.randint(50, SCREEN_HEIGHT - 50)
     
     def _init_zigzag(self, enemy):
         """Initialize elite-type enemy behavior with burst speed capability."""
         # Position from the right side
-        enemy.rect.x = SCREEN_WIDTH + random.randint(50, 200)
-        enemy.rect.y = random.randint(50, SCREEN_HEIGHT - 50)
+        enemy.rect.x = SCREEN_WIDTH + rng.randint(50, 200)
+        enemy.rect.y = rng.randint(50, SCREEN_HEIGHT - 50)
         
         # Elite-type enemies have higher speed with burst capability
         if enemy.enemy_type == 'elite':
@@ -141,30 +148,30 @@ class EnemyBehaviorManager:
     
     def _init_sine(self, enemy):
         """Initialize sine wave behavior."""
-        enemy.angle = random.random() * 6.28
+        enemy.angle = rng.random() * 6.28
         enemy.center_y = enemy.rect.centery
-        enemy.amplitude = random.randint(30, 70)
-        enemy.frequency = random.uniform(0.05, 0.1)
+        enemy.amplitude = rng.randint(30, 70)
+        enemy.frequency = rng.uniform(0.05, 0.1)
         
         # Position from the right side
-        enemy.rect.x = SCREEN_WIDTH + random.randint(50, 200)
-        enemy.rect.y = random.randint(50, SCREEN_HEIGHT - 50)
+        enemy.rect.x = SCREEN_WIDTH + rng.randint(50, 200)
+        enemy.rect.y = rng.randint(50, SCREEN_HEIGHT - 50)
     
     def _init_dive(self, enemy):
         """Initialize dive behavior."""
         enemy.dive_state = "approach"
-        enemy.target_y = random.randint(100, SCREEN_HEIGHT - 100)
+        enemy.target_y = rng.randint(100, SCREEN_HEIGHT - 100)
         enemy.dive_speed = enemy.speed * 1.5
         
         # Position from the right side
-        enemy.rect.x = SCREEN_WIDTH + random.randint(50, 200)
-        enemy.rect.y = random.randint(50, SCREEN_HEIGHT - 50)
+        enemy.rect.x = SCREEN_WIDTH + rng.randint(50, 200)
+        enemy.rect.y = rng.randint(50, SCREEN_HEIGHT - 50)
     
     def _init_straight(self, enemy):
         """Initialize straight behavior."""
         # Position from the right side
-        enemy.rect.x = SCREEN_WIDTH + random.randint(50, 200)
-        enemy.rect.y = random.randint(50, SCREEN_HEIGHT - 50)
+        enemy.rect.x = SCREEN_WIDTH + rng.randint(50, 200)
+        enemy.rect.y = rng.randint(50, SCREEN_HEIGHT - 50)
     
     def drifter_behavior(self, enemy, delta_time):
         """Update drifter behavior (low-type enemy)."""
@@ -181,7 +188,7 @@ class EnemyBehaviorManager:
                         # Start stuttering
                         enemy.is_stuttering = True
                         enemy.stutter_duration = 0.5  # Stutter for 0.5 seconds
-                        enemy.stutter_timer = random.uniform(3.0, 5.0)  # Reset timer for next stutter
+                        enemy.stutter_timer = rng.uniform(3.0, 5.0)  # Reset timer for next stutter
                         enemy.stutter_warning = 0
             else:
                 enemy.stutter_warning = 0
@@ -204,7 +211,7 @@ class EnemyBehaviorManager:
         
         # Determine if we should start a dash warning
         if (not enemy.is_dashing and not enemy.is_preparing_shot and enemy.dash_cooldown <= 0 and 
-            enemy.dash_warning <= 0 and random.random() < enemy.dash_chance):
+            enemy.dash_warning <= 0 and rng.random() < enemy.dash_chance):
             enemy.dash_warning = 0.4  # 0.4 second warning before dash
             # Choose dash direction based on player position if available
             if hasattr(enemy, 'game_manager') and enemy.game_manager and enemy.game_manager.player:
@@ -215,9 +222,9 @@ class EnemyBehaviorManager:
                 elif player.rect.centery > enemy.rect.centery + 50:
                     enemy.dash_direction = 1  # Dash down
                 else:
-                    enemy.dash_direction = random.choice([-1, 1])  # Random direction
+                    enemy.dash_direction = rng.choice([-1, 1])  # Random direction
             else:
-                enemy.dash_direction = random.choice([-1, 1])  # Random direction
+                enemy.dash_direction = rng.choice([-1, 1])  # Random direction
         
         # Update dash warning
         if enemy.dash_warning > 0:
@@ -225,18 +232,14 @@ class EnemyBehaviorManager:
             if enemy.dash_warning <= 0:
                 # Start dash
                 enemy.is_dashing = True
-                enemy.dash_duration = random.uniform(0.4, 0.8)  # Slightly longer dash
-                enemy.dash_cooldown = random.uniform(2.0, 4.0)  # Long cooldown between dashes
-                enemy.dash_trail = []  # Clear trail
+                enemy.dash_duration = rng.uniform(0.4, 0.8)  # Slightly longer dash
+                enemy.dash_cooldown = rng.uniform(2.0, 4.0)  # Long cooldown between dashes
+                enemy.dash_trail.clear()  # Clear trail
         
         # Handle dashing
         if enemy.is_dashing:
-            # Store position for trail effect
-            if len(enemy.dash_trail) < 5:  # Limit to 5 positions
-                enemy.dash_trail.append((enemy.rect.centerx, enemy.rect.centery))
-            else:
-                enemy.dash_trail.pop(0)
-                enemy.dash_trail.append((enemy.rect.centerx, enemy.rect.centery))
+            # Store position for trail effect (the ring buffer keeps the last 5)
+            enemy.dash_trail.push(enemy.rect.centerx, enemy.rect.centery)
             
             # Move vertically based on dash direction
             enemy.rect.y += enemy.dash_direction * enemy.dash_speed * speed_multiplier * delta_time * 60
@@ -355,7 +358,7 @@ class EnemyBehaviorManager:
                 if enemy.stutter_timer <= 0:
                     enemy.is_stuttering = True
                     enemy.stutter_duration = 0.5
-                    enemy.stutter_timer = random.uniform(3.0, 5.0)
+                    enemy.stutter_timer = rng.uniform(3.0, 5.0)
             else:
                 enemy.stutter_duration -= delta_time
                 if enemy.stutter_duration <= 0:
@@ -385,25 +388,21 @@ class EnemyBehaviorManager:
                 enemy.is_telegraphing = True
                 enemy.telegraph_timer = enemy.telegraph_duration
                 
-                # Create a brightened version of the image for telegraph effect
-                bright_image = enemy.original_image.copy()
-                bright_overlay = pygame.Surface(bright_image.get_size(), pygame.SRCALPHA)
-                bright_overlay.fill((50, 50, 100, 0))
-                bright_image.blit(bright_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-                enemy.image = bright_image
+                # Use the cached brightened version of the image for telegraph effect
+                enemy.image = get_tint_cache().get_tinted(enemy.original_image, (50, 50, 100, 0))
             
             # Update telegraph timer
             if enemy.is_telegraphing:
                 enemy.telegraph_timer -= delta_time
                 if enemy.telegraph_timer <= 0:
                     enemy.is_telegraphing = False
-                    enemy.image = enemy.original_image.copy()  # Reset image
+                    enemy.image = enemy.original_image  # Reset image
                     
                     # Fire a shot
                     if enemy.time_since_last_shot >= enemy.fire_rate:
                         self._fire_shot(enemy)
                         enemy.time_since_last_shot = 0
-                        enemy.fire_rate = random.uniform(2.0, 3.0)
+                        enemy.fire_rate = rng.uniform(2.0, 3.0)
         
         # Remove if it goes off-screen
         if enemy.rect.right < 0:
@@ -435,19 +434,15 @@ class EnemyBehaviorManager:
                 enemy.pre_burst_delay -= delta_time
                 
                 # Visual telegraph effect - flash between normal and bright
-                flash_intensity = int(abs(math.sin(enemy.pre_burst_delay * 20)) * 100)
-                bright_image = enemy.original_image.copy()
-                bright_overlay = pygame.Surface(bright_image.get_size(), pygame.SRCALPHA)
-                bright_overlay.fill((flash_intensity, flash_intensity, 0, 0))
-                bright_image.blit(bright_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-                enemy.image = bright_image
+                flash_intensity = abs(math.sin(enemy.pre_burst_delay * 20))
+                enemy.image = get_tint_cache().get_tinted(enemy.original_image, (100, 100, 0, 0), flash_intensity)
                 
                 # When telegraph is complete, start the burst
                 if enemy.pre_burst_delay <= 0:
                     enemy.is_bursting = True
                     enemy.burst_duration = enemy.burst_max_duration
                     # Reset image
-                    enemy.image = enemy.original_image.copy()
+                    enemy.image = enemy.original_image
                 
                 # Move at reduced speed during telegraph
                 enemy.rect.x -= base_speed * 0.5
@@ -507,7 +502,7 @@ class EnemyBehaviorManager:
                             player_lane = 1  # Player is below
                         
                         # 70% chance to target player's lane, 30% chance to predict movement
-                        if random.random() < 0.7 or player_lane == 0:
+                        if rng.random() < 0.7 or player_lane == 0:
                             # Target player's current position
                             enemy.target_y = player.rect.centery
                         else:
@@ -516,7 +511,7 @@ class EnemyBehaviorManager:
                                 # Calculate player's vertical movement direction
                                 player_moving_down = player.rect.centery > player.last_y
                                 # Predict further movement in that direction
-                                prediction_offset = random.randint(30, 70) * (1 if player_moving_down else -1)
+                                prediction_offset = rng.randint(30, 70) * (1 if player_moving_down else -1)
                                 enemy.target_y = player.rect.centery + prediction_offset
                                 # Keep within screen bounds
                                 enemy.target_y = max(50, min(SCREEN_HEIGHT - 50, enemy.target_y))
@@ -609,132 +604,52 @@ class EnemyBehaviorManager:
     
     def _fire_shot(self, enemy):
         """Fire a projectile from the enemy."""
+        if not self.projectile_manager:
+            return
         if enemy.movement_pattern == "drifter":
-            # Dim energy bolt for drifter
-            bullet = {
-                'x': enemy.rect.centerx,
-                'y': enemy.rect.bottom,
-                'speed': 2,  # Slower-moving projectile
-                'width': 3,
-                'height': 7,
-                'color': (180, 80, 80),  # Dimmer red energy bolt
-                'damage': 1
-            }
+            # Dim energy bolt for drifter (slower-moving projectile)
+            self.projectile_manager.spawn(
+                enemy.rect.centerx, enemy.rect.bottom, 0, 2, 3, 7,
+                (180, 80, 80), damage=1, kind=KIND_DOWN, owner=id(enemy), speed=2
+            )
         else:
-            # Default bullet
-            bullet = {
-                'x': enemy.rect.centerx,
-                'y': enemy.rect.bottom,
-                'speed': 3,  # Slow-moving projectile
-                'width': 4,
-                'height': 8,
-                'color': (255, 100, 100),  # Red energy bolt
-                'damage': 1
-            }
-        enemy.bullets.append(bullet)
+            # Default bullet (slow-moving red energy bolt)
+            self.projectile_manager.spawn(
+                enemy.rect.centerx, enemy.rect.bottom, 0, 3, 4, 8,
+                (255, 100, 100), damage=1, kind=KIND_DOWN, owner=id(enemy), speed=3
+            )
     
-    def update_bullets(self, enemy):
-        """Update enemy bullets."""
-        if hasattr(enemy, 'bullets'):
-            # Get player reference for homing missiles
-            player = None
-            if hasattr(enemy, 'game_manager') and enemy.game_manager and hasattr(enemy.game_manager, 'player'):
-                player = enemy.game_manager.player
-            
-            for bullet in list(enemy.bullets):
-                # Check if this is a juggernaut bullet with velocity components
-                if 'vx' in bullet and 'vy' in bullet:
-                    # Update position using velocity components
-                    bullet['x'] += bullet['vx']
-                    bullet['y'] += bullet['vy']
-                    
-                    # Handle homing missiles
-                    if 'homing' in bullet and bullet['homing'] and player:
-                        # Calculate direction to player
-                        dx = player.rect.centerx - bullet['x']
-                        dy = player.rect.centery - bullet['y']
-                        distance = math.sqrt(dx*dx + dy*dy)
-                        
-                        if distance > 0:
-                            # Normalize direction
-                            dx /= distance
-                            dy /= distance
-                            
-                            # Adjust velocity toward player (homing effect)
-                            bullet['vx'] += dx * bullet['homing_strength']
-                            bullet['vy'] += dy * bullet['homing_strength']
-                            
-                            # Normalize velocity to maintain constant speed
-                            velocity = math.sqrt(bullet['vx']**2 + bullet['vy']**2)
-                            if velocity > 0:
-                                bullet['vx'] = (bullet['vx'] / velocity) * bullet['speed']
-                                bullet['vy'] = (bullet['vy'] / velocity) * bullet['speed']
-                        
-                        # Update missile lifetime
-                        if 'lifetime' in bullet:
-                            bullet['lifetime'] -= 0.016  # Approximate for one frame
-                            if bullet['lifetime'] <= 0:
-                                enemy.bullets.remove(bullet)
-                                continue
-                        
-                        # Store trail positions for rendering
-                        if 'trail' in bullet:
-                            bullet['trail'].append((bullet['x'], bullet['y']))
-                            # Keep only the last 10 positions
-                            if len(bullet['trail']) > 10:
-                                bullet['trail'] = bullet['trail'][-10:]
-                    
-                    # Remove bullets that go off screen
-                    if (bullet['x'] < -50 or bullet['x'] > SCREEN_WIDTH + 50 or
-                        bullet['y'] < -50 or bullet['y'] > SCREEN_HEIGHT + 50):
-                        enemy.bullets.remove(bullet)
-                
-                # Handle standard direction-based bullets
-                elif 'direction' in bullet and bullet['direction'] == 'left':
-                    # Horizontal bullet (moving left)
-                    bullet['x'] += bullet['speed']
-                    
-                    # Remove bullets that go off the left side of the screen
-                    if bullet['x'] + bullet['width'] < 0:
-                        enemy.bullets.remove(bullet)
-                else:
-                    # Vertical bullet (moving down)
-                    bullet['y'] += bullet['speed']
-                    
-                    # Remove bullets that go off the bottom of the screen
-                    if bullet['y'] > SCREEN_HEIGHT:
-                        enemy.bullets.remove(bullet)
     def _fire_shot_left(self, enemy):
         """Fire a projectile to the left (for low-type enemy)."""
-        # More pronounced bullet for better visibility
-        bullet = {
-            'x': enemy.rect.centerx - 5,  # Start slightly to the left of center
-            'y': enemy.rect.centery,
-            'speed': -6,  # Faster negative speed means moving left quickly
-            'width': 8,   # Wider bullet
-            'height': 3,  # Shorter but wider for better visibility
-            'color': (255, 80, 80),  # Brighter red for better visibility
-            'damage': 1,
-            'direction': 'left'  # Mark this as a horizontal bullet
-        }
-        enemy.bullets.append(bullet)
+        if not self.projectile_manager:
+            return
+        # More pronounced bullet for better visibility: wider, shorter, brighter red
+        self.projectile_manager.spawn(
+            enemy.rect.centerx - 5,  # Start slightly to the left of center
+            enemy.rect.centery,
+            -6, 0,  # Faster negative speed means moving left quickly
+            8, 3,
+            (255, 80, 80),
+            damage=1, kind=KIND_LEFT, owner=id(enemy), speed=6
+        )
+    
     def _init_juggernaut(self, enemy):
         """Initialize juggernaut behavior for super-type enemy."""
         # Position far to the right of the screen for dramatic entrance
         # Note: For SuperEnemy class, this is already set in the constructor
         if not hasattr(enemy, 'is_exploding'):  # Only set if not a SuperEnemy
             enemy.rect.x = SCREEN_WIDTH + 300
-            enemy.rect.y = random.randint(80, SCREEN_HEIGHT - 80)
+            enemy.rect.y = rng.randint(80, SCREEN_HEIGHT - 80)
         
         # Movement direction (always start moving left)
         enemy.direction = -1
         
         # Dynamic positioning behavior - more aggressive
-        enemy.preferred_distance = random.randint(180, 250)  # Closer preferred distance to be more threatening
+        enemy.preferred_distance = rng.randint(180, 250)  # Closer preferred distance to be more threatening
         enemy.min_distance = 120   # Can get closer to player
         enemy.max_distance = 300   # Don't get too far
         enemy.position_update_timer = 0  # Timer for position recalculation
-        enemy.position_update_interval = random.uniform(0.8, 1.5)  # More frequent position updates
+        enemy.position_update_interval = rng.uniform(0.8, 1.5)  # More frequent position updates
         enemy.current_target_x = None  # Target X position (will be calculated)
         
         # Screen boundary limits
@@ -742,13 +657,13 @@ class EnemyBehaviorManager:
         enemy.max_x = SCREEN_WIDTH - enemy.rect.width - 20  # Don't go off right edge
         
         # Vertical movement properties - more dynamic and aggressive
-        enemy.bob_angle = random.random() * 6.28
-        enemy.bob_speed = random.uniform(0.02, 0.04)
-        enemy.bob_amplitude = random.randint(4, 7)
+        enemy.bob_angle = rng.random() * 6.28
+        enemy.bob_speed = rng.uniform(0.02, 0.04)
+        enemy.bob_amplitude = rng.randint(4, 7)
         enemy.target_y = enemy.rect.y
         
         # Attack properties - more aggressive
-        enemy.last_attack_time = time.time()
+        enemy.last_attack_time = get_clock().time()
         enemy.attack_warning = False
         enemy.warning_duration = 0
         enemy.attack_type = None
@@ -762,7 +677,7 @@ class EnemyBehaviorManager:
         # Charge properties - more aggressive
         enemy.charge_speed = 3.5  # Increased for more impactful charges
         enemy.charge_duration = 0
-        enemy.charge_cooldown = random.uniform(4.0, 7.0)  # Reduced cooldown for more frequent charges
+        enemy.charge_cooldown = rng.uniform(4.0, 7.0)  # Reduced cooldown for more frequent charges
         
         # Shield properties
         enemy.shield_opacity = 255
@@ -832,9 +747,9 @@ class EnemyBehaviorManager:
                 enemy.direction = 1 if distance_to_player > 0 else -1
             else:
                 # Within acceptable range, occasionally adjust position for more dynamic movement
-                if random.random() < 0.3:  # 30% chance to adjust position even when in acceptable range
+                if rng.random() < 0.3:  # 30% chance to adjust position even when in acceptable range
                     # Choose a new position within the acceptable range
-                    offset = random.randint(enemy.min_distance, enemy.max_distance)
+                    offset = rng.randint(enemy.min_distance, enemy.max_distance)
                     enemy.current_target_x = player.rect.centerx - offset * (1 if distance_to_player > 0 else -1)
                     enemy.direction = 1 if enemy.rect.centerx < enemy.current_target_x else -1
             
@@ -888,7 +803,7 @@ class EnemyBehaviorManager:
             distance_y = player.rect.centery - enemy.rect.centery
             
             # Add some randomness to vertical positioning
-            vertical_offset = random.randint(-40, 40)
+            vertical_offset = rng.randint(-40, 40)
             adjusted_player_y = player.rect.centery + vertical_offset
             adjusted_distance_y = adjusted_player_y - enemy.rect.centery
             
@@ -937,7 +852,7 @@ class EnemyBehaviorManager:
             if enemy.charge_duration <= 0:
                 enemy.is_charging = False
                 enemy.retreat_active = True
-                enemy.charge_cooldown = random.uniform(6.0, 9.0)  # Longer cooldown
+                enemy.charge_cooldown = rng.uniform(6.0, 9.0)  # Longer cooldown
                 # Retreat duration is proportional to how far we charged
                 retreat_duration = enemy.charge_duration * 0.7
                 enemy.retreat_duration = max(0.8, min(1.8, retreat_duration))
@@ -953,7 +868,7 @@ class EnemyBehaviorManager:
                 player_in_front = (enemy.direction == -1 and player.rect.x < enemy.rect.x) or \
                                  (enemy.direction == 1 and player.rect.x > enemy.rect.x)
                 
-                if player_in_front and random.random() < 0.7:  # 70% chance to charge when conditions are met
+                if player_in_front and rng.random() < 0.7:  # 70% chance to charge when conditions are met
                     self._prepare_charge(enemy)
         
         # Handle shield regeneration
@@ -971,7 +886,7 @@ class EnemyBehaviorManager:
             if enemy.shield_pulse_radius > 100:
                 enemy.shield_pulse_active = False
                 enemy.shield_pulse_radius = 0
-                enemy.shield_pulse_cooldown = random.uniform(3.0, 5.0)  # Longer cooldown
+                enemy.shield_pulse_cooldown = rng.uniform(3.0, 5.0)  # Longer cooldown
         elif enemy.shield_pulse_cooldown > 0:
             enemy.shield_pulse_cooldown -= delta_time
             if enemy.shield_pulse_cooldown <= 0 and enemy.has_shield and player:
@@ -1043,7 +958,7 @@ class EnemyBehaviorManager:
                 enemy.attack_type = "single_shot"
         elif enemy.attack_phase == 2:
             # Phase 2: Twin cannons with occasional single shot for variety
-            if random.random() < 0.8:  # 80% chance for twin shot
+            if rng.random() < 0.8:  # 80% chance for twin shot
                 enemy.attack_type = "twin_shot"
             else:
                 enemy.attack_type = "single_shot"  # 20% chance for single shot
@@ -1056,7 +971,7 @@ class EnemyBehaviorManager:
                 
                 if distance_to_player < 120:  # Player is very close
                     # 50% chance for twin shot (faster) when player is close
-                    enemy.attack_type = "twin_shot" if random.random() < 0.5 else "missile_barrage"
+                    enemy.attack_type = "twin_shot" if rng.random() < 0.5 else "missile_barrage"
                 else:
                     enemy.attack_type = "missile_barrage"
             else:
@@ -1105,11 +1020,11 @@ class EnemyBehaviorManager:
         
         # Reset attack cooldown based on phase - more aggressive
         if enemy.attack_phase == 1:
-            enemy.attack_cooldown = random.uniform(2.0, 3.0)  # Faster attacks
+            enemy.attack_cooldown = rng.uniform(2.0, 3.0)  # Faster attacks
         elif enemy.attack_phase == 2:
-            enemy.attack_cooldown = random.uniform(1.8, 2.5)  # Even faster
+            enemy.attack_cooldown = rng.uniform(1.8, 2.5)  # Even faster
         else:
-            enemy.attack_cooldown = random.uniform(1.5, 2.0)  # Very aggressive in phase 3
+            enemy.attack_cooldown = rng.uniform(1.5, 2.0)  # Very aggressive in phase 3
         
         # Re-enable tracking after attack
         enemy.tracking_enabled = True
@@ -1141,7 +1056,7 @@ class EnemyBehaviorManager:
     def _prepare_charge(self, enemy):
         """Prepare a charge attack."""
         enemy.is_charging = True
-        enemy.charge_duration = random.uniform(0.9, 1.4)  # Longer charges
+        enemy.charge_duration = rng.uniform(0.9, 1.4)  # Longer charges
         enemy.engine_flare = 0  # No visual flare
         
         # No visual indication of charge
@@ -1165,7 +1080,7 @@ class EnemyBehaviorManager:
                     enemy.direction = 1   # Charge right toward player
             else:
                 # More tactical charge - sometimes charge past player or to a strategic position
-                tactical_choice = random.random()
+                tactical_choice = rng.random()
                 
                 if tactical_choice < 0.7:  # 70% chance for direct charge (increased from 60%)
                     # Direct charge toward player
@@ -1175,7 +1090,7 @@ class EnemyBehaviorManager:
                         enemy.direction = 1   # Charge right toward player
                 elif tactical_choice < 0.9:  # 20% chance for positioning charge
                     # Charge to a position that gives better attack angle
-                    target_x = player.rect.centerx + random.randint(100, 200) * (1 if random.random() < 0.5 else -1)
+                    target_x = player.rect.centerx + rng.randint(100, 200) * (1 if rng.random() < 0.5 else -1)
                     enemy.direction = 1 if target_x > enemy.rect.centerx else -1
                 else:  # 10% chance for feint
                     # Feint in opposite direction of player
@@ -1185,7 +1100,7 @@ class EnemyBehaviorManager:
             # Also adjust vertical position to better target player
             if abs(player.rect.centery - enemy.rect.centery) > 30:
                 # Move toward player's vertical position with minimal randomness
-                vertical_offset = random.randint(-15, 15)  # Reduced randomness for more accurate targeting
+                vertical_offset = rng.randint(-15, 15)  # Reduced randomness for more accurate targeting
                 enemy.target_y = player.rect.centery + vertical_offset
                 
                 # Adjust position immediately to better aim
@@ -1219,7 +1134,7 @@ class EnemyBehaviorManager:
             dy = player.rect.centery - enemy.rect.centery
             
             # Add some randomness to make it not perfect
-            dy += random.randint(-30, 30)
+            dy += rng.randint(-30, 30)
             
             # Normalize direction
             distance = math.sqrt(dx*dx + dy*dy)
@@ -1248,23 +1163,13 @@ class EnemyBehaviorManager:
             vy = speed * math.sin(angle_rad)
         
         # Create bullet with angle - larger, more powerful projectiles
-        bullet = {
-            'x': fire_x,
-            'y': enemy.rect.centery,
-            'vx': vx,
-            'vy': vy,
-            'speed': speed,
-            'width': 14,  # Even larger projectiles (was 10)
-            'height': 7,  # Taller projectiles (was 5)
-            'color': (200, 50, 200),  # Purple energy bolt
-            'damage': 1,
-            'angle': angle_offset
-        }
-        
-        if not hasattr(enemy, 'bullets'):
-            enemy.bullets = []
-        
-        enemy.bullets.append(bullet)
+        if self.projectile_manager:
+            self.projectile_manager.spawn(
+                fire_x, enemy.rect.centery, vx, vy,
+                14, 7,  # Even larger projectiles (was 10x5)
+                (200, 50, 200),  # Purple energy bolt
+                damage=1, kind=KIND_AIMED, owner=id(enemy), speed=speed
+            )
     
     def _fire_juggernaut_missile(self, enemy, angle_offset=0):
         """Fire a homing missile from the juggernaut enemy."""
@@ -1287,24 +1192,12 @@ class EnemyBehaviorManager:
         vy = math.sin(angle_rad) * speed
         
         # Create missile with homing properties - larger, more powerful missiles
-        missile = {
-            'x': fire_x,
-            'y': enemy.rect.centery,
-            'vx': vx,
-            'vy': vy,
-            'speed': speed,
-            'width': 16,  # Even larger missiles (was 12)
-            'height': 8,  # Taller missiles (was 6)
-            'color': (255, 100, 0),  # Orange missile
-            'damage': 1,
-            'angle': angle_offset,
-            'homing': True,
-            'homing_strength': 0.05,  # Weaker homing (was 0.08) for slower turning
-            'lifetime': 5.0,  # Longer lifetime (was 4.0) since they're slower
-            'trail': []  # Store trail positions
-        }
-        
-        if not hasattr(enemy, 'bullets'):
-            enemy.bullets = []
-        
-        enemy.bullets.append(missile)
+        if self.projectile_manager:
+            self.projectile_manager.spawn(
+                fire_x, enemy.rect.centery, vx, vy,
+                16, 8,  # Even larger missiles (was 12x6)
+                (255, 100, 0),  # Orange missile
+                damage=1, kind=KIND_MISSILE, owner=id(enemy), speed=speed,
+                lifetime=5.0,  # Longer lifetime (was 4.0) since they're slower
+                homing_strength=0.05  # Weaker homing (was 0.08) for slower turning
+            )
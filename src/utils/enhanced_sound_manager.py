@@ -4,12 +4,9 @@ Handles loading, playing, and controlling volume of sound effects and music.
 Works with the new AssetManager system.
 """
 import pygame
-import logging
+from src.utils.log_manager import get_logger
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, 
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger('SoundManager')
+logger = get_logger('sound')
 
 class EnhancedSoundManager:
     def __init__(self, asset_manager, default_sfx_volume=0.7, default_music_volume=0.5):
@@ -0,0 +1,139 @@
+"""
+Font Manager for the Space Impact game.
+Resolves every font once and caches rendered text surfaces, so static labels
+cost a single blit per frame and changing numbers only re-render when they change.
+"""
+import pygame
+from src.utils.lru import LRUCache, surface_bytes
+
+try:
+    import pygame.freetype
+    FREETYPE_AVAILABLE = True
+except ImportError:
+    FREETYPE_AVAILABLE = False
+
+MAX_CACHED_TEXTS = 512              # Rendered surfaces kept before evicting
+MAX_CACHED_BYTES = 8 * 1024 * 1024  # Pixel memory kept before evicting
+
+class FontManager:
+    """Font registry with an LRU cache of rendered text surfaces."""
+
+    def __init__(self, use_freetype=False, max_entries=MAX_CACHED_TEXTS, max_bytes=MAX_CACHED_BYTES):
+        """
+        Initialize the font manager.
+
+        Args:
+            use_freetype: Render text through pygame.freetype when it is available
+            max_entries: Maximum number of rendered surfaces kept in the cache
+            max_bytes: Maximum pixel memory of rendered surfaces kept in the cache
+        """
+        self.use_freetype = use_freetype and FREETYPE_AVAILABLE
+
+        # Resolved fonts keyed by (family, size, bold, italic)
+        self.fonts = {}
+        self.freetype_fonts = {}
+
+        # Rendered text keyed by (font key, text, color, antialias, background)
+        self.text_cache = LRUCache(max_entries, max_bytes, size_of=surface_bytes)
+
+        # Reverse lookup so render() can accept the font objects handed out
+        self._font_keys = {}
+
+    def get_font(self, family, size, bold=False, italic=False):
+        """
+        Return a shared font, resolving it on first use.
+
+        Args:
+            family: Font family name (e.g. 'Arial')
+            size: Point size
+            bold: Bold style
+            italic: Italic style
+
+        Returns:
+            pygame.font.Font: The shared font object
+        """
+        key = (family, size, bool(bold), bool(italic))
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(family, size, bold=bold, italic=italic)
+            self.fonts[key] = font
+            self._font_keys[id(font)] = key
+        return font
+
+    def _get_freetype_font(self, key):
+        """Return the freetype font matching a registry key."""
+        font = self.freetype_fonts.get(key)
+        if font is None:
+            if not pygame.freetype.get_init():
+                pygame.freetype.init()
+            family, size, bold, italic = key
+            font = pygame.freetype.SysFont(family, size, bold=bold, italic=italic)
+            self.freetype_fonts[key] = font
+        return font
+
+    def render(self, font, text, antialias, color, background=None):
+        """
+        Render text through the cache (same arguments as pygame.font.Font.render).
+
+        The returned surface is shared, so callers must not draw on it or change its alpha.
+
+        Args:
+            font: Font from get_font()
+            text: Text to render
+            antialias: Antialias flag
+            color: Text color
+            background: Optional background color
+
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        font_key = self._font_keys.get(id(font))
+        if font_key is None:
+            # Font not from the registry, so it can't be cached safely
+            self.text_cache.misses += 1
+            return font.render(text, antialias, color, background)
+
+        key = (font_key, text, tuple(color), antialias,
+               tuple(background) if background is not None else None)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            return surface
+
+        if self.use_freetype:
+            ft_font = self._get_freetype_font(font_key)
+            ft_font.antialiased = antialias
+            surface, _ = ft_font.render(text, color, background)
+        else:
+            surface = font.render(text, antialias, color, background)
+
+        return self.text_cache.put(key, surface)
+
+    def clear_cache(self):
+        """Drop every rendered surface (fonts stay resolved)."""
+        self.text_cache.clear()
+
+    def get_stats(self):
+        """Return cache statistics."""
+        stats = self.text_cache.get_stats()
+        lookups = stats['hits'] + stats['misses']
+        stats['fonts'] = len(self.fonts)
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+# Shared font manager used by all UI and HUD drawing
+_font_manager = None
+
+def get_font_manager():
+    """Return the shared font manager, creating it on first use."""
+    global _font_manager
+    if _font_manager is None:
+        _font_manager = FontManager()
+    return _font_manager
+
+def get_font(family, size, bold=False, italic=False):
+    """Return a shared font (drop-in for pygame.font.SysFont)."""
+    return get_font_manager().get_font(family, size, bold, italic)
+
+def render_text(font, text, antialias, color, background=None):
+    """Render text through the shared cache (drop-in for font.render)."""
+    return get_font_manager().render(font, text, antialias, color, background)
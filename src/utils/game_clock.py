@@ -0,0 +1,118 @@
+"""
+Game Clock for the Space Impact game.
+Single source of simulation time and randomness, so a seed plus an input
+sequence replays identically no matter how fast frames are produced.
+"""
+import random
+import time
+
+# Clock modes
+MODE_FIXED = 'fixed'        # Every tick advances by the same step (headless, replays)
+MODE_VARIABLE = 'variable'  # Every tick advances by the measured real frame time
+MODE_SCALED = 'scaled'      # Real frame time multiplied by a time scale (fast-forward / slow motion)
+
+class GameClock:
+    """Provides simulation time to every subsystem."""
+
+    def __init__(self, mode=MODE_VARIABLE, fixed_step=1.0 / 60, time_scale=1.0, max_step=0.25):
+        """
+        Initialize the clock.
+
+        Args:
+            mode: One of MODE_FIXED, MODE_VARIABLE or MODE_SCALED
+            fixed_step: Seconds added per tick in fixed mode
+            time_scale: Multiplier applied to real frame time in scaled mode
+            max_step: Largest step a single tick may take in variable/scaled mode,
+                      so a long hitch does not teleport the simulation
+        """
+        if mode not in (MODE_FIXED, MODE_VARIABLE, MODE_SCALED):
+            raise ValueError(f"Unknown clock mode: {mode}")
+        self.mode = mode
+        self.fixed_step = fixed_step
+        self.time_scale = time_scale
+        self.max_step = max_step
+
+        self.elapsed = 0.0   # Simulation time in seconds
+        self.dt = fixed_step if mode == MODE_FIXED else 0.0  # Length of the last tick
+        self.frame = 0
+        self.last_real_time = time.perf_counter()
+
+    def tick(self, step=None):
+        """
+        Advance the clock by one simulation frame and return the step in seconds.
+
+        Args:
+            step: Explicit step in seconds (replays). None lets the clock mode decide
+        """
+        now = time.perf_counter()
+        real_dt = now - self.last_real_time
+        self.last_real_time = now
+
+        if step is None:
+            if self.mode == MODE_FIXED:
+                step = self.fixed_step
+            elif self.mode == MODE_SCALED:
+                step = min(real_dt, self.max_step) * self.time_scale
+            else:
+                step = min(real_dt, self.max_step)
+
+        self.dt = step
+        self.elapsed += step
+        self.frame += 1
+        return step
+
+    def set_time_scale(self, time_scale):
+        """Change the time scale (switches a variable clock to scaled mode)."""
+        self.time_scale = time_scale
+        if self.mode == MODE_VARIABLE:
+            self.mode = MODE_SCALED
+
+    def time(self):
+        """Return simulation time in seconds (drop-in for time.time())."""
+        return self.elapsed
+
+    def get_ticks(self):
+        """Return simulation time in milliseconds (drop-in for pygame.time.get_ticks())."""
+        return int(self.elapsed * 1000)
+
+# Shared clock read by sprites and managers
+_clock = GameClock()
+
+def get_clock():
+    """Return the active game clock."""
+    return _clock
+
+def set_clock(clock):
+    """Replace the active game clock."""
+    global _clock
+    _clock = clock
+
+# Per-subsystem random streams. Modules keep references to these objects,
+# so reseeding happens in place rather than by replacing them.
+_seed = None
+_streams = {}
+
+def get_rng(name):
+    """Return the random stream for a subsystem, creating it on first use."""
+    stream = _streams.get(name)
+    if stream is None:
+        stream = random.Random()
+        stream.seed(f"{_seed}:{name}" if _seed is not None else None)
+        _streams[name] = stream
+    return stream
+
+def seed_streams(seed):
+    """
+    Reseed every random stream.
+
+    Args:
+        seed: Any hashable seed. None seeds from system entropy (non-deterministic)
+    """
+    global _seed
+    _seed = seed
+    for name, stream in _streams.items():
+        stream.seed(f"{seed}:{name}" if seed is not None else None)
+
+def get_seed():
+    """Return the seed the random streams were last seeded with."""
+    return _seed
@@ -0,0 +1,96 @@
+"""
+Glow Cache for the Space Impact game.
+Builds radial glow sprites once with a vectorized alpha falloff and shares
+them between stars, hearts, engines and UI buttons, so drawing a glow is a
+single blit instead of a new surface and a stack of circles every frame.
+"""
+import numpy as np
+import pygame
+from src.utils.lru import LRUCache, surface_bytes
+
+ALPHA_STEP = 2                       # Glow alpha is rounded to this step so sprites are reused
+MAX_CACHED_GLOWS = 1024              # Glow sprites kept before evicting
+MAX_CACHED_BYTES = 4 * 1024 * 1024   # Pixel memory kept before evicting
+
+class GlowCache:
+    """LRU cache of radial glow sprites keyed by radius, color, alpha and falloff."""
+
+    def __init__(self, max_entries=MAX_CACHED_GLOWS, max_bytes=MAX_CACHED_BYTES):
+        """
+        Initialize the glow cache.
+
+        Args:
+            max_entries: Maximum number of glow sprites kept in the cache
+            max_bytes: Maximum pixel memory of glow sprites kept in the cache
+        """
+        self.glows = LRUCache(max_entries, max_bytes, size_of=surface_bytes)
+
+    def get_glow(self, radius, color, alpha=255, falloff=1.0):
+        """
+        Return a shared glow sprite, building it on first use.
+
+        The sprite is radius * 2 pixels wide with the glow centered on it. The
+        returned surface is shared, so callers must not draw on it or change its alpha.
+
+        Args:
+            radius: Glow radius in pixels (rounded to a whole pixel)
+            color: RGB glow color
+            alpha: Alpha at the center of the glow (rounded to ALPHA_STEP)
+            falloff: Exponent of the fade from center to edge (0 gives a flat disc,
+                     1 a linear fade, larger values a tighter core)
+
+        Returns:
+            pygame.Surface: The glow sprite, or None if the radius or alpha is zero
+        """
+        radius = int(round(radius))
+        alpha = min(255, int(alpha / ALPHA_STEP + 0.5) * ALPHA_STEP)
+        if radius <= 0 or alpha <= 0:
+            return None
+
+        key = (radius, tuple(color[:3]), alpha, falloff)
+        glow = self.glows.get(key)
+        if glow is None:
+            glow = self.glows.put(key, self._build_glow(radius, key[1], alpha, falloff))
+        return glow
+
+    def _build_glow(self, radius, color, alpha, falloff):
+        """Render a glow sprite with its alpha computed for every pixel at once."""
+        size = radius * 2
+        glow = pygame.Surface((size, size), pygame.SRCALPHA)
+        glow.fill((*color, 0))
+
+        # Distance of every pixel center from the glow center, as a fraction of the radius
+        offsets = np.arange(size, dtype=np.float32) + 0.5 - radius
+        distance = np.hypot(offsets[:, None], offsets[None, :]) / radius
+        inside = distance < 1.0
+        strength = np.where(inside, np.power(np.clip(1.0 - distance, 0.0, 1.0), falloff), 0.0)
+
+        pixels = pygame.surfarray.pixels_alpha(glow)
+        pixels[:] = (strength * alpha).astype(np.uint8)
+        del pixels  # Unlock the surface
+        return glow
+
+    def clear(self):
+        """Drop every cached glow."""
+        self.glows.clear()
+
+    def get_stats(self):
+        """Return cache statistics."""
+        return self.glows.get_stats()
+
+# Shared glow cache used by every sprite and UI element
+_glow_cache = None
+
+def get_glow_cache():
+    """Return the shared glow cache, creating it on first use."""
+    global _glow_cache
+    if _glow_cache is None:
+        _glow_cache = GlowCache()
+    return _glow_cache
+
+def blit_glow(surface, center, radius, color, alpha=255, falloff=1.0):
+    """Blit a cached glow centered on a point."""
+    glow = get_glow_cache().get_glow(radius, color, alpha, falloff)
+    if glow is not None:
+        half = glow.get_width() // 2
+        surface.blit(glow, (int(center[0]) - half, int(center[1]) - half))
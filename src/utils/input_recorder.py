@@ -0,0 +1,337 @@
+"""
+Input Recorder for the Space Impact game.
+Records the seed, per-frame held keys, modifier state, input events and frame
+steps of a session to a compact binary file and plays them back through the
+same input path, with periodic state-hash checkpoints to detect divergence.
+
+File layout: an uncompressed header followed by a zlib stream of records.
+Each frame is one flags byte plus only the fields that changed since the
+previous frame, so an idle frame costs a single byte before compression.
+"""
+import struct
+import zlib
+import pygame
+from src.utils.game_clock import get_clock
+from src.utils.log_manager import get_logger
+from src.version import VERSION
+
+logger = get_logger('replay')
+
+MAGIC = b'SCRP'
+FORMAT_VERSION = 1
+CHECKPOINT_INTERVAL = 300  # Frames between state-hash checkpoints (5 seconds at 60 FPS)
+
+# Keys the game reads as held state; each one is a bit of the recorded key mask
+RECORDED_KEYS = (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE)
+
+# Header option flags
+OPTION_START_IN_GAME = 0x01  # Session started with start_new_game() instead of the menu
+OPTION_INVULNERABLE = 0x02   # Player was made invulnerable (headless autopilot runs)
+
+# Record flags
+RECORD_KEYS = 0x01        # Held-key mask changed (u8 follows)
+RECORD_STEP = 0x02        # Frame step changed (f64 seconds follows)
+RECORD_MODS = 0x04        # Modifier state changed (u16 follows)
+RECORD_EVENTS = 0x08      # Events follow (u8 count, then one entry per event)
+RECORD_CHECKPOINT = 0x80  # Not a frame: state hash of the previous frame (u32 follows)
+
+# Event codes and payload layouts
+EVENT_FORMATS = {
+    pygame.KEYDOWN: (1, '<IH'),          # key, mod
+    pygame.KEYUP: (2, '<IH'),            # key, mod
+    pygame.MOUSEBUTTONDOWN: (3, '<Bhh'), # button, x, y
+    pygame.MOUSEBUTTONUP: (4, '<Bhh'),   # button, x, y
+    pygame.MOUSEMOTION: (5, '<hh'),      # x, y
+    pygame.QUIT: (6, ''),
+}
+EVENT_TYPES = {code: (event_type, fmt) for event_type, (code, fmt) in EVENT_FORMATS.items()}
+
+HEADER_FORMAT = '<4sBqdHB'  # magic, format version, seed, frame step, checkpoint interval, options
+
+class FrameInput:
+    """Everything the game reads from the player during one frame."""
+    __slots__ = ('keys', 'mods', 'events', 'step')
+
+    def __init__(self, keys=(), mods=0, events=(), step=None):
+        """
+        Initialize the frame input.
+
+        Args:
+            keys: Held pygame key codes
+            mods: Modifier key state (pygame.key.get_mods())
+            events: Input events to handle this frame
+            step: Simulation step in seconds, or None to let the clock decide
+        """
+        self.keys = keys
+        self.mods = mods
+        self.events = events
+        self.step = step
+
+    @classmethod
+    def poll(cls):
+        """Read the live keyboard, modifier state and event queue."""
+        pressed = pygame.key.get_pressed()
+        keys = [key for key in RECORDED_KEYS if pressed[key]]
+        return cls(keys, pygame.key.get_mods(), pygame.event.get())
+
+def _key_mask(keys):
+    """Pack held keys into a bit mask over RECORDED_KEYS."""
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if key in keys:
+            mask |= 1 << bit
+    return mask
+
+def _mask_keys(mask):
+    """Unpack a key mask into the held key codes."""
+    return [key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit)]
+
+def _event_payload(event):
+    """Return the values stored for an event."""
+    if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+        return (event.key, event.mod & 0xFFFF)
+    if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        return (event.button, event.pos[0], event.pos[1])
+    if event.type == pygame.MOUSEMOTION:
+        return event.pos
+    return ()
+
+def _make_event(event_type, values):
+    """Rebuild a pygame event from its stored values."""
+    if event_type in (pygame.KEYDOWN, pygame.KEYUP):
+        return pygame.event.Event(event_type, key=values[0], mod=values[1])
+    if event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        return pygame.event.Event(event_type, button=values[0], pos=(values[1], values[2]))
+    if event_type == pygame.MOUSEMOTION:
+        return pygame.event.Event(event_type, pos=values, rel=(0, 0), buttons=(0, 0, 0))
+    return pygame.event.Event(event_type)
+
+def get_state_hash(game):
+    """
+    Return a 32-bit hash of the simulation state (clock, score, entities, bosses).
+
+    Random stream states are left out: drawing consumes the cosmetic streams,
+    so a rendered replay of a headless recording would never match.
+
+    Args:
+        game: GameManager to hash
+
+    Returns:
+        int: CRC32 of the state
+    """
+    player = game.player
+    state = [
+        get_clock().frame, get_clock().get_ticks(), game.game_state, game.score,
+        (player.rect.x, player.rect.y, player.health) if player else None,
+        [(e.rect.x, e.rect.y, e.health) for e in game.enemies],
+        [(a.rect.x, a.rect.y) for a in game.asteroids],
+        [(d.rect.x, d.rect.y) for d in game.debris],
+        game.projectile_manager.count,
+        game.phase_manager.current_phase_index,
+    ]
+    for boss in (game.boss_manager.mini_boss, game.boss_manager.main_boss):
+        state.append((boss.rect.x, boss.rect.y, boss.health) if boss else None)
+    return zlib.crc32(repr(state).encode())
+
+class InputRecorder:
+    """Writes a session's input to a replay file."""
+
+    def __init__(self, path, seed, frame_step, start_in_game=False, invulnerable=False,
+                 checkpoint_interval=CHECKPOINT_INTERVAL):
+        """
+        Open a replay file for writing.
+
+        Args:
+            path: File to write
+            seed: Seed the game's random streams were seeded with (must not be None)
+            frame_step: Step of a fixed-step clock, used as the starting step
+            start_in_game: The session starts in a new game rather than the menu
+            invulnerable: The player is invulnerable for the whole session
+            checkpoint_interval: Frames between state-hash checkpoints
+        """
+        if seed is None:
+            raise ValueError("Recording needs a seeded game")
+        self.path = path
+        self.checkpoint_interval = checkpoint_interval
+        self.frames = 0
+        self.checkpoints = 0
+
+        options = (OPTION_START_IN_GAME if start_in_game else 0) | (OPTION_INVULNERABLE if invulnerable else 0)
+        version = VERSION.encode()
+        self.file = open(path, 'wb')
+        self.file.write(struct.pack(HEADER_FORMAT, MAGIC, FORMAT_VERSION, seed, frame_step,
+                                    checkpoint_interval, options))
+        self.file.write(struct.pack('<B', len(version)) + version)
+        self.compressor = zlib.compressobj(9)
+        self.buffer = bytearray()
+
+        # Values of the previous frame; only changes are written
+        self.last_mask = 0
+        self.last_step = frame_step
+        self.last_mods = 0
+
+    def record(self, frame_input, step, game=None):
+        """
+        Append one frame.
+
+        Args:
+            frame_input: FrameInput the frame was run with
+            step: Simulation step the clock advanced by
+            game: GameManager, hashed on checkpoint frames
+        """
+        flags = 0
+        payload = bytearray()
+        mask = _key_mask(frame_input.keys)
+        if mask != self.last_mask:
+            flags |= RECORD_KEYS
+            payload += struct.pack('<B', mask)
+            self.last_mask = mask
+        if step != self.last_step:
+            flags |= RECORD_STEP
+            payload += struct.pack('<d', step)
+            self.last_step = step
+        mods = frame_input.mods & 0xFFFF
+        if mods != self.last_mods:
+            flags |= RECORD_MODS
+            payload += struct.pack('<H', mods)
+            self.last_mods = mods
+        events = [event for event in frame_input.events if event.type in EVENT_FORMATS][:255]
+        if events:
+            flags |= RECORD_EVENTS
+            payload += struct.pack('<B', len(events))
+            for event in events:
+                code, fmt = EVENT_FORMATS[event.type]
+                payload += struct.pack('<B', code) + struct.pack(fmt, *_event_payload(event))
+
+        self.buffer.append(flags)
+        self.buffer += payload
+        self.frames += 1
+
+        if game is not None and self.frames % self.checkpoint_interval == 0:
+            self.buffer.append(RECORD_CHECKPOINT)
+            self.buffer += struct.pack('<I', get_state_hash(game))
+            self.checkpoints += 1
+            # Flush so the file is replayable up to here even if the game crashes later
+            self._write(zlib.Z_SYNC_FLUSH)
+
+    def _write(self, flush_mode=None):
+        """Compress buffered records into the file."""
+        data = self.compressor.compress(bytes(self.buffer))
+        self.buffer.clear()
+        if flush_mode is not None:
+            data += self.compressor.flush(flush_mode)
+        self.file.write(data)
+        self.file.flush()
+
+    def close(self):
+        """Finish the compressed stream and close the file."""
+        if self.file.closed:
+            return
+        self._write(zlib.Z_FINISH)
+        self.file.close()
+        logger.info(f"Recorded {self.frames} frames ({self.checkpoints} checkpoints) to {self.path}")
+
+class InputReplay:
+    """Reads a replay file back one frame at a time."""
+
+    def __init__(self, path):
+        """
+        Load a replay file.
+
+        Args:
+            path: File written by InputRecorder
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        header_size = struct.calcsize(HEADER_FORMAT)
+        magic, format_version, seed, frame_step, interval, options = struct.unpack_from(HEADER_FORMAT, data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        if format_version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported replay format version {format_version}")
+        version_length = data[header_size]
+        self.game_version = data[header_size + 1:header_size + 1 + version_length].decode()
+        if self.game_version != VERSION:
+            logger.warning(f"Replay was recorded with version {self.game_version} (running {VERSION})")
+
+        self.path = path
+        self.seed = seed
+        self.frame_step = frame_step
+        self.checkpoint_interval = interval
+        self.start_in_game = bool(options & OPTION_START_IN_GAME)
+        self.invulnerable = bool(options & OPTION_INVULNERABLE)
+
+        # A truncated stream (crashed session) decodes up to its last flush
+        self.data = zlib.decompressobj().decompress(data[header_size + 1 + version_length:])
+        self.offset = 0
+        self.frames = 0
+        self.checkpoints = 0
+        self.divergences = 0
+        self.first_divergence = None  # Frame of the first failed checkpoint
+
+        self.mask = 0
+        self.step = frame_step
+        self.mods = 0
+
+    def finished(self):
+        """Return True once every recorded frame has been read."""
+        return self.offset >= len(self.data)
+
+    def next_frame(self):
+        """
+        Return the next recorded frame.
+
+        Returns:
+            FrameInput: The frame's input and step, or None at the end of the replay
+        """
+        data = self.data
+        if self.offset >= len(data):
+            return None
+        flags = data[self.offset]
+        offset = self.offset + 1
+        if flags & RECORD_KEYS:
+            self.mask = data[offset]
+            offset += 1
+        if flags & RECORD_STEP:
+            self.step = struct.unpack_from('<d', data, offset)[0]
+            offset += 8
+        if flags & RECORD_MODS:
+            self.mods = struct.unpack_from('<H', data, offset)[0]
+            offset += 2
+        events = []
+        if flags & RECORD_EVENTS:
+            count = data[offset]
+            offset += 1
+            for _ in range(count):
+                event_type, fmt = EVENT_TYPES[data[offset]]
+                offset += 1
+                values = struct.unpack_from(fmt, data, offset)
+                offset += struct.calcsize(fmt)
+                events.append(_make_event(event_type, values))
+        self.offset = offset
+        self.frames += 1
+        return FrameInput(_mask_keys(self.mask), self.mods, events, self.step)
+
+    def verify(self, game):
+        """
+        Check the game state against the checkpoint recorded after the last frame, if any.
+
+        Args:
+            game: GameManager being replayed
+
+        Returns:
+            bool: False if a checkpoint was found and the state no longer matches
+        """
+        data = self.data
+        if self.offset >= len(data) or data[self.offset] != RECORD_CHECKPOINT:
+            return True
+        expected = struct.unpack_from('<I', data, self.offset + 1)[0]
+        self.offset += 5
+        self.checkpoints += 1
+        if get_state_hash(game) == expected:
+            return True
+        self.divergences += 1
+        if self.first_divergence is None:
+            self.first_divergence = self.frames
+            logger.warning(f"Replay diverged from the recording at frame {self.frames}")
+        return False
@@ -0,0 +1,23 @@
+"""
+Input state helpers for the Space Impact game.
+Lets scripted runs feed held keys to the player instead of the real keyboard.
+"""
+
+class KeyState:
+    """Held-key snapshot that can be indexed like pygame.key.get_pressed()."""
+
+    def __init__(self, keys=()):
+        """Initialize with an iterable of held pygame key codes."""
+        self.keys = frozenset(keys)
+
+    def __getitem__(self, key):
+        """Return True if the key is held."""
+        return key in self.keys
+
+    def __iter__(self):
+        """Iterate over the held key codes."""
+        return iter(self.keys)
+
+    def __len__(self):
+        """Return the number of held keys."""
+        return len(self.keys)
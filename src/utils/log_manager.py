@@ -0,0 +1,124 @@
+"""
+Log Manager for the Space Impact game.
+Sets up one 'SpaceConquer' logger hierarchy with a logger per category.
+Records go through a queue to a listener thread that writes the console and
+the rotating files under logs/, so logging never blocks the game loop.
+Hot-path messages are rate-limited per key with throttle().
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+
+LOG_DIRECTORY = 'logs'
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+ROOT_LOGGER = 'SpaceConquer'
+MAX_LOG_BYTES = 1024 * 1024  # Size a log file grows to before rotating
+LOG_BACKUPS = 5              # Rotated log files kept
+DEFAULT_THROTTLE_MS = 1000   # Default interval between repeats of a throttled message
+
+_listener = None
+_last_logged = {}  # Throttle key -> time it was last allowed (monotonic ms)
+
+def setup_logging(directory=LOG_DIRECTORY, console=True, debug=False):
+    """
+    Route every game logger through a background listener thread.
+
+    Safe to call more than once; only the first call installs the handlers.
+
+    Args:
+        directory: Folder for the rotating log files (None disables file logging)
+        console: Also echo records to stdout
+        debug: Start with debug messages enabled
+
+    Returns:
+        str: Path of the log file, or None if file logging is disabled
+    """
+    global _listener
+    root = logging.getLogger(ROOT_LOGGER)
+    set_debug_logging(debug)
+    if _listener is not None:
+        return getattr(_listener, 'log_path', None)
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = []
+    log_path = None
+    if directory:
+        try:
+            os.makedirs(directory, exist_ok=True)
+            log_path = os.path.join(directory, time.strftime("space_conquer_%Y-%m-%d_%H-%M-%S.log"))
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_path, maxBytes=MAX_LOG_BYTES, backupCount=LOG_BACKUPS, encoding='utf-8')
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        except OSError as e:
+            print(f"Could not open log file in {directory}: {e}")
+            log_path = None
+    if console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter('%(levelname)s [%(name)s] %(message)s'))
+        handlers.append(console_handler)
+
+    # The game thread only enqueues records; the listener does the formatting and I/O
+    record_queue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(record_queue))
+    root.propagate = False
+    _listener = logging.handlers.QueueListener(record_queue, *handlers, respect_handler_level=True)
+    _listener.log_path = log_path
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    if log_path:
+        root.info(f"Logger initialized. Log file: {log_path}")
+    return log_path
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def get_logger(category):
+    """
+    Return the logger for a category (e.g. 'boss', 'sound', 'phases').
+
+    Args:
+        category: Subsystem name, appended to the SpaceConquer logger name
+
+    Returns:
+        logging.Logger: Category logger
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{category}")
+
+def set_debug_logging(enabled):
+    """Switch debug messages on or off for every category."""
+    logging.getLogger(ROOT_LOGGER).setLevel(logging.DEBUG if enabled else logging.INFO)
+
+def is_debug_logging():
+    """Return True if debug messages are enabled."""
+    return logging.getLogger(ROOT_LOGGER).level <= logging.DEBUG
+
+def throttle(key, interval_ms=DEFAULT_THROTTLE_MS):
+    """
+    Rate-limit a message: return True at most once per interval for a key.
+
+    Usage: ``if throttle('boss.state'): logger.debug(...)`` so the message is
+    neither formatted nor queued while it is being suppressed.
+
+    Args:
+        key: Message key (usually '<category>.<event>')
+        interval_ms: Minimum time between allowed messages in milliseconds
+
+    Returns:
+        bool: True if the message should be logged now
+    """
+    now = time.monotonic() * 1000.0
+    last = _last_logged.get(key)
+    if last is not None and now - last < interval_ms:
+        return False
+    _last_logged[key] = now
+    return True
@@ -0,0 +1,106 @@
+"""
+LRU Cache for the Space Impact game.
+Shared least-recently-used store behind the text, glow, tint, ghost and mask
+caches: entry and memory limits, an optional source object kept alive per
+entry (for keys built from id(source)) and the same hit, miss and eviction
+counters for every cache.
+"""
+from collections import OrderedDict
+
+def surface_bytes(surface):
+    """Return the pixel memory of a surface in bytes."""
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+class LRUCache:
+    """Least recently used cache with entry and byte limits."""
+
+    def __init__(self, max_entries, max_bytes=None, size_of=None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum memory of the kept values (None for no limit)
+            size_of: Function returning the memory of a value in bytes
+                     (None to count only entries)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+        # key -> (source, value)
+        self.entries = OrderedDict()
+        self.cached_bytes = 0
+
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """
+        Look up a value and mark it as recently used.
+
+        Returns:
+            The cached value, or None (counted as a miss) if it isn't cached
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key, value, source=None):
+        """
+        Store a value, evicting the least recently used entries past the limits.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            source: Object the key was derived from (e.g. the image behind an
+                    id(image) key); held with the entry so its id can't be
+                    reused by another object while the entry is cached
+
+        Returns:
+            The stored value
+        """
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.cached_bytes -= self._size(old[1])
+        self.entries[key] = (source, value)
+        self.cached_bytes += self._size(value)
+        while self.entries and (len(self.entries) > self.max_entries or
+                                (self.max_bytes is not None and self.cached_bytes > self.max_bytes)):
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.cached_bytes -= self._size(evicted)
+            self.evictions += 1
+        return value
+
+    def _size(self, value):
+        """Return the memory of a value, or 0 when sizes aren't tracked."""
+        return self.size_of(value) if self.size_of is not None else 0
+
+    def forget(self, source):
+        """Drop every entry stored with a source object (counted as evictions)."""
+        for key in [key for key, entry in self.entries.items() if entry[0] is source]:
+            self.cached_bytes -= self._size(self.entries.pop(key)[1])
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every entry (counters are kept)."""
+        self.entries.clear()
+        self.cached_bytes = 0
+
+    def get_stats(self):
+        """Return cache statistics."""
+        return {
+            'entries': len(self.entries),
+            'bytes': self.cached_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
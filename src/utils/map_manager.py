@@ -3,13 +3,10 @@ Map Manager for Space Conquer.
 Handles loading, managing, and transitioning between game maps.
 """
 import pygame
-import logging
 from pathlib import Path
+from src.utils.log_manager import get_logger
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, 
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger('MapManager')
+logger = get_logger('maps')
 
 class MapManager:
     def __init__(self, asset_manager, sound_manager):
@@ -0,0 +1,121 @@
+"""
+Mask Cache for the Space Impact game.
+Builds a pixel collision mask once per sprite image and keeps it, so a
+broadphase hit can be confirmed pixel-perfectly without calling
+pygame.mask.from_surface every frame. Rotated sprites carry the mask of their
+rotation bucket (see RotatedFrame), which is used as-is.
+"""
+import pygame
+from src.utils.lru import LRUCache
+
+MAX_CACHED_MASKS = 512  # Image masks kept before evicting
+
+def mask_bytes(mask):
+    """Return the approximate memory of a mask (one bit per pixel)."""
+    width, height = mask.get_size()
+    return width * height // 8
+
+class MaskCache:
+    """LRU cache of collision masks keyed by source image."""
+
+    def __init__(self, max_entries=MAX_CACHED_MASKS):
+        """
+        Initialize the mask cache.
+
+        Args:
+            max_entries: Maximum number of image masks kept in the cache
+        """
+        # id(image) -> mask, stored with the image as its source
+        self.masks = LRUCache(max_entries, size_of=mask_bytes)
+        # (width, height) -> fully set mask, for plain rects such as projectiles
+        self.rect_masks = {}
+
+    def get_mask(self, image):
+        """
+        Return the shared collision mask of an image, building it on first use.
+
+        Args:
+            image: Sprite surface (colorkey or per-pixel alpha)
+
+        Returns:
+            pygame.mask.Mask: Mask of the image's opaque pixels
+        """
+        mask = self.masks.get(id(image))
+        if mask is None:
+            mask = self.masks.put(id(image), pygame.mask.from_surface(image), source=image)
+        return mask
+
+    def get_rect_mask(self, size):
+        """Return a shared mask with every bit set for a rect size."""
+        mask = self.rect_masks.get(size)
+        if mask is None:
+            mask = pygame.mask.Mask(size, fill=True)
+            self.rect_masks[size] = mask
+        return mask
+
+    def forget(self, image):
+        """Drop the cached mask of an image."""
+        self.masks.forget(image)
+
+    def clear(self):
+        """Drop every cached mask."""
+        self.masks.clear()
+        self.rect_masks.clear()
+
+    def get_stats(self):
+        """Return cache statistics."""
+        return self.masks.get_stats()
+
+# Shared mask cache
+_mask_cache = None
+
+def get_mask_cache():
+    """Return the shared mask cache."""
+    global _mask_cache
+    if _mask_cache is None:
+        _mask_cache = MaskCache()
+    return _mask_cache
+
+def get_sprite_mask(sprite):
+    """
+    Get the collision mask of a sprite's current image.
+
+    Args:
+        sprite: Sprite with an image and optionally a mask (rotated sprites)
+
+    Returns:
+        pygame.mask.Mask, or None if the sprite has no image
+    """
+    mask = getattr(sprite, 'mask', None)
+    if mask is not None:
+        return mask
+    image = getattr(sprite, 'image', None)
+    if image is None:
+        return None
+    return get_mask_cache().get_mask(image)
+
+def sprites_overlap(sprite_a, sprite_b):
+    """
+    Check whether the opaque pixels of two sprites overlap at their rects.
+
+    Sprites without a mask count as overlapping, so the rect result stands.
+    """
+    mask_a = get_sprite_mask(sprite_a)
+    mask_b = get_sprite_mask(sprite_b)
+    if mask_a is None or mask_b is None:
+        return True
+    offset = (sprite_b.rect.x - sprite_a.rect.x, sprite_b.rect.y - sprite_a.rect.y)
+    return mask_a.overlap(mask_b, offset) is not None
+
+def sprite_overlaps_rect(sprite, rect):
+    """
+    Check whether the opaque pixels of a sprite overlap a solid rect.
+
+    Sprites without a mask count as overlapping, so the rect result stands.
+    """
+    mask = get_sprite_mask(sprite)
+    if mask is None or rect.width <= 0 or rect.height <= 0:
+        return True
+    rect_mask = get_mask_cache().get_rect_mask(rect.size)
+    offset = (rect.x - sprite.rect.x, rect.y - sprite.rect.y)
+    return mask.overlap(rect_mask, offset) is not None
@@ -0,0 +1,253 @@
+"""
+Music Manager for the Space Impact game.
+Plays music on two reserved mixer channels so tracks can crossfade, decodes
+tracks on a background thread so switching never blocks the game loop, and
+drives fades and volume ducking from the game clock instead of sleeping.
+"""
+import queue
+import threading
+import pygame
+from src.utils.game_clock import get_clock
+from src.utils.log_manager import get_logger
+
+logger = get_logger('music')
+
+MUSIC_CHANNELS = 2  # Mixer channels reserved for music (one fading out, one fading in)
+
+class MusicManager:
+    """Non-blocking music player with crossfades, preloading and ducking."""
+
+    def __init__(self, volume=0.5):
+        """
+        Initialize the music manager.
+
+        Args:
+            volume: Music volume from 0 to 1
+        """
+        self.volume = volume
+        self.enabled = bool(pygame.mixer.get_init())
+
+        # Decoded tracks keyed by file path, filled in by the loader thread
+        self.sounds = {}
+        self.failed = set()
+        self.loading = set()
+        self.lock = threading.Lock()
+        self.requests = queue.Queue()
+        self.loader = None
+
+        # Channel state: gain is the fade level, multiplied by volume and ducking
+        self.channels = []
+        self.gains = [0.0] * MUSIC_CHANNELS
+        self.fades = [None] * MUSIC_CHANNELS  # (start gain, target gain, elapsed, duration, stop at end)
+        self.active = None  # Index of the channel playing the current track
+        self.current_path = None
+        self.paused = False
+
+        # Track waiting for its decode to finish: (path, loops, fade seconds)
+        self.pending = None
+        # Path to play instead when a track fails to decode (e.g. OGG -> WAV)
+        self.fallbacks = {}
+
+        # Volume ducking (e.g. while a jingle plays)
+        self.duck_factor = 1.0
+        self.duck_remaining = 0.0
+
+        if self.enabled:
+            pygame.mixer.set_reserved(MUSIC_CHANNELS)
+            self.channels = [pygame.mixer.Channel(i) for i in range(MUSIC_CHANNELS)]
+            self.loader = threading.Thread(target=self._load_worker, name="music-loader", daemon=True)
+            self.loader.start()
+
+    def _load_worker(self):
+        """Decode requested tracks in the background."""
+        while True:
+            path = self.requests.get()
+            if path is None:
+                return
+            try:
+                sound = pygame.mixer.Sound(path)
+                with self.lock:
+                    self.sounds[path] = sound
+            except (pygame.error, FileNotFoundError) as e:
+                logger.error(f"Error decoding music track {path}: {e}")
+                with self.lock:
+                    self.failed.add(path)
+            finally:
+                with self.lock:
+                    self.loading.discard(path)
+
+    def set_fallback(self, path, fallback):
+        """Play fallback instead of path if path can't be decoded."""
+        self.fallbacks[path] = fallback
+
+    def preload(self, path):
+        """Queue a track for background decoding (no-op if already loaded or queued)."""
+        if not self.enabled:
+            return
+        with self.lock:
+            if path in self.sounds or path in self.loading or path in self.failed:
+                return
+            self.loading.add(path)
+        self.requests.put(path)
+
+    def is_loaded(self, path):
+        """Return True if a track is decoded and ready to play."""
+        with self.lock:
+            return path in self.sounds
+
+    def play(self, path, loops=-1, fade_ms=0):
+        """
+        Start a track, crossfading from whatever is playing.
+
+        If the track is still decoding it starts as soon as it is ready,
+        while the previous track keeps playing.
+
+        Args:
+            path: Music file path
+            loops: Loop count (-1 loops forever)
+            fade_ms: Crossfade length in milliseconds (0 cuts immediately)
+        """
+        if not self.enabled:
+            return
+        self.current_path = path
+        self.preload(path)
+        self.pending = (path, loops, fade_ms / 1000.0)
+        self._start_pending()
+
+    def _start_pending(self):
+        """Start the pending track once it has been decoded."""
+        path, loops, fade = self.pending
+        with self.lock:
+            sound = self.sounds.get(path)
+            failed = path in self.failed
+        if failed:
+            self.pending = None
+            fallback = self.fallbacks.get(path)
+            if fallback is not None and self.current_path == path:
+                self.play(fallback, loops, fade * 1000.0)
+            return
+        if sound is None:
+            return
+        self.pending = None
+
+        # Fade out (or cut) the old channel
+        if self.active is not None:
+            if fade > 0:
+                self._fade(self.active, 0.0, fade, stop=True)
+            else:
+                self.channels[self.active].stop()
+                self.gains[self.active] = 0.0
+                self.fades[self.active] = None
+
+        # Start the new track on the other channel
+        index = 0 if self.active is None else 1 - self.active
+        channel = self.channels[index]
+        channel.stop()
+        self.gains[index] = 0.0 if fade > 0 else 1.0
+        self.fades[index] = None
+        channel.play(sound, loops=loops)
+        if fade > 0:
+            self._fade(index, 1.0, fade)
+        self.active = index
+        if self.paused:
+            channel.pause()
+        self._apply_volume()
+
+    def _fade(self, index, target, duration, stop=False):
+        """Start a gain fade on a channel."""
+        self.fades[index] = (self.gains[index], target, 0.0, duration, stop)
+
+    def stop(self, fade_ms=0):
+        """Stop the music, optionally fading out."""
+        if not self.enabled:
+            return
+        self.pending = None
+        self.current_path = None
+        for index, channel in enumerate(self.channels):
+            if fade_ms > 0 and channel.get_busy():
+                self._fade(index, 0.0, fade_ms / 1000.0, stop=True)
+            else:
+                channel.stop()
+                self.gains[index] = 0.0
+                self.fades[index] = None
+        self.active = None
+
+    def pause(self):
+        """Pause the music."""
+        self.paused = True
+        for channel in self.channels:
+            channel.pause()
+
+    def unpause(self):
+        """Resume the music."""
+        self.paused = False
+        for channel in self.channels:
+            channel.unpause()
+
+    def set_volume(self, volume):
+        """Set the music volume from 0 to 1."""
+        self.volume = max(0, min(1, volume))
+        self._apply_volume()
+
+    def get_volume(self):
+        """Return the effective music volume (including ducking)."""
+        return self.volume * self.duck_factor
+
+    def duck(self, factor=0.3, duration_ms=1000):
+        """
+        Lower the music for a while, restoring it automatically.
+
+        Args:
+            factor: Volume multiplier while ducked
+            duration_ms: How long to stay ducked in milliseconds
+        """
+        self.duck_factor = factor
+        self.duck_remaining = duration_ms / 1000.0
+        self._apply_volume()
+
+    def unduck(self):
+        """Restore the music volume right away."""
+        self.duck_factor = 1.0
+        self.duck_remaining = 0.0
+        self._apply_volume()
+
+    def _apply_volume(self):
+        """Push the combined gain to every music channel."""
+        level = self.volume * self.duck_factor
+        for index, channel in enumerate(self.channels):
+            channel.set_volume(self.gains[index] * level)
+
+    def update(self):
+        """Advance fades and ducking by one game-clock step. Never blocks."""
+        if not self.enabled:
+            return
+        dt = get_clock().dt
+
+        if self.pending is not None:
+            self._start_pending()
+
+        for index, fade in enumerate(self.fades):
+            if fade is None:
+                continue
+            start, target, elapsed, duration, stop = fade
+            elapsed += dt
+            progress = min(1.0, elapsed / duration) if duration > 0 else 1.0
+            self.gains[index] = start + (target - start) * progress
+            if progress >= 1.0:
+                self.fades[index] = None
+                if stop:
+                    self.channels[index].stop()
+            else:
+                self.fades[index] = (start, target, elapsed, duration, stop)
+
+        if self.duck_remaining > 0:
+            self.duck_remaining -= dt
+            if self.duck_remaining <= 0:
+                self.duck_factor = 1.0
+
+        self._apply_volume()
+
+    def shutdown(self):
+        """Stop the loader thread."""
+        if self.loader is not None:
+            self.requests.put(None)
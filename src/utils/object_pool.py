@@ -0,0 +1,143 @@
+"""
+Object Pool for the Space Impact game.
+Recycles killed sprites (bullets, boss bullets, enemies, asteroids, debris and
+power-ups) instead of building new ones, so spawning during frenzy mode and
+boss fights reuses existing instances rather than churning the allocator and GC.
+"""
+import abc
+import pygame
+
+DEFAULT_MAX_FREE = 128  # Killed instances kept per pool for reuse
+
+class PooledSprite(pygame.sprite.Sprite, metaclass=abc.ABCMeta):
+    """
+    Sprite that can be recycled through an ObjectPool.
+
+    Subclasses put their setup in reset() instead of __init__, so a recycled
+    instance goes through exactly the same initialization as a new one.
+    """
+    pool = None  # Pool the instance returns to when killed (set by ObjectPool)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.reset(*args, **kwargs)
+
+    @abc.abstractmethod
+    def reset(self, *args, **kwargs):
+        """Initialize the sprite state (called for new and recycled instances)."""
+
+    def recycle(self, *args, **kwargs):
+        """Drop every attribute left from the previous life, then reset."""
+        # Recycled sprites were killed, so they belong to no groups
+        self.__dict__.clear()
+        pygame.sprite.Sprite.__init__(self)
+        self.reset(*args, **kwargs)
+
+    def kill(self):
+        """Remove the sprite from every group and hand it back to its pool."""
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
+
+class ObjectPool:
+    """Free list of killed instances of one PooledSprite class."""
+
+    def __init__(self, cls, max_free=DEFAULT_MAX_FREE):
+        """
+        Initialize the pool.
+
+        Args:
+            cls: PooledSprite subclass built by the pool
+            max_free: Maximum number of killed instances kept for reuse
+        """
+        self.cls = cls
+        self.max_free = max_free
+        self.free = []
+        # Instances killed this frame; they may still be referenced until the frame ends
+        self.pending = []
+
+        # Pool statistics
+        self.hits = 0        # Acquires served by a recycled instance
+        self.misses = 0      # Acquires that had to build a new instance
+        self.live = 0        # Instances handed out and not yet returned
+        self.high_water = 0  # Most instances live at once
+
+    def acquire(self, *args, **kwargs):
+        """
+        Return a ready instance, recycling a killed one when available.
+
+        Args:
+            *args, **kwargs: Constructor arguments of the sprite class
+
+        Returns:
+            PooledSprite: Initialized instance
+        """
+        if self.free:
+            obj = self.free.pop()
+            obj.recycle(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.misses += 1
+        obj.pool = self
+        self.live += 1
+        if self.live > self.high_water:
+            self.high_water = self.live
+        return obj
+
+    def release(self, obj):
+        """Take back a killed instance (reusable once collect() runs)."""
+        self.live = max(0, self.live - 1)
+        if len(self.free) + len(self.pending) < self.max_free:
+            self.pending.append(obj)
+
+    def collect(self):
+        """Make instances killed since the last call available for reuse."""
+        if self.pending:
+            self.free.extend(self.pending)
+            self.pending.clear()
+
+    def forget_live(self):
+        """Stop counting live instances (e.g. when a new game drops the old sprite groups)."""
+        self.live = 0
+
+    def get_stats(self):
+        """Return pool statistics."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'live': self.live,
+            'free': len(self.free) + len(self.pending),
+            'high_water': self.high_water,
+        }
+
+# Shared pools, one per sprite class
+_pools = {}
+
+def get_pool(cls):
+    """Return the shared pool for a sprite class, creating it on first use."""
+    pool = _pools.get(cls)
+    if pool is None:
+        pool = ObjectPool(cls)
+        _pools[cls] = pool
+    return pool
+
+def empty_group(group):
+    """Kill every sprite of a group so pooled ones return to their pools (instead of Group.empty())."""
+    for sprite in group.sprites():
+        sprite.kill()
+
+def collect_pools():
+    """Make every instance killed during the last frame reusable."""
+    for pool in _pools.values():
+        pool.collect()
+
+def forget_live_sprites():
+    """Reset the live counts of every pool."""
+    for pool in _pools.values():
+        pool.forget_live()
+
+def get_pool_stats():
+    """Return statistics for every pool, keyed by class name."""
+    return {cls.__name__: pool.get_stats() for cls, pool in _pools.items()}
@@ -0,0 +1,225 @@
+"""
+Particle System for the Space Impact game.
+Stores every explosion particle in fixed-capacity NumPy arrays so movement
+and expiry run as vectorized operations, and draws them from a cache of
+pre-rendered particle sprites instead of allocating a surface per particle.
+"""
+import math
+import numpy as np
+import pygame
+from src.config import FPS
+from src.utils.game_clock import get_rng
+
+# Random stream used to seed the vectorized particle generator
+rng = get_rng('particles')
+
+ALPHA_BUCKETS = 16   # Fade levels pre-rendered per particle sprite
+COLOR_STEP = 32      # Particle colors are quantized so cached sprites are reused
+
+# Emitter presets. Each preset is a list of layers emitted together:
+#   count       - particles in the layer
+#   speed       - (min, max) pixels per second in a random direction
+#   velocity    - (min, max) pixels per second per axis (used instead of speed)
+#   size        - (min, max) radius in pixels
+#   lifetime    - (min, max) seconds
+#   color       - base color, with optional per-channel color_variation
+#   color_range - ((r_min, r_max), (g_min, g_max), (b_min, b_max)) instead of color
+#   spread      - particles start anywhere inside the emitter area instead of its center
+#   fade        - fade out over the particle's lifetime
+EXPLOSION_PRESETS = {
+    # Enhanced enemy deaths: colored burst plus a few bright white flash particles
+    'low': [
+        {'count': 25, 'speed': (50, 200), 'size': (2, 6), 'lifetime': (0.1, 0.4),
+         'color': (255, 100, 50), 'color_variation': 30, 'fade': True},
+        {'count': 5, 'speed': (100, 250), 'size': (3, 7), 'lifetime': (0.05, 0.2),
+         'color': (255, 255, 255), 'fade': True},
+    ],
+    'elite': [
+        {'count': 30, 'speed': (50, 200), 'size': (2, 6), 'lifetime': (0.1, 0.4),
+         'color': (255, 200, 50), 'color_variation': 30, 'fade': True},
+        {'count': 5, 'speed': (100, 250), 'size': (3, 7), 'lifetime': (0.05, 0.2),
+         'color': (255, 255, 255), 'fade': True},
+    ],
+    'super': [
+        {'count': 40, 'speed': (50, 200), 'size': (2, 6), 'lifetime': (0.1, 0.4),
+         'color': (150, 100, 255), 'color_variation': 30, 'fade': True},
+        {'count': 5, 'speed': (100, 250), 'size': (3, 7), 'lifetime': (0.05, 0.2),
+         'color': (255, 255, 255), 'fade': True},
+    ],
+    # Boss death: solid red/orange/yellow chunks scattered over the whole hull
+    'boss': [
+        {'count': 5, 'velocity': (-3 * FPS, 3 * FPS), 'size': (3, 10), 'lifetime': (20 / FPS, 40 / FPS),
+         'color_range': ((200, 255), (100, 200), (0, 100)), 'spread': True, 'fade': False},
+    ],
+    # Objects wiped off the screen at once (main boss entrance)
+    'debris': [
+        {'count': 8, 'speed': (40, 160), 'size': (2, 5), 'lifetime': (0.1, 0.35),
+         'color': (200, 180, 160), 'color_variation': 30, 'fade': True},
+    ],
+}
+
+class ParticleSystem:
+    """Shared pool of explosion particles backed by NumPy columns."""
+
+    def __init__(self, capacity=2048):
+        """
+        Initialize the particle pool.
+
+        Args:
+            capacity: Maximum number of live particles (extra spawns are dropped)
+        """
+        self.capacity = capacity
+        self.count = 0
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.int16)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.fade = np.zeros(capacity, dtype=bool)
+        self.owner = np.zeros(capacity, dtype=np.int64)
+
+        self.np_rng = np.random.default_rng(rng.getrandbits(64))
+
+        # Pre-rendered particle sprites keyed by (size, color, alpha bucket)
+        self._sprite_cache = {}
+
+        # Statistics
+        self.spawned = 0
+        self.dropped = 0
+
+    def clear(self):
+        """Remove every particle and reseed the generator from the particle stream."""
+        self.count = 0
+        self.np_rng = np.random.default_rng(rng.getrandbits(64))
+
+    def emit(self, x, y, preset, area=None, owner=0):
+        """
+        Emit a burst of particles from a preset.
+
+        Args:
+            x, y: Emitter center
+            preset: Name of an EXPLOSION_PRESETS entry (or a list of layers)
+            area: Optional (width, height) used by layers with spread
+            owner: Optional tag so an emitter can count its own live particles
+        """
+        layers = EXPLOSION_PRESETS[preset] if isinstance(preset, str) else preset
+        for layer in layers:
+            self._emit_layer(x, y, layer, area, owner)
+
+    def _emit_layer(self, x, y, layer, area, owner):
+        """Emit one preset layer."""
+        free = self.capacity - self.count
+        n = min(layer['count'], free)
+        self.dropped += layer['count'] - n
+        if n <= 0:
+            return
+        gen = self.np_rng
+        s = slice(self.count, self.count + n)
+
+        if layer.get('spread') and area is not None:
+            width, height = area
+            self.x[s] = x + gen.integers(-(width // 2), width // 2 + 1, n)
+            self.y[s] = y + gen.integers(-(height // 2), height // 2 + 1, n)
+        else:
+            self.x[s] = x
+            self.y[s] = y
+
+        if 'velocity' in layer:
+            low, high = layer['velocity']
+            self.vx[s] = gen.uniform(low, high, n)
+            self.vy[s] = gen.uniform(low, high, n)
+        else:
+            angle = gen.uniform(0, 2 * math.pi, n)
+            speed = gen.uniform(layer['speed'][0], layer['speed'][1], n)
+            self.vx[s] = np.cos(angle) * speed
+            self.vy[s] = np.sin(angle) * speed
+
+        self.size[s] = gen.integers(layer['size'][0], layer['size'][1] + 1, n)
+        life = gen.uniform(layer['lifetime'][0], layer['lifetime'][1], n)
+        self.life[s] = life
+        self.max_life[s] = life
+
+        if 'color_range' in layer:
+            color = np.stack([gen.integers(low, high + 1, n) for low, high in layer['color_range']], axis=1)
+        else:
+            color = np.tile(np.array(layer['color'], dtype=np.int32), (n, 1))
+            variation = layer.get('color_variation', 0)
+            if variation:
+                color = color + gen.integers(-variation, variation + 1, (n, 3))
+        color = np.clip(color, 0, 255)
+        # Quantize so particles share cached sprites
+        self.color[s] = np.minimum((color + COLOR_STEP // 2) // COLOR_STEP * COLOR_STEP, 255)
+
+        self.fade[s] = layer.get('fade', True)
+        self.owner[s] = owner
+        self.count += n
+        self.spawned += n
+
+    def count_owned(self, owner):
+        """Return how many live particles an emitter owns."""
+        return int(np.count_nonzero(self.owner[:self.count] == owner))
+
+    def update(self, dt):
+        """
+        Advance every particle.
+
+        Args:
+            dt: Length of the simulation frame in seconds
+        """
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.life[:n] -= dt
+
+        # Compact the live particles to the front of the arrays
+        keep = self.life[:n] > 0
+        kept = int(np.count_nonzero(keep))
+        if kept != n:
+            for array in (self.x, self.y, self.vx, self.vy, self.life, self.max_life,
+                          self.size, self.color, self.fade, self.owner):
+                array[:kept] = array[:n][keep]
+            self.count = kept
+
+    def _get_sprite(self, size, color, alpha_bucket):
+        """Return a cached particle sprite, rendering it on first use."""
+        key = (size, color, alpha_bucket)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            alpha = 255 * alpha_bucket // (ALPHA_BUCKETS - 1)
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, alpha), (size, size), size)
+            self._sprite_cache[key] = sprite
+        return sprite
+
+    def draw(self, surface):
+        """Draw every particle."""
+        n = self.count
+        if n == 0:
+            return
+        size = self.size[:n]
+        left = (self.x[:n] - size).astype(np.int32).tolist()
+        top = (self.y[:n] - size).astype(np.int32).tolist()
+        ratio = np.where(self.fade[:n], self.life[:n] / self.max_life[:n], 1.0)
+        alpha_bucket = np.clip(np.ceil(ratio * (ALPHA_BUCKETS - 1)), 0, ALPHA_BUCKETS - 1).astype(np.int32).tolist()
+        sizes = size.tolist()
+        colors = [tuple(c) for c in self.color[:n].tolist()]
+
+        get_sprite = self._get_sprite
+        surface.blits([(get_sprite(sizes[i], colors[i], alpha_bucket[i]), (left[i], top[i]))
+                       for i in range(n)], doreturn=False)
+
+    def get_stats(self):
+        """Return particle statistics."""
+        return {
+            'live': self.count,
+            'capacity': self.capacity,
+            'spawned': self.spawned,
+            'dropped': self.dropped,
+            'cached_sprites': len(self._sprite_cache),
+        }
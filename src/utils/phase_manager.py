@@ -3,8 +3,12 @@ Phase Manager for the Space Impact game.
 Handles game phases, difficulty progression, and enemy types based on time.
 """
 import pygame
-import time
 import math
+from .game_clock import get_clock
+from .font_manager import get_font, render_text
+from .log_manager import get_logger
+
+logger = get_logger('phases')
 
 class Phase:
     """Represents a game phase with specific enemy types and difficulty settings."""
@@ -46,12 +50,12 @@ class PhaseManager:
         self.timer_paused = False
         self.timer_start_time = 0
         self.timer_paused_time = 0
-        self.last_update_time_ms = time.time() * 1000  # Use milliseconds for more precision
+        self.last_update_time_ms = get_clock().time() * 1000  # Use milliseconds for more precision
         
         # Boss timer (separate from game timer)
         self.boss_timer = 0  # Time in seconds for boss fights
         self.boss_timer_active = False
-        self.last_boss_update_time_ms = time.time() * 1000
+        self.last_boss_update_time_ms = get_clock().time() * 1000
         self.boss_asteroid_spawn_timer = 0  # Timer for spawning asteroids during boss fights
         
         # Frenzy mode
@@ -92,7 +96,7 @@ class PhaseManager:
     def update(self):
         """Update phases based on current game time."""
         # Update cooldown state
-        current_time = time.time()
+        current_time = get_clock().time()
         if self.is_on_cooldown and current_time - self.last_phase_selection_time >= self.phase_selection_cooldown:
             self.is_on_cooldown = False
         
@@ -105,11 +109,11 @@ class PhaseManager:
             if not self.boss_timer_active:
                 self.boss_timer = 0
                 self.boss_timer_active = True
-                self.last_boss_update_time_ms = time.time() * 1000
+                self.last_boss_update_time_ms = get_clock().time() * 1000
                 self.boss_asteroid_spawn_timer = 0
             
             # Update boss timer
-            current_time_ms = time.time() * 1000
+            current_time_ms = get_clock().time() * 1000
             elapsed = (current_time_ms - self.last_boss_update_time_ms) / 1000
             self.boss_timer += elapsed
             self.last_boss_update_time_ms = current_time_ms
@@ -128,7 +132,7 @@ class PhaseManager:
             not self.game_manager.ui_manager.settings_open):
             
             # Use real time for accurate timing
-            current_time_ms = time.time() * 1000  # Convert to milliseconds for more precision
+            current_time_ms = get_clock().time() * 1000  # Convert to milliseconds for more precision
             
             if hasattr(self, 'last_update_time_ms'):
                 # Calculate elapsed time since last update in seconds
@@ -184,7 +188,7 @@ class PhaseManager:
         if self.game_manager.boss_manager.has_active_boss():
             if self.frenzy_mode:
                 self.frenzy_mode = False
-                print(f"Frenzy mode ended due to boss at {self.format_time(self.game_time)}")
+                logger.info(f"Frenzy mode ended due to boss at {self.format_time(self.game_time)}")
             return
             
         # Check if we should start a frenzy based on specific times
@@ -195,13 +199,13 @@ class PhaseManager:
                 if abs(self.game_time - frenzy_time) < 0.1:
                     self.frenzy_mode = True
                     self.frenzy_start_time = self.game_time
-                    print(f"Frenzy mode activated at {self.format_time(self.game_time)}!")
+                    logger.info(f"Frenzy mode activated at {self.format_time(self.game_time)}!")
                     break
         else:
             # Check if frenzy should end
             if self.game_time >= self.frenzy_start_time + self.frenzy_duration:
                 self.frenzy_mode = False
-                print(f"Frenzy mode ended at {self.format_time(self.game_time)}")
+                logger.info(f"Frenzy mode ended at {self.format_time(self.game_time)}")
     
     def format_time(self, seconds):
         """Format seconds as MM:SS"""
@@ -219,7 +223,7 @@ class PhaseManager:
                 
             # Only print phase changes in testing mode
             if self.game_manager.testing_mode:
-                print(f"Entering new phase: {current_phase.name} (Time: {self.format_time(current_phase.time_threshold)})")
+                logger.info(f"Entering new phase: {current_phase.name} (Time: {self.format_time(current_phase.time_threshold)})")
     
     def _apply_phase_settings(self, phase):
         """Apply the settings for the given phase to the game."""
@@ -264,7 +268,7 @@ class PhaseManager:
             # Spawn the appropriate boss
             boss = self.game_manager.boss_manager.spawn_boss(phase.boss_type)
             if boss:
-                print(f"Boss spawned: {boss.name}")
+                logger.info(f"Boss spawned: {boss.name}")
                 
                 # For main boss, kill all remaining enemies with explosion effects
                 if phase.boss_type == 'main':
@@ -274,9 +278,9 @@ class PhaseManager:
                 if hasattr(self.game_manager, 'show_boss_warning'):
                     self.game_manager.show_boss_warning(phase.boss_type)
             else:
-                print(f"Failed to spawn boss for phase: {phase.name}")
+                logger.warning(f"Failed to spawn boss for phase: {phase.name}")
         else:
-            print(f"No boss for phase: {phase.name}")
+            logger.info(f"No boss for phase: {phase.name}")
             
         # Trigger phase transition effect
         self._handle_phase_transition()
@@ -300,7 +304,7 @@ class PhaseManager:
             
         if 0 <= phase_index < len(self.phases):
             # Set cooldown
-            self.last_phase_selection_time = time.time()
+            self.last_phase_selection_time = get_clock().time()
             self.is_on_cooldown = True
             
             # Deselect all phases first
@@ -317,7 +321,7 @@ class PhaseManager:
             # Apply phase settings directly
             self._apply_phase_settings(target_phase)
             
-            print(f"Skipped to phase: {target_phase.name} (Time: {self.format_time(target_phase.time_threshold)})")
+            logger.info(f"Skipped to phase: {target_phase.name} (Time: {self.format_time(target_phase.time_threshold)})")
             return True
         return False
         
@@ -326,13 +330,13 @@ class PhaseManager:
         if not self.timer_paused:
             self.timer_paused = True
             self.timer_paused_time = self.game_time
-            print(f"Timer paused at {self.format_time(self.game_time)}")
+            logger.info(f"Timer paused at {self.format_time(self.game_time)}")
     
     def resume_timer(self):
         """Resume the game timer."""
         if self.timer_paused:
             self.timer_paused = False
-            print(f"Timer resumed at {self.format_time(self.game_time)}")
+            logger.info(f"Timer resumed at {self.format_time(self.game_time)}")
             
     def handle_boss_defeated(self, boss_type):
         """Handle boss defeat events."""
@@ -420,12 +424,12 @@ class PhaseManager:
                             (self.collapse_button_rect.centerx + 5, self.collapse_button_rect.centery), 2)
         
         # Draw title
-        marker_title = pygame.font.SysFont('Arial', 18, bold=True)
-        title_text = marker_title.render("Phase Markers:", True, (255, 255, 100))
+        marker_title = get_font('Arial', 18, bold=True)
+        title_text = render_text(marker_title, "Phase Markers:", True, (255, 255, 100))
         surface.blit(title_text, (panel_x, panel_y))
         
         # Draw current game time
-        time_text = marker_title.render(f"Time: {self.format_time(self.game_time)}", True, (255, 255, 255))
+        time_text = render_text(marker_title, f"Time: {self.format_time(self.game_time)}", True, (255, 255, 255))
         surface.blit(time_text, (panel_x, panel_y + 20))
         
         # If collapsed, don't draw the phase markers
@@ -435,11 +439,11 @@ class PhaseManager:
         # Calculate cooldown progress
         cooldown_progress = 0
         if self.is_on_cooldown:
-            elapsed = time.time() - self.last_phase_selection_time
+            elapsed = get_clock().time() - self.last_phase_selection_time
             cooldown_progress = min(1.0, elapsed / self.phase_selection_cooldown)
         
         # Draw markers
-        marker_font = pygame.font.SysFont('Arial', 16)
+        marker_font = get_font('Arial', 16)
         for i, phase in enumerate(self.phases):
             # Create marker rectangle
             marker_rect = pygame.Rect(panel_x, panel_y + 50 + i * 30, panel_width, 25)
@@ -467,7 +471,7 @@ class PhaseManager:
             pygame.draw.rect(surface, border_color, marker_rect, 1)
             
             # Draw marker text
-            text = marker_font.render(f"{phase.name} ({self.format_time(phase.time_threshold)})", True, text_color)
+            text = render_text(marker_font, f"{phase.name} ({self.format_time(phase.time_threshold)})", True, text_color)
             surface.blit(text, (panel_x + 5, panel_y + 53 + i * 30))
         
         # Draw cooldown indicator if on cooldown
@@ -480,23 +484,23 @@ class PhaseManager:
                 pygame.draw.rect(surface, (100, 200, 100), progress_rect)
             
             # Draw cooldown text
-            cooldown_font = pygame.font.SysFont('Arial', 12)
-            cooldown_text = cooldown_font.render(f"Cooldown: {self.phase_selection_cooldown - (time.time() - self.last_phase_selection_time):.1f}s", 
+            cooldown_font = get_font('Arial', 12)
+            cooldown_text = render_text(cooldown_font, f"Cooldown: {self.phase_selection_cooldown - (get_clock().time() - self.last_phase_selection_time):.1f}s", 
                                                True, (200, 200, 200))
             surface.blit(cooldown_text, (panel_x, panel_y + 55 + len(self.phases) * 30))
     def draw_game_timer(self, surface):
         """Draw the game timer below the chapter title."""
         # Don't show game timer during boss fights
         if self.game_manager.show_chapter_header and not self.boss_timer_active:
-            font = pygame.font.SysFont('Arial', 18)
-            timer_text = font.render(f"Time: {self.format_time(self.game_time)}", True, (200, 200, 255))
+            font = get_font('Arial', 18)
+            timer_text = render_text(font, f"Time: {self.format_time(self.game_time)}", True, (200, 200, 255))
             surface.blit(timer_text, (surface.get_width() // 2 - timer_text.get_width() // 2, 40))
     
     def draw_boss_timer(self, surface):
         """Draw the boss timer during boss fights."""
         if self.boss_timer_active:
-            font = pygame.font.SysFont('Arial', 18)
-            timer_text = font.render(f"Boss Time: {self.format_time(self.boss_timer)}", True, (255, 100, 100))
+            font = get_font('Arial', 18)
+            timer_text = render_text(font, f"Boss Time: {self.format_time(self.boss_timer)}", True, (255, 100, 100))
             surface.blit(timer_text, (surface.get_width() // 2 - timer_text.get_width() // 2, 40))
             
     def draw_boss_warning(self, surface, boss_type):
@@ -504,7 +508,7 @@ class PhaseManager:
         # This is called when a boss is about to appear
         
         # Calculate pulsing effect
-        pulse = (math.sin(pygame.time.get_ticks() / 100) + 1) * 0.5  # 0 to 1
+        pulse = (math.sin(get_clock().get_ticks() / 100) + 1) * 0.5  # 0 to 1
         alpha = int(100 + pulse * 155)  # 100 to 255
         
         # Create overlay with pulsing red
@@ -513,11 +517,11 @@ class PhaseManager:
         surface.blit(overlay, (0, 0))
         
         # Draw warning text
-        font = pygame.font.SysFont('Arial', 48, bold=True)
+        font = get_font('Arial', 48, bold=True)
         if boss_type == 'mini':
-            warning_text = font.render("WARNING!", True, (255, 50, 50))
+            warning_text = render_text(font, "WARNING!", True, (255, 50, 50))
         else:
-            warning_text = font.render("FINAL BOSS APPROACHING!", True, (255, 50, 50))
+            warning_text = render_text(font, "FINAL BOSS APPROACHING!", True, (255, 50, 50))
             
         # Add a pulsing effect to the text
         size_multiplier = 1.0 + pulse * 0.3  # 1.0 to 1.3
@@ -540,7 +544,7 @@ class PhaseManager:
             return
             
         # Create a pulsing red overlay for the entire screen
-        pulse = (math.sin(pygame.time.get_ticks() / 150) + 1) * 0.5  # 0 to 1
+        pulse = (math.sin(get_clock().get_ticks() / 150) + 1) * 0.5  # 0 to 1
         alpha = int(20 + pulse * 30)  # 20 to 50 alpha
         
         # Create semi-transparent red overlay
@@ -549,8 +553,8 @@ class PhaseManager:
         surface.blit(overlay, (0, 0))
         
         # Draw "FRENZY MODE" text with intense effects
-        frenzy_font = pygame.font.SysFont('Arial', 32, bold=True)
-        frenzy_text = frenzy_font.render("FRENZY MODE", True, (255, 50, 50))
+        frenzy_font = get_font('Arial', 32, bold=True)
+        frenzy_text = render_text(frenzy_font, "FRENZY MODE", True, (255, 50, 50))
         
         # Add a pulsing effect
         size_multiplier = 1.0 + pulse * 0.3  # 1.0 to 1.3
@@ -601,8 +605,8 @@ class PhaseManager:
         # Draw time remaining
         if self.frenzy_start_time > 0:
             time_remaining = max(0, self.frenzy_duration - (self.game_time - self.frenzy_start_time))
-            time_font = pygame.font.SysFont('Arial', 16)
-            time_text = time_font.render(f"{time_remaining:.1f}s", True, (255, 255, 255))
+            time_font = get_font('Arial', 16)
+            time_text = render_text(time_font, f"{time_remaining:.1f}s", True, (255, 255, 255))
             time_rect = time_text.get_rect(center=(surface.get_width() // 2, 130))  # Position below the frenzy text
             surface.blit(time_text, time_rect)
     def _clear_all_enemies_with_explosion(self):
@@ -612,10 +616,15 @@ class PhaseManager:
         asteroids = list(self.game_manager.asteroids)
         debris = list(self.game_manager.debris)
         
+        # Explosions are batched into the shared particle system
+        particles = self.game_manager.particle_system
+        
         # Create a delayed explosion effect for each enemy
         for i, enemy in enumerate(enemies):
             # Destroy the enemy
             enemy.health = 0
+            preset = enemy.enemy_type if getattr(enemy, 'enemy_type', None) in ('low', 'elite', 'super') else 'low'
+            particles.emit(enemy.rect.centerx, enemy.rect.centery, preset)
             
             # Play explosion sound with slight delay to avoid sound overload
             if i % 3 == 0 and 'explosion' in self.game_manager.sound_manager.sounds:
@@ -624,10 +633,14 @@ class PhaseManager:
             # Remove from sprite groups
             enemy.kill()
         
+        # Enemy projectiles are cleared along with the enemies
+        self.game_manager.projectile_manager.clear()
+        
         # Create a delayed explosion effect for each asteroid
         for i, asteroid in enumerate(asteroids):
             # Destroy the asteroid
             asteroid.health = 0
+            particles.emit(asteroid.rect.centerx, asteroid.rect.centery, 'debris')
             
             # Play explosion sound with slight delay
             if i % 3 == 0 and 'explosion' in self.game_manager.sound_manager.sounds:
@@ -640,6 +653,7 @@ class PhaseManager:
         for i, debris_obj in enumerate(debris):
             # Destroy the debris
             debris_obj.health = 0
+            particles.emit(debris_obj.rect.centerx, debris_obj.rect.centery, 'debris')
             
             # Play explosion sound with slight delay
             if i % 3 == 0 and 'explosion' in self.game_manager.sound_manager.sounds:
@@ -648,7 +662,7 @@ class PhaseManager:
             # Remove from sprite groups
             debris_obj.kill()
             
-        print(f"Cleared {len(enemies)} enemies, {len(asteroids)} asteroids, and {len(debris)} debris for main boss entrance")
+        logger.info(f"Cleared {len(enemies)} enemies, {len(asteroids)} asteroids, and {len(debris)} debris for main boss entrance")
     def should_spawn_boss_asteroid(self):
         """Check if it's time to spawn an asteroid during boss fights."""
         if self.boss_timer_active and self.boss_asteroid_spawn_timer >= 6:  # Every 6 seconds
@@ -0,0 +1,233 @@
+"""
+Profiler for the Space Impact game.
+Records how long each stage of the main loop takes in fixed-size ring buffers,
+so per-stage percentiles can be shown in a testing overlay, dumped to CSV or
+read from headless runs. When disabled every call is a single flag check.
+"""
+import csv
+import os
+import time
+import numpy as np
+import pygame
+from src.utils.font_manager import get_font
+from src.utils.log_manager import get_logger
+
+logger = get_logger('profiler')
+
+DEFAULT_CAPACITY = 600          # Samples kept per stage (10 seconds at 60 FPS)
+OVERLAY_REFRESH_FRAMES = 30     # Frames between overlay redraws
+LOG_DIRECTORY = 'logs'
+
+perf_counter_ns = time.perf_counter_ns
+
+class StageBuffer:
+    """Ring buffer of durations for one stage."""
+    __slots__ = ('samples', 'index', 'filled', 'total')
+
+    def __init__(self, capacity):
+        """Create an empty buffer holding the most recent samples."""
+        self.samples = np.zeros(capacity, dtype=np.int64)
+        self.index = 0
+        self.filled = 0
+        self.total = 0  # Samples recorded since the last reset
+
+    def add(self, duration_ns):
+        """Record one duration, overwriting the oldest sample when full."""
+        samples = self.samples
+        samples[self.index] = duration_ns
+        self.index += 1
+        if self.index == len(samples):
+            self.index = 0
+        if self.filled < len(samples):
+            self.filled += 1
+        self.total += 1
+
+    def ordered(self):
+        """Return the kept samples from oldest to newest."""
+        if self.filled < len(self.samples):
+            return self.samples[:self.filled]
+        return np.concatenate((self.samples[self.index:], self.samples[:self.index]))
+
+class Profiler:
+    """Per-stage frame-time recorder with a live overlay."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, enabled=False):
+        """
+        Initialize the profiler.
+
+        Args:
+            capacity: Samples kept per stage
+            enabled: Start recording right away
+        """
+        self.capacity = capacity
+        self.enabled = enabled
+        self.visible = False  # Overlay shown (testing mode only)
+
+        # Stage name -> StageBuffer, in the order stages were first recorded
+        self.stages = {}
+        # Latest entity counts shown next to the timings
+        self.counts = {}
+
+        self.frames = 0
+        self.overlay = None
+        self.overlay_age = OVERLAY_REFRESH_FRAMES
+
+    def enable(self):
+        """Start recording."""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording (kept samples stay readable)."""
+        self.enabled = False
+
+    def toggle(self):
+        """Toggle recording together with the overlay."""
+        self.enabled = not self.enabled
+        self.visible = self.enabled
+        self.overlay = None
+        self.overlay_age = OVERLAY_REFRESH_FRAMES
+        return self.enabled
+
+    def reset(self):
+        """Drop every recorded sample and count."""
+        self.stages.clear()
+        self.counts.clear()
+        self.frames = 0
+        self.overlay = None
+
+    def start(self):
+        """Return a timestamp to measure the next stage from (0 when disabled)."""
+        if not self.enabled:
+            return 0
+        return perf_counter_ns()
+
+    def lap(self, name, start):
+        """
+        Record the time since start as one sample of a stage.
+
+        A start of 0 comes from a start() made while recording was off (e.g.
+        F3 pressed mid-frame); no sample is recorded for it, only the chain
+        of timestamps begins.
+
+        Args:
+            name: Stage name (e.g. 'update.enemies')
+            start: Timestamp from start() or the previous lap()
+
+        Returns:
+            int: Timestamp to measure the following stage from
+        """
+        if not self.enabled:
+            return 0
+        now = perf_counter_ns()
+        if start:
+            self.record(name, now - start)
+        return now
+
+    def record(self, name, duration_ns):
+        """Record a duration in nanoseconds for a stage."""
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = StageBuffer(self.capacity)
+            self.stages[name] = stage
+        stage.add(duration_ns)
+
+    def set_count(self, name, value):
+        """Store an entity count shown with the timings."""
+        if self.enabled:
+            self.counts[name] = value
+
+    def end_frame(self):
+        """Mark the end of a frame."""
+        if self.enabled:
+            self.frames += 1
+
+    def get_stats(self):
+        """
+        Return timing statistics for every stage.
+
+        Returns:
+            dict: Stage name -> {'p50_ms', 'p95_ms', 'p99_ms', 'mean_ms', 'max_ms', 'samples'}
+        """
+        stats = {}
+        for name, stage in self.stages.items():
+            if stage.filled == 0:
+                continue
+            samples = stage.samples[:stage.filled] / 1e6
+            p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+            stats[name] = {
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'p99_ms': float(p99),
+                'mean_ms': float(samples.mean()),
+                'max_ms': float(samples.max()),
+                'samples': stage.filled,
+            }
+        return stats
+
+    def get_counts(self):
+        """Return the latest entity counts."""
+        return dict(self.counts)
+
+    def dump_csv(self, directory=LOG_DIRECTORY):
+        """
+        Write every kept sample to a CSV file.
+
+        Args:
+            directory: Folder to write the file into
+
+        Returns:
+            str: Path of the written file
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, time.strftime("profile_%Y-%m-%d_%H-%M-%S.csv"))
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['stage', 'sample', 'duration_ns'])
+            for name, stage in self.stages.items():
+                # Number samples so the newest one of every stage lines up
+                first = stage.total - stage.filled
+                for i, duration in enumerate(stage.ordered().tolist()):
+                    writer.writerow([name, first + i, duration])
+        logger.info(f"Profiler samples written to {path}")
+        return path
+
+    def _build_overlay(self):
+        """Render the statistics panel."""
+        font = get_font('Consolas', 14)
+        line_height = font.get_linesize()
+        stats = self.get_stats()
+
+        lines = [f"{'Stage':<22}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name, stage in stats.items():
+            lines.append(f"{name:<22}{stage['p50_ms']:>7.2f}{stage['p95_ms']:>7.2f}{stage['p99_ms']:>7.2f}")
+        if self.counts:
+            lines.append("")
+            lines.append("  ".join(f"{name}: {value}" for name, value in self.counts.items()))
+
+        # Text changes every refresh, so render it directly instead of through the text cache
+        rendered = [font.render(line, True, (200, 255, 200)) for line in lines]
+        width = max(text.get_width() for text in rendered) + 16
+        height = len(rendered) * line_height + 12
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        pygame.draw.rect(panel, (80, 160, 80), panel.get_rect(), 1)
+        for i, text in enumerate(rendered):
+            panel.blit(text, (8, 6 + i * line_height))
+        return panel
+
+    def draw_overlay(self, surface, position=(10, 80)):
+        """
+        Draw the statistics panel, refreshing it every OVERLAY_REFRESH_FRAMES frames.
+
+        Args:
+            surface: Surface to draw on
+            position: Top-left corner of the panel
+        """
+        if not self.visible:
+            return
+        self.overlay_age += 1
+        if self.overlay is None or self.overlay_age >= OVERLAY_REFRESH_FRAMES:
+            self.overlay = self._build_overlay()
+            self.overlay_age = 0
+        surface.blit(self.overlay, position)
@@ -0,0 +1,347 @@
+"""
+Projectile Manager for the Space Impact game.
+Stores every enemy projectile in one structure-of-arrays NumPy pool so
+movement, homing, expiry, culling and player hits run as vectorized operations.
+"""
+import math
+import numpy as np
+import pygame
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, ROTATION_STEPS
+from src.utils.game_clock import get_clock
+from src.utils.trail_system import get_trail_system
+
+# Projectile kinds
+KIND_DOWN = 0      # Vertical bolt (drifter/oscillate shots), y is the top edge
+KIND_LEFT = 1      # Horizontal bolt moving left (low-type enemy shots)
+KIND_AIMED = 2     # Free-moving bolt with velocity components (juggernaut shots)
+KIND_MISSILE = 3   # Homing missile with lifetime and trail (juggernaut missiles)
+
+TRAIL_LENGTH = 10       # Trail positions kept per missile
+CULL_MARGIN = 50        # Free-moving projectiles are removed this far off-screen
+SIZE_BITS = 12          # Bits per projectile width/height in a sprite key
+SIZE_MASK = (1 << SIZE_BITS) - 1
+BUCKET_BITS = 9         # Bits for the rotation bucket in a sprite key
+BUCKET_MASK = (1 << BUCKET_BITS) - 1
+
+class ProjectileManager:
+    """Global pool of enemy projectiles backed by NumPy columns."""
+
+    def __init__(self, capacity=256):
+        """Initialize the projectile pool."""
+        self.capacity = 0
+        self.count = 0
+        self.next_serial = 0
+        self._allocate(capacity)
+
+        # Pre-rendered projectile sprites keyed by packed look (see _get_sprite_keys)
+        self._sprite_cache = {}
+
+    def _allocate(self, capacity):
+        """Create (or grow) the column arrays, keeping live projectiles."""
+        columns = {
+            'x': np.float32, 'y': np.float32,
+            'vx': np.float32, 'vy': np.float32,
+            'speed': np.float32,
+            'w': np.int16, 'h': np.int16,
+            'damage': np.int16, 'kind': np.int8,
+            'lifetime': np.float32, 'homing': np.float32,
+            'owner': np.int64, 'serial': np.int64,
+        }
+        for name, dtype in columns.items():
+            new_array = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                new_array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, new_array)
+
+        new_color = np.zeros((capacity, 3), dtype=np.uint8)
+        new_trail = np.zeros((capacity, TRAIL_LENGTH, 2), dtype=np.float32)
+        new_trail_len = np.zeros(capacity, dtype=np.int8)
+        new_trail_head = np.zeros(capacity, dtype=np.int8)
+        if self.capacity:
+            new_color[:self.count] = self.color[:self.count]
+            new_trail[:self.count] = self.trail[:self.count]
+            new_trail_len[:self.count] = self.trail_len[:self.count]
+            new_trail_head[:self.count] = self.trail_head[:self.count]
+        self.color = new_color
+        self.trail = new_trail  # Ring buffer of recent positions per projectile
+        self.trail_len = new_trail_len
+        self.trail_head = new_trail_head  # Slot the next trail position is written to
+
+        self.capacity = capacity
+
+    def spawn(self, x, y, vx, vy, width, height, color, damage=1, kind=KIND_AIMED,
+              owner=0, speed=0.0, lifetime=math.inf, homing_strength=0.0):
+        """
+        Add a projectile to the pool.
+
+        Returns:
+            int: Unique serial number of the new projectile
+        """
+        if self.count >= self.capacity:
+            self._allocate(self.capacity * 2)
+
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.speed[i] = speed
+        self.w[i] = width
+        self.h[i] = height
+        self.damage[i] = damage
+        self.kind[i] = kind
+        self.lifetime[i] = lifetime
+        self.homing[i] = homing_strength
+        self.owner[i] = owner
+        self.serial[i] = self.next_serial
+        self.color[i] = color[:3]
+        self.trail_len[i] = 0
+        self.trail_head[i] = 0
+        self.count += 1
+
+        self.next_serial += 1
+        return self.serial[i]
+
+    def clear(self):
+        """Remove every projectile."""
+        self.count = 0
+
+    def _compact(self, keep):
+        """Keep only the projectiles selected by a boolean mask."""
+        n = self.count
+        kept = int(np.count_nonzero(keep))
+        if kept == n:
+            return
+        for name in ('x', 'y', 'vx', 'vy', 'speed', 'w', 'h', 'damage', 'kind',
+                     'lifetime', 'homing', 'owner', 'serial', 'color', 'trail', 'trail_len', 'trail_head'):
+            array = getattr(self, name)
+            array[:kept] = array[:n][keep]
+        self.count = kept
+
+    def remove(self, indices):
+        """Remove projectiles by index."""
+        if len(indices) == 0:
+            return
+        keep = np.ones(self.count, dtype=bool)
+        keep[indices] = False
+        self._compact(keep)
+
+    def update(self, target=None):
+        """
+        Advance every projectile by one frame.
+
+        Args:
+            target: Optional (x, y) position that homing missiles steer toward
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        x = self.x[:n]
+        y = self.y[:n]
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        kind = self.kind[:n]
+
+        # Move everything along its velocity
+        x += vx
+        y += vy
+
+        # Homing steering for missiles
+        homing = self.homing[:n] > 0
+        if target is not None and homing.any():
+            idx = np.nonzero(homing)[0]
+            dx = target[0] - x[idx]
+            dy = target[1] - y[idx]
+            distance = np.hypot(dx, dy)
+            steer = distance > 0
+            idx = idx[steer]
+            if len(idx):
+                strength = self.homing[idx]
+                new_vx = vx[idx] + dx[steer] / distance[steer] * strength
+                new_vy = vy[idx] + dy[steer] / distance[steer] * strength
+
+                # Normalize velocity to maintain constant speed
+                velocity = np.hypot(new_vx, new_vy)
+                moving = velocity > 0
+                scale = np.where(moving, self.speed[idx] / np.where(moving, velocity, 1), 1)
+                vx[idx] = new_vx * scale
+                vy[idx] = new_vy * scale
+
+            # Missiles burn down only while they have something to chase
+            self.lifetime[:n][homing] -= get_clock().dt
+
+            # Record trail positions in each missile's ring buffer (overwrites the oldest)
+            trail_idx = np.nonzero(homing)[0]
+            head = self.trail_head[trail_idx]
+            self.trail[trail_idx, head, 0] = x[trail_idx]
+            self.trail[trail_idx, head, 1] = y[trail_idx]
+            self.trail_head[trail_idx] = (head + 1) % TRAIL_LENGTH
+            self.trail_len[trail_idx] = np.minimum(self.trail_len[trail_idx] + 1, TRAIL_LENGTH)
+
+        # Expire and cull off-screen projectiles
+        keep = self.lifetime[:n] > 0
+        free = (kind == KIND_AIMED) | (kind == KIND_MISSILE)
+        keep &= ~(free & ((x < -CULL_MARGIN) | (x > SCREEN_WIDTH + CULL_MARGIN) |
+                          (y < -CULL_MARGIN) | (y > SCREEN_HEIGHT + CULL_MARGIN)))
+        keep &= ~((kind == KIND_LEFT) & (x + self.w[:n] < 0))
+        keep &= ~((kind == KIND_DOWN) & (y > SCREEN_HEIGHT))
+        self._compact(keep)
+
+    def get_bounds(self):
+        """Return the left, top, right and bottom edges of every projectile."""
+        n = self.count
+        w = self.w[:n]
+        h = self.h[:n]
+        left = np.floor(self.x[:n]) - w // 2
+        # Vertical bolts are anchored at their top edge, everything else is centered
+        top = np.where(self.kind[:n] == KIND_DOWN, np.floor(self.y[:n]), np.floor(self.y[:n]) - h // 2)
+        return left, top, left + w, top + h
+
+    def get_rect(self, i):
+        """Return the rect of one projectile (the same edges as get_bounds)."""
+        w = int(self.w[i])
+        h = int(self.h[i])
+        left = int(np.floor(self.x[i])) - w // 2
+        top = int(np.floor(self.y[i]))
+        if self.kind[i] != KIND_DOWN:
+            top -= h // 2
+        return pygame.Rect(left, top, w, h)
+
+    def collide_rect(self, rect):
+        """
+        Find projectiles overlapping a rect.
+
+        Returns:
+            numpy.ndarray: Indices of overlapping projectiles
+        """
+        if self.count == 0:
+            return np.empty(0, dtype=np.intp)
+        left, top, right, bottom = self.get_bounds()
+        hit = (left < rect.right) & (right > rect.left) & (top < rect.bottom) & (bottom > rect.top)
+        return np.nonzero(hit)[0]
+
+    def _build_glow(self, width, height, color):
+        """Create a soft elliptical glow."""
+        glow_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.ellipse(glow_surface, (*color, 100), (0, 0, width, height))
+        return glow_surface
+
+    def _build_left_trail(self, width, height, color):
+        """Create the fading trail drawn behind horizontal bolts."""
+        trail_length = width * 1.5
+        trail_surface = pygame.Surface((int(trail_length), height), pygame.SRCALPHA)
+        for i in range(int(trail_length)):
+            alpha = 150 * (1 - i / trail_length)
+            pygame.draw.line(trail_surface, (*color, int(alpha)),
+                             (i, height // 2), (i, height // 2), 1)
+        return trail_surface
+
+    def _build_bolt(self, width, height, color):
+        """Create the unrotated juggernaut bolt image."""
+        bullet_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        bullet_surface.fill((*color, 255))
+        core_rect = pygame.Rect(width // 4, height // 4, width // 2, height // 2)
+        pygame.draw.rect(bullet_surface, (255, 255, 200), core_rect)
+        return bullet_surface
+
+    def _build_sprite(self, kind, width, height, color, bucket):
+        """
+        Pre-render a projectile with its core, glow and trail in one surface.
+
+        Args:
+            kind: KIND_LEFT, KIND_DOWN or KIND_AIMED (missiles share the aimed bolt)
+            width: Projectile width
+            height: Projectile height
+            color: RGB color
+            bucket: Rotation bucket of aimed bolts (ignored for other kinds)
+
+        Returns:
+            tuple: (surface, (dx, dy)) where the offset moves the projectile's
+                   position to the surface's top-left corner
+        """
+        if kind == KIND_LEFT:
+            # Horizontal bolt with a bright core, glow and trail; origin at the glow's corner
+            glow = self._build_glow(width * 2, height * 2, color)
+            trail = self._build_left_trail(width, height, color)
+            sprite_width = max(width * 2, width + width // 2 + trail.get_width())
+            sprite = pygame.Surface((sprite_width, height * 2), pygame.SRCALPHA)
+            sprite.fill(color, (width - width // 2, height - height // 2, width, height))
+            sprite.fill((255, 200, 200), (width - width // 4, height - height // 4, width // 2, height // 2))
+            sprite.blit(glow, (0, 0))
+            sprite.blit(trail, (width + width // 2, height - height // 2))
+            return sprite, (-width, -height)
+        if kind == KIND_DOWN:
+            # Vertical bolt with a small glow, 2px larger on every side
+            glow = self._build_glow(width + 4, height + 4, color)
+            sprite = pygame.Surface((width + 4, height + 4), pygame.SRCALPHA)
+            sprite.fill(color, ((width + 4) // 2 - width // 2, 2, width, height))
+            sprite.blit(glow, (0, 0))
+            return sprite, (-((width + 4) // 2), -2)
+        # Juggernaut bolt or missile, rotated to its heading and centered on its position
+        sprite = pygame.transform.rotate(self._build_bolt(width, height, color),
+                                         -bucket * (360 / ROTATION_STEPS))
+        return sprite, (-(sprite.get_width() // 2), -(sprite.get_height() // 2))
+
+    def _get_sprite_keys(self):
+        """
+        Pack the look of every projectile into one integer per projectile.
+
+        Returns:
+            numpy.ndarray: Keys of (kind, width, height, color, rotation bucket)
+        """
+        n = self.count
+        kind = self.kind[:n].astype(np.int64)
+        rotated = (kind == KIND_AIMED) | (kind == KIND_MISSILE)
+        # Missiles use the aimed bolt image; only those two kinds turn to their heading
+        shape = np.where(rotated, KIND_AIMED, kind)
+        angle = np.degrees(np.arctan2(self.vy[:n].astype(np.float64), self.vx[:n].astype(np.float64)))
+        bucket = np.where(rotated, np.rint(angle / (360 / ROTATION_STEPS)).astype(np.int64) % ROTATION_STEPS, 0)
+        color = self.color[:n].astype(np.int64)
+        packed_color = (color[:, 0] << 16) | (color[:, 1] << 8) | color[:, 2]
+        width = self.w[:n].astype(np.int64) & SIZE_MASK
+        height = self.h[:n].astype(np.int64) & SIZE_MASK
+        key = (shape << SIZE_BITS | width) << SIZE_BITS | height
+        return ((key << 24 | packed_color) << BUCKET_BITS) | bucket
+
+    def _get_trail_points(self, i):
+        """Return the trail of a projectile from oldest to newest position."""
+        trail_len = int(self.trail_len[i])
+        head = int(self.trail_head[i])
+        if trail_len < TRAIL_LENGTH:
+            return self.trail[i, :trail_len].tolist()
+        return np.concatenate((self.trail[i, head:], self.trail[i, :head])).tolist()
+
+    def draw(self, surface):
+        """Draw every projectile with one batched blit, then the missile trails."""
+        n = self.count
+        if n == 0:
+            return
+
+        # One pre-rendered sprite per distinct look; build the ones not seen yet
+        keys, first, inverse = np.unique(self._get_sprite_keys(), return_index=True, return_inverse=True)
+        sprites = np.empty(len(keys), dtype=object)
+        offsets = np.empty((len(keys), 2), dtype=np.int64)
+        sprite_cache = self._sprite_cache
+        for j, key in enumerate(keys.tolist()):
+            entry = sprite_cache.get(key)
+            if entry is None:
+                i = first[j]
+                kind = KIND_AIMED if self.kind[i] == KIND_MISSILE else int(self.kind[i])
+                entry = self._build_sprite(kind, int(self.w[i]), int(self.h[i]),
+                                           tuple(int(c) for c in self.color[i]), key & BUCKET_MASK)
+                sprite_cache[key] = entry
+            sprites[j] = entry[0]
+            offsets[j] = entry[1]
+
+        # Blit positions for the whole pool at once; zip builds each (x, y) pair only as it is
+        # blitted, so no per-projectile containers pile up for the garbage collector
+        inverse = inverse.reshape(-1)
+        xs = (self.x[:n].astype(int) + offsets[inverse, 0]).tolist()
+        ys = (self.y[:n].astype(int) + offsets[inverse, 1]).tolist()
+        surface.blits(zip(sprites[inverse].tolist(), zip(xs, ys)), doreturn=False)
+
+        # Homing missiles draw their own trail
+        missiles = np.nonzero((self.kind[:n] == KIND_MISSILE) & (self.trail_len[:n] > 1))[0]
+        for i in missiles:
+            get_trail_system().draw_line(surface, (255, 100, 0), self._get_trail_points(i))
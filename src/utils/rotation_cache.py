@@ -0,0 +1,86 @@
+"""
+Rotation Cache for the Space Impact game.
+Pre-renders sprite images at a fixed number of angle buckets the first time
+an image is rotated, so rotating a sprite every frame becomes a table lookup.
+"""
+import pygame
+
+DEFAULT_ROTATION_STEPS = 72  # 5 degree buckets
+
+class RotatedFrame:
+    """One pre-rendered rotation of an image."""
+    __slots__ = ('image', 'size', 'mask')
+
+    def __init__(self, image):
+        """Store the rotated image with its rect size and collision mask."""
+        self.image = image
+        self.size = image.get_size()
+        self.mask = pygame.mask.from_surface(image)
+
+class RotationCache:
+    """Shared table of rotated images keyed by source image."""
+
+    def __init__(self, steps=DEFAULT_ROTATION_STEPS):
+        """
+        Initialize the cache.
+
+        Args:
+            steps: Number of angle buckets in a full turn
+        """
+        self.steps = steps
+        self.step_angle = 360.0 / steps
+        # id(source image) -> (source image, [RotatedFrame] * steps)
+        self.tables = {}
+
+    def _build_table(self, image):
+        """Pre-render every angle bucket of an image."""
+        frames = [RotatedFrame(pygame.transform.rotate(image, bucket * self.step_angle))
+                  for bucket in range(self.steps)]
+        # Keep a reference to the source so its id can't be reused while cached
+        self.tables[id(image)] = (image, frames)
+        return frames
+
+    def get_bucket(self, angle):
+        """Return the bucket index nearest to an angle in degrees."""
+        return int(round(angle / self.step_angle)) % self.steps
+
+    def get_frame(self, image, angle):
+        """
+        Return the cached rotation of an image nearest to an angle.
+
+        Angles follow pygame.transform.rotate (degrees, counterclockwise).
+        The returned image is shared, so callers must copy it before drawing on it.
+
+        Args:
+            image: Unrotated source surface
+            angle: Rotation in degrees
+
+        Returns:
+            RotatedFrame: Rotated image with its rect size and collision mask
+        """
+        table = self.tables.get(id(image))
+        frames = table[1] if table is not None else self._build_table(image)
+        return frames[self.get_bucket(angle)]
+
+    def get_image(self, image, angle):
+        """Return only the rotated image (drop-in for pygame.transform.rotate)."""
+        return self.get_frame(image, angle).image
+
+    def forget(self, image):
+        """Drop the cached rotations of an image."""
+        self.tables.pop(id(image), None)
+
+    def clear(self):
+        """Drop every cached rotation."""
+        self.tables.clear()
+
+# Shared caches, one per bucket count
+_rotation_caches = {}
+
+def get_rotation_cache(steps=DEFAULT_ROTATION_STEPS):
+    """Return the shared rotation cache for a bucket count."""
+    cache = _rotation_caches.get(steps)
+    if cache is None:
+        cache = RotationCache(steps)
+        _rotation_caches[steps] = cache
+    return cache
@@ -3,8 +3,15 @@ Sound manager for the Space Impact game.
 Handles loading, playing, and controlling volume of sound effects and music.
 """
 import pygame
-import os
 from src.config import DEFAULT_SFX_VOLUME, DEFAULT_MUSIC_VOLUME, get_asset_path
+from src.utils.music_manager import MusicManager, MUSIC_CHANNELS
+from src.utils.voice_manager import VoiceManager
+from src.utils.audio_variants import load_audio_manifest, find_variant_paths
+from src.utils.log_manager import get_logger
+
+logger = get_logger('sound')
+
+MUSIC_CROSSFADE_MS = 500  # Crossfade used when switching tracks
 
 class SoundManager:
     def __init__(self):
@@ -20,21 +27,27 @@ class SoundManager:
         self.music_tracks = {}
         self.current_music = None
         
+        # Music is played and crossfaded without blocking the game loop
+        self.music = MusicManager(self.music_volume)
+        
+        # Sound effects play on their own reserved channels, after the music ones
+        self.voices = VoiceManager(first_channel=MUSIC_CHANNELS)
+        
         try:
             self._load_sounds()
-            print("Sound effects loaded successfully!")
+            logger.info("Sound effects loaded successfully!")
         except Exception as e:
             self.sound_enabled = False
-            print(f"Error loading sound effects: {e}")
-            print("Game will run without sound effects.")
+            logger.error(f"Error loading sound effects: {e}")
+            logger.warning("Game will run without sound effects.")
         
         try:
             self._load_music_tracks()
-            print("Music tracks loaded successfully!")
+            logger.info("Music tracks loaded successfully!")
         except Exception as e:
             self.music_enabled = False
-            print(f"Error loading music tracks: {e}")
-            print("Game will run without background music.")
+            logger.error(f"Error loading music tracks: {e}")
+            logger.warning("Game will run without background music.")
     
     def _load_sounds(self):
         """Load all sound effects."""
@@ -47,17 +60,23 @@ class SoundManager:
             'game_over': 'game_over.wav'
         }
         
+        # Compact variants listed in the manifest load first, the WAV is the fallback
+        manifest = load_audio_manifest('sounds')
         for name, filename in sound_files.items():
-            path = get_asset_path('sounds', filename)
-            if os.path.exists(path):
-                self.sounds[name] = pygame.mixer.Sound(path)
+            for path in find_variant_paths('sounds', filename, manifest):
+                try:
+                    self.sounds[name] = pygame.mixer.Sound(path)
+                except pygame.error as e:
+                    logger.warning(f"Could not decode {path}: {e}")
+                    continue
                 self.sounds[name].set_volume(self.sfx_volume)
-            else:
-                print(f"Warning: Sound file not found: {path}")
+                break
+            if name not in self.sounds:
+                logger.warning(f"Warning: Sound file not found: {get_asset_path('sounds', filename)}")
                 # For enemy_death, fall back to explosion sound if not found
                 if name == 'enemy_death' and 'explosion' in self.sounds:
                     self.sounds[name] = self.sounds['explosion']
-                    print(f"Using explosion sound as fallback for {name}")
+                    logger.info(f"Using explosion sound as fallback for {name}")
     
     def _load_music_tracks(self):
         """Load all music tracks."""
@@ -69,59 +88,68 @@ class SoundManager:
             'boss_battle': 'boss_battle.wav'
         }
         
+        manifest = load_audio_manifest('music')
         for track_name, filename in music_files.items():
-            path = get_asset_path('music', filename)
-            if os.path.exists(path):
-                self.music_tracks[track_name] = path
-                print(f"Loaded music track: {track_name}")
+            paths = find_variant_paths('music', filename, manifest)
+            if paths:
+                self.music_tracks[track_name] = paths[0]
+                # Fall back to the next variant if one can't be decoded
+                for path, fallback in zip(paths, paths[1:]):
+                    self.music.set_fallback(path, fallback)
+                logger.info(f"Loaded music track: {track_name}")
             else:
-                print(f"Music file not found: {path}")
+                logger.warning(f"Music file not found: {get_asset_path('music', filename)}")
                 # Fallback logic
                 if track_name == 'gameplay' and 'menu' in self.music_tracks:
                     self.music_tracks[track_name] = self.music_tracks['menu']
-                    print(f"Using menu music as fallback for {track_name}")
+                    logger.info(f"Using menu music as fallback for {track_name}")
                 elif track_name == 'boss' and 'gameplay' in self.music_tracks:
                     self.music_tracks[track_name] = self.music_tracks['gameplay']
-                    print(f"Using gameplay music as fallback for {track_name}")
+                    logger.info(f"Using gameplay music as fallback for {track_name}")
         
         if not self.music_tracks:
             self.music_enabled = False
+        
+        # Decode the menu track in the background now; the rest follow in preload_music
+        if 'menu' in self.music_tracks:
+            self.music.preload(self.music_tracks['menu'])
+    
+    def preload_music(self):
+        """Queue every music track for background decoding so switching (e.g. to boss music) is instant."""
+        for path in set(self.music_tracks.values()):
+            self.music.preload(path)
     
     def play_sound(self, sound_name):
         """Play a sound effect by name."""
         if self.sound_enabled:
             if sound_name in self.sounds:
-                self.sounds[sound_name].play()
+                self.voices.play(sound_name, self.sounds[sound_name])
             elif sound_name == 'enemy_death' and 'explosion' in self.sounds:
                 # Fall back to explosion sound if enemy_death is requested but not available
-                self.sounds['explosion'].play()
-                print("Using explosion sound as fallback for enemy_death")
+                self.voices.play('explosion', self.sounds['explosion'])
+                logger.info("Using explosion sound as fallback for enemy_death")
     
     def play_music(self, track='menu', loop=-1):
         """Start playing a specific music track."""
         if self.music_enabled and track in self.music_tracks:
-            # Only load and play if it's a different track
-            if self.current_music != track:
-                pygame.mixer.music.load(self.music_tracks[track])
-                pygame.mixer.music.set_volume(self.music_volume)
-                self.current_music = track
-            pygame.mixer.music.play(loop)
-            print(f"Playing music track: {track}")
+            self.music.play(self.music_tracks[track], loop)
+            self.current_music = track
+            logger.info(f"Playing music track: {track}")
         elif self.music_enabled:
-            print(f"Music track '{track}' not found, available tracks: {list(self.music_tracks.keys())}")
+            logger.warning(f"Music track '{track}' not found, available tracks: {list(self.music_tracks.keys())}")
     
     def stop_music(self):
         """Stop background music."""
-        pygame.mixer.music.stop()
+        self.music.stop()
         self.current_music = None
     
     def pause_music(self):
         """Pause background music."""
-        pygame.mixer.music.pause()
+        self.music.pause()
     
     def unpause_music(self):
         """Unpause background music."""
-        pygame.mixer.music.unpause()
+        self.music.unpause()
     
     def set_sfx_volume(self, volume):
         """Set volume for all sound effects."""
@@ -137,21 +165,30 @@ class SoundManager:
         
         if self.music_volume <= 0.01:  # Effectively zero
             if self.music_enabled:
-                pygame.mixer.music.pause()
+                self.music.pause()
                 self.music_enabled = False
         else:
             if not self.music_enabled:
-                pygame.mixer.music.unpause()
+                self.music.unpause()
                 self.music_enabled = True
-            pygame.mixer.music.set_volume(self.music_volume)
+            self.music.set_volume(self.music_volume)
     
     def switch_music(self, track, loop=-1):
-        """Switch to a different music track smoothly."""
+        """Crossfade to a different music track without blocking."""
         if self.music_enabled and track in self.music_tracks:
             if self.current_music != track:
-                pygame.mixer.music.fadeout(500)  # Fade out over 500ms
-                pygame.time.wait(500)  # Wait for fade out
-                self.play_music(track, loop)
+                self.music.play(self.music_tracks[track], loop, fade_ms=MUSIC_CROSSFADE_MS)
+                self.current_music = track
+                logger.info(f"Crossfading to music track: {track}")
+    
+    def update(self):
+        """Advance music fades and ducking and close the frame's voice counters. Call once per frame."""
+        self.music.update()
+        self.voices.end_frame()
+    
+    def get_voice_stats(self):
+        """Get the sound effect play counters (played, merged, stolen, dropped) of the last frame."""
+        return self.voices.get_frame_stats()
     
     def get_available_tracks(self):
         """Get list of available music tracks."""
@@ -162,17 +199,16 @@ class SoundManager:
         return self.current_music
     
     def temporarily_lower_music(self, duration=1000, factor=0.3):
-        """Temporarily lower music volume and restore it after duration."""
+        """Temporarily lower music volume; it is restored automatically after duration (ms)."""
         if self.music_enabled:
-            current_volume = pygame.mixer.music.get_volume()
-            pygame.mixer.music.set_volume(current_volume * factor)
+            current_volume = self.music.get_volume()
+            self.music.duck(factor, duration)
             return current_volume
         return 0
     
     def restore_music_volume(self, original_volume=None):
-        """Restore music volume to original level or default."""
+        """Restore music volume to original level or default right away."""
         if self.music_enabled:
+            self.music.unduck()
             if original_volume is not None:
-                pygame.mixer.music.set_volume(original_volume)
-            else:
-                pygame.mixer.music.set_volume(self.music_volume)
+                self.music.set_volume(original_volume)
@@ -0,0 +1,96 @@
+"""
+Startup trace for the Space Impact game.
+Records when each initialization stage ran and how long it took, from the
+moment this module is first imported, so the path to the first menu frame
+can be logged, printed (--startup-trace) or checked against a budget.
+"""
+import threading
+import time
+from src.utils.log_manager import get_logger
+
+logger = get_logger('startup')
+
+perf_counter_ns = time.perf_counter_ns
+
+class StartupTrace:
+    """Timeline of initialization stages and milestones."""
+
+    def __init__(self):
+        """Start the timeline now."""
+        self.origin = perf_counter_ns()
+        # (name, start offset ns, duration ns, thread name); milestones have no duration
+        self.entries = []
+        self.marks = {}
+        self.lock = threading.Lock()
+
+    def start(self):
+        """Return a timestamp to pass to lap()."""
+        return perf_counter_ns()
+
+    def lap(self, name, start):
+        """
+        Record a stage that began at start and ends now.
+
+        Args:
+            name: Stage name
+            start: Timestamp from start() or a previous lap()
+
+        Returns:
+            The current timestamp, to chain into the next stage
+        """
+        now = perf_counter_ns()
+        with self.lock:
+            self.entries.append((name, start - self.origin, now - start, threading.current_thread().name))
+        return now
+
+    def mark(self, name):
+        """Record a milestone (e.g. the first frame) at the current time, once."""
+        with self.lock:
+            if name in self.marks:
+                return
+            offset = perf_counter_ns() - self.origin
+            self.marks[name] = offset
+            self.entries.append((name, offset, None, threading.current_thread().name))
+
+    def get_mark_ms(self, name):
+        """Return milliseconds from startup to a milestone, or None if it wasn't reached."""
+        offset = self.marks.get(name)
+        return offset / 1e6 if offset is not None else None
+
+    def get_timeline(self):
+        """
+        Get the recorded stages and milestones in start order.
+
+        Returns:
+            List of (name, start ms, duration ms or None for milestones, thread name)
+        """
+        with self.lock:
+            entries = sorted(self.entries, key=lambda entry: entry[1])
+        return [(name, start / 1e6, duration / 1e6 if duration is not None else None, thread)
+                for name, start, duration, thread in entries]
+
+    def format_timeline(self):
+        """Return the timeline as printable lines."""
+        lines = [f"{'Stage':<32}{'start ms':>10}{'ms':>10}  thread"]
+        for name, start, duration, thread in self.get_timeline():
+            length = f"{duration:>10.1f}" if duration is not None else f"{'--':>10}"
+            lines.append(f"{name:<32}{start:>10.1f}{length}  {thread}")
+        return lines
+
+    def log_timeline(self):
+        """Write the timeline to the log."""
+        for line in self.format_timeline():
+            logger.info(line)
+
+# Shared trace, started when this module is first imported
+_startup_trace = StartupTrace()
+
+def get_startup_trace():
+    """Return the shared startup trace."""
+    return _startup_trace
+
+def reset_startup_trace():
+    """Start a fresh trace (e.g. before creating another game in the same process)."""
+    global _startup_trace
+    _startup_trace = StartupTrace()
+    return _startup_trace
@@ -0,0 +1,100 @@
+"""
+Tint Cache for the Space Impact game.
+Builds additive and multiplicative tinted copies of sprites at a fixed number
+of intensity buckets the first time they are needed, so hit flashes, blinks
+and boss pattern flashes are a lookup and a single blit instead of a copy and
+an overlay every frame.
+"""
+import pygame
+from src.utils.lru import LRUCache, surface_bytes
+
+TINT_LEVELS = 16                     # Intensity buckets between no tint and full tint
+MAX_CACHED_TINTS = 512               # Tinted sprites kept before evicting
+MAX_CACHED_BYTES = 16 * 1024 * 1024  # Pixel memory kept before evicting
+
+TINT_ADD = 'add'    # Brighten towards the color (flashes)
+TINT_MULT = 'mult'  # Darken by the color (shadows, color filters)
+
+class TintCache:
+    """LRU cache of tinted sprites keyed by source image, mode, color and intensity bucket."""
+
+    def __init__(self, levels=TINT_LEVELS, max_entries=MAX_CACHED_TINTS, max_bytes=MAX_CACHED_BYTES):
+        """
+        Initialize the tint cache.
+
+        Args:
+            levels: Number of intensity buckets
+            max_entries: Maximum number of tinted sprites kept in the cache
+            max_bytes: Maximum pixel memory of tinted sprites kept in the cache
+        """
+        self.levels = levels
+        # (id(source), mode, color, bucket) -> tinted image, stored with the source image
+        self.tints = LRUCache(max_entries, max_bytes, size_of=surface_bytes)
+
+    def get_bucket(self, intensity):
+        """Return the bucket nearest to an intensity from 0 to 1."""
+        return max(0, min(self.levels, int(intensity * self.levels + 0.5)))
+
+    def get_tinted(self, image, color, intensity=1.0, mode=TINT_ADD):
+        """
+        Return a shared tinted copy of an image, building it on first use.
+
+        An additive tint adds color * intensity to every pixel. A multiplicative
+        tint multiplies every pixel by a color that moves from white to the given
+        color as the intensity grows. Colors with an alpha component tint the
+        alpha channel too. The returned surface is shared, so callers must not
+        draw on it or change its alpha.
+
+        Args:
+            image: Source surface
+            color: RGB or RGBA tint color
+            intensity: Tint strength from 0 to 1 (rounded to one of the buckets)
+            mode: TINT_ADD or TINT_MULT
+
+        Returns:
+            pygame.Surface: The tinted image, or the source image if the intensity rounds to zero
+        """
+        bucket = self.get_bucket(intensity)
+        if bucket == 0:
+            return image
+
+        color = tuple(color)
+        key = (id(image), mode, color, bucket)
+        tinted = self.tints.get(key)
+        if tinted is None:
+            tinted = self.tints.put(key, self._build_tint(image, color, bucket / self.levels, mode), source=image)
+        return tinted
+
+    def _build_tint(self, image, color, strength, mode):
+        """Render one tinted copy of an image."""
+        tinted = image.copy()
+        if mode == TINT_MULT:
+            tint = tuple(int(255 - (255 - c) * strength) for c in color)
+            flags = pygame.BLEND_RGBA_MULT if len(tint) == 4 else pygame.BLEND_RGB_MULT
+        else:
+            tint = tuple(int(c * strength) for c in color)
+            flags = pygame.BLEND_RGBA_ADD if len(tint) == 4 else pygame.BLEND_RGB_ADD
+        tinted.fill(tint, special_flags=flags)
+        return tinted
+
+    def forget(self, image):
+        """Drop every cached tint of an image."""
+        self.tints.forget(image)
+
+    def clear(self):
+        """Drop every cached tint."""
+        self.tints.clear()
+
+    def get_stats(self):
+        """Return cache statistics."""
+        return self.tints.get_stats()
+
+# Shared tint cache used by every sprite
+_tint_cache = None
+
+def get_tint_cache():
+    """Return the shared tint cache, creating it on first use."""
+    global _tint_cache
+    if _tint_cache is None:
+        _tint_cache = TintCache()
+    return _tint_cache
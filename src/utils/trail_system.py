@@ -0,0 +1,124 @@
+"""
+Trail System for the Space Impact game.
+Keeps recent positions in fixed-size NumPy ring buffers and draws trails from
+pre-rendered faded "ghost" frames and batched line strips, so a trail costs
+the same every frame no matter how long the entity has been alive.
+"""
+import numpy as np
+import pygame
+from src.utils.lru import LRUCache, surface_bytes
+from src.utils.tint_cache import get_tint_cache
+
+DEFAULT_TRAIL_LENGTH = 5             # Positions kept per trail
+MAX_CACHED_GHOSTS = 256              # Ghost frames kept before evicting
+MAX_CACHED_BYTES = 8 * 1024 * 1024   # Pixel memory of ghost frames kept before evicting
+
+class Trail:
+    """Fixed-size ring buffer of recent positions."""
+    __slots__ = ('points', 'head', 'size')
+
+    def __init__(self, length=DEFAULT_TRAIL_LENGTH):
+        """Create an empty trail holding the last length positions."""
+        self.points = np.zeros((length, 2), dtype=np.float32)
+        self.head = 0  # Index the next position is written to
+        self.size = 0
+
+    def push(self, x, y):
+        """Record a position, overwriting the oldest one when full."""
+        points = self.points
+        points[self.head, 0] = x
+        points[self.head, 1] = y
+        self.head += 1
+        if self.head == len(points):
+            self.head = 0
+        if self.size < len(points):
+            self.size += 1
+
+    def clear(self):
+        """Forget every position."""
+        self.head = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def get_points(self):
+        """Return the kept positions from oldest to newest as a list of (x, y)."""
+        if self.size < len(self.points):
+            return self.points[:self.size].tolist()
+        return np.concatenate((self.points[self.head:], self.points[:self.head])).tolist()
+
+class TrailSystem:
+    """Shared renderer for ghost-image trails and line trails."""
+
+    def __init__(self, max_ghosts=MAX_CACHED_GHOSTS, max_bytes=MAX_CACHED_BYTES):
+        """
+        Initialize the trail system.
+
+        Args:
+            max_ghosts: Maximum number of faded ghost frames kept in the cache
+            max_bytes: Maximum pixel memory of ghost frames kept in the cache
+        """
+        # (id(image), alpha, tint) -> ghost, stored with the source image
+        self.ghosts = LRUCache(max_ghosts, max_bytes, size_of=surface_bytes)
+
+    def get_ghost(self, image, alpha, tint=None):
+        """
+        Return a shared faded copy of an image, building it on first use.
+
+        Args:
+            image: Source surface
+            alpha: Surface alpha of the ghost
+            tint: Optional RGBA color added to the image before fading
+
+        Returns:
+            pygame.Surface: The ghost frame (must not be drawn on)
+        """
+        key = (id(image), alpha, tint)
+        ghost = self.ghosts.get(key)
+        if ghost is None:
+            source = get_tint_cache().get_tinted(image, tint) if tint else image
+            ghost = source.copy()
+            ghost.set_alpha(alpha)
+            self.ghosts.put(key, ghost, source=image)
+        return ghost
+
+    def draw_ghosts(self, surface, image, ghosts):
+        """
+        Blit a row of ghost frames in one batch.
+
+        Args:
+            surface: Surface to draw on
+            image: Source surface of every ghost
+            ghosts: (position, alpha, tint) for each ghost, drawn in order
+        """
+        surface.blits([(self.get_ghost(image, alpha, tint), position)
+                       for position, alpha, tint in ghosts], doreturn=False)
+
+    def draw_line(self, surface, color, trail, width=2):
+        """
+        Draw a trail as one connected line strip.
+
+        Args:
+            surface: Surface to draw on
+            color: Line color
+            trail: Trail or list of (x, y) points from oldest to newest
+            width: Line width in pixels
+        """
+        points = trail.get_points() if isinstance(trail, Trail) else trail
+        if len(points) > 1:
+            pygame.draw.lines(surface, color, False, points, width)
+
+    def get_stats(self):
+        """Return ghost cache statistics."""
+        return self.ghosts.get_stats()
+
+# Shared trail system used by every sprite
+_trail_system = None
+
+def get_trail_system():
+    """Return the shared trail system, creating it on first use."""
+    global _trail_system
+    if _trail_system is None:
+        _trail_system = TrailSystem()
+    return _trail_system
@@ -3,10 +3,17 @@ UI Manager for the Space Impact game.
 Handles UI elements like settings panel, menus, etc.
 """
 import pygame # type: ignore
-import random
 import math
-import time
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, GRAY, DARK_GRAY
+from src.utils.game_clock import get_clock, get_rng
+from src.utils.font_manager import get_font, render_text
+from src.utils.glow_cache import blit_glow
+from src.utils.ui_widgets import Widget, Panel, Label, Button, ToggleButton, Slider
+from src.utils.log_manager import is_debug_logging, set_debug_logging
+
+# Random streams (seeded through the game clock module)
+rng = get_rng('ui')
+menu_rng = get_rng('menu')
 
 class UIManager:
     def __init__(self, asset_loader, sound_manager):
@@ -68,6 +75,7 @@ class UIManager:
         self.god_mode_button_rect = None
         self.player_coords_button_rect = None
         self.fps_button_rect = None
+        self.debug_logs_button_rect = None
         
         # Player respawn in test mode
         self.respawning = False
@@ -102,9 +110,9 @@ class UIManager:
         self.dragging_music_handle = False
         
         # Fonts
-        self.font_large = pygame.font.SysFont('Arial', 32)
-        self.font_medium = pygame.font.SysFont('Arial', 22)
-        self.font_small = pygame.font.SysFont('Arial', 16)
+        self.font_large = get_font('Arial', 32)
+        self.font_medium = get_font('Arial', 22)
+        self.font_small = get_font('Arial', 16)
         
         # Load heart images
         self.full_heart_img = self.asset_loader.get_image('full_heart')
@@ -115,15 +123,61 @@ class UIManager:
             self.full_heart_img = pygame.transform.scale(self.full_heart_img, (32, 32))
         if self.empty_heart_img.get_width() > 32 or self.empty_heart_img.get_height() > 32:
             self.empty_heart_img = pygame.transform.scale(self.empty_heart_img, (32, 32))
+        
+        # Retained widgets, re-rendered only when their inputs change
+        self.widgets = {
+            'settings_button': Widget(self._render_settings_button),
+            'score_panel': Panel((20, 20, 40, 180), (40, 40, 60, 180), (100, 100, 180)),
+            'score_label': Label(get_font('Arial', 24, bold=True), (150, 150, 255), (40, 40, 100)),
+            'health_panel': Panel((40, 10, 10, 180), (50, 20, 20, 180), (180, 100, 100)),
+            'settings_overlay': Panel((0, 0, 20, 200)),
+            'settings_panel': Panel((20, 20, 50, 220), (50, 50, 80, 220), (100, 100, 180), 2),
+            'settings_title': Label(get_font('Arial', 36, bold=True), (150, 150, 255), (40, 40, 100), 2),
+            'sfx_slider': Slider(),
+            'music_slider': Slider(),
+            'dark_overlay': Panel((0, 0, 0, 180)),
+            # Alpha 243 matches the two overlapping alpha 200 panels this screen used to draw
+            'game_over_panel': Panel((40, 0, 0, 243), (60, 10, 30, 243), (150, 30, 30), 2,
+                                     details=[((200, 50, 50), (20, 20), (-20, 20), 2),
+                                              ((200, 50, 50), (20, -30), (-20, -30), 2)]),
+            'game_over_title': Label(get_font('Arial', 48, bold=True), (255, 50, 50), (100, 0, 0), 2),
+            'confirm_panel': Panel((40, 20, 30, 240), (60, 30, 50, 240), (180, 80, 100), 2,
+                                   details=[((200, 100, 80), (20, 20), (-20, 20), 2),
+                                            ((200, 100, 80), (20, -20), (-20, -20), 2)]),
+            'testing_panel': Panel((20, 20, 40, 220), border_color=(100, 150, 255), border_width=2),
+            'coords_box': Panel((20, 20, 40, 180)),
+            'fps_box': Panel((20, 20, 40, 180)),
+            'respawn_overlay': Panel((0, 0, 0, 100)),
+        }
+    
+    def _get_widget(self, key, factory):
+        """Return a retained widget, creating it on first use."""
+        widget = self.widgets.get(key)
+        if widget is None:
+            widget = factory()
+            self.widgets[key] = widget
+        return widget
+    
+    def get_render_counts(self):
+        """Return how many times each widget has been re-rendered."""
+        return {str(key): widget.render_count for key, widget in self.widgets.items()}
     
     def draw_settings_button(self, surface):
         """Draw an enhanced settings button with the space theme."""
-        # Create a semi-transparent panel for the button
         button_size = 40
         button_rect = pygame.Rect(SCREEN_WIDTH - button_size - 10, 10, button_size, button_size)
         
-        # Check if mouse is hovering over the button
+        # Check if mouse is hovering over the button (the cached image is re-rendered only when this changes)
         is_hovered = button_rect.collidepoint(pygame.mouse.get_pos())
+        self.widgets['settings_button'].draw(surface, button_rect.topleft, button_size, is_hovered)
+        
+        # Store the button rect for click detection
+        self.settings_button_rect = button_rect
+    
+    def _render_settings_button(self, button_size, is_hovered):
+        """Render the settings button and its gear icon."""
+        button = pygame.Surface((button_size, button_size), pygame.SRCALPHA)
+        button_rect = button.get_rect()
         
         # Draw button background with gradient
         for i in range(button_size):
@@ -142,13 +196,11 @@ class UIManager:
                     int(40 + 50 * progress),
                     180
                 )
-            panel_surface = pygame.Surface((button_size, 1), pygame.SRCALPHA)
-            panel_surface.fill(color)
-            surface.blit(panel_surface, (button_rect.left, button_rect.top + i))
+            button.fill(color, (0, i, button_size, 1))
         
         # Draw button border with glow effect
         border_color = (150, 150, 255) if is_hovered else (100, 100, 180)
-        pygame.draw.rect(surface, border_color, button_rect, 2)
+        pygame.draw.rect(button, border_color, button_rect, 2)
         
         # Draw gear icon with glow effect
         center_x = button_rect.centerx
@@ -160,7 +212,7 @@ class UIManager:
         # Draw outer gear with glow
         if is_hovered:
             # Glow effect
-            pygame.draw.circle(surface, (100, 100, 200, 100), (center_x, center_y), radius + 4)
+            pygame.draw.circle(button, (100, 100, 200), (center_x, center_y), radius + 4)
         
         # Draw gear teeth
         for i in range(num_teeth):
@@ -171,28 +223,24 @@ class UIManager:
             inner_y = center_y + inner_radius * math.sin(angle + math.pi / num_teeth)
             
             # Draw tooth
-            pygame.draw.line(surface, (180, 180, 255), (outer_x, outer_y), (inner_x, inner_y), 2)
+            pygame.draw.line(button, (180, 180, 255), (outer_x, outer_y), (inner_x, inner_y), 2)
         
         # Draw gear center circle
-        pygame.draw.circle(surface, (180, 180, 255), (center_x, center_y), inner_radius)
-        pygame.draw.circle(surface, (100, 100, 180), (center_x, center_y), inner_radius, 1)
-        
-        # Store the button rect for click detection
-        self.settings_button_rect = button_rect
+        pygame.draw.circle(button, (180, 180, 255), (center_x, center_y), inner_radius)
+        pygame.draw.circle(button, (100, 100, 180), (center_x, center_y), inner_radius, 1)
+        return button
     
     def draw_settings_panel(self, surface, game_state=None):
         """Draw an enhanced settings panel with the same mysterious space theme."""
         # Create a semi-transparent overlay for the entire screen
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 20, 200))
-        surface.blit(overlay, (0, 0))
+        self.widgets['settings_overlay'].draw(surface, surface.get_rect())
         
         # Add some particle effects (stars) in the background
         for i in range(20):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            size = random.randint(1, 3)
-            brightness = random.randint(150, 255)
+            x = rng.randint(0, SCREEN_WIDTH)
+            y = rng.randint(0, SCREEN_HEIGHT)
+            size = rng.randint(1, 3)
+            brightness = rng.randint(150, 255)
             pygame.draw.circle(surface, (brightness, brightness, brightness), (x, y), size)
         
         # Create a semi-transparent panel
@@ -201,34 +249,17 @@ class UIManager:
         panel_x = self.panel_x
         panel_y = SCREEN_HEIGHT // 2 - panel_height // 2
         
-        # Draw panel background with gradient
-        for i in range(panel_height):
-            progress = i / panel_height
-            color = (
-                int(20 + 30 * progress),
-                int(20 + 30 * progress),
-                int(50 + 30 * progress),
-                220
-            )
-            panel_surface = pygame.Surface((panel_width, 1), pygame.SRCALPHA)
-            panel_surface.fill(color)
-            surface.blit(panel_surface, (panel_x, panel_y + i))
-        
-        # Draw panel border with glow effect
-        pygame.draw.rect(surface, (100, 100, 180), (panel_x, panel_y, panel_width, panel_height), 2)
+        # Draw panel background with gradient and border
+        self.widgets['settings_panel'].draw(surface, pygame.Rect(panel_x, panel_y, panel_width, panel_height))
         
         # Draw settings title with glow effect
-        settings_font = pygame.font.SysFont('Arial', 36, bold=True)
-        glow_text = settings_font.render('SETTINGS', True, (40, 40, 100))
-        surface.blit(glow_text, (panel_x + panel_width // 2 - glow_text.get_width() // 2 + 2, panel_y + 30 + 2))
-        
-        settings_text = settings_font.render('SETTINGS', True, (150, 150, 255))
-        surface.blit(settings_text, (panel_x + panel_width // 2 - settings_text.get_width() // 2, panel_y + 30))
+        settings_text = self.widgets['settings_title'].get_surface('SETTINGS')
+        surface.blit(settings_text, (panel_x + panel_width // 2 - (settings_text.get_width() - 2) // 2, panel_y + 30))
         
         
         # Sound effects label with enhanced styling
-        sfx_font = pygame.font.SysFont('Arial', 22, bold=True)
-        sfx_text = sfx_font.render('SOUND EFFECTS', True, (180, 180, 255))
+        sfx_font = get_font('Arial', 22, bold=True)
+        sfx_text = render_text(sfx_font, 'SOUND EFFECTS', True, (180, 180, 255))
         surface.blit(sfx_text, (panel_x + 20, panel_y + 100))
         
         # Sound effects slider
@@ -236,96 +267,36 @@ class UIManager:
         sfx_slider_y = panel_y + 130
         sfx_slider_width = panel_width - 90
         
-        # Draw slider background with gradient
         slider_height = 10
-        # Draw slider background with hover effect
-        slider_bg_color = (30, 30, 60, 220)
-        if self.sfx_slider_clickable_rect.collidepoint(pygame.mouse.get_pos()):
-            slider_bg_color = (40, 40, 80, 220)  # Brighter when hovered
-        
         slider_bg_rect = pygame.Rect(sfx_slider_x, sfx_slider_y, sfx_slider_width, slider_height)
-        for i in range(slider_height):
-            progress = i / slider_height
-            color = (
-                int(20 + 20 * progress),
-                int(20 + 20 * progress),
-                int(40 + 20 * progress),
-                220
-            )
-            slider_bg = pygame.Surface((sfx_slider_width, 1), pygame.SRCALPHA)
-            slider_bg.fill(color)
-            surface.blit(slider_bg, (slider_bg_rect.left, slider_bg_rect.top + i))
-        
-        # Draw slider border
-        pygame.draw.rect(surface, (100, 100, 180), slider_bg_rect, 1)
-        
-        # Draw slider fill with gradient
-        fill_width = int(sfx_slider_width * self.sound_manager.sfx_volume)
-        fill_rect = pygame.Rect(sfx_slider_x, sfx_slider_y, fill_width, slider_height)
-        for i in range(fill_rect.height):
-            progress = i / fill_rect.height
-            color = (
-                int(40 + 60 * progress),
-                int(40 + 60 * progress),
-                int(120 + 80 * progress),
-                220
-            )
-            fill_bg = pygame.Surface((fill_width, 1), pygame.SRCALPHA)
-            fill_bg.fill(color)
-            surface.blit(fill_bg, (fill_rect.left, fill_rect.top + i))
         
-        # Draw slider handle with glow effect
+        # Handle position, kept within slider bounds
         handle_x = sfx_slider_x + int(sfx_slider_width * self.sound_manager.sfx_volume)
         handle_y = sfx_slider_y + slider_height // 2
-        handle_radius = 10
-        
-        # Ensure handle stays within slider bounds
+        handle_radius = Slider.HANDLE_RADIUS
         handle_x = max(sfx_slider_x, min(handle_x, sfx_slider_x + sfx_slider_width))
         
-        # Update handle rect for click detection - make it slightly larger for easier clicking
-        self.sfx_handle_rect = pygame.Rect(0, 0, 24, 24)  # Larger clickable area
-        self.sfx_handle_rect.center = (handle_x, handle_y)
-        
-        # Draw handle with hover/drag effect
-        is_hovered = self.sfx_handle_rect.collidepoint(pygame.mouse.get_pos())
-        handle_color = (150, 150, 255)
-        glow_color = (100, 100, 200, 150)
+        # Hover uses a slightly larger area than the handle for easier clicking
+        hover_rect = pygame.Rect(0, 0, 24, 24)
+        hover_rect.center = (handle_x, handle_y)
+        is_hovered = hover_rect.collidepoint(pygame.mouse.get_pos())
         
-        if self.dragging_sfx_handle:
-            handle_color = (180, 180, 255)  # Brighter when dragging
-            glow_color = (120, 120, 220, 180)
-        elif is_hovered:
-            handle_color = (170, 170, 255)  # Slightly brighter when hovered
-            glow_color = (110, 110, 210, 170)
-        
-        # Glow effect
-        pygame.draw.circle(surface, glow_color, (handle_x, handle_y), handle_radius + 2)
-        # Main handle
-        pygame.draw.circle(surface, handle_color, (handle_x, handle_y), handle_radius)
-        # Inner highlight
-        pygame.draw.circle(surface, (200, 200, 255), (handle_x - 2, handle_y - 2), handle_radius // 2)
-        
-        # Draw a small indicator line to show the handle is draggable
-        indicator_color = (180, 180, 255)
-        pygame.draw.line(surface, indicator_color, 
-                       (handle_x - 4, handle_y), 
-                       (handle_x + 4, handle_y), 2)
-        pygame.draw.line(surface, indicator_color, 
-                       (handle_x, handle_y - 4), 
-                       (handle_x, handle_y + 4), 2)
+        # Draw the track, fill and handle (re-rendered only when volume, hover or drag changes)
+        self.widgets['sfx_slider'].draw(surface, slider_bg_rect, self.sound_manager.sfx_volume,
+                                        is_hovered, self.dragging_sfx_handle)
         
         # Update the handle rect position
         self.sfx_handle_rect = pygame.Rect(handle_x - handle_radius, handle_y - handle_radius, handle_radius * 2, handle_radius * 2)
         self.sfx_slider_rect = slider_bg_rect
         
         # Sound effects percentage
-        percent_font = pygame.font.SysFont('Arial', 18)
-        sfx_percent = percent_font.render(f"{int(self.sound_manager.sfx_volume * 100)}%", True, (180, 180, 255))
+        percent_font = get_font('Arial', 18)
+        sfx_percent = render_text(percent_font, f"{int(self.sound_manager.sfx_volume * 100)}%", True, (180, 180, 255))
         surface.blit(sfx_percent, (sfx_slider_x + sfx_slider_width + 10, sfx_slider_y - 5))
         
         # Music label with enhanced styling
-        music_font = pygame.font.SysFont('Arial', 22, bold=True)
-        music_text = music_font.render('MUSIC', True, (180, 180, 255))
+        music_font = get_font('Arial', 22, bold=True)
+        music_text = render_text(music_font, 'MUSIC', True, (180, 180, 255))
         surface.blit(music_text, (panel_x + 20, panel_y + 160))
         
         # Music slider
@@ -333,88 +304,28 @@ class UIManager:
         music_slider_y = panel_y + 190
         music_slider_width = panel_width - 90
         
-        # Draw slider background with gradient
-        # Draw slider background with hover effect
-        music_slider_bg_color = (30, 30, 60, 220)
-        if self.music_slider_clickable_rect.collidepoint(pygame.mouse.get_pos()):
-            music_slider_bg_color = (40, 40, 80, 220)  # Brighter when hovered
-        
         music_slider_bg_rect = pygame.Rect(music_slider_x, music_slider_y, music_slider_width, slider_height)
-        for i in range(slider_height):
-            progress = i / slider_height
-            color = (
-                int(20 + 20 * progress),
-                int(20 + 20 * progress),
-                int(40 + 20 * progress),
-                220
-            )
-            slider_bg = pygame.Surface((music_slider_width, 1), pygame.SRCALPHA)
-            slider_bg.fill(color)
-            surface.blit(slider_bg, (music_slider_bg_rect.left, music_slider_bg_rect.top + i))
-        
-        # Draw slider border
-        pygame.draw.rect(surface, (100, 100, 180), music_slider_bg_rect, 1)
-        
-        # Draw slider fill with gradient
-        music_fill_width = int(music_slider_width * self.sound_manager.music_volume)
-        music_fill_rect = pygame.Rect(music_slider_x, music_slider_y, music_fill_width, slider_height)
-        for i in range(music_fill_rect.height):
-            progress = i / music_fill_rect.height
-            color = (
-                int(40 + 60 * progress),
-                int(40 + 60 * progress),
-                int(120 + 80 * progress),
-                220
-            )
-            fill_bg = pygame.Surface((music_fill_width, 1), pygame.SRCALPHA)
-            fill_bg.fill(color)
-            surface.blit(fill_bg, (music_fill_rect.left, music_fill_rect.top + i))
         
-        # Draw slider handle with glow effect
+        # Handle position, kept within slider bounds
         music_handle_x = music_slider_x + int(music_slider_width * self.sound_manager.music_volume)
         music_handle_y = music_slider_y + slider_height // 2
-        
-        # Ensure handle stays within slider bounds
         music_handle_x = max(music_slider_x, min(music_handle_x, music_slider_x + music_slider_width))
         
-        # Update handle rect for click detection - make it slightly larger for easier clicking
-        self.music_handle_rect = pygame.Rect(0, 0, 24, 24)  # Larger clickable area
-        self.music_handle_rect.center = (music_handle_x, music_handle_y)
-        
-        # Draw handle with hover/drag effect
-        is_hovered = self.music_handle_rect.collidepoint(pygame.mouse.get_pos())
-        handle_color = (150, 150, 255)
-        glow_color = (100, 100, 200, 150)
-        
-        if self.dragging_music_handle:
-            handle_color = (180, 180, 255)  # Brighter when dragging
-            glow_color = (120, 120, 220, 180)
-        elif is_hovered:
-            handle_color = (170, 170, 255)  # Slightly brighter when hovered
-            glow_color = (110, 110, 210, 170)
-        
-        # Glow effect
-        pygame.draw.circle(surface, glow_color, (music_handle_x, music_handle_y), handle_radius + 2)
-        # Main handle
-        pygame.draw.circle(surface, handle_color, (music_handle_x, music_handle_y), handle_radius)
-        # Inner highlight
-        pygame.draw.circle(surface, (200, 200, 255), (music_handle_x - 2, music_handle_y - 2), handle_radius // 2)
-        
-        # Draw a small indicator line to show the handle is draggable
-        indicator_color = (180, 180, 255)
-        pygame.draw.line(surface, indicator_color, 
-                       (music_handle_x - 4, music_handle_y), 
-                       (music_handle_x + 4, music_handle_y), 2)
-        pygame.draw.line(surface, indicator_color, 
-                       (music_handle_x, music_handle_y - 4), 
-                       (music_handle_x, music_handle_y + 4), 2)
+        # Hover uses a slightly larger area than the handle for easier clicking
+        hover_rect = pygame.Rect(0, 0, 24, 24)
+        hover_rect.center = (music_handle_x, music_handle_y)
+        is_hovered = hover_rect.collidepoint(pygame.mouse.get_pos())
+        
+        # Draw the track, fill and handle (re-rendered only when volume, hover or drag changes)
+        self.widgets['music_slider'].draw(surface, music_slider_bg_rect, self.sound_manager.music_volume,
+                                          is_hovered, self.dragging_music_handle)
         
         # Update the handle rect position
         self.music_handle_rect = pygame.Rect(music_handle_x - handle_radius, music_handle_y - handle_radius, handle_radius * 2, handle_radius * 2)
         self.music_slider_rect = music_slider_bg_rect
         
         # Music percentage
-        music_percent = percent_font.render(f"{int(self.sound_manager.music_volume * 100)}%", True, (180, 180, 255))
+        music_percent = render_text(percent_font, f"{int(self.sound_manager.music_volume * 100)}%", True, (180, 180, 255))
         surface.blit(music_percent, (music_slider_x + music_slider_width + 10, music_slider_y - 5))
         
         # Button dimensions - make main menu button wider to fit text
@@ -499,7 +410,7 @@ class UIManager:
             
             # Update the phase manager's last update time when toggling settings
             if hasattr(self.game_manager, 'phase_manager'):
-                self.game_manager.phase_manager.last_update_time_ms = time.time() * 1000
+                self.game_manager.phase_manager.last_update_time_ms = get_clock().time() * 1000
                 
             return True
         
@@ -553,7 +464,7 @@ class UIManager:
                 self.settings_open = False
                 # Update the phase manager's last update time to prevent time skipping
                 if hasattr(self.game_manager, 'phase_manager'):
-                    self.game_manager.phase_manager.last_update_time_ms = time.time() * 1000
+                    self.game_manager.phase_manager.last_update_time_ms = get_clock().time() * 1000
                 return True
         
         return False
@@ -624,33 +535,11 @@ class UIManager:
         score_panel_height = 40
         score_panel_rect = pygame.Rect(10, 10, score_panel_width, score_panel_height)
         
-        # Draw panel background with gradient
-        for i in range(score_panel_height):
-            progress = i / score_panel_height
-            color = (
-                int(20 + 20 * progress),
-                int(20 + 20 * progress),
-                int(40 + 20 * progress),
-                180
-            )
-            panel_surface = pygame.Surface((score_panel_width, 1), pygame.SRCALPHA)
-            panel_surface.fill(color)
-            surface.blit(panel_surface, (score_panel_rect.left, score_panel_rect.top + i))
-        
-        # Draw panel border with glow effect
-        pygame.draw.rect(surface, (100, 100, 180), score_panel_rect, 1)
-        
-        # Draw score with glow effect
-        score_font = pygame.font.SysFont('Arial', 24, bold=True)
-        score_text = f"SCORE: {score}"
+        # Draw panel background with gradient (re-rendered only when the width changes)
+        self.widgets['score_panel'].draw(surface, score_panel_rect)
         
-        # Glow effect
-        glow_text = score_font.render(score_text, True, (40, 40, 100))
-        surface.blit(glow_text, (20 + 1, 18 + 1))
-        
-        # Main text
-        main_text = score_font.render(score_text, True, (150, 150, 255))
-        surface.blit(main_text, (20, 18))
+        # Draw score with glow effect (re-rendered only when the score changes)
+        self.widgets['score_label'].draw(surface, (20, 18), f"SCORE: {score}")
         
         # Create a semi-transparent panel for health
         # In testing mode, limit to 3 hearts
@@ -662,21 +551,8 @@ class UIManager:
         health_panel_height = 40
         health_panel_rect = pygame.Rect(10, 60, health_panel_width, health_panel_height)
         
-        # Draw panel background with gradient
-        for i in range(health_panel_height):
-            progress = i / health_panel_height
-            color = (
-                int(40 + 10 * progress),
-                int(10 + 10 * progress),
-                int(10 + 10 * progress),
-                180
-            )
-            panel_surface = pygame.Surface((health_panel_width, 1), pygame.SRCALPHA)
-            panel_surface.fill(color)
-            surface.blit(panel_surface, (health_panel_rect.left, health_panel_rect.top + i))
-        
-        # Draw panel border with glow effect
-        pygame.draw.rect(surface, (180, 100, 100), health_panel_rect, 1)
+        # Draw panel background with gradient and border
+        self.widgets['health_panel'].draw(surface, health_panel_rect)
         
         # Draw health hearts with animation effect
         heart_spacing = 45
@@ -687,15 +563,12 @@ class UIManager:
             # Use the existing heart images with added effects
             if i < health:
                 # Add pulsing glow effect to full hearts
-                pulse_factor = 0.8 + 0.2 * abs(math.sin(pygame.time.get_ticks() * 0.003 + i * 0.5))
-                glow_size = int(40 * pulse_factor)
-                
-                # Create a glow surface
-                glow_surface = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surface, (255, 100, 100, 50), (glow_size//2, glow_size//2), glow_size//2)
+                pulse_factor = 0.8 + 0.2 * abs(math.sin(get_clock().get_ticks() * 0.003 + i * 0.5))
+                glow_radius = int(40 * pulse_factor) // 2
                 
-                # Blit the glow and then the heart
-                surface.blit(glow_surface, (heart_x - 5, heart_y - 5))
+                # Blit the cached glow and then the heart
+                blit_glow(surface, (heart_x - 5 + glow_radius, heart_y - 5 + glow_radius),
+                          glow_radius, (255, 100, 100), 50, falloff=0)
                 surface.blit(self.full_heart_img, (heart_x, heart_y))
             else:
                 # Just draw the empty heart
@@ -708,16 +581,14 @@ class UIManager:
     def show_game_over(self, surface, score):
         """Display an enhanced game over screen."""
         # Create a dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
+        self.widgets['dark_overlay'].draw(surface, surface.get_rect())
         
         # Add some particle effects
         for i in range(30):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            size = random.randint(1, 4)
-            color = (random.randint(150, 255), random.randint(0, 100), random.randint(0, 50))
+            x = rng.randint(0, SCREEN_WIDTH)
+            y = rng.randint(0, SCREEN_HEIGHT)
+            size = rng.randint(1, 4)
+            color = (rng.randint(150, 255), rng.randint(0, 100), rng.randint(0, 50))
             pygame.draw.circle(surface, color, (x, y), size)
         
         # Create a semi-transparent panel for the game over message
@@ -725,98 +596,16 @@ class UIManager:
         panel_rect = pygame.Rect(SCREEN_WIDTH // 2 - panel_width // 2, SCREEN_HEIGHT // 2 - panel_height // 2, 
                                 panel_width, panel_height)
         
-        # Draw panel background with gradient
-        for i in range(panel_height):
-            progress = i / panel_height
-            color = (
-                int(40 + 20 * progress),
-                int(0 + 10 * progress),
-                int(0 + 30 * progress),
-                200
-            )
-            panel_surface = pygame.Surface((panel_width, 1), pygame.SRCALPHA)
-            panel_surface.fill(color)
-            surface.blit(panel_surface, (panel_rect.left, panel_rect.top + i))
-        
-        # Draw panel border
-        pygame.draw.rect(surface, (150, 30, 30), panel_rect, 2)
-        
-        # Add some "tech" details to the panel
-        pygame.draw.line(surface, (200, 50, 50, 150), 
-                        (panel_rect.left + 20, panel_rect.top + 20), 
-                        (panel_rect.left + panel_width - 20, panel_rect.top + 20), 2)
-        pygame.draw.line(surface, (200, 50, 50, 150), 
-                        (panel_rect.left + 20, panel_rect.bottom - 30),  # Moved up to 30px from bottom
-                        (panel_rect.left + panel_width - 20, panel_rect.bottom - 30), 2)
-        
-        # Draw game over text with glow effect
-        game_over_font = pygame.font.SysFont('Arial', 48, bold=True)
-        glow_text = game_over_font.render('GAME OVER', True, (100, 0, 0))
-        surface.blit(glow_text, (SCREEN_WIDTH // 2 - glow_text.get_width() // 2 + 2, panel_rect.top + 50 + 2))
-        
-        game_over_text = game_over_font.render('GAME OVER', True, (255, 50, 50))
-        surface.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, panel_rect.top + 50))
-        
-        # Draw score
-        score_font = pygame.font.SysFont('Arial', 32)
-        score_text = score_font.render(f'Final Score: {score}', True, (220, 220, 255))
-        surface.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, panel_rect.top + 120))
-        
-        # Create restart button
-        restart_button_width, restart_button_height = 250, 50
-        restart_button_rect = pygame.Rect(SCREEN_WIDTH // 2 - restart_button_width // 2, 
-                                        panel_rect.top + 180, 
-                                        restart_button_width, restart_button_height)
-        is_restart_hovered = restart_button_rect.collidepoint(pygame.mouse.get_pos())
-        self._draw_stylized_button(surface, restart_button_rect, "RESTART", (60, 10, 10), (150, 30, 30), is_restart_hovered)
-        
-        # Create main menu button with proper padding and gap
-        main_menu_button_rect = pygame.Rect(SCREEN_WIDTH // 2 - restart_button_width // 2, 
-                                    panel_rect.top + 250,  # Increased gap from first button (from 180 to 250 = 70px gap)
-                                    restart_button_width, restart_button_height)
-        is_menu_hovered = main_menu_button_rect.collidepoint(pygame.mouse.get_pos())
-        self._draw_stylized_button(surface, main_menu_button_rect, "MAIN MENU", (30, 30, 60), (70, 70, 140), is_menu_hovered)
-        
-        # Store button rectangles for click detection - make sure these are class variables
-        self.start_button_rect = restart_button_rect
-        self.main_menu_button_rect = main_menu_button_rect  # Store the main menu button rect
-        self.test_button_rect = None  # No test button on game over screen
-        
-        # Draw panel background with gradient
-        for i in range(panel_height):
-            progress = i / panel_height
-            color = (
-                int(40 + 20 * progress),
-                int(0 + 10 * progress),
-                int(0 + 30 * progress),
-                200
-            )
-            panel_surface = pygame.Surface((panel_width, 1), pygame.SRCALPHA)
-            panel_surface.fill(color)
-            surface.blit(panel_surface, (panel_rect.left, panel_rect.top + i))
-        
-        # Draw panel border
-        pygame.draw.rect(surface, (150, 30, 30), panel_rect, 2)
-        
-        # Add some "tech" details to the panel
-        pygame.draw.line(surface, (200, 50, 50, 150), 
-                        (panel_rect.left + 20, panel_rect.top + 20), 
-                        (panel_rect.left + panel_width - 20, panel_rect.top + 20), 2)
-        pygame.draw.line(surface, (200, 50, 50, 150), 
-                        (panel_rect.left + 20, panel_rect.bottom - 30),  # Moved up to 30px from bottom
-                        (panel_rect.left + panel_width - 20, panel_rect.bottom - 30), 2)
+        # Draw panel background with gradient, border and "tech" details
+        self.widgets['game_over_panel'].draw(surface, panel_rect)
         
         # Draw game over text with glow effect
-        game_over_font = pygame.font.SysFont('Arial', 48, bold=True)
-        glow_text = game_over_font.render('GAME OVER', True, (100, 0, 0))
-        surface.blit(glow_text, (SCREEN_WIDTH // 2 - glow_text.get_width() // 2 + 2, panel_rect.top + 50 + 2))
-        
-        game_over_text = game_over_font.render('GAME OVER', True, (255, 50, 50))
-        surface.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, panel_rect.top + 50))
+        game_over_text = self.widgets['game_over_title'].get_surface('GAME OVER')
+        surface.blit(game_over_text, (SCREEN_WIDTH // 2 - (game_over_text.get_width() - 2) // 2, panel_rect.top + 50))
         
         # Draw score
-        score_font = pygame.font.SysFont('Arial', 32)
-        score_text = score_font.render(f'Final Score: {score}', True, (220, 220, 255))
+        score_font = get_font('Arial', 32)
+        score_text = render_text(score_font, f'Final Score: {score}', True, (220, 220, 255))
         surface.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, panel_rect.top + 120))
         
         # Create restart button
@@ -839,53 +628,100 @@ class UIManager:
         self.main_menu_button_rect = main_menu_button_rect  # Store the main menu button rect
         self.test_button_rect = None  # No test button on game over screen
     
-    def show_start_screen(self, surface, testing_mode=False):
-        """Display an enhanced start screen with mysterious vibe."""
+    def _render_menu_backdrop(self):
+        """Build the static star and nebula layer of the start screen (generated once)."""
+        backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        
         # Create a starry background effect
         for i in range(50):  # Add extra stars for the menu
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            size = random.randint(1, 3)
-            brightness = random.randint(150, 255)
-            pygame.draw.circle(surface, (brightness, brightness, brightness), (x, y), size)
+            x = menu_rng.randint(0, SCREEN_WIDTH)
+            y = menu_rng.randint(0, SCREEN_HEIGHT)
+            size = menu_rng.randint(1, 3)
+            brightness = menu_rng.randint(150, 255)
+            pygame.draw.circle(backdrop, (brightness, brightness, brightness), (x, y), size)
         
         # Add a mysterious nebula-like effect
+        nebula_surface = pygame.Surface((300, 200), pygame.SRCALPHA)
         for i in range(5):
-            nebula_surface = pygame.Surface((300, 200), pygame.SRCALPHA)
-            color = (random.randint(20, 60), random.randint(0, 30), random.randint(40, 80), 15)
+            nebula_surface.fill((0, 0, 0, 0))
+            color = (menu_rng.randint(20, 60), menu_rng.randint(0, 30), menu_rng.randint(40, 80), 15)
             pygame.draw.ellipse(nebula_surface, color, (0, 0, 300, 200))
-            surface.blit(nebula_surface, (random.randint(0, SCREEN_WIDTH-300), random.randint(0, SCREEN_HEIGHT-200)))
+            backdrop.blit(nebula_surface, (menu_rng.randint(0, SCREEN_WIDTH-300), menu_rng.randint(0, SCREEN_HEIGHT-200)))
         
+        # Run-length encode the mostly transparent layer so blits skip the empty pixels
+        backdrop.set_alpha(255, pygame.RLEACCEL)
+        return backdrop
+    
+    def _render_menu_title(self):
+        """Build the title block: translucent band, glowing title and the static "By" caption."""
         # Create a semi-transparent overlay for the title area
-        title_overlay = pygame.Surface((SCREEN_WIDTH, 100), pygame.SRCALPHA)
-        title_overlay.fill((0, 0, 30, 180))
-        surface.blit(title_overlay, (0, 130))
+        title_block = pygame.Surface((SCREEN_WIDTH, 100), pygame.SRCALPHA)
+        title_block.fill((0, 0, 30, 180))
         
-        # Draw a glowing effect for the title
-        glow_font = pygame.font.SysFont('Arial', 60, bold=True)
-        glow_text = glow_font.render('SPACE CONQUER', True, (60, 60, 120))
-        surface.blit(glow_text, (SCREEN_WIDTH // 2 - glow_text.get_width() // 2 + 2, 152))
+        # Draw a glowing effect for the title, then the main title
+        title_font = get_font('Arial', 60, bold=True)
+        glow_text = render_text(title_font, 'SPACE CONQUER', True, (60, 60, 120))
+        title_block.blit(glow_text, (SCREEN_WIDTH // 2 - glow_text.get_width() // 2 + 2, 22))
+        title_text = render_text(title_font, 'SPACE CONQUER', True, (150, 150, 255))
+        title_block.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 20))
         
-        # Draw the main title
-        title_font = pygame.font.SysFont('Arial', 60, bold=True)
-        title_text = title_font.render('SPACE CONQUER', True, (150, 150, 255))
-        surface.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 150))
+        # Draw "By" text (always static)
+        by_pos = self._get_menu_credit_positions()[0]
+        title_block.blit(render_text(get_font('Arial', 18, bold=True), 'By ', True, (150, 150, 200)),
+                         (by_pos[0], by_pos[1] - 130))
+        return title_block
+    
+    def _render_menu_controls(self):
+        """Build the controls box and tagline of the start screen."""
+        controls_block = pygame.Surface((400, 130), pygame.SRCALPHA)
         
-        # Add developer name with lightning effects under the title
-        dev_font = pygame.font.SysFont('Arial', 18, bold=True)
-        by_text = dev_font.render('By ', True, (150, 150, 200))
-        dev_text = dev_font.render('Gauciv', True, (200, 200, 255))
+        # Controls section with a semi-transparent background
+        controls_block.fill((0, 0, 30, 150), (0, 0, 400, 80))
+        
+        # Draw controls text
+        controls_title = render_text(self.font_medium, 'CONTROLS:', True, (200, 200, 255))
+        controls_block.blit(controls_title, (20, 10))
+        
+        controls_text = render_text(self.font_small, 'Arrow keys: Move | SPACE: Shoot | ESC: Settings', True, (180, 180, 220))
+        controls_block.blit(controls_text, (20, 40))
         
-        # Calculate positions
+        # Add a mysterious tagline
+        tagline_font = get_font('Arial', 18, italic=True)
+        tagline_text = render_text(tagline_font, 'The void awaits...', True, (150, 150, 200))
+        controls_block.blit(tagline_text, (200 - tagline_text.get_width() // 2, 100))
+        controls_block.set_alpha(255, pygame.RLEACCEL)
+        return controls_block
+    
+    def _get_menu_credit_positions(self):
+        """Return the screen positions of the "By" caption and the developer name."""
+        dev_font = get_font('Arial', 18, bold=True)
+        by_text = render_text(dev_font, 'By ', True, (150, 150, 200))
+        dev_text = render_text(dev_font, 'Gauciv', True, (200, 200, 255))
         combined_width = by_text.get_width() + dev_text.get_width()
         by_pos = (SCREEN_WIDTH // 2 - combined_width // 2, 210)
         dev_pos = (by_pos[0] + by_text.get_width(), 210)
+        return by_pos, dev_pos
+    
+    def show_start_screen(self, surface, testing_mode=False):
+        """
+        Display an enhanced start screen with mysterious vibe.
+        
+        The backdrop, title block and controls are pre-rendered layers; only the
+        lightning flash and hover effects are drawn each frame.
+        """
+        # Static layers (stars and nebulae are seeded once, not re-rolled every frame)
+        self._get_widget('menu_backdrop', lambda: Widget(self._render_menu_backdrop)).draw(surface, (0, 0))
+        self._get_widget('menu_title', lambda: Widget(self._render_menu_title)).draw(surface, (0, 130))
+        self._get_widget('menu_controls', lambda: Widget(self._render_menu_controls)).draw(
+            surface, (SCREEN_WIDTH // 2 - 200, 420))
         
-        # Draw "By" text (always static)
-        surface.blit(by_text, by_pos)
+        # Add developer name with lightning effects under the title
+        dev_font = get_font('Arial', 18, bold=True)
+        dev_text = render_text(dev_font, 'Gauciv', True, (200, 200, 255))
+        dev_pos = self._get_menu_credit_positions()[1]
         
         # Create lightning effect only for the developer name
-        current_time = pygame.time.get_ticks()
+        current_time = get_clock().get_ticks()
         if current_time % 2000 < 150:  # Flash every 2 seconds for 150ms
             # Draw lightning bolts around the name
             lightning_points = [
@@ -906,11 +742,11 @@ class UIManager:
                 pygame.draw.lines(surface, (100, 150, 255), False, points, 2)
             
             # Add glow to the dev text
-            glow_text = dev_font.render('Gauciv', True, (100, 150, 255))
+            glow_text = render_text(dev_font, 'Gauciv', True, (100, 150, 255))
             surface.blit(glow_text, (dev_pos[0] + 1, dev_pos[1] + 1))
             
             # Draw the text with a brighter color during flash
-            bright_text = dev_font.render('Gauciv', True, (220, 220, 255))
+            bright_text = render_text(dev_font, 'Gauciv', True, (220, 220, 255))
             surface.blit(bright_text, dev_pos)
         else:
             # Draw normal text
@@ -934,36 +770,14 @@ class UIManager:
             self.robot_button_rect = robot_rect
             
             # Draw the robot icon with a subtle glow
-            glow_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
-            glow_color = (100, 150, 255, 30)
-            pygame.draw.circle(glow_surface, glow_color, (30, 30), 25)
-            surface.blit(glow_surface, (robot_rect.x - 10, robot_rect.y - 10))
+            blit_glow(surface, (robot_rect.x + 20, robot_rect.y + 20), 25, (100, 150, 255), 30, falloff=0)
             # Center the robot icon properly in its rect
             surface.blit(self.robot_icon, (robot_rect.x, robot_rect.y))
             
             # Add a subtle glow effect if hovered
             if self.robot_button_rect.collidepoint(pygame.mouse.get_pos()):
-                glow_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
-                glow_color = (100, 150, 255, 50)
-                pygame.draw.circle(glow_surface, glow_color, (30, 30), 25)
-                surface.blit(glow_surface, (self.robot_button_rect.x - 10, self.robot_button_rect.y - 10))
-        
-        # Controls section with a semi-transparent background
-        controls_overlay = pygame.Surface((400, 80), pygame.SRCALPHA)
-        controls_overlay.fill((0, 0, 30, 150))
-        surface.blit(controls_overlay, (SCREEN_WIDTH // 2 - 200, 420))
-        
-        # Draw controls text
-        controls_title = self.font_medium.render('CONTROLS:', True, (200, 200, 255))
-        surface.blit(controls_title, (SCREEN_WIDTH // 2 - 180, 430))
-        
-        controls_text = self.font_small.render('Arrow keys: Move | SPACE: Shoot | ESC: Settings', True, (180, 180, 220))
-        surface.blit(controls_text, (SCREEN_WIDTH // 2 - 180, 460))
-        
-        # Add a mysterious tagline
-        tagline_font = pygame.font.SysFont('Arial', 18, italic=True)
-        tagline_text = tagline_font.render('The void awaits...', True, (150, 150, 200))
-        surface.blit(tagline_text, (SCREEN_WIDTH // 2 - tagline_text.get_width() // 2, 520))
+                blit_glow(surface, (self.robot_button_rect.x + 20, self.robot_button_rect.y + 20),
+                          25, (100, 150, 255), 50, falloff=0)
         
         # Store button rectangles for click detection
         self.start_button_rect = start_button_rect
@@ -972,53 +786,15 @@ class UIManager:
         self.main_menu_button_rect = None
     
     def _draw_stylized_button(self, surface, rect, text, color_dark, color_light, is_hovered=False):
-        """Draw a stylized button with a space theme."""
-        # Draw button background with gradient
-        for i in range(rect.height):
-            progress = i / rect.height
-            
-            # Brighten colors if hovered
-            if is_hovered:
-                color = (
-                    min(255, int(color_dark[0] + (color_light[0] - color_dark[0]) * progress + 30)),
-                    min(255, int(color_dark[1] + (color_light[1] - color_dark[1]) * progress + 30)),
-                    min(255, int(color_dark[2] + (color_light[2] - color_dark[2]) * progress + 30))
-                )
-            else:
-                color = (
-                    int(color_dark[0] + (color_light[0] - color_dark[0]) * progress),
-                    int(color_dark[1] + (color_light[1] - color_dark[1]) * progress),
-                    int(color_dark[2] + (color_light[2] - color_dark[2]) * progress)
-                )
-            pygame.draw.line(surface, color, (rect.left, rect.top + i), (rect.right, rect.top + i))
-        
-        # Draw button border with glow effect
-        border_color = (min(255, color_light[0] + 30 if is_hovered else color_light[0]),
-                        min(255, color_light[1] + 30 if is_hovered else color_light[1]),
-                        min(255, color_light[2] + 30 if is_hovered else color_light[2]))
-        pygame.draw.rect(surface, border_color, rect, 2)
-        
-        # Add some "tech" details to the button
-        pygame.draw.line(surface, (100, 100, 200, 150), 
-                        (rect.left + 10, rect.top + 5), 
-                        (rect.left + rect.width - 20, rect.top + 5), 1)
-        pygame.draw.line(surface, (100, 100, 200, 150), 
-                        (rect.left + 10, rect.bottom - 5), 
-                        (rect.left + rect.width - 20, rect.bottom - 5), 1)
-        
-        # Draw text
-        font = pygame.font.SysFont('Arial', 24, bold=True)
-        text_color = (240, 240, 255) if is_hovered else (220, 220, 255)
-        text_surface = font.render(text, True, text_color)
-        text_rect = text_surface.get_rect(center=rect.center)
-        surface.blit(text_surface, text_rect)
+        """Draw a stylized button with a space theme (cached per caption and colors)."""
+        button = self._get_widget(('button', text, color_dark, color_light),
+                                  lambda: Button(text, color_dark, color_light, get_font('Arial', 24, bold=True)))
+        button.draw(surface, rect, is_hovered)
 
     def _draw_confirmation_dialog(self, surface):
         """Draw a confirmation dialog for returning to main menu."""
         # Create a dark overlay for the background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Darker overlay for the confirmation dialog
-        surface.blit(overlay, (0, 0))
+        self.widgets['dark_overlay'].draw(surface, surface.get_rect())
         
         # Create dialog box
         dialog_width, dialog_height = 400, 200
@@ -1026,38 +802,17 @@ class UIManager:
         dialog_y = SCREEN_HEIGHT // 2 - dialog_height // 2
         dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
         
-        # Draw dialog background with gradient
-        for i in range(dialog_height):
-            progress = i / dialog_height
-            color = (
-                int(40 + 20 * progress),
-                int(20 + 10 * progress),
-                int(30 + 20 * progress),
-                240
-            )
-            dialog_surface = pygame.Surface((dialog_width, 1), pygame.SRCALPHA)
-            dialog_surface.fill(color)
-            surface.blit(dialog_surface, (dialog_x, dialog_y + i))
-        
-        # Draw dialog border with glow effect
-        pygame.draw.rect(surface, (180, 80, 100), dialog_rect, 2)
-        
-        # Add tech details to the dialog
-        pygame.draw.line(surface, (200, 100, 80, 150), 
-                       (dialog_x + 20, dialog_y + 20), 
-                       (dialog_x + dialog_width - 20, dialog_y + 20), 2)
-        pygame.draw.line(surface, (200, 100, 80, 150), 
-                       (dialog_x + 20, dialog_y + dialog_height - 20), 
-                       (dialog_x + dialog_width - 20, dialog_y + dialog_height - 20), 2)
+        # Draw dialog background with gradient, border and tech details
+        self.widgets['confirm_panel'].draw(surface, dialog_rect)
         
         # Draw warning text
-        warning_font = pygame.font.SysFont('Arial', 24, bold=True)
-        warning_text = warning_font.render("Return to Main Menu?", True, (255, 200, 180))
+        warning_font = get_font('Arial', 24, bold=True)
+        warning_text = render_text(warning_font, "Return to Main Menu?", True, (255, 200, 180))
         surface.blit(warning_text, (SCREEN_WIDTH // 2 - warning_text.get_width() // 2, dialog_y + 40))
         
         # Draw confirmation message
-        confirm_font = pygame.font.SysFont('Arial', 18)
-        confirm_text = confirm_font.render("Are you sure? Your current progress will be lost.", True, (220, 220, 255))
+        confirm_font = get_font('Arial', 18)
+        confirm_text = render_text(confirm_font, "Are you sure? Your current progress will be lost.", True, (220, 220, 255))
         surface.blit(confirm_text, (SCREEN_WIDTH // 2 - confirm_text.get_width() // 2, dialog_y + 80))
         
         # Draw Yes button
@@ -1138,43 +893,34 @@ class UIManager:
             robot_rect = self.robot_button_rect
             
             # Draw the robot icon with a subtle glow
-            glow_surface = pygame.Surface((50, 50), pygame.SRCALPHA)
-            glow_color = (100, 150, 255, 30)
-            pygame.draw.circle(glow_surface, glow_color, (25, 25), 20)
-            surface.blit(glow_surface, (robot_rect.x - 5, robot_rect.y - 5))
+            blit_glow(surface, (robot_rect.x + 20, robot_rect.y + 20), 20, (100, 150, 255), 30, falloff=0)
             # Center the robot icon properly in its rect
             surface.blit(self.robot_icon, (robot_rect.x, robot_rect.y))
             
             # Draw testing mode indicator
-            test_font = pygame.font.SysFont('Arial', 14)
-            test_text = test_font.render("TEST MODE", True, (100, 150, 255))
+            test_font = get_font('Arial', 14)
+            test_text = render_text(test_font, "TEST MODE", True, (100, 150, 255))
             surface.blit(test_text, (robot_rect.right + 5, robot_rect.centery - test_text.get_height() // 2))
             
             # Draw God Mode indicator if enabled
             if self.god_mode:
-                god_text = test_font.render("GOD MODE", True, (255, 215, 0))  # Gold color
+                god_text = render_text(test_font, "GOD MODE", True, (255, 215, 0))  # Gold color
                 surface.blit(god_text, (robot_rect.right + 5, robot_rect.centery + 10))
             return
             
         # Draw a compact popup panel that doesn't overlap with the robot icon
         panel_width = 250
-        panel_height = 150  # Reduced height since we removed phase selector
+        panel_height = 190  # Taller to fit the Debug Logs button
         panel_x = 10
         panel_y = 120
         
-        # Draw panel background
-        panel_color = (20, 20, 40, 220)
+        # Draw panel background and border
         panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        panel_surface.fill(panel_color)
-        surface.blit(panel_surface, panel_rect)
-        
-        # Draw panel border
-        pygame.draw.rect(surface, (100, 150, 255), panel_rect, 2)
+        self.widgets['testing_panel'].draw(surface, panel_rect)
         
         # Draw header
-        header_font = pygame.font.SysFont('Arial', 16, bold=True)
-        header_text = header_font.render("TESTING OPTIONS", True, (200, 200, 255))
+        header_font = get_font('Arial', 16, bold=True)
+        header_text = render_text(header_font, "TESTING OPTIONS", True, (200, 200, 255))
         surface.blit(header_text, (panel_x + 10, panel_y + 10))
         
         # Draw collapse button (X)
@@ -1213,68 +959,46 @@ class UIManager:
         self._draw_toggle_button(surface, fps_rect, "Show FPS", self.show_fps)
         button_y += button_height + button_spacing
         
+        # Debug Logs button (verbose log messages for every category)
+        debug_logs_rect = pygame.Rect(panel_x + 10, button_y, panel_width - 20, button_height)
+        self._draw_toggle_button(surface, debug_logs_rect, "Debug Logs", is_debug_logging())
+        button_y += button_height + button_spacing
+        
         # Note about phase markers
-        note_text = self.font_small.render("Use phase markers on the right side →", True, (200, 200, 255))
+        note_text = render_text(self.font_small, "Use phase markers on the right side →", True, (200, 200, 255))
         surface.blit(note_text, (panel_x + 10, button_y))
         
         # Store button rectangles for click detection
         self.god_mode_button_rect = god_mode_rect
         self.player_coords_button_rect = coords_rect
         self.fps_button_rect = fps_rect
+        self.debug_logs_button_rect = debug_logs_rect
         
         # Draw stats in the bottom right corner if enabled
         if self.show_player_coords and player:
-            coords_font = pygame.font.SysFont('Arial', 14)
-            coords_text = coords_font.render(f"X:{int(player.rect.x)}, Y:{int(player.rect.y)}", True, (200, 200, 255))
+            coords_font = get_font('Arial', 14)
+            coords_text = render_text(coords_font, f"X:{int(player.rect.x)}, Y:{int(player.rect.y)}", True, (200, 200, 255))
             
-            # Create background with padding
+            # Right-align the coordinates on a background with padding
             coords_bg_width = coords_text.get_width() + 20
-            coords_bg = pygame.Surface((coords_bg_width, 25), pygame.SRCALPHA)
-            coords_bg.fill((20, 20, 40, 180))
-            
-            # Right-align the coordinates
             coords_x = SCREEN_WIDTH - coords_bg_width - 10
-            surface.blit(coords_bg, (coords_x, SCREEN_HEIGHT - 60))
+            self.widgets['coords_box'].draw(surface, pygame.Rect(coords_x, SCREEN_HEIGHT - 60, coords_bg_width, 25))
             surface.blit(coords_text, (coords_x + 10, SCREEN_HEIGHT - 55))
         
         if self.show_fps:
-            fps_font = pygame.font.SysFont('Arial', 14)
-            fps_text = fps_font.render(f"FPS: {int(fps)}", True, (200, 200, 255))
+            fps_font = get_font('Arial', 14)
+            fps_text = render_text(fps_font, f"FPS: {int(fps)}", True, (200, 200, 255))
             
-            # Create background with padding
+            # Right-align the FPS counter on a background with padding
             fps_bg_width = fps_text.get_width() + 20
-            fps_bg = pygame.Surface((fps_bg_width, 25), pygame.SRCALPHA)
-            fps_bg.fill((20, 20, 40, 180))
-            
-            # Right-align the FPS counter
             fps_x = SCREEN_WIDTH - fps_bg_width - 10
-            surface.blit(fps_bg, (fps_x, SCREEN_HEIGHT - 30))
+            self.widgets['fps_box'].draw(surface, pygame.Rect(fps_x, SCREEN_HEIGHT - 30, fps_bg_width, 25))
             surface.blit(fps_text, (fps_x + 10, SCREEN_HEIGHT - 25))
     
     def _draw_toggle_button(self, surface, rect, text, is_active):
-        """Draw a toggle button with on/off state."""
-        # Draw button background
-        button_color = (40, 40, 80) if not is_active else (60, 80, 120)
-        pygame.draw.rect(surface, button_color, rect, border_radius=5)
-        
-        # Draw button border
-        border_color = (80, 80, 120) if not is_active else (100, 150, 200)
-        pygame.draw.rect(surface, border_color, rect, width=2, border_radius=5)
-        
-        # Draw button text
-        button_font = pygame.font.SysFont('Arial', 14)
-        text_surface = button_font.render(text, True, (200, 200, 255))
-        surface.blit(text_surface, (rect.x + 10, rect.centery - text_surface.get_height() // 2))
-        
-        # Draw toggle indicator
-        toggle_rect = pygame.Rect(rect.right - 50, rect.centery - 8, 40, 16)
-        pygame.draw.rect(surface, (30, 30, 50), toggle_rect, border_radius=8)
-        
-        # Draw toggle handle
-        handle_x = toggle_rect.right - 14 if is_active else toggle_rect.left + 2
-        handle_rect = pygame.Rect(handle_x, toggle_rect.centery - 6, 12, 12)
-        handle_color = (100, 200, 100) if is_active else (150, 150, 150)
-        pygame.draw.rect(surface, handle_color, handle_rect, border_radius=6)
+        """Draw a toggle button with on/off state (cached per caption)."""
+        toggle = self._get_widget(('toggle', text), lambda: ToggleButton(text, get_font('Arial', 14)))
+        toggle.draw(surface, rect, is_active)
         
     def handle_testing_panel_click(self, pos, phase_manager=None):
         """Handle clicks on the testing panel."""
@@ -1308,6 +1032,10 @@ class UIManager:
             self.show_fps = not self.show_fps
             return True
             
+        if self.debug_logs_button_rect and self.debug_logs_button_rect.collidepoint(pos):
+            set_debug_logging(not is_debug_logging())
+            return True
+            
         return False
     def draw_respawn_countdown(self, surface):
         """Draw respawn countdown in test mode."""
@@ -1315,40 +1043,38 @@ class UIManager:
             return
             
         # Calculate remaining time
-        remaining_time = max(0, (self.respawn_timer + self.respawn_duration - pygame.time.get_ticks()) / 1000)
+        remaining_time = max(0, (self.respawn_timer + self.respawn_duration - get_clock().get_ticks()) / 1000)
         
         # Create a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))  # Semi-transparent black
-        surface.blit(overlay, (0, 0))
+        self.widgets['respawn_overlay'].draw(surface, surface.get_rect())
         
         # Draw respawn message
-        font_large = pygame.font.SysFont('Arial', 48, bold=True)
-        font_medium = pygame.font.SysFont('Arial', 24)
+        font_large = get_font('Arial', 48, bold=True)
+        font_medium = get_font('Arial', 24)
         
         # Main message
-        respawn_text = font_large.render("RESPAWNING", True, (255, 255, 255))
+        respawn_text = render_text(font_large, "RESPAWNING", True, (255, 255, 255))
         surface.blit(respawn_text, (SCREEN_WIDTH // 2 - respawn_text.get_width() // 2, SCREEN_HEIGHT // 2 - 60))
         
         # Countdown
-        countdown_text = font_large.render(f"{remaining_time:.1f}", True, (255, 200, 0))
+        countdown_text = render_text(font_large, f"{remaining_time:.1f}", True, (255, 200, 0))
         surface.blit(countdown_text, (SCREEN_WIDTH // 2 - countdown_text.get_width() // 2, SCREEN_HEIGHT // 2))
         
         # Test mode message
-        test_text = font_medium.render("Test Mode: Auto-respawn enabled", True, (150, 200, 255))
+        test_text = render_text(font_medium, "Test Mode: Auto-respawn enabled", True, (150, 200, 255))
         surface.blit(test_text, (SCREEN_WIDTH // 2 - test_text.get_width() // 2, SCREEN_HEIGHT // 2 + 60))
         
     def start_respawn_countdown(self):
         """Start the respawn countdown."""
         self.respawning = True
-        self.respawn_timer = pygame.time.get_ticks()
+        self.respawn_timer = get_clock().get_ticks()
         
     def update_respawn_countdown(self):
         """Update the respawn countdown and check if it's complete."""
         if not self.respawning:
             return False
             
-        current_time = pygame.time.get_ticks()
+        current_time = get_clock().get_ticks()
         if current_time - self.respawn_timer >= self.respawn_duration:
             self.respawning = False
             return True  # Respawn complete
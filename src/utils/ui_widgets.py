@@ -0,0 +1,273 @@
+"""
+UI Widgets for the Space Impact game.
+Retained panels, labels, buttons and sliders that keep their rendered surface
+and only re-render when one of their inputs (size, text, hover state, slider
+position) changes, so a mostly static HUD costs a few blits per frame.
+"""
+import pygame
+from src.utils.font_manager import render_text
+
+class Widget:
+    """Base class for UI elements that cache their rendered surface."""
+
+    def __init__(self, renderer=None):
+        """
+        Initialize the widget.
+
+        Args:
+            renderer: Optional function building the surface from the widget state
+                      (used instead of overriding render)
+        """
+        self.renderer = renderer
+        self.surface = None
+        self.state = None
+        self.render_count = 0  # How many times the surface was regenerated
+
+    def render(self, *state):
+        """Build the widget surface for a state."""
+        return self.renderer(*state)
+
+    def get_surface(self, *state):
+        """Return the cached surface, re-rendering it only if the state changed."""
+        if self.surface is None or state != self.state:
+            self.surface = self.render(*state)
+            self.state = state
+            self.render_count += 1
+        return self.surface
+
+    def draw(self, target, position, *state):
+        """Blit the widget for a state at a position."""
+        target.blit(self.get_surface(*state), position)
+
+    def invalidate(self):
+        """Force the next draw to re-render."""
+        self.surface = None
+
+def _solid(color):
+    """Drop the alpha of a color (shapes drawn straight onto the screen ignore it)."""
+    return tuple(color[:3])
+
+class Panel(Widget):
+    """Translucent panel with a vertical gradient, border and optional detail lines."""
+
+    def __init__(self, top_color, bottom_color=None, border_color=None, border_width=1, details=()):
+        """
+        Initialize the panel.
+
+        Args:
+            top_color: RGBA color of the first row
+            bottom_color: RGBA color the gradient moves towards (defaults to a flat fill)
+            border_color: Optional border color
+            border_width: Border width in pixels
+            details: (color, start, end, width) lines in panel coordinates. Negative
+                     coordinates are measured from the right or bottom edge
+        """
+        super().__init__()
+        self.top_color = top_color
+        self.bottom_color = bottom_color or top_color
+        self.border_color = border_color
+        self.border_width = border_width
+        self.details = details
+
+    def render(self, width, height):
+        """Build the panel surface."""
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        top, bottom = self.top_color, self.bottom_color
+        if top == bottom:
+            surface.fill(top)
+        else:
+            for i in range(height):
+                progress = i / height
+                surface.fill(tuple(int(a + (b - a) * progress) for a, b in zip(top, bottom)), (0, i, width, 1))
+
+        if self.border_color:
+            pygame.draw.rect(surface, _solid(self.border_color), (0, 0, width, height), self.border_width)
+
+        for color, start, end, line_width in self.details:
+            start = (start[0] % width, start[1] % height)
+            end = (end[0] % width, end[1] % height)
+            pygame.draw.line(surface, _solid(color), start, end, line_width)
+        return surface
+
+    def draw(self, target, rect):
+        """Blit the panel filling a rect."""
+        target.blit(self.get_surface(rect.width, rect.height), rect.topleft)
+
+class Label(Widget):
+    """Text with an optional offset glow copy behind it."""
+
+    def __init__(self, font, color, glow_color=None, glow_offset=1):
+        """
+        Initialize the label.
+
+        Args:
+            font: Font from get_font()
+            color: Text color
+            glow_color: Optional color of the glow copy drawn behind the text
+            glow_offset: Offset of the glow copy in pixels
+        """
+        super().__init__()
+        self.font = font
+        self.color = color
+        self.glow_color = glow_color
+        self.glow_offset = glow_offset
+
+    def render(self, text):
+        """Build the label surface."""
+        main_text = render_text(self.font, text, True, self.color)
+        if not self.glow_color:
+            return main_text
+        offset = self.glow_offset
+        glow_text = render_text(self.font, text, True, self.glow_color)
+        surface = pygame.Surface((main_text.get_width() + offset, main_text.get_height() + offset), pygame.SRCALPHA)
+        surface.blit(glow_text, (offset, offset))
+        surface.blit(main_text, (0, 0))
+        return surface
+
+class Button(Widget):
+    """Stylized gradient button with hover highlight."""
+
+    def __init__(self, text, color_dark, color_light, font):
+        """
+        Initialize the button.
+
+        Args:
+            text: Button caption
+            color_dark: Gradient color at the top
+            color_light: Gradient color at the bottom (and border)
+            font: Caption font
+        """
+        super().__init__()
+        self.text = text
+        self.color_dark = color_dark
+        self.color_light = color_light
+        self.font = font
+
+    def render(self, width, height, is_hovered):
+        """Build the button surface."""
+        color_dark, color_light = self.color_dark, self.color_light
+        # Gradient rows run one pixel past the right edge, like the lines they replace
+        surface = pygame.Surface((width + 1, height))
+
+        for i in range(height):
+            progress = i / height
+            color = tuple(int(dark + (light - dark) * progress) for dark, light in zip(color_dark, color_light))
+            # Brighten colors if hovered
+            if is_hovered:
+                color = tuple(min(255, c + 30) for c in color)
+            surface.fill(color, (0, i, width + 1, 1))
+
+        # Draw button border with glow effect
+        border_color = tuple(min(255, c + 30 if is_hovered else c) for c in color_light)
+        pygame.draw.rect(surface, border_color, (0, 0, width, height), 2)
+
+        # Add some "tech" details to the button
+        pygame.draw.line(surface, (100, 100, 200), (10, 5), (width - 20, 5), 1)
+        pygame.draw.line(surface, (100, 100, 200), (10, height - 5), (width - 20, height - 5), 1)
+
+        # Draw text
+        text_color = (240, 240, 255) if is_hovered else (220, 220, 255)
+        text_surface = render_text(self.font, self.text, True, text_color)
+        surface.blit(text_surface, text_surface.get_rect(center=(width // 2, height // 2)))
+        return surface
+
+    def draw(self, target, rect, is_hovered=False):
+        """Blit the button over a rect."""
+        target.blit(self.get_surface(rect.width, rect.height, is_hovered), rect.topleft)
+
+class ToggleButton(Widget):
+    """Rounded on/off toggle with a caption."""
+
+    def __init__(self, text, font):
+        """
+        Initialize the toggle.
+
+        Args:
+            text: Toggle caption
+            font: Caption font
+        """
+        super().__init__()
+        self.text = text
+        self.font = font
+
+    def render(self, width, height, is_active):
+        """Build the toggle surface."""
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        rect = surface.get_rect()
+
+        # Draw button background and border
+        button_color = (40, 40, 80) if not is_active else (60, 80, 120)
+        pygame.draw.rect(surface, button_color, rect, border_radius=5)
+        border_color = (80, 80, 120) if not is_active else (100, 150, 200)
+        pygame.draw.rect(surface, border_color, rect, width=2, border_radius=5)
+
+        # Draw button text
+        text_surface = render_text(self.font, self.text, True, (200, 200, 255))
+        surface.blit(text_surface, (10, rect.centery - text_surface.get_height() // 2))
+
+        # Draw toggle indicator and handle
+        toggle_rect = pygame.Rect(rect.right - 50, rect.centery - 8, 40, 16)
+        pygame.draw.rect(surface, (30, 30, 50), toggle_rect, border_radius=8)
+        handle_x = toggle_rect.right - 14 if is_active else toggle_rect.left + 2
+        handle_rect = pygame.Rect(handle_x, toggle_rect.centery - 6, 12, 12)
+        handle_color = (100, 200, 100) if is_active else (150, 150, 150)
+        pygame.draw.rect(surface, handle_color, handle_rect, border_radius=6)
+        return surface
+
+    def draw(self, target, rect, is_active):
+        """Blit the toggle over a rect."""
+        target.blit(self.get_surface(rect.width, rect.height, is_active), rect.topleft)
+
+class Slider(Widget):
+    """Volume slider track, fill and draggable handle."""
+
+    HANDLE_RADIUS = 10
+    PADDING = 12  # Room around the track for the handle and its glow
+
+    def render(self, width, height, value, is_hovered, is_dragging):
+        """Build the slider surface (the track starts PADDING pixels in)."""
+        pad = self.PADDING
+        surface = pygame.Surface((width + pad * 2, height + pad * 2), pygame.SRCALPHA)
+        track = pygame.Rect(pad, pad, width, height)
+
+        # Draw slider background with gradient
+        for i in range(height):
+            progress = i / height
+            color = (int(20 + 20 * progress), int(20 + 20 * progress), int(40 + 20 * progress), 220)
+            surface.fill(color, (track.left, track.top + i, width, 1))
+        pygame.draw.rect(surface, (100, 100, 180), track, 1)
+
+        # Draw slider fill with gradient
+        fill_width = int(width * value)
+        for i in range(height):
+            progress = i / height
+            color = (int(40 + 60 * progress), int(40 + 60 * progress), int(120 + 80 * progress), 220)
+            surface.fill(color, (track.left, track.top + i, fill_width, 1))
+
+        # Draw handle with hover/drag effect
+        handle_x = max(track.left, min(track.left + fill_width, track.right))
+        handle_y = track.top + height // 2
+        radius = self.HANDLE_RADIUS
+        handle_color = (150, 150, 255)
+        glow_color = (100, 100, 200)
+        if is_dragging:
+            handle_color = (180, 180, 255)  # Brighter when dragging
+            glow_color = (120, 120, 220)
+        elif is_hovered:
+            handle_color = (170, 170, 255)  # Slightly brighter when hovered
+            glow_color = (110, 110, 210)
+        pygame.draw.circle(surface, glow_color, (handle_x, handle_y), radius + 2)
+        pygame.draw.circle(surface, handle_color, (handle_x, handle_y), radius)
+        pygame.draw.circle(surface, (200, 200, 255), (handle_x - 2, handle_y - 2), radius // 2)
+
+        # Draw a small indicator to show the handle is draggable
+        indicator_color = (180, 180, 255)
+        pygame.draw.line(surface, indicator_color, (handle_x - 4, handle_y), (handle_x + 4, handle_y), 2)
+        pygame.draw.line(surface, indicator_color, (handle_x, handle_y - 4), (handle_x, handle_y + 4), 2)
+        return surface
+
+    def draw(self, target, rect, value, is_hovered=False, is_dragging=False):
+        """Blit the slider with its track over a rect."""
+        pad = self.PADDING
+        target.blit(self.get_surface(rect.width, rect.height, value, is_hovered, is_dragging),
+                    (rect.left - pad, rect.top - pad))
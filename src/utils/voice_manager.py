@@ -0,0 +1,171 @@
+"""
+Voice Manager for the Space Impact game.
+Plays sound effects on mixer channels reserved per category, caps how many
+copies of one sound can ring at once, merges repeated requests for the same
+sound that arrive within a short window and steals the lowest-priority voice
+when a category runs out of channels.
+"""
+import pygame
+from src.utils.game_clock import get_clock
+from src.utils.log_manager import get_logger
+
+logger = get_logger('sound')
+
+# Mixer channels reserved for each category of sound effect
+VOICE_POOLS = {
+    'weapons': 4,   # Player and boss shots
+    'impacts': 6,   # Explosions and hits
+    'events': 3,    # Power-ups, game start and game over
+    'ui': 2,        # Menu clicks and alerts
+}
+SPARE_CHANNELS = 4  # Unreserved channels left for plain Sound.play() calls
+
+# How each sound effect is voiced:
+#   category: Pool the sound plays in
+#   max_voices: Copies of the sound allowed to play at once
+#   priority: Higher priorities steal channels from lower ones when the pool is full
+#   merge_ms: Requests within this long after the last start are merged into it
+SOUND_VOICES = {
+    'shoot': {'category': 'weapons', 'max_voices': 3, 'priority': 1, 'merge_ms': 30},
+    'explosion': {'category': 'impacts', 'max_voices': 4, 'priority': 2, 'merge_ms': 50},
+    'enemy_death': {'category': 'impacts', 'max_voices': 3, 'priority': 2, 'merge_ms': 50},
+    'powerup': {'category': 'events', 'max_voices': 1, 'priority': 3, 'merge_ms': 100},
+    'game_start': {'category': 'events', 'max_voices': 1, 'priority': 5, 'merge_ms': 0},
+    'game_over': {'category': 'events', 'max_voices': 1, 'priority': 5, 'merge_ms': 0},
+}
+DEFAULT_VOICE = {'category': 'ui', 'max_voices': 1, 'priority': 1, 'merge_ms': 50}
+
+class VoiceManager:
+    """Assigns sound effects to reserved mixer channels."""
+
+    def __init__(self, first_channel=0):
+        """
+        Initialize the voice manager.
+
+        Args:
+            first_channel: Index of the first mixer channel to reserve (channels
+                           before it belong to someone else, e.g. music)
+        """
+        self.enabled = bool(pygame.mixer.get_init())
+
+        # Channels per category and what each one is playing: (sound, priority, start time)
+        self.pools = {}
+        self.voices = {}
+        # Start time of the latest voice of each sound, for merging
+        self.last_start = {}
+
+        # Counters for the frame in progress, the last finished frame and the whole run
+        self.frame_stats = self._empty_stats()
+        self.last_frame_stats = self._empty_stats()
+        self.total_stats = self._empty_stats()
+
+        if self.enabled:
+            reserved = first_channel + sum(VOICE_POOLS.values())
+            pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved + SPARE_CHANNELS))
+            pygame.mixer.set_reserved(reserved)
+            index = first_channel
+            for category, count in VOICE_POOLS.items():
+                self.pools[category] = [pygame.mixer.Channel(i) for i in range(index, index + count)]
+                index += count
+
+    def _empty_stats(self):
+        """Return a fresh set of play counters."""
+        return {'played': 0, 'merged': 0, 'stolen': 0, 'dropped': 0}
+
+    def _count(self, key):
+        """Add one to a counter for this frame and the whole run."""
+        self.frame_stats[key] += 1
+        self.total_stats[key] += 1
+
+    def play(self, name, sound):
+        """
+        Play a sound effect on a channel from its category's pool.
+
+        Args:
+            name: Sound name, looked up in SOUND_VOICES
+            sound: pygame Sound to play
+
+        Returns:
+            The channel the sound is (or already was) playing on, or None if it was dropped
+        """
+        if not self.enabled:
+            return None
+        spec = SOUND_VOICES.get(name, DEFAULT_VOICE)
+        pool = self.pools[spec['category']]
+        now = get_clock().get_ticks()
+
+        # Busy channels in the pool; finished voices are forgotten
+        playing = []
+        for channel in pool:
+            if channel in self.voices:
+                if channel.get_busy():
+                    playing.append(channel)
+                else:
+                    del self.voices[channel]
+
+        # Merge into the voice that just started
+        last = self.last_start.get(name)
+        same = [channel for channel in playing if self.voices[channel][0] == name]
+        if same and last is not None and now - last <= spec['merge_ms']:
+            self._count('merged')
+            return max(same, key=lambda channel: self.voices[channel][2])
+
+        if len(same) >= spec['max_voices']:
+            # At the sound's own cap: restart its oldest voice
+            channel = min(same, key=lambda channel: self.voices[channel][2])
+            self._count('stolen')
+        else:
+            channel = next((channel for channel in pool if channel not in playing), None)
+            if channel is None:
+                # Pool full: steal the lowest-priority voice (oldest first), unless ours is lower
+                channel = min(playing, key=lambda channel: (self.voices[channel][1], self.voices[channel][2]))
+                if self.voices[channel][1] > spec['priority']:
+                    self._count('dropped')
+                    return None
+                self._count('stolen')
+
+        channel.play(sound)
+        self.voices[channel] = (name, spec['priority'], now)
+        self.last_start[name] = now
+        self._count('played')
+        return channel
+
+    def stop(self):
+        """Stop every sound effect."""
+        for pool in self.pools.values():
+            for channel in pool:
+                channel.stop()
+        self.voices.clear()
+
+    def end_frame(self):
+        """Close the current frame's counters. Call once per frame."""
+        self.last_frame_stats = self.frame_stats
+        self.frame_stats = self._empty_stats()
+
+    def get_frame_stats(self):
+        """
+        Get the play counters of the last finished frame.
+
+        Returns:
+            Dictionary with 'played', 'merged', 'stolen' and 'dropped' counts
+        """
+        return dict(self.last_frame_stats)
+
+    def get_total_stats(self):
+        """
+        Get the play counters for the whole run.
+
+        Returns:
+            Dictionary with 'played', 'merged', 'stolen' and 'dropped' counts
+        """
+        return dict(self.total_stats)
+
+    def get_active_voices(self):
+        """
+        Count the busy channels in each pool.
+
+        Returns:
+            Dictionary mapping category to (busy channels, pool size)
+        """
+        return {category: (sum(1 for channel in pool if channel.get_busy()), len(pool))
+                for category, pool in self.pools.items()}
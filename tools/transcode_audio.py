@@ -0,0 +1,174 @@
+"""
+Space Conquer - Audio Transcoder
+
+Run with ``python -m tools.transcode_audio`` from the project root. Transcodes
+every WAV listed in the sound and music manifests to OGG Vorbis (with ffmpeg
+or oggenc), records the OGG under the entry's "variants" and prints the package
+size and track-switch (decode) latency of the WAV and OGG variants.
+"""
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import time
+import pygame
+from src.config import BASE_DIR
+from src.utils.audio_variants import load_audio_manifest
+
+AUDIO_DIRECTORIES = ('sounds', 'music')
+ENCODERS = ('ffmpeg', 'oggenc')
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Transcode manifest audio to OGG and compare the variants")
+    parser.add_argument('--quality', type=int, default=4,
+                        help="Vorbis quality from 0 (smallest) to 10 (best)")
+    parser.add_argument('--encoder', choices=('auto',) + ENCODERS, default='auto',
+                        help="Encoder to use (default: the first one found on PATH)")
+    parser.add_argument('--force', action='store_true',
+                        help="Transcode even when the OGG is newer than its WAV")
+    parser.add_argument('--report-only', action='store_true',
+                        help="Only measure the variants that already exist")
+    parser.add_argument('--repeats', type=int, default=3,
+                        help="Decodes timed per file for the latency report")
+    return parser.parse_args()
+
+def find_encoder(choice):
+    """Return (name, executable) of the encoder to use, or None if none is installed."""
+    for name in (ENCODERS if choice == 'auto' else (choice,)):
+        executable = shutil.which(name)
+        if executable:
+            return name, executable
+    return None
+
+def transcode(encoder, source, target, quality):
+    """
+    Encode one WAV file to OGG Vorbis.
+
+    Args:
+        encoder: (name, executable) from find_encoder
+        source: Path of the WAV file
+        target: Path of the OGG file to write
+        quality: Vorbis quality (0-10)
+
+    Returns:
+        True if the OGG was written
+    """
+    name, executable = encoder
+    if name == 'ffmpeg':
+        command = [executable, '-y', '-loglevel', 'error', '-i', str(source),
+                   '-c:a', 'libvorbis', '-q:a', str(quality), str(target)]
+    else:
+        command = [executable, '--quiet', '-q', str(quality), '-o', str(target), str(source)]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"  {source.name}: {name} failed: {result.stderr.strip()}")
+        return False
+    return target.exists()
+
+def transcode_directory(subdir, encoder, quality, force):
+    """
+    Transcode the WAVs of one manifest and record their OGG variants.
+
+    Args:
+        subdir: 'sounds' or 'music'
+        encoder: (name, executable) from find_encoder
+        quality: Vorbis quality (0-10)
+        force: Transcode even when the OGG is up to date
+
+    Returns:
+        Number of files transcoded
+    """
+    directory = BASE_DIR / "assets" / subdir
+    manifest = load_audio_manifest(subdir)
+    transcoded = 0
+    changed = False
+    for asset_id, entry in manifest.items():
+        source = directory / entry["file"]
+        if not source.exists():
+            print(f"  {subdir}/{entry['file']}: missing, skipped")
+            continue
+        target = source.with_suffix('.ogg')
+        if force or not target.exists() or target.stat().st_mtime < source.stat().st_mtime:
+            if not transcode(encoder, source, target, quality):
+                continue
+            transcoded += 1
+        if entry.get("variants", {}).get("ogg") != target.name:
+            entry.setdefault("variants", {})["ogg"] = target.name
+            changed = True
+
+    if changed:
+        with open(directory / "manifest.json", "w") as f:
+            json.dump(manifest, f, indent=4)
+    return transcoded
+
+def time_decode(path, repeats):
+    """Return the average time in milliseconds to decode a file into a mixer Sound, or None if it can't be decoded."""
+    start = time.perf_counter()
+    try:
+        for _ in range(repeats):
+            pygame.mixer.Sound(str(path))
+    except pygame.error as e:
+        print(f"  {path.name}: can't decode ({e})")
+        return None
+    return (time.perf_counter() - start) / repeats * 1000
+
+def _cell(value, scale=1.0):
+    """Format one report column, or a dash for a missing value."""
+    return f"{value / scale:>10.1f}" if value is not None else f"{'-':>10}"
+
+def print_report(repeats):
+    """Print size and decode latency of the WAV and OGG variant of every manifest entry."""
+    mixer_ready = bool(pygame.mixer.get_init())
+    print(f"{'Asset':<28}{'WAV KiB':>10}{'OGG KiB':>10}{'WAV ms':>10}{'OGG ms':>10}")
+    totals = {'wav': 0, 'runtime': 0}
+    for subdir in AUDIO_DIRECTORIES:
+        directory = BASE_DIR / "assets" / subdir
+        for asset_id, entry in load_audio_manifest(subdir).items():
+            wav = directory / entry["file"]
+            if not wav.exists():
+                continue
+            ogg_name = entry.get("variants", {}).get("ogg")
+            ogg = directory / ogg_name if ogg_name else None
+            if ogg is not None and not ogg.exists():
+                ogg = None
+
+            wav_size = wav.stat().st_size
+            ogg_size = ogg.stat().st_size if ogg else None
+            totals['wav'] += wav_size
+            totals['runtime'] += ogg_size if ogg_size is not None else wav_size
+            wav_ms = time_decode(wav, repeats) if mixer_ready else None
+            ogg_ms = time_decode(ogg, repeats) if mixer_ready and ogg else None
+            print(f"{subdir + '/' + asset_id:<28}{_cell(wav_size, 1024)}{_cell(ogg_size, 1024)}"
+                  f"{_cell(wav_ms)}{_cell(ogg_ms)}")
+
+    saved = 100 - totals['runtime'] / totals['wav'] * 100 if totals['wav'] else 0.0
+    print(f"\nPackage audio: {totals['wav'] / 1024:.1f} KiB as WAV, "
+          f"{totals['runtime'] / 1024:.1f} KiB loaded at runtime ({saved:.0f}% smaller)")
+    if not mixer_ready:
+        print("Mixer unavailable: decode latency not measured")
+
+def main():
+    """Transcode the manifest audio and report on the variants."""
+    args = parse_args()
+    if not args.report_only:
+        encoder = find_encoder(args.encoder)
+        if encoder is None:
+            print(f"No encoder found (install one of: {', '.join(ENCODERS)}); reporting existing variants only")
+        else:
+            for subdir in AUDIO_DIRECTORIES:
+                count = transcode_directory(subdir, encoder, args.quality, args.force)
+                print(f"{subdir}: {count} file(s) transcoded with {encoder[0]}")
+            print()
+
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"Could not open the mixer: {e}")
+    print_report(args.repeats)
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())